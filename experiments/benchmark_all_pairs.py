@@ -0,0 +1,106 @@
+"""
+Benchmark : tables de plus courts chemins pour toutes les paires
+
+Pour un quartier, on précalcule toutes les paires une fois. On compare
+les deux méthodes de calcul (Floyd–Warshall par blocs et une recherche
+Dijkstra par source), le choix automatique, puis le temps d'une requête
+servie par la table face à un appel à dijkstra.
+
+Les coûts unitaires du choix automatique (_FLOYD_WARSHALL_OP_COST,
+_DIJKSTRA_ARC_COST dans src/all_pairs.py) se recalibrent à partir des
+colonnes « FW (s) » et « Dijkstra (s) ».
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+import numpy as np
+from src.graph import Graph
+from src.algorithms import dijkstra
+from src.all_pairs import AllPairsTable
+from src.generators import (
+    generate_grid_graph,
+    generate_clustered_urban_graph,
+    generate_realistic_city,
+)
+
+
+def benchmark_graph(name, graph, num_queries=200, seed=42):
+    """Compare les méthodes de calcul et le temps de requête sur un graphe."""
+    n = graph.num_vertices()
+    m = len(graph.freeze().targets)
+    timings = {}
+    tables = {}
+    for method in ("floyd_warshall", "dijkstra", "auto"):
+        start = time.perf_counter()
+        tables[method] = AllPairsTable.build(graph, method=method)
+        timings[method] = time.perf_counter() - start
+    assert np.allclose(tables["floyd_warshall"].distances, tables["dijkstra"].distances)
+    fw_estimate, dijkstra_estimate = AllPairsTable.estimate_costs(n, m)
+
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_queries)]
+    table = tables["auto"]
+    start = time.perf_counter()
+    for s, t in pairs:
+        dijkstra(graph, s, t)
+    search_time = (time.perf_counter() - start) / num_queries
+    start = time.perf_counter()
+    for s, t in pairs:
+        table.query(s, t)
+    lookup_time = (time.perf_counter() - start) / num_queries
+
+    print(f"{name:<24} {n:<7} {m:<7} {timings['floyd_warshall']:<8.3f} "
+          f"{fw_estimate:<8.3f} {timings['dijkstra']:<13.3f} {dijkstra_estimate:<8.3f} "
+          f"{table.method:<15} {search_time * 1e6:<14.0f} {lookup_time * 1e6:<10.1f}")
+    return timings, search_time, lookup_time
+
+
+def dense_graph(n, seed=42):
+    """Graphe complet orienté aux poids aléatoires (cas favorable à Floyd–Warshall)."""
+    rng = random.Random(seed)
+    graph = Graph(directed=True)
+    for v in range(n):
+        graph.add_vertex(v, rng.random(), rng.random())
+    for u in range(n):
+        for v in range(n):
+            if u != v:
+                graph.add_edge(u, v, weight=rng.uniform(1.0, 100.0))
+    return graph
+
+
+def benchmark_all_pairs():
+    """Lance le benchmark sur des graphes de la taille d'un quartier."""
+    print("\n" + "="*120)
+    print(" BENCHMARK : TABLES TOUTES PAIRES")
+    print("="*120)
+    random.seed(42)
+    np.random.seed(42)
+
+    graphs = [
+        ("Ville 'small'", generate_realistic_city("small")),
+        ("Un quartier (80)", generate_clustered_urban_graph(1, 80)),
+        ("Quartiers 4×60", generate_clustered_urban_graph(4, 60)),
+        ("Ville 'medium'", generate_realistic_city("medium")),
+        ("Grille 20×20", generate_grid_graph(20, 20)),
+        ("Grille 30×30", generate_grid_graph(30, 30)),
+        ("Graphe complet 150", dense_graph(150)),
+    ]
+
+    print(f"{'Graphe':<24} {'n':<7} {'Arcs':<7} {'FW (s)':<8} {'estimé':<8} "
+          f"{'Dijkstra (s)':<13} {'estimé':<8} {'Choix auto':<15} "
+          f"{'dijkstra (µs)':<14} {'Table (µs)':<10}")
+    print("-"*120)
+    results = {}
+    for name, graph in graphs:
+        results[name] = benchmark_graph(name, graph)
+    print("-"*120)
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_all_pairs()
@@ -0,0 +1,113 @@
+"""
+Benchmark : arc-flags contre repères (ALT)
+
+Les arc-flags ferment, pour chaque région cible, les arcs qui ne mènent
+vers elle par aucun plus court chemin : loin de la cible, la recherche ne
+suit presque que le « couloir » utile. Les repères bornent la distance
+restante mais laissent tous les arcs ouverts.
+
+Pour chaque graphe : prétraitement et mémoire de chaque index, puis
+sommets explorés et temps moyen de Dijkstra, A*, Dijkstra + arc-flags,
+A* + arc-flags et ALT, sur les mêmes paires aléatoires. Chaque coût est
+comparé à celui de Dijkstra avant de publier les chiffres.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+from src.algorithms import dijkstra, astar
+from src.arc_flags import ArcFlags
+from src.landmarks import LandmarkIndex
+from src.generators import (
+    generate_grid_graph,
+    generate_random_urban_graph,
+    generate_clustered_urban_graph,
+    add_traffic_congestion
+)
+
+
+def benchmark_graph(name, graph, regions=None, num_regions=32, num_landmarks=16,
+                    num_pairs=100, seed=42):
+    """Prétraite le graphe puis compare les algorithmes sur num_pairs requêtes."""
+    flags = ArcFlags.build(graph, regions=regions, num_regions=num_regions)
+
+    start = time.perf_counter()
+    landmarks = LandmarkIndex.build(graph, num_landmarks, selection="avoid", seed=seed)
+    landmarks_time = time.perf_counter() - start
+    tables = {id(landmarks.forward): landmarks.forward, id(landmarks.backward): landmarks.backward}
+    landmarks_kb = sum(table.nbytes for table in tables.values()) / 1024
+
+    algorithms = {
+        "dijkstra": lambda s, t: dijkstra(graph, s, t),
+        "astar": lambda s, t: astar(graph, s, t),
+        "arc_flags": lambda s, t: dijkstra(graph, s, t, arc_flags=flags),
+        "arc_flags_astar": lambda s, t: astar(graph, s, t, arc_flags=flags),
+        "alt": lambda s, t: astar(graph, s, t, heuristic=landmarks),
+    }
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_pairs)]
+
+    stats = {}
+    expected = [dijkstra(graph, s, t).cost for s, t in pairs]
+    for algo, run in algorithms.items():
+        visited = time_ms = 0.0
+        for (source, target), cost in zip(pairs, expected):
+            result = run(source, target)
+            # Chiffres publiés seulement pour des chemins exacts
+            assert result.cost == cost or abs(result.cost - cost) < 1e-6 * max(1.0, cost), \
+                f"{algo} : coût {result.cost} au lieu de {cost} ({source} -> {target})"
+            visited += result.visited_nodes
+            time_ms += result.execution_time * 1000
+        stats[algo] = (visited / num_pairs, time_ms / num_pairs)
+
+    print(f"\n{name} : {graph.num_vertices()} sommets")
+    print(f"  arc-flags : {flags.num_regions} régions, prétraitement {flags.build_time:.2f} s, "
+          f"{flags.nbytes() / 1024:.0f} Ko")
+    print(f"  ALT       : {landmarks.num_landmarks()} repères, prétraitement {landmarks_time:.2f} s, "
+          f"{landmarks_kb:.0f} Ko")
+    print(f"{'Algorithme':<20} {'Sommets explorés':<18} {'Temps moyen (ms)':<18} {'Gain vs Dijkstra':<15}")
+    print("-"*72)
+    t_dijkstra = stats["dijkstra"][1]
+    for algo, (visited, time_ms) in stats.items():
+        speedup = f"{t_dijkstra / time_ms:.1f}x"
+        print(f"{algo:<20} {visited:<18.0f} {time_ms:<18.2f} {speedup:<15}")
+    print("-"*72)
+    return stats
+
+
+def benchmark_arc_flags():
+    """Lance le benchmark sur les graphes du benchmark ALT."""
+    print("\n" + "="*72)
+    print(" BENCHMARK : ARC-FLAGS CONTRE REPÈRES (ALT)")
+    print("="*72)
+    random.seed(42)
+
+    results = {}
+    city = generate_clustered_urban_graph(num_clusters=20, vertices_per_cluster=150,
+                                          cluster_radius=300, world_size=8000)
+    quarters = {v: vertex.label.split('_')[0] for v, vertex in city.vertices.items()}
+    results["clustered"] = benchmark_graph(
+        "Ville en quartiers (20 × 150 sommets), régions = quartiers", city, regions=quarters
+    )
+    results["clustered_geometric"] = benchmark_graph(
+        "Ville en quartiers, régions géométriques", city
+    )
+
+    grid = generate_grid_graph(100, 100)
+    add_traffic_congestion(grid, congestion_factor=4.0, affected_ratio=0.5)
+    results["grid_traffic"] = benchmark_graph("Grille 100×100 congestionnée (×4 sur 50 %)", grid)
+
+    results["urban"] = benchmark_graph(
+        "Graphe urbain aléatoire",
+        generate_random_urban_graph(num_vertices=3000, avg_degree=4, width=10000,
+                                    height=10000, min_distance=20)
+    )
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_arc_flags()
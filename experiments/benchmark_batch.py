@@ -0,0 +1,74 @@
+"""
+Benchmark : itinéraires par lots
+
+Compare une boucle Python sur dijkstra et astar à route_many, dans le
+processus courant puis avec un pool de 2 et 4 processus. Le graphe est
+projeté en mémoire par chaque processus (voir storage.py) : seules les
+paires de sommets et les résultats traversent les processus.
+
+Le gain du pool est borné par le nombre de cœurs disponibles.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import math
+import random
+import time
+from src.algorithms import dijkstra, astar
+from src.batch import route_many
+from src.generators import generate_grid_graph, generate_random_urban_graph
+
+
+def benchmark_graph(name, graph, num_queries=2000, workers=(1, 2, 4), seed=42):
+    """Débit (requêtes par seconde) de chaque mode sur des requêtes aléatoires."""
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_queries)]
+
+    print(f"\n{name} : {graph.num_vertices()} sommets, {num_queries} requêtes")
+    print(f"{'Algorithme':<12} {'Mode':<22} {'Temps (s)':<12} {'Requêtes/s':<12} {'Gain':<8}")
+    print("-"*70)
+    results = {}
+    for algorithm, search in (("dijkstra", dijkstra), ("astar", astar)):
+        start = time.perf_counter()
+        expected = [search(graph, s, t).cost for s, t in pairs]
+        loop_time = time.perf_counter() - start
+        print(f"{algorithm:<12} {'boucle':<22} {loop_time:<12.2f} "
+              f"{num_queries / loop_time:<12.0f} {1.0:<8.2f}")
+        timings = {}
+        for count in workers:
+            start = time.perf_counter()
+            costs = [result.cost for _, result in
+                     route_many(graph, pairs, algorithm=algorithm, workers=count)]
+            timings[count] = time.perf_counter() - start
+            assert all(math.isclose(a, b) or a == b for a, b in zip(costs, expected))
+            mode = "route_many" if count == 1 else f"route_many, {count} proc."
+            print(f"{algorithm:<12} {mode:<22} {timings[count]:<12.2f} "
+                  f"{num_queries / timings[count]:<12.0f} {loop_time / timings[count]:<8.2f}")
+        results[algorithm] = (loop_time, timings)
+    print("-"*70)
+    return results
+
+
+def benchmark_batch():
+    """Lance le benchmark sur deux graphes."""
+    print("\n" + "="*70)
+    print(" BENCHMARK : ITINÉRAIRES PAR LOTS")
+    print("="*70)
+    print(f"Cœurs disponibles : {os.cpu_count()}")
+    random.seed(42)
+
+    results = {}
+    results["grid"] = benchmark_graph("Grille 60×60", generate_grid_graph(60, 60))
+    results["urban"] = benchmark_graph(
+        "Graphe urbain aléatoire",
+        generate_random_urban_graph(num_vertices=5000, avg_degree=4, width=10000,
+                                    height=10000, min_distance=20)
+    )
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_batch()
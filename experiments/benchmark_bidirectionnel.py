@@ -0,0 +1,128 @@
+"""
+Benchmark : recherches bidirectionnelles contre recherches simples
+
+Sur une grille, une recherche Dijkstra vers une cible à distance d explore
+un disque de rayon d ; les deux recherches du Dijkstra bidirectionnel
+explorent chacune un disque de rayon d/2, soit environ deux fois moins de
+sommets au total. L'A* bidirectionnel oriente en plus chaque recherche vers
+l'autre extrémité (potentiels moyennés).
+
+Le benchmark tire des paires (source, cible) au hasard, vérifie que les
+coûts sont identiques et compare sommets explorés et temps moyens sur :
+- une grille non-orientée
+- la même grille orientée (poids asymétriques : recherche arrière sur le
+  graphe transposé)
+- un réseau géographique aléatoire (lon/lat, poids en km, heuristique Haversine)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import numpy as np
+from src.graph import Graph
+from src.algorithms import dijkstra, astar, bidirectional_dijkstra, bidirectional_astar
+from src.generators import generate_grid_graph
+from src.workspace import SearchWorkspace
+
+
+ALGORITHMS = {
+    "dijkstra": dijkstra,
+    "bidirectional_dijkstra": bidirectional_dijkstra,
+    "astar": astar,
+    "bidirectional_astar": bidirectional_astar,
+}
+
+
+def benchmark_pairs(graph, pairs):
+    """Moyennes (sommets explorés, temps ms) de chaque algorithme sur les paires."""
+    workspace = SearchWorkspace()
+    totals = {name: [0, 0.0] for name in ALGORITHMS}
+    for source, target in pairs:
+        reference = None
+        for name, algorithm in ALGORITHMS.items():
+            result = algorithm(graph, source, target, workspace=workspace)
+            if reference is None:
+                reference = result
+            assert result.success == reference.success
+            assert not result.success or abs(result.cost - reference.cost) < 1e-9
+            totals[name][0] += result.visited_nodes
+            totals[name][1] += result.execution_time * 1000
+    return {name: (visited / len(pairs), time_ms / len(pairs))
+            for name, (visited, time_ms) in totals.items()}
+
+
+def print_results(title, stats):
+    """Affiche le tableau d'un benchmark (speedup par rapport à Dijkstra)."""
+    print(f"\n{title}")
+    print(f"{'Algorithme':<25} {'Sommets explorés':<18} {'Temps moyen (ms)':<18} {'Speedup':<10}")
+    print("-"*72)
+    t_dijk = stats["dijkstra"][1]
+    for name, (visited, time_ms) in stats.items():
+        print(f"{name:<25} {visited:<18.0f} {time_ms:<18.2f} {t_dijk / time_ms:<10.2f}")
+    print("-"*72)
+
+
+def geographic_graph(num_vertices=20000, seed=42):
+    """
+    Réseau géographique aléatoire (environ 10 km × 10 km autour de Paris) :
+    chaque sommet est relié à ses voisins d'une grille perturbée, avec un
+    détour de 0 à 40 % sur la distance Haversine.
+    """
+    rng = np.random.default_rng(seed)
+    side = int(num_vertices ** 0.5)
+    n = side * side
+    rows, cols = np.divmod(np.arange(n), side)
+    lon = 2.25 + (cols + rng.uniform(-0.3, 0.3, n)) * (0.14 / side)
+    lat = 48.81 + (rows + rng.uniform(-0.3, 0.3, n)) * (0.09 / side)
+
+    graph = Graph(directed=False)
+    graph.is_geographic = True
+    graph.add_vertices_from(np.arange(n), lon, lat)
+    right = np.flatnonzero(cols < side - 1)
+    down = np.flatnonzero(rows < side - 1)
+    sources = np.concatenate([right, down])
+    targets = np.concatenate([right + 1, down + side])
+    keep = rng.random(len(sources)) < 0.85   # quelques rues manquantes
+    sources, targets = sources[keep], targets[keep]
+    lengths = graph.straight_line_distances(sources, targets, metric='haversine')
+    graph.add_edges_from(sources, targets, lengths * rng.uniform(1.0, 1.4, len(lengths)))
+    return graph
+
+
+def benchmark_bidirectional(rows=200, cols=200, num_pairs=50, seed=42):
+    """Lance le benchmark sur les trois graphes."""
+    print("\n" + "="*72)
+    print(" BENCHMARK : RECHERCHES BIDIRECTIONNELLES")
+    print("="*72)
+    rng = random.Random(seed)
+
+    grid = generate_grid_graph(rows, cols)
+    n = grid.num_vertices()
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_pairs)]
+    stats_grid = benchmark_pairs(grid, pairs)
+    print_results(f"Grille {rows}×{cols} (non-orientée), {num_pairs} paires", stats_grid)
+
+    # Même grille, orientée : chaque sens de circulation a son propre temps de parcours
+    directed = Graph(directed=True)
+    xs, ys = grid.coordinate_arrays()
+    directed.add_vertices_from(grid.row_ids(), xs, ys)
+    sources, targets, weights = grid.freeze().edge_arrays()
+    factors = [rng.uniform(1.0, 3.0) for _ in range(len(weights))]
+    directed.add_edges_from(sources, targets, weights * factors)
+    stats_directed = benchmark_pairs(directed, pairs)
+    print_results(f"Grille {rows}×{cols} orientée (poids asymétriques), {num_pairs} paires",
+                  stats_directed)
+
+    city = geographic_graph(rows * cols, seed)
+    n = city.num_vertices()
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_pairs)]
+    stats_city = benchmark_pairs(city, pairs)
+    print_results(f"Réseau géographique ({n} sommets, km), {num_pairs} paires", stats_city)
+
+    return {"grid": stats_grid, "grid_directed": stats_directed, "geographic": stats_city}
+
+
+if __name__ == "__main__":
+    benchmark_bidirectional()
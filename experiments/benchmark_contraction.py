@@ -0,0 +1,100 @@
+"""
+Benchmark : hiérarchies de contraction contre Dijkstra et A*
+
+Le prétraitement (contraction de tous les sommets) est coûteux et se fait
+hors ligne : la hiérarchie est sauvegardée sur disque puis rechargée au
+démarrage du service. Ensuite, chaque requête ne visite que quelques
+centaines de sommets, quelle que soit la distance entre source et cible.
+
+Pour chaque graphe : temps de prétraitement, nombre de raccourcis, taille
+du fichier, puis sommets explorés et temps moyens (requête complète avec
+dépliage du chemin, et coût seul) sur les mêmes paires aléatoires.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import tempfile
+import time
+from src.algorithms import dijkstra, astar
+from src.contraction import ContractionHierarchy
+from src.generators import (
+    generate_grid_graph,
+    generate_random_urban_graph,
+    add_traffic_congestion
+)
+
+
+def benchmark_graph(name, graph, num_pairs=100, seed=42):
+    """Prétraite le graphe puis compare les requêtes sur num_pairs paires."""
+    start = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    build_time = time.perf_counter() - start
+
+    # Aller-retour sur disque
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.ch")
+        ch.save(path)
+        size_kb = os.path.getsize(path) / 1024
+        ch = ContractionHierarchy.load(path)
+
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_pairs)]
+
+    stats = {}
+    for algo, run in (("dijkstra", lambda s, t: dijkstra(graph, s, t)),
+                      ("astar", lambda s, t: astar(graph, s, t)),
+                      ("ch", ch.query)):
+        visited = time_ms = 0.0
+        for source, target in pairs:
+            result = run(source, target)
+            visited += result.visited_nodes
+            time_ms += result.execution_time * 1000
+        stats[algo] = (visited / num_pairs, time_ms / num_pairs)
+
+    # Coût seul, sans dépliage du chemin (vérifié contre Dijkstra)
+    distance_ms = 0.0
+    for source, target in pairs:
+        start = time.perf_counter()
+        cost = ch.distance(source, target)
+        distance_ms += (time.perf_counter() - start) * 1000
+        expected = dijkstra(graph, source, target).cost
+        assert cost == expected or abs(cost - expected) < 1e-9
+    stats["ch_distance"] = (stats["ch"][0], distance_ms / num_pairs)
+
+    print(f"\n{name} : {graph.num_vertices()} sommets, {ch.num_shortcuts} raccourcis, "
+          f"prétraitement {build_time:.1f} s, fichier {size_kb:.0f} Ko")
+    print(f"{'Algorithme':<15} {'Sommets explorés':<18} {'Temps moyen (ms)':<18} {'Speedup':<10}")
+    print("-"*64)
+    t_dijk = stats["dijkstra"][1]
+    for algo, (visited, time_ms) in stats.items():
+        print(f"{algo:<15} {visited:<18.0f} {time_ms:<18.3f} {t_dijk / time_ms:<10.1f}")
+    print("-"*64)
+    return stats
+
+
+def benchmark_contraction():
+    """Lance le benchmark sur une grille congestionnée et un graphe urbain."""
+    print("\n" + "="*64)
+    print(" BENCHMARK : HIÉRARCHIES DE CONTRACTION")
+    print("="*64)
+    random.seed(42)
+
+    results = {}
+    grid = generate_grid_graph(60, 60)
+    add_traffic_congestion(grid, congestion_factor=3.0, affected_ratio=0.3)
+    results["grid_traffic"] = benchmark_graph("Grille 60×60 congestionnée", grid)
+
+    results["urban"] = benchmark_graph(
+        "Graphe urbain aléatoire",
+        generate_random_urban_graph(num_vertices=5000, avg_degree=4, width=10000,
+                                    height=10000, min_distance=20)
+    )
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_contraction()
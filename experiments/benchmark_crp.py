@@ -0,0 +1,96 @@
+"""
+Benchmark : partition personnalisable (CRP) sous trafic changeant
+
+Le trafic modifie les poids en continu. Une hiérarchie de contraction
+doit être reconstruite entièrement à chaque changement ; avec CRP, seule
+la personnalisation (cliques des cellules) est refaite, la partition est
+calculée une fois pour toutes.
+
+Pour chaque graphe : temps de partition, temps de reconstruction d'une
+hiérarchie de contraction, puis plusieurs « minutes » de trafic : temps de
+personnalisation, vérification des coûts contre Dijkstra, sommets explorés
+et temps moyens des requêtes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+from src.algorithms import dijkstra
+from src.contraction import ContractionHierarchy
+from src.crp import CRPOverlay
+from src.generators import (
+    generate_grid_graph,
+    generate_clustered_urban_graph,
+    add_traffic_congestion
+)
+
+
+def benchmark_graph(name, graph, num_updates=3, num_pairs=30, seed=42):
+    """Partitionne le graphe puis le repersonnalise après chaque mise à jour du trafic."""
+    start = time.perf_counter()
+    overlay = CRPOverlay.build(graph)
+    partition_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ContractionHierarchy.build(graph)
+    ch_time = time.perf_counter() - start
+
+    print(f"\n{name} : {graph.num_vertices()} sommets, cellules {overlay.num_cells}")
+    print(f"Partition : {partition_time:.2f} s (une fois) | "
+          f"reconstruction hiérarchie de contraction : {ch_time:.1f} s")
+    print(f"{'Mise à jour':<12} {'Personnalisation (s)':<22} {'CRP (ms)':<10} "
+          f"{'Dijkstra (ms)':<14} {'Sommets CRP / Dijkstra':<22}")
+    print("-"*82)
+
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    stats = []
+    for update in range(num_updates + 1):
+        if update:
+            add_traffic_congestion(graph, congestion_factor=rng.uniform(1.5, 4.0),
+                                   affected_ratio=0.2)
+        start = time.perf_counter()
+        metric = overlay.customize(graph)
+        customize_time = time.perf_counter() - start
+
+        crp_ms = dijkstra_ms = crp_visited = dijkstra_visited = 0.0
+        for _ in range(num_pairs):
+            source, target = rng.choice(vertices), rng.choice(vertices)
+            result = metric.query(source, target)
+            expected = dijkstra(graph, source, target)
+            assert result.success == expected.success
+            assert not result.success or abs(result.cost - expected.cost) < 1e-9
+            crp_ms += result.execution_time * 1000
+            dijkstra_ms += expected.execution_time * 1000
+            crp_visited += result.visited_nodes
+            dijkstra_visited += expected.visited_nodes
+        stats.append((customize_time, crp_ms / num_pairs, dijkstra_ms / num_pairs))
+        visited = f"{crp_visited / num_pairs:.0f} / {dijkstra_visited / num_pairs:.0f}"
+        print(f"{update:<12} {customize_time:<22.2f} {crp_ms / num_pairs:<10.2f} "
+              f"{dijkstra_ms / num_pairs:<14.2f} {visited:<22}")
+    print("-"*82)
+    return {"partition": partition_time, "ch_build": ch_time, "updates": stats}
+
+
+def benchmark_crp():
+    """Lance le benchmark sur une ville en quartiers et une grille."""
+    print("\n" + "="*82)
+    print(" BENCHMARK : PARTITION PERSONNALISABLE (CRP) SOUS TRAFIC")
+    print("="*82)
+    random.seed(42)
+
+    results = {}
+    results["clustered"] = benchmark_graph(
+        "Ville en quartiers (40 × 250 sommets)",
+        generate_clustered_urban_graph(num_clusters=40, vertices_per_cluster=250,
+                                       cluster_radius=300, world_size=15000)
+    )
+    results["grid"] = benchmark_graph("Grille 100×100", generate_grid_graph(100, 100))
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_crp()
@@ -0,0 +1,86 @@
+"""
+Benchmark : étiquettes de hubs pour les requêtes de distance seule
+
+Beaucoup d'appels n'utilisent que dijkstra(graph, s, t).cost (estimation
+du temps de trajet). Les étiquettes de hubs répondent à ces requêtes par
+une fusion de deux listes triées, sans recherche dans le graphe.
+
+Pour chaque graphe : temps de construction (hiérarchie de contraction
+puis étiquettes), rapport de taille des étiquettes, taille du fichier, puis
+temps moyen par requête de distance comparé à Dijkstra et à la hiérarchie
+de contraction.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import tempfile
+import time
+from src.algorithms import dijkstra
+from src.contraction import ContractionHierarchy
+from src.hub_labels import HubLabels
+from src.generators import generate_grid_graph, generate_random_urban_graph
+
+
+def benchmark_graph(name, graph, num_pairs=200, seed=42):
+    """Construit les étiquettes puis compare les requêtes de distance."""
+    start = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    ch_time = time.perf_counter() - start
+    start = time.perf_counter()
+    labels = HubLabels.from_contraction(ch)
+    label_time = time.perf_counter() - start
+
+    # Aller-retour sur disque
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "graph.hl")
+        labels.save(path)
+        size_kb = os.path.getsize(path) / 1024
+        labels = HubLabels.load(path)
+
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_pairs)]
+    expected = [dijkstra(graph, s, t).cost for s, t in pairs]
+
+    timings = {}
+    for algo, run in (("dijkstra", lambda s, t: dijkstra(graph, s, t).cost),
+                      ("ch", ch.distance),
+                      ("hub_labels", labels.distance)):
+        start = time.perf_counter()
+        costs = [run(s, t) for s, t in pairs]
+        timings[algo] = (time.perf_counter() - start) / num_pairs * 1e6
+        assert all(c == e or abs(c - e) < 1e-9 for c, e in zip(costs, expected))
+
+    print(f"\n{name} : {graph.num_vertices()} sommets, hiérarchie {ch_time:.1f} s, "
+          f"étiquettes {label_time:.1f} s, fichier {size_kb:.0f} Ko")
+    print(labels.summary())
+    print(f"{'Algorithme':<15} {'Temps par requête (µs)':<24} {'Speedup':<10}")
+    print("-"*50)
+    for algo, micros in timings.items():
+        print(f"{algo:<15} {micros:<24.1f} {timings['dijkstra'] / micros:<10.0f}")
+    print("-"*50)
+    return timings
+
+
+def benchmark_hub_labels():
+    """Lance le benchmark sur un graphe urbain et une grille."""
+    print("\n" + "="*50)
+    print(" BENCHMARK : ÉTIQUETTES DE HUBS")
+    print("="*50)
+    random.seed(42)
+
+    results = {}
+    results["urban"] = benchmark_graph(
+        "Graphe urbain aléatoire",
+        generate_random_urban_graph(num_vertices=5000, avg_degree=4, width=10000,
+                                    height=10000, min_distance=20)
+    )
+    results["grid"] = benchmark_graph("Grille 60×60", generate_grid_graph(60, 60))
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_hub_labels()
@@ -0,0 +1,87 @@
+"""
+Benchmark : files de priorité pour Dijkstra et A*
+
+heapq (intégré, doublons paresseux) contre les files de
+priority_queues.py : tas binaire instrumenté, file de Dial (un seau par
+valeur de clé) et tas radix. Les files à seaux demandent des clés entières
+monotones : chaque poids doit être un multiple de resolution (1 par
+défaut), sinon la recherche lève ValueError. La grille a des poids
+entiers ; les longueurs du graphe urbain sont arrondies au mètre avant
+le benchmark, ce qui rend toutes les files exactes sur ce graphe.
+
+Pour chaque graphe et chaque file : temps moyen, entrées sorties, taille
+maximale de la file, et écart maximal au coût exact.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+from src.algorithms import dijkstra, astar
+from src.generators import generate_grid_graph, generate_random_urban_graph
+
+
+QUEUES = (None, "heap", "dial", "radix")
+
+
+def round_weights(graph):
+    """Arrondit chaque arc au mètre (clés entières des files à seaux)."""
+    for edge in graph.get_all_edges():
+        edge.weight = float(round(edge.weight))
+    return graph
+
+
+def benchmark_graph(name, graph, num_pairs=50, seed=42):
+    """Compare les files sur num_pairs requêtes Dijkstra et A*."""
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_pairs)]
+    exact = {pair: dijkstra(graph, *pair).cost for pair in pairs}
+
+    print(f"\n{name} : {graph.num_vertices()} sommets")
+    print(f"{'Algorithme':<10} {'File':<8} {'Temps moyen (ms)':<18} {'Sorties':<10} "
+          f"{'Taille max':<12} {'Écart max':<10}")
+    print("-"*72)
+    stats = {}
+    for algo, run in (("dijkstra", dijkstra), ("astar", astar)):
+        for queue in QUEUES:
+            time_ms = pops = max_size = error = 0.0
+            for pair in pairs:
+                result = run(graph, *pair, queue=queue)
+                time_ms += result.execution_time * 1000
+                if result.queue_stats is not None:
+                    pops += result.queue_stats["pops"]
+                    max_size = max(max_size, result.queue_stats["max_size"])
+                if result.success:
+                    error = max(error, result.cost - exact[pair])
+            label = queue or "heapq"
+            stats[(algo, label)] = (time_ms / num_pairs, pops / num_pairs, max_size, error)
+            pops_text = f"{pops / num_pairs:.0f}" if queue else "-"
+            size_text = f"{max_size:.0f}" if queue else "-"
+            print(f"{algo:<10} {label:<8} {time_ms / num_pairs:<18.2f} {pops_text:<10} "
+                  f"{size_text:<12} {error:<10.2f}")
+    print("-"*72)
+    return stats
+
+
+def benchmark_queues():
+    """Lance le benchmark sur une grille et un graphe urbain."""
+    print("\n" + "="*72)
+    print(" BENCHMARK : FILES DE PRIORITÉ")
+    print("="*72)
+    random.seed(42)
+
+    results = {}
+    results["grid"] = benchmark_graph("Grille 100×100 (poids entiers)", generate_grid_graph(100, 100))
+    results["urban"] = benchmark_graph(
+        "Graphe urbain aléatoire (poids arrondis au mètre)",
+        round_weights(generate_random_urban_graph(num_vertices=10000, avg_degree=4,
+                                                  width=20000, height=20000,
+                                                  min_distance=20))
+    )
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_queues()
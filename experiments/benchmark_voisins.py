@@ -0,0 +1,95 @@
+"""
+Benchmark : coût du parcours des voisins pendant une requête
+
+Compare, sur une grille 300×300, l'ancienne API get_neighbors() (une liste
+de tuples construite à chaque appel) et iter_neighbors() (itérateur lisant
+directement les listes stockées du graphe).
+
+Pour chaque sommet exploré par une requête Dijkstra, get_neighbors() alloue
+une liste plus un tuple par voisin ; iter_neighbors() n'alloue qu'un objet
+itérateur (zip réutilise son tuple de sortie).
+
+Les allocations sont mesurées avec tracemalloc : pour chaque appel, pic de
+mémoire au-dessus du niveau de départ pendant l'appel et le parcours de
+son résultat (rien n'étant libéré avant la fin, c'est ce que l'appel alloue).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import tracemalloc
+from src.algorithms import dijkstra
+from src.generators import generate_grid_graph
+
+
+def time_neighbor_scan(graph, order, method, num_runs=5):
+    """Temps moyen (ms) d'un parcours des voisins de tous les sommets de order."""
+    times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        for v in order:
+            for neighbor, weight in method(v):
+                pass
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times)
+
+
+def measure_allocations(order, method):
+    """Octets alloués par les appels à method sur order (somme des pics, tracemalloc)."""
+    tracemalloc.start()
+    total = 0
+    for v in order:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for neighbor, weight in method(v):
+            pass
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total
+
+
+def benchmark_neighbors(rows=300, cols=300):
+    """Mesure les octets alloués et le temps économisés par requête."""
+    print("\n" + "="*70)
+    print(f" BENCHMARK : PARCOURS DES VOISINS (grille {rows}×{cols})")
+    print("="*70)
+
+    graph = generate_grid_graph(rows, cols)
+    source, target = 0, graph.num_vertices() - 1
+
+    result = dijkstra(graph, source, target)
+    expanded = list(result.explored_nodes)
+
+    # Allocations par requête : un appel par sommet exploré
+    calls = len(expanded)
+    allocs_list = measure_allocations(expanded, graph.get_neighbors)
+    allocs_iter = measure_allocations(expanded, graph.iter_neighbors)
+
+    t_list = time_neighbor_scan(graph, expanded, graph.get_neighbors)
+    t_iter = time_neighbor_scan(graph, expanded, graph.iter_neighbors)
+
+    print(f"\nRequête {source} → {target} : {calls} sommets explorés, "
+          f"temps total {result.execution_time * 1000:.1f} ms")
+    print(f"\n{'API':<20} {'Octets alloués':<15} {'Parcours (ms)':<15}")
+    print("-"*50)
+    print(f"{'get_neighbors()':<20} {allocs_list:<15} {t_list:<15.1f}")
+    print(f"{'iter_neighbors()':<20} {allocs_iter:<15} {t_iter:<15.1f}")
+    print("-"*50)
+    print(f"\nOctets économisés par requête : {allocs_list - allocs_iter} "
+          f"({(1 - allocs_iter / allocs_list) * 100:.0f}%)")
+    if t_list > 0:
+        print(f"Gain de temps sur le parcours : {(1 - t_iter / t_list) * 100:.0f}%")
+
+    return {
+        "expanded": calls,
+        "bytes_get_neighbors": allocs_list,
+        "bytes_iter_neighbors": allocs_iter,
+        "time_get_neighbors_ms": t_list,
+        "time_iter_neighbors_ms": t_iter
+    }
+
+
+if __name__ == "__main__":
+    benchmark_neighbors()
@@ -1,7 +1,7 @@
 """
-Expérience : Comparaison entre Dijkstra, A* et Bellman-Ford
+Expérience : Comparaison entre Dijkstra, A* (uni- et bidirectionnels) et Bellman-Ford
 
-Compare les trois algorithmes sur différents types de graphes urbains
+Compare les cinq algorithmes sur différents types de graphes urbains
 et analyse leurs performances relatives.
 """
 
@@ -199,42 +199,33 @@ def experiment_all():
         "Ville Clustérisée (150 sommets)": results3
     }
     
-    print(f"\n{'Graphe':<35} {'Dijkstra (ms)':<15} {'A* (ms)':<15} {'Bellman-Ford (ms)':<20} {'Speedup A*':<12}")
-    print("-"*100)
+    print(f"\n{'Graphe':<35} {'Dijkstra (ms)':<15} {'Bidir. (ms)':<15} {'A* (ms)':<15} {'A* bidir. (ms)':<15} {'Bellman-Ford (ms)':<20} {'Speedup A*':<12}")
+    print("-"*130)
     
     for name, results in all_results.items():
-        if results['dijkstra'].success and results['astar'].success and results['bellman_ford'].success:
+        if all(result.success for result in results.values()):
             t_dijk = results['dijkstra'].execution_time * 1000
+            t_bidir = results['bidirectional_dijkstra'].execution_time * 1000
             t_astar = results['astar'].execution_time * 1000
+            t_bidir_astar = results['bidirectional_astar'].execution_time * 1000
             t_bf = results['bellman_ford'].execution_time * 1000
             speedup = t_dijk / t_astar if t_astar > 0 else float('inf')
             
-            print(f"{name:<35} {t_dijk:<15.2f} {t_astar:<15.2f} {t_bf:<20.2f} {speedup:<12.2f}x")
+            print(f"{name:<35} {t_dijk:<15.2f} {t_bidir:<15.2f} {t_astar:<15.2f} {t_bidir_astar:<15.2f} {t_bf:<20.2f} {speedup:<12.2f}x")
     
-    print("-"*100)
+    print("-"*130)
     
     # Sauvegarder résultats
     export_data = {}
     for name, results in all_results.items():
         export_data[name] = {
-            "dijkstra": {
-                "cost": results['dijkstra'].cost,
-                "visited": results['dijkstra'].visited_nodes,
-                "time_ms": results['dijkstra'].execution_time * 1000,
-                "success": results['dijkstra'].success
-            },
-            "astar": {
-                "cost": results['astar'].cost,
-                "visited": results['astar'].visited_nodes,
-                "time_ms": results['astar'].execution_time * 1000,
-                "success": results['astar'].success
-            },
-            "bellman_ford": {
-                "cost": results['bellman_ford'].cost,
-                "visited": results['bellman_ford'].visited_nodes,
-                "time_ms": results['bellman_ford'].execution_time * 1000,
-                "success": results['bellman_ford'].success
+            algo: {
+                "cost": result.cost,
+                "visited": result.visited_nodes,
+                "time_ms": result.execution_time * 1000,
+                "success": result.success
             }
+            for algo, result in results.items()
         }
     
     export_results_to_json(export_data, "figures/results_comparaison.json")
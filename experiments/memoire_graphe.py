@@ -0,0 +1,46 @@
+"""
+Expérience : Empreinte mémoire des représentations de graphe
+
+Compare, sur generate_realistic_city("large"), la mémoire retenue par :
+- Graph        : objets Vertex / Edge (deux Edge par route non-orientée)
+- CompactGraph : colonnes typées, vues Vertex / Edge créées à la demande
+- CSRGraph     : tableaux NumPy figés (lecture seule, pour les requêtes)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.generators import generate_realistic_city
+from src.compact import CompactGraph
+from src.utils import measure_memory
+import random
+
+
+def experiment_memory(size="large"):
+    """Mesure la mémoire de chaque représentation."""
+    print("\n" + "="*70)
+    print(f" EXPÉRIENCE : EMPREINTE MÉMOIRE (ville '{size}')")
+    print("="*70)
+
+    random.seed(42)
+    graph, mem_graph = measure_memory(generate_realistic_city, size)
+    compact, mem_compact = measure_memory(CompactGraph.from_graph, graph)
+    csr, mem_csr = measure_memory(graph.freeze)
+
+    n = graph.num_vertices()
+    m = graph.num_edges_count()
+    print(f"\nGraphe : {n} sommets, {m} arêtes")
+
+    print(f"\n{'Représentation':<15} {'Mémoire (Ko)':<15} {'Octets/sommet':<15} {'Ratio':<10}")
+    print("-"*55)
+    rows = [("Graph", mem_graph), ("CompactGraph", mem_compact), ("CSRGraph", mem_csr)]
+    for name, mem in rows:
+        print(f"{name:<15} {mem / 1024:<15.1f} {mem / n:<15.1f} {mem / mem_graph:<10.2f}")
+    print("-"*55)
+
+    return {name: mem for name, mem in rows}
+
+
+if __name__ == "__main__":
+    experiment_memory()
@@ -10,7 +10,23 @@ __version__ = "1.0.0"
 __author__ = "Équipe ProjetS5"
 
 from .graph import Graph, Vertex, Edge
-from .algorithms import dijkstra, astar
+from .compact import CompactGraph
+from .csr import CSRGraph
+from .algorithms import (
+    dijkstra, astar, bidirectional_dijkstra, bidirectional_astar, ShortestPathTree,
+    iter_dijkstra, iter_astar, SearchStream
+)
+from .workspace import SearchWorkspace
+from .cache import ShortestPathTreeCache
+from .landmarks import LandmarkIndex
+from .contraction import ContractionHierarchy
+from .crp import CRPOverlay
+from .hub_labels import HubLabels
+from .arc_flags import ArcFlags
+from .matrix import distance_matrix
+from .all_pairs import AllPairsTable
+from .batch import route_many
+from .storage import save_graph_binary, open_graph_binary, load_graph_binary
 from .generators import generate_grid_graph, generate_random_urban_graph
 from .visualizer import plot_graph, plot_path, plot_comparison
 
@@ -18,8 +34,29 @@ __all__ = [
     "Graph",
     "Vertex",
     "Edge",
+    "CompactGraph",
+    "CSRGraph",
     "dijkstra",
     "astar",
+    "bidirectional_dijkstra",
+    "bidirectional_astar",
+    "ShortestPathTree",
+    "iter_dijkstra",
+    "iter_astar",
+    "SearchStream",
+    "SearchWorkspace",
+    "ShortestPathTreeCache",
+    "LandmarkIndex",
+    "ContractionHierarchy",
+    "CRPOverlay",
+    "HubLabels",
+    "ArcFlags",
+    "distance_matrix",
+    "AllPairsTable",
+    "route_many",
+    "save_graph_binary",
+    "open_graph_binary",
+    "load_graph_binary",
     "generate_grid_graph",
     "generate_random_urban_graph",
     "plot_graph",
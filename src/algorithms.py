@@ -3,18 +3,39 @@ Module d'algorithmes de plus court chemin.
 
 Implémente :
 - Dijkstra : Algorithme classique du plus court chemin
+- Dijkstra bidirectionnel : recherches simultanées depuis la source et la cible
 - A* : Algorithme heuristique guidé par distance euclidienne
+- A* bidirectionnel : recherches simultanées guidées par des potentiels moyennés
+- Bellman-Ford (passes vectorisées, arrêt anticipé) et SPFA : poids négatifs
+
+iter_dijkstra et iter_astar exécutent les mêmes recherches pas à pas : un
+événement (sommet, distance, parent) par sommet fermé, pour animer le front
+de recherche ou l'arrêter avant la fin (voir SearchStream).
+
+Sans cible, dijkstra retourne l'arbre des plus courts chemins de la source
+(ShortestPathTree : distances et parents de toutes les lignes), coupé
+éventuellement à un rayon ou dès qu'un ensemble de cibles est atteint.
+
+Les algorithmes acceptent un Graph ou un CSRGraph (voir Graph.freeze()).
+La recherche travaille sur les lignes (0..n-1) et lit les voisins
+directement dans les listes ou tableaux stockés, sans liste intermédiaire.
 
 Complexité :
 - Dijkstra : O((n + m) log n) avec tas binaire
 - A* : O((n + m) log n) pire cas, souvent meilleur en pratique
 """
 
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, Iterable, List, Tuple, Optional, Callable, Set
+from collections import deque
 import heapq
 import math
+import sys
 import time
+import numpy as np
 from .graph import Graph
+from .csr import CSRGraph
+from .workspace import SearchWorkspace
+from .priority_queues import BinaryHeap, make_queue
 
 
 
@@ -30,6 +51,8 @@ class PathResult:
         relaxed_edges: Nombre d'arêtes relaxées
         execution_time: Temps d'exécution (secondes)
         success: True si un chemin a été trouvé
+        queue_stats: Statistiques de la file de priorité (option queue de
+            dijkstra et astar, voir priority_queues.py), sinon None
     """
     
     def __init__(
@@ -49,6 +72,7 @@ class PathResult:
         self.relaxed_edges = relaxed_edges
         self.execution_time = execution_time
         self.success = execution_time >= 0 and success  # Petit fix pour garder success
+        self.queue_stats: Optional[Dict[str, int]] = None
     
     def __repr__(self) -> str:
         if self.success:
@@ -59,24 +83,202 @@ class PathResult:
         return "PathResult(no path found)"
 
 
+class ShortestPathTree(PathResult):
+    """
+    Arbre des plus courts chemins depuis une source (dijkstra sans cible).
+    
+    Attributs (en plus de ceux de PathResult, sans chemin ni coût):
+        graph: Graphe de la recherche (correspondance ID <-> ligne)
+        source: ID de la source
+        distances (np.ndarray): Distance de chaque ligne (inf si non atteinte
+            ou au-delà de la coupure)
+        parents (np.ndarray): Ligne du parent de chaque ligne (-1 pour la
+            source et les lignes non atteintes)
+    """
+    
+    def __init__(
+        self,
+        graph: Graph,
+        source: int,
+        distances: np.ndarray,
+        parents: np.ndarray,
+        visited_nodes: int = 0,
+        explored_nodes: Set[int] = None,
+        relaxed_edges: int = 0,
+        execution_time: float = 0.0
+    ):
+        super().__init__(visited_nodes=visited_nodes, explored_nodes=explored_nodes,
+                         relaxed_edges=relaxed_edges, execution_time=execution_time,
+                         success=True)
+        self.graph = graph
+        self.source = source
+        self.distances = distances
+        self.parents = parents
+    
+    def _row(self, vertex_id: int) -> int:
+        """Ligne d'un sommet (ValueError s'il n'existe pas)."""
+        if not self.graph.has_vertex(vertex_id):
+            raise ValueError(f"Sommet {vertex_id} n'existe pas")
+        return self.graph.index_of(vertex_id)
+    
+    def distance_to(self, vertex_id: int) -> float:
+        """Distance de la source au sommet (inf s'il n'est pas atteint)."""
+        return float(self.distances[self._row(vertex_id)])
+    
+    def path_to(self, vertex_id: int) -> List[int]:
+        """
+        Chemin de la source au sommet, en O(longueur du chemin).
+        
+        Returns:
+            Liste des IDs de la source au sommet ([] s'il n'est pas atteint)
+        """
+        row = self._row(vertex_id)
+        if self.distances[row] == float('inf'):
+            return []
+        ids = self.graph.row_ids()
+        parents = self.parents
+        path = []
+        while row != -1:
+            path.append(ids[row])
+            row = parents[row]
+        path.reverse()
+        return path
+    
+    def result_to(self, vertex_id: int) -> PathResult:
+        """
+        Résultat d'une requête vers vertex_id, lu dans l'arbre (sans recherche).
+        
+        Returns:
+            PathResult (statistiques de la recherche qui a construit l'arbre,
+            execution_time de la seule lecture)
+        """
+        start_time = time.perf_counter()
+        path = self.path_to(vertex_id)
+        return PathResult(
+            path=path,
+            cost=self.distance_to(vertex_id),
+            visited_nodes=self.visited_nodes,
+            explored_nodes=self.explored_nodes,
+            relaxed_edges=self.relaxed_edges,
+            execution_time=time.perf_counter() - start_time,
+            success=bool(path)
+        )
+    
+    def nbytes(self) -> int:
+        """Retourne une estimation de la mémoire occupée (octets)."""
+        return (self.distances.nbytes + self.parents.nbytes
+                + sys.getsizeof(self.explored_nodes))
+    
+    def reached(self) -> List[int]:
+        """Retourne les IDs des sommets atteints."""
+        ids = self.graph.row_ids()
+        return [ids[r] for r in np.flatnonzero(self.distances != float('inf')).tolist()]
+    
+    def as_dict(self) -> Dict[int, float]:
+        """Retourne {ID: distance} des sommets atteints (voir plot_heatmap_distances)."""
+        ids = self.graph.row_ids()
+        rows = np.flatnonzero(self.distances != float('inf'))
+        return {ids[r]: d for r, d in zip(rows.tolist(), self.distances[rows].tolist())}
+    
+    def __repr__(self) -> str:
+        return (f"ShortestPathTree(source={self.source}, "
+                f"reached={self.visited_nodes}, "
+                f"time={self.execution_time*1000:.2f}ms)")
+
+
 def dijkstra(
     graph: Graph,
     source: int,
     target: int = None,
-    return_stats: bool = True
+    return_stats: bool = True,
+    workspace: SearchWorkspace = None,
+    arc_flags=None,
+    radius: float = None,
+    targets: Iterable[int] = None,
+    queue=None,
+    resolution: float = None
 ) -> PathResult:
     """
     Algorithme de Dijkstra pour le plus court chemin.
+    
+    Args:
+        target: Sommet cible ; si None, calcule l'arbre des plus courts chemins
+        workspace: Espace de travail réutilisé entre requêtes (voir SearchWorkspace) ;
+            la requête ne coûte alors que la zone explorée, pas O(n)
+        arc_flags: Index ArcFlags (voir arc_flags.py) : seuls les arcs utiles
+            vers la région de la cible sont parcourus (cible obligatoire)
+        radius: Sans cible : n'explore que les sommets à distance <= radius
+        targets: Sans cible : s'arrête dès que tous ces sommets sont atteints
+        queue: File de priorité "heap", "dial", "radix" ou instance (voir
+            priority_queues.py) ; None : heapq intégré, sans statistiques
+        resolution: Pas des clés entières des files à seaux ("dial", "radix") :
+            chaque poids doit en être un multiple (1.0 si None) ; ignoré
+            par "heap", dont les clés sont les coûts réels
+    
+    Returns:
+        PathResult, ou ShortestPathTree si target vaut None
+    
+    Raises:
+        ValueError: si un sommet n'existe pas, ou si une file à seaux
+            rencontre un poids qui n'est pas un multiple de resolution
+    """
+    start_time = time.perf_counter()
+    
+    # Vérifications
+    if queue is not None and radius is not None:
+        raise ValueError("radius n'est pas disponible avec une file quantifiée (queue)")
+    target_rows = _check_dijkstra_args(graph, source, target, arc_flags, radius, targets)
+    
+    # Cas trivial : source = cible
+    if source == target:
+        return PathResult(
+            path=[source],
+            cost=0.0,
+            visited_nodes=1,
+            explored_nodes={source},
+            execution_time=time.perf_counter() - start_time,
+            success=True
+        )
+    
+    if queue is not None:
+        return _queue_rows(graph, source, target, None, make_queue(queue), resolution,
+                           start_time, workspace, arc_flags, target_rows)
+    return _dijkstra_rows(graph, source, target, start_time, workspace, arc_flags,
+                          radius, target_rows)
+
+
+def astar(
+    graph: Graph,
+    source: int,
+    target: int,
+    heuristic: Callable[[int, int, Graph], float] = None,
+    return_stats: bool = True,
+    workspace: SearchWorkspace = None,
+    arc_flags=None,
+    queue=None,
+    resolution: float = None
+) -> PathResult:
+    """
+    Algorithme A* (A-étoile) pour le plus court chemin.
+    
+    Args:
+        heuristic: heuristic(u, cible, graph), ou objet fournissant des bornes
+            sur les lignes (row_bounds), comme LandmarkIndex (voir landmarks.py)
+        workspace: Espace de travail réutilisé entre requêtes (voir SearchWorkspace)
+        arc_flags: Index ArcFlags : arcs inutiles vers la région de la cible ignorés
+        queue: File de priorité "heap", "dial", "radix" ou instance (voir dijkstra)
+        resolution: Pas des clés entières des files à seaux (voir dijkstra) ;
+            l'heuristique est arrondie à un multiple inférieur
     """
     start_time = time.perf_counter()
     
     # Vérifications
     if not graph.has_vertex(source):
         raise ValueError(f"Sommet source {source} n'existe pas")
-    if target is not None and not graph.has_vertex(target):
+    if not graph.has_vertex(target):
         raise ValueError(f"Sommet cible {target} n'existe pas")
     
-    # Cas trivial : source = cible
+    # Cas trivial
     if source == target:
         return PathResult(
             path=[source],
@@ -87,104 +289,240 @@ def dijkstra(
             success=True
         )
     
-    # Initialisation
-    distances: Dict[int, float] = {v: float('inf') for v in graph.vertices}
-    distances[source] = 0.0
-    parents: Dict[int, Optional[int]] = {v: None for v in graph.vertices}
-    
-    # File de priorité : (distance, vertex_id)
-    priority_queue = [(0.0, source)]
-    visited: set = set()
+    if queue is not None:
+        h = _row_heuristic(graph, heuristic, graph.index_of(source), graph.index_of(target),
+                           target)
+        return _queue_rows(graph, source, target, h, make_queue(queue), resolution,
+                           start_time, workspace, arc_flags)
+    return _astar_rows(graph, source, target, heuristic, start_time, workspace, arc_flags)
+
+
+class SearchStream:
+    """
+    Événements d'une recherche en cours (voir iter_dijkstra et iter_astar).
+
+    Itérateur de tuples (sommet, distance, parent), un par sommet fermé,
+    dans l'ordre de fermeture ; parent vaut None pour la source. Quand la
+    recherche est terminée, result contient le résultat qu'aurait retourné
+    la fonction normale.
+
+    Attributs:
+        result: PathResult ou ShortestPathTree, None tant que la recherche
+            n'est pas allée à son terme
+
+    Note:
+        La recherche avance au rythme du consommateur : l'arrêter (break,
+        close()) abandonne la recherche, sans coût. Un espace de travail
+        passé à la recherche reste occupé tant qu'elle n'est pas terminée.
+    """
+
+    def __init__(self, steps):
+        self._steps = steps
+        self.result = None
+
+    def __iter__(self) -> 'SearchStream':
+        return self
+
+    def __next__(self) -> Tuple[int, float, Optional[int]]:
+        try:
+            return next(self._steps)
+        except StopIteration as stop:
+            if stop.value is not None:
+                self.result = stop.value
+            raise
+
+    def close(self) -> None:
+        """Abandonne la recherche."""
+        self._steps.close()
+
+    def __repr__(self) -> str:
+        state = "terminée" if self.result is not None else "en cours"
+        return f"SearchStream({state})"
+
+
+def iter_dijkstra(
+    graph: Graph,
+    source: int,
+    target: int = None,
+    workspace: SearchWorkspace = None,
+    arc_flags=None,
+    radius: float = None,
+    targets: Iterable[int] = None
+) -> SearchStream:
+    """
+    Dijkstra pas à pas : un événement (sommet, distance, parent) par sommet fermé.
+
+    Même recherche que dijkstra (mêmes arguments, hors file de priorité) :
+    la fonction normale exécute ce même code sans produire d'événements.
+    Permet d'animer le front de la recherche, ou de l'arrêter avant la fin.
+
+    Returns:
+        SearchStream ; son attribut result vaut, une fois la recherche
+        terminée, ce qu'aurait retourné dijkstra
+
+    Raises:
+        ValueError: mêmes cas que dijkstra (vérifiés dès l'appel)
+    """
+    start_time = time.perf_counter()
+    target_rows = _check_dijkstra_args(graph, source, target, arc_flags, radius, targets)
+    return SearchStream(_dijkstra_steps(graph, source, target, start_time, workspace,
+                                        arc_flags, radius, target_rows, events=True))
+
+
+def iter_astar(
+    graph: Graph,
+    source: int,
+    target: int,
+    heuristic: Callable[[int, int, Graph], float] = None,
+    workspace: SearchWorkspace = None,
+    arc_flags=None
+) -> SearchStream:
+    """
+    A* pas à pas : un événement (sommet, distance, parent) par sommet fermé.
+
+    Même recherche que astar (hors file de priorité) ; la distance est le
+    coût g du sommet depuis la source.
+
+    Returns:
+        SearchStream ; son attribut result vaut, une fois la recherche
+        terminée, ce qu'aurait retourné astar
+
+    Raises:
+        ValueError: si la source ou la cible n'existe pas (vérifié dès l'appel)
+    """
+    start_time = time.perf_counter()
+    if not graph.has_vertex(source):
+        raise ValueError(f"Sommet source {source} n'existe pas")
+    if not graph.has_vertex(target):
+        raise ValueError(f"Sommet cible {target} n'existe pas")
+    return SearchStream(_astar_steps(graph, source, target, heuristic, start_time,
+                                     workspace, arc_flags, events=True))
+
+
+def _check_dijkstra_args(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    arc_flags,
+    radius: Optional[float],
+    targets: Optional[Iterable[int]]
+) -> Optional[Set[int]]:
+    """
+    Vérifie les arguments de dijkstra.
+
+    Returns:
+        Lignes de targets (None si targets vaut None)
+
+    Raises:
+        ValueError: si un sommet n'existe pas ou si les options sont incompatibles
+    """
+    if not graph.has_vertex(source):
+        raise ValueError(f"Sommet source {source} n'existe pas")
+    if target is not None and not graph.has_vertex(target):
+        raise ValueError(f"Sommet cible {target} n'existe pas")
+    if arc_flags is not None and target is None:
+        raise ValueError("Les arc-flags nécessitent un sommet cible")
+    if target is not None and (radius is not None or targets is not None):
+        raise ValueError("radius et targets ne s'appliquent qu'à l'arbre (target=None)")
+    if radius is not None and radius < 0:
+        raise ValueError("radius doit être positif ou nul")
+    if targets is None:
+        return None
+    target_rows = set()
+    for v in targets:
+        if not graph.has_vertex(v):
+            raise ValueError(f"Sommet cible {v} n'existe pas")
+        target_rows.add(graph.index_of(v))
+    return target_rows
+
+
+def _run_steps(steps):
+    """
+    Exécute une recherche sans événements et retourne son résultat.
+
+    Sans événements, le générateur ne s'interrompt jamais : un seul next()
+    le mène à son terme.
+    """
+    try:
+        next(steps)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Événement inattendu d'une recherche sans événements")
+
+
+def bidirectional_dijkstra(
+    graph: Graph,
+    source: int,
+    target: int,
+    workspace: SearchWorkspace = None
+) -> PathResult:
+    """
+    Dijkstra bidirectionnel : une recherche depuis la source, une depuis la
+    cible (sur le graphe transposé si le graphe est orienté), qui s'arrêtent
+    quand elles ne peuvent plus améliorer le meilleur chemin rencontré.
     
-    # Statistiques
-    visited_count = 0
-    relaxed_count = 0
+    Sur un réseau routier, les deux recherches explorent chacune un disque de
+    rayon d/2 au lieu d'un disque de rayon d.
     
-    # Boucle principale
-    while priority_queue:
-        current_dist, current = heapq.heappop(priority_queue)
-        
-        # Si déjà visité, ignorer (duplicata dans la file)
-        if current in visited:
-            continue
-        
-        visited.add(current)
-        visited_count += 1
-        
-        # Arrêt anticipé si cible atteinte
-        if target is not None and current == target:
-            break
-        
-        # Si distance obsolète, ignorer
-        if current_dist > distances[current]:
-            continue
-        
-        # Relaxation des arêtes
-        for neighbor, weight in graph.get_neighbors(current):
-            if neighbor in visited:
-                continue
+    Args:
+        workspace: Espace de travail réutilisé entre requêtes (voir SearchWorkspace) ;
+            la recherche arrière utilise workspace.backward()
             
-            new_distance = distances[current] + weight
-            relaxed_count += 1
-            
-            # Mise à jour si amélioration
-            if new_distance < distances[neighbor]:
-                distances[neighbor] = new_distance
-                parents[neighbor] = current
-                heapq.heappush(priority_queue, (new_distance, neighbor))
+    Returns:
+        PathResult (explored_nodes : union des sommets fermés des deux recherches)
+    """
+    # Préparation hors chronomètre : transposé construit une fois par version du graphe
+    reverse = graph.reverse_graph()
+    start_time = time.perf_counter()
     
-    execution_time = time.perf_counter() - start_time
+    # Vérifications
+    if not graph.has_vertex(source):
+        raise ValueError(f"Sommet source {source} n'existe pas")
+    if not graph.has_vertex(target):
+        raise ValueError(f"Sommet cible {target} n'existe pas")
     
-    # Reconstruction du chemin si cible spécifiée
-    if target is not None:
-        if distances[target] == float('inf'):
-            # Pas de chemin trouvé
-            return PathResult(
-                visited_nodes=visited_count,
-                explored_nodes=visited,
-                relaxed_edges=relaxed_count,
-                execution_time=execution_time,
-                success=False
-            )
-        
-        # Reconstruction
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = parents[current]
-        path.reverse()
-        
+    # Cas trivial
+    if source == target:
         return PathResult(
-            path=path,
-            cost=distances[target],
-            visited_nodes=visited_count,
-            explored_nodes=visited,
-            relaxed_edges=relaxed_count,
-            execution_time=execution_time,
+            path=[source],
+            cost=0.0,
+            visited_nodes=1,
+            explored_nodes={source},
+            execution_time=time.perf_counter() - start_time,
             success=True
         )
     
-    # Retour de toutes les distances (mode "single-source")
-    return PathResult(
-        visited_nodes=visited_count,
-        explored_nodes=visited,
-        relaxed_edges=relaxed_count,
-        execution_time=execution_time,
-        success=True
-    )
+    return _bidirectional_rows(graph, reverse, graph.index_of(source), graph.index_of(target),
+                               None, start_time, workspace)
 
 
-def astar(
+def bidirectional_astar(
     graph: Graph,
     source: int,
     target: int,
     heuristic: Callable[[int, int, Graph], float] = None,
-    return_stats: bool = True
+    workspace: SearchWorkspace = None
 ) -> PathResult:
     """
-    Algorithme A* (A-étoile) pour le plus court chemin.
+    A* bidirectionnel à potentiels moyennés.
+    
+    La recherche avant est guidée par p(v) = (h(v, cible) - h(v, source)) / 2,
+    la recherche arrière par -p(v). Ces deux potentiels sont cohérents dès
+    que h l'est : le résultat reste exact, avec le même critère d'arrêt que
+    le Dijkstra bidirectionnel, et chaque recherche est orientée vers
+    l'autre extrémité.
+    
+    Args:
+        heuristic: Estimation heuristic(u, v, graph) de la distance entre u et v,
+            symétrique et cohérente, ou LandmarkIndex. Par défaut : distance à
+            vol d'oiseau (euclidienne, ou Haversine en km si graph.is_geographic)
+        workspace: Espace de travail réutilisé entre requêtes (voir SearchWorkspace)
+            
+    Returns:
+        PathResult (explored_nodes : union des sommets fermés des deux recherches)
     """
+    # Préparation hors chronomètre (voir bidirectional_dijkstra)
+    reverse = graph.reverse_graph()
     start_time = time.perf_counter()
     
     # Vérifications
@@ -204,208 +542,758 @@ def astar(
             success=True
         )
     
-    # Heuristique par défaut : adaptative
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target)
     if heuristic is None:
-        def default_heuristic(v_id: int, t_id: int, g: Graph) -> float:
-            """Heuristique adaptative (Euclidienne ou Haversine)."""
-            v = g.vertices[v_id]
-            t = g.vertices[t_id]
-            metric = 'haversine' if getattr(g, 'is_geographic', False) else 'euclidean'
-            return v.distance_to(t, metric=metric)
-        heuristic = default_heuristic
-    
-    # Initialisation
-    g_scores: Dict[int, float] = {v: float('inf') for v in graph.vertices}
-    g_scores[source] = 0.0
-    
-    # f(v) = g(v) + h(v)
-    h_source = heuristic(source, target, graph)
-    f_scores: Dict[int, float] = {v: float('inf') for v in graph.vertices}
-    f_scores[source] = h_source
-    
-    parents: Dict[int, Optional[int]] = {v: None for v in graph.vertices}
-    
-    # File de priorité OPEN : (f_score, vertex_id)
-    open_set = [(f_scores[source], source)]
-    open_set_members = {source}  # Pour vérification rapide
-    
-    # Ensemble CLOSED : sommets déjà explorés
-    closed_set = set()
-    
-    # Statistiques
-    visited_count = 0
-    relaxed_count = 0
+        potential = _straight_line_potential(graph, s_row, t_row)
+    elif hasattr(heuristic, 'row_bounds'):
+        # Bornes sur les lignes (ex. LandmarkIndex) : h_t(v) <= d(v, t), h_s(v) <= d(s, v)
+        to_target, from_source = heuristic.row_bounds(graph, s_row, t_row)
+        potential = lambda row: (to_target(row) - from_source(row)) * 0.5
+    else:
+        ids = graph.row_ids()
+        potential = lambda row: (heuristic(ids[row], target, graph)
+                                 - heuristic(ids[row], source, graph)) * 0.5
     
-    # Boucle principale
-    while open_set:
-        # Extraire le sommet de f-score minimal
-        current_f, current = heapq.heappop(open_set)
-        open_set_members.discard(current)
-        
-        # Si déjà exploré, ignorer
-        if current in closed_set:
-            continue
-        
-        # Marquer comme visité
-        closed_set.add(current)
-        visited_count += 1
-        
-        # But atteint !
-        if current == target:
-            break
-        
-        # Si f-score obsolète, ignorer
-        if current_f > f_scores[current]:
-            continue
-        
-        # Explorer les voisins
-        for neighbor, weight in graph.get_neighbors(current):
-            if neighbor in closed_set:
-                continue
-            
-            # Calculer g_score tentative
-            tentative_g = g_scores[current] + weight
-            relaxed_count += 1
-            
-            # Si amélioration
-            if tentative_g < g_scores[neighbor]:
-                # Mettre à jour le chemin
-                parents[neighbor] = current
-                g_scores[neighbor] = tentative_g
-                
-                # Calculer f_score
-                h_neighbor = heuristic(neighbor, target, graph)
-                f_scores[neighbor] = tentative_g + h_neighbor
-                
-                # Ajouter à OPEN (même si déjà présent, avec nouvelle priorité)
-                heapq.heappush(open_set, (f_scores[neighbor], neighbor))
-                open_set_members.add(neighbor)
+    return _bidirectional_rows(graph, reverse, s_row, t_row, potential, start_time, workspace)
+
+
+def compare_algorithms(
+    graph: Graph,
+    source: int,
+    target: int
+) -> Dict[str, PathResult]:
+    """
+    Compare Dijkstra, Dijkstra bidirectionnel, A*, A* bidirectionnel et
+    Bellman-Ford sur le même graphe.
+    
+    Les temps ne comptent que les requêtes : la préparation (CSR figé,
+    graphe transposé) est faite avant, une fois par version du graphe.
+    """
+    graph.reverse_graph()
+    results = {}
     
+    # Dijkstra
+    results['dijkstra'] = dijkstra(graph, source, target)
+    
+    # Dijkstra bidirectionnel
+    results['bidirectional_dijkstra'] = bidirectional_dijkstra(graph, source, target)
+    
+    # A*
+    results['astar'] = astar(graph, source, target)
+    
+    # A* bidirectionnel
+    results['bidirectional_astar'] = bidirectional_astar(graph, source, target)
+    
+    # Bellman-Ford
+    results['bellman_ford'] = bellman_ford(graph, source, target)
+    
+    return results
+
+
+def bellman_ford(
+    graph: Graph,
+    source: int,
+    target: int = None
+) -> PathResult:
+    """
+    Algorithme de Bellman-Ford (bonus) : accepte les poids négatifs.
+    
+    Passes vectorisées sur les tableaux d'arêtes, arrêtées dès qu'une passe
+    ne change plus aucune distance.
+    
+    Raises:
+        ValueError: si un sommet n'existe pas ou si un cycle de poids
+            négatif est accessible depuis la source
+    """
+    start_time = time.perf_counter()
+    
+    return _bellman_ford_rows(graph, source, target, start_time)
+
+
+def spfa(
+    graph: Graph,
+    source: int,
+    target: int = None
+) -> PathResult:
+    """
+    Variante de Bellman-Ford à file (Shortest Path Faster Algorithm).
+    
+    Ne relâche que les arêtes sortant des sommets améliorés : souvent
+    bien moins de travail que des passes complètes, même pire cas O(n·m).
+    
+    Raises:
+        ValueError: si un sommet n'existe pas ou si un cycle de poids
+            négatif est accessible depuis la source
+    """
+    start_time = time.perf_counter()
+    
+    return _spfa_rows(graph, source, target, start_time)
+
+
+# ----------------------------------------------------------------------
+# Noyaux de recherche sur les lignes (Graph ou CSRGraph)
+#
+# Les sommets y sont désignés par leur ligne 0..n-1 ; les voisins sont lus
+# via graph.row_neighbors(), qui itère directement sur les listes ou les
+# tableaux stockés sans construire de liste intermédiaire.
+# ----------------------------------------------------------------------
+
+def _rows_to_result(
+    graph: Graph,
+    parents: List[int],
+    target_row: Optional[int],
+    cost: float,
+    settled_rows: List[int],
+    relaxed_count: int,
+    start_time: float
+) -> PathResult:
+    """
+    Convertit l'état d'une recherche sur les lignes en PathResult (IDs).
+    """
+    ids = graph.row_ids()
+    explored = {ids[r] for r in settled_rows}
     execution_time = time.perf_counter() - start_time
     
-    # Vérifier si un chemin a été trouvé
-    if g_scores[target] == float('inf'):
+    if target_row is None:
         return PathResult(
-            visited_nodes=visited_count,
-            explored_nodes=closed_set,
+            visited_nodes=len(settled_rows),
+            explored_nodes=explored,
+            relaxed_edges=relaxed_count,
+            execution_time=execution_time,
+            success=True
+        )
+    if cost == float('inf'):
+        return PathResult(
+            visited_nodes=len(settled_rows),
+            explored_nodes=explored,
             relaxed_edges=relaxed_count,
             execution_time=execution_time,
             success=False
         )
     
-    # Reconstruction du chemin
     path = []
-    current = target
-    while current is not None:
-        path.append(current)
-        current = parents[current]
+    row = target_row
+    while row != -1:
+        path.append(ids[row])
+        row = parents[row]
     path.reverse()
     
     return PathResult(
         path=path,
-        cost=g_scores[target],
-        visited_nodes=visited_count,
-        explored_nodes=closed_set,
+        cost=cost,
+        visited_nodes=len(settled_rows),
+        explored_nodes=explored,
         relaxed_edges=relaxed_count,
         execution_time=execution_time,
         success=True
     )
 
 
-def compare_algorithms(
+def _rows_to_tree(
     graph: Graph,
     source: int,
-    target: int
-) -> Dict[str, PathResult]:
+    distances: List[float],
+    parents: List[int],
+    settled_rows: List[int],
+    relaxed_count: int,
+    start_time: float
+) -> ShortestPathTree:
     """
-    Compare Dijkstra, A* et Bellman-Ford sur le même graphe.
+    Convertit une recherche sans cible en ShortestPathTree (tableaux denses,
+    lignes fermées seulement : une coupure ne laisse aucune distance provisoire).
     """
-    results = {}
+    n = graph.num_vertices()
+    rows = np.fromiter(settled_rows, dtype=np.int64, count=len(settled_rows))
+    tree_distances = np.full(n, np.inf)
+    tree_distances[rows] = [distances[r] for r in settled_rows]
+    tree_parents = np.full(n, -1, dtype=np.int64)
+    tree_parents[rows] = [parents[r] for r in settled_rows]
+    ids = graph.row_ids()
+    return ShortestPathTree(
+        graph, source, tree_distances, tree_parents,
+        visited_nodes=len(settled_rows),
+        explored_nodes={ids[r] for r in settled_rows},
+        relaxed_edges=relaxed_count,
+        execution_time=time.perf_counter() - start_time
+    )
+
+
+def _dijkstra_rows(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    start_time: float,
+    workspace: Optional[SearchWorkspace] = None,
+    arc_flags=None,
+    radius: Optional[float] = None,
+    target_rows: Optional[Set[int]] = None
+) -> PathResult:
+    """
+    Dijkstra sur les lignes du graphe, avec tableaux estampillés.
     
-    # Dijkstra
-    results['dijkstra'] = dijkstra(graph, source, target)
+    Sans cible, la recherche s'arrête au-delà de radius ou une fois toutes
+    les lignes de target_rows fermées (target_rows est consommé).
+    """
+    return _run_steps(_dijkstra_steps(graph, source, target, start_time, workspace,
+                                      arc_flags, radius, target_rows, events=False))
+
+
+def _dijkstra_steps(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    start_time: float,
+    workspace: Optional[SearchWorkspace],
+    arc_flags,
+    radius: Optional[float],
+    target_rows: Optional[Set[int]],
+    events: bool
+):
+    """
+    Générateur de _dijkstra_rows : si events, produit (sommet, distance,
+    parent) à chaque fermeture ; retourne le résultat de la recherche.
+    """
+    ws = workspace if workspace is not None else SearchWorkspace()
+    gen = ws.begin(graph.num_vertices())
+    distances, parents, stamps, closed = ws.distances, ws.parents, ws.stamps, ws.closed
     
-    # A*
-    results['astar'] = astar(graph, source, target)
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target) if target is not None else None
+    distances[s_row] = 0.0
+    parents[s_row] = -1
+    stamps[s_row] = gen
     
-    # Bellman-Ford
-    results['bellman_ford'] = bellman_ford(graph, source, target)
+    priority_queue = [(0.0, s_row)]
+    settled_rows = []
+    relaxed_count = 0
+    if arc_flags is None:
+        row_neighbors = graph.row_neighbors
+    else:
+        row_neighbors = arc_flags.row_neighbors(graph, t_row)
     
-    return results
+    limit = radius if radius is not None else float('inf')
+    ids = graph.row_ids()
+    
+    while priority_queue:
+        current_dist, current = heapq.heappop(priority_queue)
+        if closed[current] == gen:
+            continue
+        if current_dist > limit:
+            break
+        closed[current] = gen
+        settled_rows.append(current)
+        if events:
+            parent = parents[current]
+            yield ids[current], current_dist, (ids[parent] if parent >= 0 else None)
+        
+        if current == t_row:
+            break
+        if target_rows is not None:
+            target_rows.discard(current)
+            if not target_rows:
+                break
+        
+        for neighbor, weight in row_neighbors(current):
+            if closed[neighbor] == gen:
+                continue
+            new_distance = current_dist + weight
+            relaxed_count += 1
+            if stamps[neighbor] != gen or new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                parents[neighbor] = current
+                stamps[neighbor] = gen
+                heapq.heappush(priority_queue, (new_distance, neighbor))
+    
+    if t_row is None:
+        return _rows_to_tree(graph, source, distances, parents, settled_rows,
+                             relaxed_count, start_time)
+    cost = distances[t_row] if stamps[t_row] == gen else float('inf')
+    return _rows_to_result(graph, parents, t_row, cost, settled_rows,
+                           relaxed_count, start_time)
 
 
-def bellman_ford(
+def _astar_rows(
     graph: Graph,
     source: int,
-    target: int = None
+    target: int,
+    heuristic: Optional[Callable[[int, int, Graph], float]],
+    start_time: float,
+    workspace: Optional[SearchWorkspace] = None,
+    arc_flags=None
 ) -> PathResult:
     """
-    Algorithme de Bellman-Ford (bonus).
+    A* sur les lignes du graphe, avec tableaux estampillés.
+    
+    Heuristique par défaut : distance à vol d'oiseau (euclidienne ou Haversine
+    selon graph.is_geographic), calculée par graph.row_distance().
     """
-    start_time = time.perf_counter()
+    return _run_steps(_astar_steps(graph, source, target, heuristic, start_time,
+                                   workspace, arc_flags, events=False))
+
+
+def _astar_steps(
+    graph: Graph,
+    source: int,
+    target: int,
+    heuristic: Optional[Callable[[int, int, Graph], float]],
+    start_time: float,
+    workspace: Optional[SearchWorkspace],
+    arc_flags,
+    events: bool
+):
+    """
+    Générateur de _astar_rows : si events, produit (sommet, g, parent) à
+    chaque fermeture ; retourne le résultat de la recherche.
+    """
+    ws = workspace if workspace is not None else SearchWorkspace()
+    gen = ws.begin(graph.num_vertices())
+    g_scores, parents, stamps, closed = ws.distances, ws.parents, ws.stamps, ws.closed
+    
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target)
+    h = _row_heuristic(graph, heuristic, s_row, t_row, target)
     
-    # Initialisation
-    distances = {v: float('inf') for v in graph.vertices}
-    distances[source] = 0.0
-    parents = {v: None for v in graph.vertices}
+    g_scores[s_row] = 0.0
+    parents[s_row] = -1
+    stamps[s_row] = gen
     
-    # Statistiques
+    open_set = [(h(s_row), s_row)]
+    settled_rows = []
     relaxed_count = 0
-    visited_vertices = set([source])  # Source toujours visitée
+    if arc_flags is None:
+        row_neighbors = graph.row_neighbors
+    else:
+        row_neighbors = arc_flags.row_neighbors(graph, t_row)
+    ids = graph.row_ids()
     
-    # Relaxation (n-1 fois)
-    n = graph.num_vertices()
-    for _ in range(n - 1):
-        for edge in graph.get_all_edges():
-            u, v, w = edge.source, edge.target, edge.weight
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if closed[current] == gen:
+            continue
+        closed[current] = gen
+        settled_rows.append(current)
+        g_current = g_scores[current]
+        if events:
+            parent = parents[current]
+            yield ids[current], g_current, (ids[parent] if parent >= 0 else None)
+        
+        if current == t_row:
+            break
+        
+        for neighbor, weight in row_neighbors(current):
+            if closed[neighbor] == gen:
+                continue
+            tentative_g = g_current + weight
             relaxed_count += 1
-            if distances[u] + w < distances[v]:
-                distances[v] = distances[u] + w
-                parents[v] = u
-                visited_vertices.add(v)
+            if stamps[neighbor] != gen or tentative_g < g_scores[neighbor]:
+                parents[neighbor] = current
+                g_scores[neighbor] = tentative_g
+                stamps[neighbor] = gen
+                heapq.heappush(open_set, (tentative_g + h(neighbor), neighbor))
     
-    # Détection de cycle négatif
-    for edge in graph.get_all_edges():
-        u, v, w = edge.source, edge.target, edge.weight
-        if distances[u] + w < distances[v]:
-            raise ValueError("Le graphe contient un cycle de poids négatif")
+    cost = g_scores[t_row] if stamps[t_row] == gen else float('inf')
+    return _rows_to_result(graph, parents, t_row, cost, settled_rows,
+                           relaxed_count, start_time)
+
+
+def _row_heuristic(
+    graph: Graph,
+    heuristic,
+    s_row: int,
+    t_row: int,
+    target: int
+) -> Callable[[int], float]:
+    """Heuristique de astar (voir son argument heuristic) sous forme ligne -> borne."""
+    if heuristic is None:
+        row_distance = graph.row_distance
+        return lambda row: row_distance(row, t_row)
+    if hasattr(heuristic, 'row_bounds'):
+        # Heuristique travaillant sur les lignes (ex. LandmarkIndex)
+        return heuristic.row_bounds(graph, s_row, t_row)[0]
+    ids = graph.row_ids()
+    return lambda row: heuristic(ids[row], target, graph)
+
+
+def _queue_rows(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    h: Optional[Callable[[int], float]],
+    queue,
+    resolution: float,
+    start_time: float,
+    workspace: Optional[SearchWorkspace] = None,
+    arc_flags=None,
+    target_rows: Optional[Set[int]] = None
+) -> PathResult:
+    """
+    Dijkstra (h None) ou A* avec une file de priorité interchangeable.
     
-    execution_time = time.perf_counter() - start_time
+    BinaryHeap : clés réelles (coût, plus h), comme le heapq intégré.
     
-    # Reconstruction si target spécifié
-    if target is not None:
-        if distances[target] == float('inf'):
-            return PathResult(
-                visited_nodes=len(visited_vertices),
-                explored_nodes=visited_vertices,
-                relaxed_edges=relaxed_count,
-                execution_time=execution_time,
-                success=False
-            )
+    Autres files (DialBuckets, RadixHeap) : clés entières w / resolution et
+    potentiel floor(h / resolution). Chaque poids relâché doit être un
+    multiple de resolution (ValueError sinon) : arrondir les poids rendrait
+    le chemin sous-optimal sans le signaler. Si h est cohérente, le
+    potentiel arrondi l'est aussi pour les poids entiers : les clés sortent
+    dans l'ordre croissant, comme l'exigent les files à seaux.
+    """
+    ws = workspace if workspace is not None else SearchWorkspace()
+    gen = ws.begin(graph.num_vertices())
+    keys, parents, stamps, closed = ws.distances, ws.parents, ws.stamps, ws.closed
+    
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target) if target is not None else None
+    keys[s_row] = 0
+    parents[s_row] = -1
+    stamps[s_row] = gen
+    costs = {s_row: 0.0}            # coûts réels, le long des parents
+    
+    if isinstance(queue, BinaryHeap):
+        inv = None
+        queue.push(0.0 if h is None else h(s_row), s_row)
+    else:
+        if resolution is None:
+            resolution = 1.0
+        if resolution <= 0:
+            raise ValueError("resolution doit être positive")
+        inv = 1.0 / resolution
+        queue.push(0 if h is None else math.floor(h(s_row) * inv), s_row)
+    floor = math.floor
+    settled_rows = []
+    relaxed_count = 0
+    if arc_flags is None:
+        row_neighbors = graph.row_neighbors
+    else:
+        row_neighbors = arc_flags.row_neighbors(graph, t_row)
+    
+    while queue:
+        _, current = queue.pop()
+        if closed[current] == gen:
+            continue
+        closed[current] = gen
+        settled_rows.append(current)
         
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = parents[current]
-        path.reverse()
+        if current == t_row:
+            break
+        if target_rows is not None:
+            target_rows.discard(current)
+            if not target_rows:
+                break
         
+        g_current = keys[current]
+        cost_current = costs[current]
+        for neighbor, weight in row_neighbors(current):
+            if closed[neighbor] == gen:
+                continue
+            if inv is None:
+                tentative = g_current + weight
+            else:
+                steps = weight * inv
+                tentative = round(steps)
+                if abs(steps - tentative) > 1e-9 * (tentative + 1):
+                    raise ValueError(f"Poids {weight} non multiple de resolution={resolution} "
+                                     f"(file à clés entières)")
+                tentative += g_current
+            relaxed_count += 1
+            if stamps[neighbor] != gen or tentative < keys[neighbor]:
+                keys[neighbor] = tentative
+                parents[neighbor] = current
+                stamps[neighbor] = gen
+                costs[neighbor] = cost_current + weight
+                if h is None:
+                    queue.push(tentative, neighbor)
+                elif inv is None:
+                    queue.push(tentative + h(neighbor), neighbor)
+                else:
+                    queue.push(tentative + floor(h(neighbor) * inv), neighbor)
+    
+    if t_row is None:
+        result = _rows_to_tree(graph, source, costs, parents, settled_rows,
+                               relaxed_count, start_time)
+    else:
+        cost = costs[t_row] if stamps[t_row] == gen else float('inf')
+        result = _rows_to_result(graph, parents, t_row, cost, settled_rows,
+                                 relaxed_count, start_time)
+    result.queue_stats = queue.stats()
+    return result
+
+
+def _straight_line_potential(graph: Graph, s_row: int, t_row: int) -> Callable[[int], float]:
+    """
+    Potentiel moyenné (d(v, t) - d(v, s)) / 2 pour la distance à vol d'oiseau.
+    
+    Même valeur qu'avec graph.row_distance (euclidienne, ou Haversine en km),
+    mais les coordonnées de s et t ne sont converties qu'une fois et celles
+    de v ne sont lues qu'une fois pour les deux distances.
+    """
+    row_coordinates = graph.row_coordinates
+    xs, ys = row_coordinates(s_row)
+    xt, yt = row_coordinates(t_row)
+    sqrt = math.sqrt
+    
+    if not getattr(graph, 'is_geographic', False):
+        def potential(row: int) -> float:
+            x, y = row_coordinates(row)
+            return (sqrt((x - xt)**2 + (y - yt)**2) - sqrt((x - xs)**2 + (y - ys)**2)) * 0.5
+        return potential
+    
+    # Haversine (x = longitude, y = latitude), en km : mêmes opérations que
+    # haversine_distance, pour des valeurs identiques à graph.row_distance
+    radians, sin, cos, atan2 = math.radians, math.sin, math.cos, math.atan2
+    cos_s, cos_t = cos(radians(ys)), cos(radians(yt))
+    
+    def potential(row: int) -> float:
+        x, y = row_coordinates(row)
+        cos_phi = cos(radians(y))
+        a_t = sin(radians(yt - y) / 2)**2 + cos_phi * cos_t * sin(radians(xt - x) / 2)**2
+        a_s = sin(radians(ys - y) / 2)**2 + cos_phi * cos_s * sin(radians(xs - x) / 2)**2
+        d_t = 6371000 * (2 * atan2(sqrt(a_t), sqrt(1 - a_t))) / 1000.0
+        d_s = 6371000 * (2 * atan2(sqrt(a_s), sqrt(1 - a_s))) / 1000.0
+        return (d_t - d_s) * 0.5
+    return potential
+
+
+def _bidirectional_rows(
+    graph: Graph,
+    reverse: Graph,
+    s_row: int,
+    t_row: int,
+    potential: Optional[Callable[[int], float]],
+    start_time: float,
+    workspace: Optional[SearchWorkspace] = None
+) -> PathResult:
+    """
+    Recherche bidirectionnelle sur les lignes du graphe ; la recherche
+    arrière parcourt reverse (graph.reverse_graph()).
+    
+    Sans potentiel, c'est un Dijkstra bidirectionnel. Avec un potentiel p
+    (recherche avant), la recherche arrière utilise -p : les deux recherches
+    parcourent alors le même graphe à coûts réduits w(u, v) - p(u) + p(v),
+    et la somme des clés d'un sommet vaut df(v) + db(v).
+    
+    Critère d'arrêt : min(file avant) + min(file arrière) >= mu, où mu est
+    le coût du meilleur chemin rencontré (évalué à chaque relâchement
+    d'une arête dont l'extrémité est étiquetée par l'autre recherche).
+    """
+    ws_f = workspace if workspace is not None else SearchWorkspace()
+    ws_b = ws_f.backward()
+    n = graph.num_vertices()
+    gen_f, gen_b = ws_f.begin(n), ws_b.begin(n)
+    dist_f, par_f, stamps_f, closed_f = ws_f.distances, ws_f.parents, ws_f.stamps, ws_f.closed
+    dist_b, par_b, stamps_b, closed_b = ws_b.distances, ws_b.parents, ws_b.stamps, ws_b.closed
+    
+    dist_f[s_row], par_f[s_row], stamps_f[s_row] = 0.0, -1, gen_f
+    dist_b[t_row], par_b[t_row], stamps_b[t_row] = 0.0, -1, gen_b
+    if potential is None:
+        queue_f = [(0.0, s_row)]
+        queue_b = [(0.0, t_row)]
+    else:
+        queue_f = [(potential(s_row), s_row)]
+        queue_b = [(-potential(t_row), t_row)]
+    neighbors_f = graph.row_neighbors
+    neighbors_b = reverse.row_neighbors
+    
+    mu = float('inf')
+    meet_f = meet_b = -1   # arête de jonction meet_f -> meet_b
+    settled_rows = []
+    relaxed_count = 0
+    
+    while True:
+        # Retirer les entrées périmées en tête des files
+        while queue_f and closed_f[queue_f[0][1]] == gen_f:
+            heapq.heappop(queue_f)
+        while queue_b and closed_b[queue_b[0][1]] == gen_b:
+            heapq.heappop(queue_b)
+        if not queue_f or not queue_b or queue_f[0][0] + queue_b[0][0] >= mu:
+            break
+        
+        # Avancer la recherche dont la file est la plus courte (critère de Pohl)
+        forward = len(queue_f) <= len(queue_b)
+        if forward:
+            queue, dist, parents, stamps, closed, gen, sign = \
+                queue_f, dist_f, par_f, stamps_f, closed_f, gen_f, 1.0
+            other_dist, other_stamps, other_closed, other_gen = dist_b, stamps_b, closed_b, gen_b
+            row_neighbors = neighbors_f
+        else:
+            queue, dist, parents, stamps, closed, gen, sign = \
+                queue_b, dist_b, par_b, stamps_b, closed_b, gen_b, -1.0
+            other_dist, other_stamps, other_closed, other_gen = dist_f, stamps_f, closed_f, gen_f
+            row_neighbors = neighbors_b
+        
+        _, current = heapq.heappop(queue)
+        closed[current] = gen
+        settled_rows.append(current)
+        d_current = dist[current]
+        
+        for neighbor, weight in row_neighbors(current):
+            relaxed_count += 1
+            new_distance = d_current + weight
+            
+            # Jonction avec l'autre recherche
+            if other_stamps[neighbor] == other_gen:
+                total = new_distance + other_dist[neighbor]
+                if total < mu:
+                    mu = total
+                    meet_f, meet_b = (current, neighbor) if forward else (neighbor, current)
+                # Sommet fermé par l'autre recherche : sa distance à l'autre
+                # extrémité est exacte, inutile de le mettre dans la file
+                if other_closed[neighbor] == other_gen:
+                    continue
+            
+            if closed[neighbor] == gen:
+                continue
+            if stamps[neighbor] != gen or new_distance < dist[neighbor]:
+                dist[neighbor] = new_distance
+                parents[neighbor] = current
+                stamps[neighbor] = gen
+                if potential is None:
+                    heapq.heappush(queue, (new_distance, neighbor))
+                else:
+                    heapq.heappush(queue, (new_distance + sign * potential(neighbor), neighbor))
+    
+    ids = graph.row_ids()
+    explored = {ids[r] for r in settled_rows}
+    if mu == float('inf'):
         return PathResult(
-            path=path,
-            cost=distances[target],
-            visited_nodes=len(visited_vertices),
-            explored_nodes=visited_vertices,
+            visited_nodes=len(explored),
+            explored_nodes=explored,
             relaxed_edges=relaxed_count,
-            execution_time=execution_time,
-            success=True
+            execution_time=time.perf_counter() - start_time,
+            success=False
         )
     
+    # Chemin : source -> meet_f (parents avant), puis meet_b -> cible (parents arrière)
+    path = []
+    row = meet_f
+    while row != -1:
+        path.append(ids[row])
+        row = par_f[row]
+    path.reverse()
+    row = meet_b
+    while row != -1:
+        path.append(ids[row])
+        row = par_b[row]
+    
     return PathResult(
-        visited_nodes=len(visited_vertices),
-        explored_nodes=visited_vertices,
+        path=path,
+        cost=mu,
+        visited_nodes=len(explored),
+        explored_nodes=explored,
         relaxed_edges=relaxed_count,
-        execution_time=execution_time,
+        execution_time=time.perf_counter() - start_time,
         success=True
     )
 
 
+def _bellman_ford_rows(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    start_time: float
+) -> PathResult:
+    """
+    Bellman-Ford vectorisé sur les tableaux d'arêtes (NumPy).
+    
+    Chaque passe relâche toutes les arêtes à la fois à partir des distances
+    de la passe précédente : les arêtes sont rangées par cible, et
+    np.minimum.reduceat donne la meilleure proposition de chaque sommet.
+    Arrêt dès qu'une passe ne change rien ; une amélioration à la n-ième
+    passe révèle un cycle négatif accessible depuis la source.
+    """
+    if not graph.has_vertex(source):
+        raise ValueError(f"Sommet source {source} n'existe pas")
+    if target is not None and not graph.has_vertex(target):
+        raise ValueError(f"Sommet cible {target} n'existe pas")
+    n = graph.num_vertices()
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target) if target is not None else None
+    
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    tails, heads, weights = csr.edge_arrays()
+    order = np.argsort(heads, kind='stable')
+    tails, heads, weights = tails[order], heads[order], weights[order]
+    group_heads, starts, counts = np.unique(heads, return_index=True, return_counts=True)
+    group_of_arc = np.repeat(np.arange(len(group_heads)), counts)
+    
+    distances = np.full(n, np.inf)
+    distances[s_row] = 0.0
+    parents = np.full(n, -1, dtype=np.int64)
+    relaxed_count = 0
+    
+    for iteration in range(n):
+        if len(heads) == 0:
+            break
+        candidates = distances[tails] + weights
+        best = np.minimum.reduceat(candidates, starts)
+        improved = best < distances[group_heads]
+        relaxed_count += len(heads)
+        if not improved.any():
+            break
+        if iteration == n - 1:
+            raise ValueError("Le graphe contient un cycle de poids négatif")
+        distances[group_heads[improved]] = best[improved]
+        # Parent : première arête qui réalise le minimum, pour les sommets améliorés
+        tight = np.flatnonzero(improved[group_of_arc] & (candidates == distances[heads]))
+        _, first = np.unique(heads[tight], return_index=True)
+        parents[heads[tight[first]]] = tails[tight[first]]
+    
+    reached = np.flatnonzero(distances != np.inf).tolist()
+    cost = float(distances[t_row]) if t_row is not None else 0.0
+    return _rows_to_result(graph, parents.tolist(), t_row, cost, reached,
+                           relaxed_count, start_time)
+
+
+def _spfa_rows(
+    graph: Graph,
+    source: int,
+    target: Optional[int],
+    start_time: float
+) -> PathResult:
+    """
+    SPFA : Bellman-Ford piloté par une file FIFO des sommets améliorés.
+    
+    Seuls les voisins des sommets dont la distance a changé sont relâchés.
+    Chaque sommet garde le nombre d'arêtes de son chemin courant : un chemin
+    de n arêtes ou plus contient un cycle, forcément négatif.
+    """
+    if not graph.has_vertex(source):
+        raise ValueError(f"Sommet source {source} n'existe pas")
+    if target is not None and not graph.has_vertex(target):
+        raise ValueError(f"Sommet cible {target} n'existe pas")
+    n = graph.num_vertices()
+    s_row = graph.index_of(source)
+    t_row = graph.index_of(target) if target is not None else None
+    
+    inf = float('inf')
+    distances = [inf] * n
+    parents = [-1] * n
+    lengths = [0] * n
+    queued = [False] * n
+    distances[s_row] = 0.0
+    queued[s_row] = True
+    queue = deque([s_row])
+    relaxed_count = 0
+    row_neighbors = graph.row_neighbors
+    
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        d_u = distances[u]
+        for v, w in row_neighbors(u):
+            relaxed_count += 1
+            if d_u + w < distances[v]:
+                distances[v] = d_u + w
+                parents[v] = u
+                lengths[v] = lengths[u] + 1
+                if lengths[v] >= n:
+                    raise ValueError("Le graphe contient un cycle de poids négatif")
+                if not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+    
+    reached = [r for r in range(n) if distances[r] != inf]
+    cost = distances[t_row] if t_row is not None else 0.0
+    return _rows_to_result(graph, parents, t_row, cost, reached,
+                           relaxed_count, start_time)
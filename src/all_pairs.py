@@ -0,0 +1,398 @@
+"""
+Module de tables de plus courts chemins pour toutes les paires.
+
+Pour un graphe de la taille d'un quartier (un cluster de
+generate_clustered_urban_graph, le préréglage "small" de
+generate_realistic_city), on précalcule toutes les paires une fois : une
+requête devient une lecture de tableau, au lieu d'un appel à dijkstra.
+
+Deux méthodes de calcul :
+- "floyd_warshall" : Floyd–Warshall par blocs, vectorisé avec NumPy, en
+  O(n³) opérations élémentaires mais sans boucle Python par sommet ;
+  adapté aux petits graphes denses, et accepte les poids négatifs ;
+- "dijkstra" : un arbre des plus courts chemins par source (voir
+  ShortestPathTree), en O(n · m log n) ; adapté aux graphes creux ;
+- "auto" : la méthode au plus faible coût estimé.
+
+La table garde, pour chaque paire, la distance et le premier sommet du
+chemin (« prochain saut ») : un chemin se reconstruit en suivant les sauts,
+en O(longueur du chemin). Les sauts sont stockés sur 16 bits tant que le
+graphe a moins de 32768 sommets.
+
+Usage :
+    >>> table = AllPairsTable.build(district)
+    >>> table.distance(a, b)
+    >>> table.path(a, b)
+    >>> table.save("district.apsp")
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .algorithms import PathResult, dijkstra
+from .csr import CSRGraph
+
+
+METHODS = ("auto", "floyd_warshall", "dijkstra")
+
+# Coûts unitaires approximatifs (secondes) pour le choix automatique : une
+# opération élémentaire NumPy de Floyd–Warshall, le surcoût Python de chaque
+# sommet intermédiaire, un arc relâché par Dijkstra (mesurés par
+# experiments/benchmark_all_pairs.py)
+_FLOYD_WARSHALL_OP_COST = 1e-8
+_FLOYD_WARSHALL_PIVOT_COST = 5e-4
+_DIJKSTRA_ARC_COST = 5e-7
+
+
+def _min_plus(a: np.ndarray, a_arcs: np.ndarray, a_hops: np.ndarray,
+              b: np.ndarray, b_arcs: np.ndarray,
+              out: np.ndarray, out_arcs: np.ndarray, out_hops: np.ndarray,
+              chunk: int) -> None:
+    """
+    out = min(out, a ⊗ b) en produit min-plus, dans l'ordre lexicographique
+    (distance, nombre d'arcs) ; sauts mis à jour sur amélioration stricte.
+
+    Départager les égalités de distance par le nombre d'arcs garantit que le
+    saut suivant est toujours plus proche de la cible en arcs : sans cela,
+    deux sommets reliés par un arc de poids nul peuvent, mis à jour en même
+    temps, se désigner l'un l'autre comme prochain saut.
+
+    Args:
+        a, a_arcs, a_hops: Blocs p × k (distances, arcs, sauts) vers les
+            sommets intermédiaires
+        b, b_arcs: Blocs k × q (distances, arcs) depuis les sommets intermédiaires
+        out, out_arcs, out_hops: Blocs p × q modifiés sur place
+        chunk: Nombre de lignes traitées à la fois (mémoire p × k × q bornée)
+    """
+    for start in range(0, a.shape[0], chunk):
+        rows = slice(start, start + chunk)
+        candidates = a[rows, :, None] + b[None, :, :]
+        values = candidates.min(axis=1)
+        arcs = a_arcs[rows, :, None] + b_arcs[None, :, :]
+        arcs[candidates != values[:, None, :]] = np.iinfo(arcs.dtype).max
+        best = arcs.argmin(axis=1)
+        best_arcs = np.take_along_axis(arcs, best[:, None, :], axis=1)[:, 0, :]
+        current = out[rows]
+        improved = (values < current) | ((values == current) & (best_arcs < out_arcs[rows])
+                                         & (values < np.inf))
+        if improved.any():
+            current[improved] = values[improved]
+            out_arcs[rows][improved] = best_arcs[improved]
+            via = np.take_along_axis(a_hops[rows], best, axis=1)
+            out_hops[rows][improved] = via[improved]
+
+
+def _floyd_warshall(distances: np.ndarray, arcs: np.ndarray, hops: np.ndarray,
+                    block_size: int) -> None:
+    """
+    Floyd–Warshall par blocs (sur place).
+
+    Pour chaque bloc K de sommets intermédiaires : fermeture du bloc
+    diagonal K × K, puis de la bande de lignes K et de la bande de colonnes
+    K à travers ce bloc, enfin de tout le reste à travers les deux bandes.
+    Chaque étape est un produit min-plus vectorisé (voir _min_plus).
+    """
+    n = len(distances)
+    for start in range(0, n, block_size):
+        k = slice(start, min(start + block_size, n))
+        size = k.stop - k.start
+        chunk = max(1, 2_000_000 // max(1, size * n))
+        # 1. Bloc diagonal : un sommet intermédiaire à la fois
+        for v in range(size):
+            pivot = slice(k.start + v, k.start + v + 1)
+            _min_plus(distances[k, pivot].copy(), arcs[k, pivot].copy(), hops[k, pivot].copy(),
+                      distances[pivot, k].copy(), arcs[pivot, k].copy(),
+                      distances[k, k], arcs[k, k], hops[k, k], chunk)
+        block = (distances[k, k].copy(), arcs[k, k].copy(), hops[k, k].copy())
+        # 2. Bandes : lignes K, puis colonnes K, à travers le bloc fermé
+        _min_plus(*block, distances[k, :].copy(), arcs[k, :].copy(),
+                  distances[k, :], arcs[k, :], hops[k, :], chunk)
+        _min_plus(distances[:, k].copy(), arcs[:, k].copy(), hops[:, k].copy(),
+                  block[0], block[1], distances[:, k], arcs[:, k], hops[:, k], chunk)
+        # 3. Reste : à travers les bandes finales
+        _min_plus(distances[:, k].copy(), arcs[:, k].copy(), hops[:, k].copy(),
+                  distances[k, :].copy(), arcs[k, :].copy(), distances, arcs, hops, chunk)
+
+
+def _first_hops(parents: np.ndarray, s_row: int) -> np.ndarray:
+    """
+    Premier saut depuis s_row vers chaque ligne, à partir des parents d'un
+    arbre des plus courts chemins (doublement de pointeurs, O(n log n)).
+    """
+    n = len(parents)
+    rows = np.arange(n)
+    unreached = parents < 0
+    # a[v] : v si son parent est la source (v est alors son propre premier
+    # saut), sinon son parent ; on remonte jusqu'au point fixe
+    hop = np.where((parents == s_row) | unreached, rows, parents)
+    while True:
+        jumped = hop[hop]
+        if np.array_equal(jumped, hop):
+            break
+        hop = jumped
+    hop[unreached] = -1
+    hop[s_row] = s_row
+    return hop
+
+
+class AllPairsTable:
+    """
+    Distances et prochains sauts de toutes les paires d'un graphe (lecture seule).
+
+    Attributs:
+        ids (np.ndarray): ID du sommet de chaque ligne
+        distances (np.ndarray): Matrice n × n des distances (inf si aucun chemin)
+        next_hop (np.ndarray): Matrice n × n : ligne du sommet qui suit la
+            source sur le chemin (-1 si aucun chemin, la source elle-même
+            sur la diagonale)
+        method (str): Méthode de calcul utilisée
+        build_time (float): Durée du calcul (secondes)
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        distances: np.ndarray,
+        next_hop: np.ndarray,
+        method: str = "",
+        build_time: float = 0.0
+    ):
+        """
+        Construit la table à partir de ses tableaux (voir build et load).
+
+        Args:
+            ids: ID de chaque ligne
+            distances: Matrice n × n des distances
+            next_hop: Matrice n × n des prochains sauts (lignes)
+            method: Méthode de calcul
+            build_time: Durée du calcul
+        """
+        n = len(ids)
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.distances = np.ascontiguousarray(distances, dtype=np.float64)
+        self.next_hop = np.ascontiguousarray(next_hop, dtype=_hop_dtype(n))
+        if self.distances.shape != (n, n) or self.next_hop.shape != (n, n):
+            raise ValueError("Les matrices doivent être de taille n × n")
+        self.method = method
+        self.build_time = build_time
+        self._identity = bool(n == 0 or np.array_equal(self.ids, np.arange(n)))
+        self._index: Optional[Dict[int, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph, method: str = "auto", block_size: int = 64) -> 'AllPairsTable':
+        """
+        Calcule toutes les paires.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph
+            method: "auto", "floyd_warshall" ou "dijkstra"
+            block_size: Taille des blocs de Floyd–Warshall
+
+        Returns:
+            AllPairsTable
+
+        Raises:
+            ValueError: si la méthode est inconnue, si "dijkstra" est demandé
+                avec des poids négatifs ou si un cycle négatif existe
+        """
+        if method not in METHODS:
+            raise ValueError(f"Méthode inconnue : {method} (attendu : {', '.join(METHODS)})")
+        start = time.perf_counter()
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        n = csr.num_vertices()
+        tails, heads, weights = csr.edge_arrays()
+        negative = bool(len(weights) and weights.min() < 0)
+        if method == "auto":
+            floyd_warshall_cost, dijkstra_cost = cls.estimate_costs(n, len(heads))
+            method = "floyd_warshall" if negative or floyd_warshall_cost <= dijkstra_cost \
+                else "dijkstra"
+        if method == "dijkstra" and negative:
+            raise ValueError("La méthode dijkstra n'accepte pas les poids négatifs")
+
+        hops = np.full((n, n), -1, dtype=_hop_dtype(n))
+        if method == "floyd_warshall":
+            distances = np.full((n, n), np.inf)
+            np.minimum.at(distances, (tails, heads), weights)
+            has_arc = np.isfinite(distances)
+            hops[has_arc] = np.broadcast_to(np.arange(n), (n, n))[has_arc]
+            diagonal = np.arange(n)
+            # Un arc négatif vers soi-même est déjà un cycle négatif
+            if (distances[diagonal, diagonal] < 0).any():
+                raise ValueError("Le graphe contient un cycle de poids négatif")
+            distances[diagonal, diagonal] = 0.0
+            hops[diagonal, diagonal] = diagonal
+            arcs = has_arc.astype(np.int32)
+            arcs[diagonal, diagonal] = 0
+            _floyd_warshall(distances, arcs, hops, block_size)
+            if (distances[diagonal, diagonal] < 0).any():
+                raise ValueError("Le graphe contient un cycle de poids négatif")
+        else:
+            distances = np.empty((n, n))
+            ids = csr.row_ids()
+            for s_row in range(n):
+                tree = dijkstra(csr, ids[s_row])
+                distances[s_row] = tree.distances
+                hops[s_row] = _first_hops(tree.parents, s_row)
+
+        return cls(csr.ids, distances, hops, method=method,
+                   build_time=time.perf_counter() - start)
+
+    @staticmethod
+    def estimate_costs(num_vertices: int, num_arcs: int) -> Tuple[float, float]:
+        """
+        Durées estimées (secondes) des deux méthodes, pour le choix automatique.
+
+        Returns:
+            (floyd_warshall, dijkstra)
+        """
+        n, m = num_vertices, num_arcs
+        return (n**3 * _FLOYD_WARSHALL_OP_COST + n * _FLOYD_WARSHALL_PIVOT_COST,
+                n * (n + m) * _DIJKSTRA_ARC_COST)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def num_vertices(self) -> int:
+        """Retourne le nombre de sommets."""
+        return len(self.ids)
+
+    def has_vertex(self, vertex_id: int) -> bool:
+        """Vérifie si un sommet existe."""
+        if self._identity:
+            return isinstance(vertex_id, (int, np.integer)) and 0 <= vertex_id < len(self.ids)
+        return vertex_id in self._id_index()
+
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        if self._identity:
+            if 0 <= vertex_id < len(self.ids):
+                return int(vertex_id)
+            raise KeyError(vertex_id)
+        return self._id_index()[vertex_id]
+
+    def _id_index(self) -> Dict[int, int]:
+        """Table ID -> ligne, construite au premier appel."""
+        if self._index is None:
+            self._index = {v: r for r, v in enumerate(self.ids.tolist())}
+        return self._index
+
+    def distance(self, source: int, target: int) -> float:
+        """
+        Coût du plus court chemin de source à cible (lecture de la table).
+
+        Raises:
+            KeyError: si un sommet n'existe pas
+        """
+        return float(self.distances[self.index_of(source), self.index_of(target)])
+
+    def path(self, source: int, target: int) -> List[int]:
+        """
+        Chemin de source à cible, reconstruit en suivant les prochains sauts.
+
+        Returns:
+            Liste des IDs ([] si aucun chemin)
+
+        Raises:
+            KeyError: si un sommet n'existe pas
+        """
+        row, t_row = self.index_of(source), self.index_of(target)
+        next_hop = self.next_hop
+        if next_hop[row, t_row] < 0:
+            return []
+        rows = [row]
+        while row != t_row:
+            row = int(next_hop[row, t_row])
+            rows.append(row)
+        if self._identity:
+            return rows
+        ids = self.ids
+        return [int(ids[r]) for r in rows]
+
+    def query(self, source: int, target: int) -> PathResult:
+        """
+        Plus court chemin sous forme de PathResult (aucune recherche).
+
+        Raises:
+            ValueError: si un sommet n'existe pas
+        """
+        start_time = time.perf_counter()
+        if not self.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not self.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+        path = self.path(source, target)
+        return PathResult(path=path, cost=self.distance(source, target),
+                          execution_time=time.perf_counter() - start_time,
+                          success=bool(path))
+
+    # ------------------------------------------------------------------
+    # Statistiques et sauvegarde
+    # ------------------------------------------------------------------
+
+    def nbytes(self) -> int:
+        """Retourne la taille mémoire des tableaux (octets)."""
+        return self.ids.nbytes + self.distances.nbytes + self.next_hop.nbytes
+
+    def summary(self) -> str:
+        """
+        Retourne un rapport sur la table.
+
+        Returns:
+            Chaîne de caractères avec statistiques
+        """
+        n = self.num_vertices()
+        reachable = int(np.isfinite(self.distances).sum()) - n if n else 0
+        pairs = n * (n - 1)
+        return f"""
+Table toutes paires : {self.method}
+----------------------------------------
+Nombre de sommets     : {n}
+Paires accessibles    : {reachable} / {pairs}
+Sauts                 : {self.next_hop.dtype.itemsize * 8} bits
+Mémoire               : {self.nbytes() / 1024**2:.2f} Mo
+Calcul                : {self.build_time:.2f} s
+        """.strip()
+
+    def save(self, filename: str) -> None:
+        """
+        Sauvegarde la table (format NumPy .npz compressé, nom de fichier inchangé).
+
+        Args:
+            filename: Chemin du fichier
+        """
+        with open(filename, "wb") as f:
+            np.savez_compressed(f, ids=self.ids, distances=self.distances,
+                                next_hop=self.next_hop, method=np.array(self.method))
+
+    @classmethod
+    def load(cls, filename: str) -> 'AllPairsTable':
+        """
+        Recharge une table sauvegardée.
+
+        Args:
+            filename: Chemin du fichier
+
+        Returns:
+            AllPairsTable prête pour les requêtes
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            return cls(data["ids"], data["distances"], data["next_hop"],
+                       method=str(data["method"]))
+
+    def __repr__(self) -> str:
+        return f"AllPairsTable(vertices={self.num_vertices()}, method={self.method!r})"
+
+
+def _hop_dtype(num_vertices: int) -> type:
+    """Plus petit type entier signé pour des lignes 0..n-1 (et -1)."""
+    return np.int16 if num_vertices < 2**15 else np.int32
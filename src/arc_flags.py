@@ -0,0 +1,227 @@
+"""
+Module des arc-flags : élagage orienté vers la région de la cible.
+
+Un prétraitement découpe les sommets en K régions et attribue à chaque arc
+un vecteur de K bits : le bit r est levé si l'arc appartient à un plus
+court chemin vers un sommet de la région r. Pendant une requête vers une
+cible de la région r, Dijkstra et A* ignorent les arcs dont le bit r est
+baissé ; près de la cible (dans sa région) tous les arcs restent ouverts.
+
+Calcul des bits de la région r : tous les arcs internes à r, plus les arcs
+« tendus » d'un arbre des plus courts chemins inversé depuis chaque sommet
+d'entrée de r (un plus court chemin vers r y entre forcément par l'un
+d'eux).
+
+Régions : fournies par l'appelant (par exemple les quartiers d'un graphe
+généré par generate_clustered_urban_graph) ou découpage géométrique par
+bissections successives des coordonnées.
+
+Les bits dépendent des poids : après une modification du trafic, il faut
+refaire le prétraitement (contrairement aux repères ALT).
+
+Usage :
+    >>> flags = ArcFlags.build(graph, num_regions=32)
+    >>> result = dijkstra(graph, source, target, arc_flags=flags)
+    >>> result = astar(graph, source, target, arc_flags=flags)
+    >>> print(flags.summary())
+"""
+
+import math
+import time
+from itertools import compress
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+import numpy as np
+from .csr import CSRGraph
+from .crp import _bisect
+from .landmarks import _shortest_path_tree
+
+
+class ArcFlags:
+    """
+    Régions et bits des arcs d'un graphe (lecture seule).
+
+    Attributs:
+        regions (np.ndarray): Région de chaque ligne (0..K-1)
+        offsets (np.ndarray): Début des arcs de chaque ligne, dans l'ordre de
+            row_neighbors (ordre CSR)
+        flags (np.ndarray): Bits des arcs, compactés (arcs × ceil(K / 8) octets)
+        num_regions (int): Nombre de régions K
+        build_time (float): Durée du prétraitement (secondes)
+    """
+
+    def __init__(
+        self,
+        regions: np.ndarray,
+        offsets: np.ndarray,
+        flags: np.ndarray,
+        version: Optional[int] = None,
+        build_time: float = 0.0
+    ):
+        """
+        Construit l'index à partir de ses tableaux (voir build).
+
+        Args:
+            regions: Région de chaque ligne
+            offsets: Offsets CSR des arcs (taille n + 1)
+            flags: Bits compactés (np.packbits sur l'axe des régions)
+            version: Version du graphe au moment du prétraitement
+            build_time: Durée du prétraitement
+        """
+        self.regions = np.ascontiguousarray(regions, dtype=np.int64)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.flags = np.ascontiguousarray(flags, dtype=np.uint8)
+        self.num_regions = int(self.regions.max()) + 1 if len(self.regions) else 0
+        if len(self.offsets) != len(self.regions) + 1 or len(self.flags) != self.offsets[-1]:
+            raise ValueError("Tableaux de tailles incohérentes")
+        self.version = version
+        self.build_time = build_time
+        self._regions = self.regions.tolist()
+        self._offsets = memoryview(self.offsets)
+        self._masks: Dict[int, memoryview] = {}   # région -> bits des arcs (voir region_mask)
+
+    def __getstate__(self) -> dict:
+        # Vues mémoire non sérialisables (pool de processus en mode spawn)
+        state = self.__dict__.copy()
+        del state['_offsets'], state['_masks']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._offsets = memoryview(self.offsets)
+        self._masks = {}
+
+    @classmethod
+    def build(
+        cls,
+        graph,
+        regions: Optional[Dict[int, Hashable]] = None,
+        num_regions: int = 32
+    ) -> 'ArcFlags':
+        """
+        Calcule les régions et les bits des arcs.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph (poids positifs ou nuls)
+            regions: Région de chaque sommet {ID: clé de région} (clés
+                quelconques) ; si None, découpage géométrique
+            num_regions: Nombre approximatif de régions du découpage
+                géométrique (au plus ceil(n / num_regions) sommets par région)
+
+        Returns:
+            ArcFlags
+
+        Raises:
+            ValueError: si un sommet n'a pas de région ou num_regions < 1
+        """
+        start = time.perf_counter()
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        n = csr.num_vertices()
+
+        if regions is None:
+            if num_regions < 1:
+                raise ValueError("num_regions doit être positif")
+            row_regions = np.zeros(n, dtype=np.int64)
+            parts = _bisect(csr.xs, csr.ys, np.arange(n, dtype=np.int64),
+                            max(1, math.ceil(n / num_regions)))
+            for r, part in enumerate(parts):
+                row_regions[part] = r
+        else:
+            keys = {}
+            try:
+                row_regions = np.array([keys.setdefault(regions[v], len(keys))
+                                        for v in csr.ids.tolist()], dtype=np.int64)
+            except KeyError as error:
+                raise ValueError(f"Sommet {error.args[0]} sans région") from None
+
+        tails, heads, weights = csr.edge_arrays()
+        num_flags = int(row_regions.max()) + 1 if n else 0
+        flags = np.zeros((len(heads), num_flags), dtype=bool)
+        reverse = csr.reverse_graph()
+        for r in range(num_flags):
+            column = flags[:, r]
+            column[(row_regions[tails] == r) & (row_regions[heads] == r)] = True  # arcs internes
+            entries = np.unique(heads[(row_regions[heads] == r) & (row_regions[tails] != r)])
+            for entry in entries.tolist():
+                dist = _shortest_path_tree(reverse, entry)[0]
+                with np.errstate(invalid='ignore'):
+                    column |= np.isfinite(dist[heads]) & (
+                        weights + dist[heads] <= dist[tails] * (1 + 1e-12) + 1e-12)
+
+        return cls(row_regions, csr.offsets, np.packbits(flags, axis=1),
+                   version=getattr(graph, 'version', None),
+                   build_time=time.perf_counter() - start)
+
+    def check_graph(self, graph) -> None:
+        """
+        Vérifie que le graphe est celui du prétraitement, poids inchangés.
+
+        Raises:
+            ValueError: si le nombre de sommets diffère ou si les poids ont changé
+        """
+        if graph.num_vertices() != len(self.regions):
+            raise ValueError(f"Arc-flags calculés pour {len(self.regions)} sommets, "
+                             f"graphe de {graph.num_vertices()} sommets")
+        version = getattr(graph, 'version', None)
+        if version is not None and self.version is not None and version != self.version:
+            raise ValueError("Le graphe a été modifié depuis le calcul des arc-flags")
+
+    def region_flags(self, region: int) -> np.ndarray:
+        """Retourne le bit de la région pour chaque arc (uint8, 0 ou 1)."""
+        return (self.flags[:, region >> 3] >> (7 - (region & 7))) & 1
+
+    def region_mask(self, region: int) -> memoryview:
+        """
+        Bits de la région, calculés au premier appel puis conservés (un octet
+        par arc : au plus K masques, extraits à la demande des seules régions
+        des cibles interrogées).
+        """
+        mask = self._masks.get(region)
+        if mask is None:
+            mask = self._masks[region] = memoryview(self.region_flags(region))
+        return mask
+
+    def row_neighbors(self, graph, t_row: int) -> Callable[[int], Iterable[Tuple[int, float]]]:
+        """
+        Fonction de voisinage restreinte aux arcs utiles vers t_row.
+
+        Args:
+            graph: Graphe interrogé (celui du prétraitement ou sa version figée)
+            t_row: Ligne de la cible
+
+        Returns:
+            row -> itérable de (voisin, poids), comme graph.row_neighbors
+        """
+        self.check_graph(graph)
+        mask = self.region_mask(self._regions[t_row])
+        offsets = self._offsets
+        neighbors = graph.row_neighbors
+        return lambda row: compress(neighbors(row), mask[offsets[row]:offsets[row + 1]])
+
+    def nbytes(self) -> int:
+        """Retourne la taille mémoire des tableaux (octets)."""
+        return self.regions.nbytes + self.offsets.nbytes + self.flags.nbytes
+
+    def summary(self) -> str:
+        """
+        Retourne un rapport mémoire et élagage.
+
+        Returns:
+            Chaîne de caractères avec statistiques
+        """
+        num_arcs = len(self.flags)
+        set_bits = int(np.unpackbits(self.flags, axis=1)[:, :self.num_regions].sum()) \
+            if num_arcs else 0
+        ratio = set_bits / (num_arcs * self.num_regions) if num_arcs and self.num_regions else 0.0
+        return f"""
+Arc-flags
+----------------------------------------
+Nombre de régions     : {self.num_regions}
+Nombre d'arcs         : {num_arcs}
+Octets par arc        : {self.flags.shape[1] if num_arcs else 0}
+Arcs ouverts / région : {ratio * 100:.1f} %
+Mémoire               : {self.nbytes() / 1024**2:.2f} Mo
+Prétraitement         : {self.build_time:.2f} s
+        """.strip()
+
+    def __repr__(self) -> str:
+        return f"ArcFlags(regions={self.num_regions}, arcs={len(self.flags)})"
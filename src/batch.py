@@ -0,0 +1,184 @@
+"""
+Module de calcul d'itinéraires par lots.
+
+route_many répond à une longue liste de requêtes (source, cible) en un
+appel, au lieu d'une boucle Python sur dijkstra ou astar :
+
+- les requêtes sont découpées en paquets (chunk_size), répartis sur un pool
+  de processus (workers > 1) ;
+- le graphe n'est pas sérialisé vers les processus : il est écrit une fois
+  au format binaire (voir storage.py), et chaque processus le projette en
+  mémoire (open_graph_binary). Les pages sont partagées entre tous les
+  processus, et une tâche n'emporte que ses paires de sommets. Un chemin
+  de fichier binaire peut aussi être passé directement à la place du graphe ;
+- chaque processus réutilise un SearchWorkspace d'une requête à l'autre ;
+- les ensembles explored_nodes, volumineux, ne sont renvoyés que sur
+  demande (keep_explored).
+
+Les résultats arrivent au fil de l'eau, sous forme de couples (indice de la
+requête, PathResult) : dans l'ordre des requêtes (ordered=True), ou dans
+l'ordre où les paquets se terminent (ordered=False).
+
+Usage :
+    >>> for i, result in route_many(graph, pairs, algorithm="astar", workers=4):
+    ...     costs[i] = result.cost
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Sequence, Tuple, Union
+from .algorithms import (
+    PathResult,
+    dijkstra,
+    astar,
+    bidirectional_dijkstra,
+    bidirectional_astar,
+)
+from .storage import save_graph_binary, open_graph_binary
+from .workspace import SearchWorkspace
+
+
+ALGORITHMS = {
+    "dijkstra": dijkstra,
+    "astar": astar,
+    "bidirectional_dijkstra": bidirectional_dijkstra,
+    "bidirectional_astar": bidirectional_astar,
+}
+
+
+class _RouteTask:
+    """Calcule des paquets de requêtes sur un graphe, avec un espace de travail réutilisé."""
+
+    def __init__(self, graph, algorithm: str, options: dict, keep_explored: bool):
+        self.graph = graph
+        self.search = ALGORITHMS[algorithm]
+        self.options = options
+        self.keep_explored = keep_explored
+        self.workspace = SearchWorkspace()
+
+    def __call__(self, start: int, pairs: Sequence[Tuple[int, int]]
+                 ) -> Tuple[int, List[PathResult]]:
+        """Retourne (indice de la première requête, résultats du paquet)."""
+        results = []
+        for source, target in pairs:
+            result = self.search(self.graph, source, target, workspace=self.workspace,
+                                 **self.options)
+            if not self.keep_explored:
+                result.explored_nodes = set()
+            results.append(result)
+        return start, results
+
+
+_worker_task = None
+
+
+def _init_worker(filename: str, algorithm: str, options: dict, keep_explored: bool) -> None:
+    """Projette le graphe binaire dans un processus du pool (une fois par processus)."""
+    global _worker_task
+    _worker_task = _RouteTask(open_graph_binary(filename), algorithm, options, keep_explored)
+
+
+def _run_chunk(start: int, pairs: Sequence[Tuple[int, int]]) -> Tuple[int, List[PathResult]]:
+    """Calcule un paquet dans un processus du pool."""
+    return _worker_task(start, pairs)
+
+
+def route_many(
+    graph: Union[str, object],
+    pairs: Sequence[Tuple[int, int]],
+    algorithm: str = "dijkstra",
+    workers: int = 1,
+    chunk_size: int = 256,
+    ordered: bool = True,
+    keep_explored: bool = False,
+    mp_context=None,
+    **options
+) -> Iterator[Tuple[int, PathResult]]:
+    """
+    Calcule les plus courts chemins d'une liste de requêtes.
+
+    Args:
+        graph: Graph, CompactGraph, CSRGraph, ou chemin d'un graphe binaire
+            (voir save_graph_binary), alors ouvert sans copie
+        pairs: Requêtes (source, cible)
+        algorithm: "dijkstra", "astar", "bidirectional_dijkstra" ou
+            "bidirectional_astar"
+        workers: Nombre de processus (1 : calcul dans le processus courant,
+            None : un par cœur)
+        chunk_size: Nombre de requêtes par tâche
+        ordered: True : résultats dans l'ordre des requêtes ; False : dans
+            l'ordre où les paquets se terminent
+        keep_explored: Conserve explored_nodes dans les résultats
+        mp_context: Contexte multiprocessing du pool (par exemple
+            multiprocessing.get_context("spawn")) ; None : celui par défaut
+            de la plateforme
+        **options: Options de l'algorithme (par exemple queue="dial",
+            heuristic=landmarks ou arc_flags=flags) ; avec workers > 1, elles
+            doivent être sérialisables par pickle (pas de lambda) : en mode
+            spawn (Windows, macOS), elles sont copiées dans chaque processus
+
+    Returns:
+        Itérateur de couples (indice de la requête, PathResult)
+
+    Raises:
+        ValueError: si l'algorithme est inconnu, si chunk_size n'est pas
+            positif ou si un sommet n'existe pas
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algorithme inconnu : {algorithm} "
+                         f"(attendu : {', '.join(ALGORITHMS)})")
+    if chunk_size < 1:
+        raise ValueError("chunk_size doit être positif")
+    filename = graph if isinstance(graph, str) else None
+    if filename is not None:
+        graph = open_graph_binary(filename)
+    pairs = [(source, target) for source, target in pairs]
+    for source, target in pairs:
+        if not graph.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not graph.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+
+    chunks = [(start, pairs[start:start + chunk_size])
+              for start in range(0, len(pairs), chunk_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+    if workers <= 1:
+        return _stream_serial(_RouteTask(graph, algorithm, options, keep_explored), chunks)
+    return _stream_pool(graph, filename, chunks, workers, ordered, mp_context,
+                        (algorithm, options, keep_explored))
+
+
+def _stream_serial(task: _RouteTask, chunks) -> Iterator[Tuple[int, PathResult]]:
+    """Résultats calculés dans le processus courant, au fur et à mesure."""
+    for start, pairs in chunks:
+        _, results = task(start, pairs)
+        yield from enumerate(results, start)
+
+
+def _stream_pool(graph, filename, chunks, workers: int, ordered: bool, mp_context,
+                 settings: tuple) -> Iterator[Tuple[int, PathResult]]:
+    """Résultats calculés par un pool de processus qui partagent le graphe projeté."""
+    directory = None
+    if filename is None:
+        directory = tempfile.mkdtemp(prefix="route_many_")
+        filename = os.path.join(directory, "graph.sgpg")
+        save_graph_binary(graph, filename)
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                   initializer=_init_worker, initargs=(filename, *settings))
+        with pool:
+            futures = [pool.submit(_run_chunk, start, pairs) for start, pairs in chunks]
+            try:
+                for future in (futures if ordered else as_completed(futures)):
+                    start, results = future.result()
+                    yield from enumerate(results, start)
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,141 @@
+"""
+Module de cache des arbres des plus courts chemins.
+
+Dans l'application web, l'utilisateur garde souvent le même départ et
+essaie plusieurs arrivées. Un arbre des plus courts chemins depuis la
+source (dijkstra sans cible, voir ShortestPathTree) répond à toutes ces
+requêtes : une nouvelle arrivée ne coûte qu'une remontée des parents, en
+microsecondes.
+
+Les arbres sont gardés dans un cache LRU borné en mémoire, indexé par
+(graphe, version du graphe, source). Modifier les poids
+incrémente graph.version : les arbres de l'ancienne version ne sont plus
+jamais servis et sont retirés à la requête suivante sur ce graphe.
+
+Usage :
+    >>> cache = ShortestPathTreeCache(max_bytes=64 * 1024**2)
+    >>> result = cache.route(graph, source, target)     # construit l'arbre
+    >>> result = cache.route(graph, source, other)      # lecture seule
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Tuple
+from .algorithms import PathResult, ShortestPathTree, dijkstra
+
+
+class ShortestPathTreeCache:
+    """
+    Cache LRU d'arbres des plus courts chemins, borné en mémoire.
+
+    Attributs:
+        max_bytes (int): Mémoire maximale des arbres conservés (octets)
+        hits (int): Requêtes servies par un arbre en cache
+        misses (int): Requêtes ayant construit un arbre
+
+    Le cache peut être partagé entre threads (accès protégés par un verrou).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024**2):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes: Mémoire maximale des arbres conservés (octets)
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes doit être positif")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._trees: 'OrderedDict[Tuple, ShortestPathTree]' = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(graph, source: int) -> Tuple:
+        # L'arbre garde une référence au graphe : son id() reste unique tant
+        # que l'entrée existe
+        return (id(graph), getattr(graph, 'version', None), source)
+
+    def tree(self, graph, source: int) -> ShortestPathTree:
+        """
+        Arbre des plus courts chemins depuis source, construit si absent.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph
+            source: ID de la source
+
+        Returns:
+            ShortestPathTree (à ne pas modifier : il peut être partagé)
+
+        Raises:
+            ValueError: si la source n'existe pas
+        """
+        key = self._key(graph, source)
+        with self._lock:
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return tree
+            self.misses += 1
+            self._drop_stale(graph)
+
+        tree = dijkstra(graph, source)   # hors verrou : d'autres lectures restent possibles
+
+        with self._lock:
+            size = tree.nbytes()
+            if size <= self.max_bytes and key not in self._trees:
+                self._trees[key] = tree
+                self._nbytes += size
+                while self._nbytes > self.max_bytes:
+                    _, evicted = self._trees.popitem(last=False)
+                    self._nbytes -= evicted.nbytes()
+        return tree
+
+    def route(self, graph, source: int, target: int) -> PathResult:
+        """
+        Plus court chemin de source à target, lu dans l'arbre de la source.
+
+        Raises:
+            ValueError: si la source ou la cible n'existe pas
+        """
+        if not graph.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+        return self.tree(graph, source).result_to(target)
+
+    def _drop_stale(self, graph) -> None:
+        """Retire les arbres d'une ancienne version du graphe (verrou tenu)."""
+        graph_id = id(graph)
+        version = getattr(graph, 'version', None)
+        stale = [key for key in self._trees if key[0] == graph_id and key[1] != version]
+        for key in stale:
+            self._nbytes -= self._trees.pop(key).nbytes()
+
+    def invalidate(self, graph=None) -> None:
+        """
+        Vide le cache, ou seulement les arbres d'un graphe.
+
+        Args:
+            graph: Graphe dont les arbres sont retirés (None : tous)
+        """
+        with self._lock:
+            if graph is None:
+                self._trees.clear()
+                self._nbytes = 0
+                return
+            for key in [key for key in self._trees if key[0] == id(graph)]:
+                self._nbytes -= self._trees.pop(key).nbytes()
+
+    def nbytes(self) -> int:
+        """Retourne la mémoire occupée par les arbres conservés (octets)."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def __repr__(self) -> str:
+        return (f"ShortestPathTreeCache(trees={len(self._trees)}, "
+                f"memory={self._nbytes / 1024**2:.1f}/{self.max_bytes / 1024**2:.0f} Mo, "
+                f"hits={self.hits}, misses={self.misses})")
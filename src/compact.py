@@ -0,0 +1,353 @@
+"""
+Module de stockage compact (colonnes) des graphes.
+
+Dans un Graph, chaque sommet est un objet Vertex et chaque arête orientée
+un objet Edge (deux par route d'un graphe non-orienté). CompactGraph range
+ces mêmes informations dans des tableaux typés (module array) :
+- sommets : colonnes x, y et labels
+- arêtes : par ligne, tableaux des cibles, poids, types de route et vitesses
+  (ces deux derniers ne sont créés que si une arête de la ligne s'écarte
+  des valeurs par défaut 'main' / 50 km/h)
+
+Aucun objet Vertex ou Edge n'est conservé : graph.vertices[v] et get_edge()
+renvoient des vues légères (VertexView, EdgeView) qui lisent et écrivent
+directement dans les colonnes.
+
+L'API publique est celle de Graph ; les algorithmes s'utilisent sans
+modification. Pour des requêtes intensives, figer le graphe (freeze()).
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple, Iterator
+from .graph import Graph, Vertex, Edge
+
+
+class VertexView(Vertex):
+    """
+    Vue sur un sommet d'un CompactGraph.
+
+    Se comporte comme un Vertex ; les modifications de x, y ou label sont
+    écrites dans les colonnes du graphe.
+    """
+
+    __slots__ = ('_graph', '_row')
+
+    def __init__(self, graph: 'CompactGraph', row: int):
+        self._graph = graph
+        self._row = row
+
+    @property
+    def id(self) -> int:
+        return self._graph._ids[self._row]
+
+    @property
+    def x(self) -> float:
+        return self._graph._xs[self._row]
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._graph._xs[self._row] = value
+
+    @property
+    def y(self) -> float:
+        return self._graph._ys[self._row]
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._graph._ys[self._row] = value
+
+    @property
+    def label(self) -> str:
+        label = self._graph._labels[self._row]
+        return label if label is not None else f"V{self.id}"
+
+    @label.setter
+    def label(self, value: str) -> None:
+        self._graph._labels[self._row] = value or None
+
+
+class EdgeView(Edge):
+    """
+    Vue sur une arête orientée d'un CompactGraph.
+
+    Se comporte comme un Edge ; les modifications de weight, road_type ou
+    speed_limit sont écrites dans les colonnes du graphe.
+    """
+
+    __slots__ = ()  # _graph, _row et _pos sont hérités de Edge
+
+    def __init__(self, graph: 'CompactGraph', row: int, pos: int):
+        self._graph = graph
+        self._row = row
+        self._pos = pos
+
+    @property
+    def source(self) -> int:
+        return self._graph._ids[self._row]
+
+    @property
+    def target(self) -> int:
+        return self._graph._ids[self._graph._targets[self._row][self._pos]]
+
+    @property
+    def road_type(self) -> str:
+        return self._graph._get_road_type(self._row, self._pos)
+
+    @road_type.setter
+    def road_type(self, value: str) -> None:
+        self._graph._set_road_type(self._row, self._pos, value)
+
+    @property
+    def speed_limit(self) -> float:
+        return self._graph._get_speed(self._row, self._pos)
+
+    @speed_limit.setter
+    def speed_limit(self, value: float) -> None:
+        self._graph._set_speed(self._row, self._pos, value)
+
+
+class _VertexTable(Mapping):
+    """Dictionnaire ID -> VertexView, sans objet stocké par sommet."""
+
+    def __init__(self, graph: 'CompactGraph'):
+        self._graph = graph
+
+    def __getitem__(self, vertex_id: int) -> VertexView:
+        return VertexView(self._graph, self._graph._index[vertex_id])
+
+    def __contains__(self, vertex_id) -> bool:
+        return vertex_id in self._graph._index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph._ids)
+
+    def __len__(self) -> int:
+        return len(self._graph._ids)
+
+
+class CompactGraph(Graph):
+    """
+    Graphe stocké en colonnes (struct-of-arrays).
+
+    Même interface que Graph. Les sommets et arêtes sont rangés dans des
+    tableaux typés : environ 16 octets par arête orientée au lieu d'un
+    objet Edge, d'un int et d'un float Python.
+    """
+
+    DEFAULT_ROAD_TYPE = "main"
+    DEFAULT_SPEED = 50.0
+
+    def __init__(
+        self,
+        directed: bool = True,
+        edge_index: bool = False,
+        parallel_edges: str = "keep_all"
+    ):
+        """
+        Initialise un graphe compact vide.
+
+        Args:
+            directed: Si True, graphe orienté ; si False, graphe non-orienté
+            edge_index: Si True, index haché des arêtes (voir Graph)
+            parallel_edges: 'keep_all' ou 'keep_min' (voir Graph)
+        """
+        super().__init__(directed, edge_index, parallel_edges)
+        self.vertices = _VertexTable(self)
+
+        # Colonnes des sommets
+        self._xs = array('d')
+        self._ys = array('d')
+        self._labels: List[Optional[str]] = []   # None = label par défaut
+
+        # Colonnes des arêtes (une entrée par ligne)
+        self._targets: List[array] = []
+        self._weights: List[array] = []
+        self._road_types: List[Optional[array]] = []  # codes ; None = tout 'main'
+        self._speeds: List[Optional[array]] = []      # None = tout 50 km/h
+        self._edges = None
+
+        self._road_type_names: List[str] = ["main"]
+        self._road_type_codes: Dict[str, int] = {"main": 0}
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CompactGraph':
+        """
+        Convertit un Graph en CompactGraph (mêmes IDs, même ordre des lignes).
+
+        Args:
+            graph: Graphe source
+
+        Returns:
+            CompactGraph équivalent
+        """
+        compact = cls(graph.directed, graph.has_edge_index(), graph.parallel_edges)
+        compact.is_geographic = graph.is_geographic
+        compact.num_edges = graph.num_edges_count()
+        for vertex_id in graph.row_ids():
+            v = graph.vertices[vertex_id]
+            label = v.label if v.label != f"V{vertex_id}" else ""
+            compact.add_vertex(vertex_id, v.x, v.y, label)
+        for row in range(graph.num_vertices()):
+            for pos, (t_row, weight) in enumerate(graph.row_neighbors(row)):
+                edge = graph._edge_at(row, pos)
+                compact._append_arc(row, t_row, weight, edge.road_type, edge.speed_limit)
+        return compact
+
+    def add_vertex(self, vertex_id: int, x: float = 0.0, y: float = 0.0, label: str = "") -> Vertex:
+        """
+        Ajoute un sommet au graphe (voir Graph.add_vertex).
+
+        Returns:
+            Une vue sur le sommet
+        """
+        if vertex_id not in self._index:
+            row = len(self._ids)
+            self._index[vertex_id] = row
+            self._ids.append(vertex_id)
+            self._xs.append(x)
+            self._ys.append(y)
+            self._labels.append(label or None)
+            self._targets.append(array('q'))
+            self._weights.append(array('d'))
+            self._road_types.append(None)
+            self._speeds.append(None)
+            if vertex_id != row:
+                self._identity = False
+            self.version += 1
+        return VertexView(self, self._index[vertex_id])
+
+    def _extend_vertices(
+        self,
+        ids: List[int],
+        xs: List[float],
+        ys: List[float],
+        labels: List[str]
+    ) -> None:
+        """Ajoute les colonnes des nouveaux sommets (voir Graph.add_vertices_from)."""
+        self._xs.extend(xs)
+        self._ys.extend(ys)
+        self._labels.extend(label or None for label in labels)
+        self._targets.extend(array('q') for _ in ids)
+        self._weights.extend(array('d') for _ in ids)
+        self._road_types.extend([None] * len(ids))
+        self._speeds.extend([None] * len(ids))
+
+    def _road_type_code(self, road_type: str) -> int:
+        """Code entier d'un type de route (ajouté à la table si nouveau)."""
+        code = self._road_type_codes.get(road_type)
+        if code is None:
+            code = len(self._road_type_names)
+            if code > 255:
+                raise ValueError("Trop de types de route distincts (255 maximum)")
+            self._road_type_names.append(road_type)
+            self._road_type_codes[road_type] = code
+        return code
+
+    def _append_arc(
+        self,
+        s_row: int,
+        t_row: int,
+        weight: float,
+        road_type: str,
+        speed_limit: float
+    ) -> None:
+        """Range une arête orientée dans les colonnes de sa ligne source."""
+        targets = self._targets[s_row]
+        if self._edge_index is not None:
+            self._edge_index.setdefault(self._edge_key(s_row, t_row), len(targets))
+        pos = len(targets)
+        targets.append(t_row)
+        self._weights[s_row].append(weight)
+        if road_type != self.DEFAULT_ROAD_TYPE or self._road_types[s_row] is not None:
+            self._set_road_type(s_row, pos, road_type)
+        if speed_limit != self.DEFAULT_SPEED or self._speeds[s_row] is not None:
+            self._set_speed(s_row, pos, speed_limit)
+        self.version += 1
+
+    def _extend_arcs(
+        self,
+        s_row: int,
+        targets: List[int],
+        weights: List[float],
+        road_types,
+        speeds
+    ) -> None:
+        """Range plusieurs arêtes orientées d'une même ligne source (voir Graph)."""
+        row_targets = self._targets[s_row]
+        first = len(row_targets)
+        if self._edge_index is not None:
+            index, key = self._edge_index, self._edge_key
+            for pos, t_row in enumerate(targets, first):
+                index.setdefault(key(s_row, t_row), pos)
+        row_targets.extend(targets)
+        self._weights[s_row].extend(weights)
+
+        # Colonnes facultatives : écrites seulement si une valeur s'écarte du défaut
+        if isinstance(road_types, str):
+            road_types = [road_types] * len(targets)
+        if self._road_types[s_row] is not None or road_types.count(self.DEFAULT_ROAD_TYPE) < len(road_types):
+            for pos, road_type in enumerate(road_types, first):
+                self._set_road_type(s_row, pos, road_type)
+        if isinstance(speeds, float):
+            speeds = [speeds] * len(targets)
+        if self._speeds[s_row] is not None or speeds.count(self.DEFAULT_SPEED) < len(speeds):
+            for pos, speed in enumerate(speeds, first):
+                self._set_speed(s_row, pos, speed)
+        self.version += 1
+
+    def _get_road_type(self, row: int, pos: int) -> str:
+        """Type de route de l'arête (row, pos)."""
+        codes = self._road_types[row]
+        return self._road_type_names[codes[pos]] if codes is not None else self.DEFAULT_ROAD_TYPE
+
+    def _set_road_type(self, row: int, pos: int, road_type: str) -> None:
+        """Écrit le type de route de l'arête (row, pos), en créant la colonne si besoin."""
+        codes = self._road_types[row]
+        if codes is None:
+            codes = self._road_types[row] = array('B', bytes(len(self._targets[row])))
+        while len(codes) <= pos:
+            codes.append(0)
+        codes[pos] = self._road_type_code(road_type)
+
+    def _get_speed(self, row: int, pos: int) -> float:
+        """Vitesse limite de l'arête (row, pos)."""
+        speeds = self._speeds[row]
+        return speeds[pos] if speeds is not None else self.DEFAULT_SPEED
+
+    def _set_speed(self, row: int, pos: int, speed_limit: float) -> None:
+        """Écrit la vitesse limite de l'arête (row, pos), en créant la colonne si besoin."""
+        speeds = self._speeds[row]
+        if speeds is None:
+            speeds = self._speeds[row] = array('d', [self.DEFAULT_SPEED] * len(self._targets[row]))
+        while len(speeds) <= pos:
+            speeds.append(self.DEFAULT_SPEED)
+        speeds[pos] = speed_limit
+
+    def _edge_at(self, row: int, pos: int) -> Edge:
+        """Retourne une vue sur l'arête rangée à la position pos de la ligne row."""
+        return EdgeView(self, row, pos)
+
+    def get_all_edges(self) -> List[Edge]:
+        """Retourne la liste de toutes les arêtes (vues créées à la demande)."""
+        return [EdgeView(self, row, pos)
+                for row, targets in enumerate(self._targets)
+                for pos in range(len(targets))]
+
+    def coordinate_arrays(self) -> Tuple[array, array]:
+        """Retourne les colonnes de coordonnées (xs, ys)."""
+        return self._xs, self._ys
+
+    def row_coordinates(self, row: int) -> Tuple[float, float]:
+        """Retourne les coordonnées (x, y) d'une ligne."""
+        return self._xs[row], self._ys[row]
+
+    def row_distance(self, row_a: int, row_b: int) -> float:
+        """Distance à vol d'oiseau entre deux lignes (voir Vertex.distance_to)."""
+        metric = 'haversine' if self.is_geographic else 'euclidean'
+        return VertexView(self, row_a).distance_to(VertexView(self, row_b), metric=metric)
+
+    def __repr__(self) -> str:
+        return (f"CompactGraph(vertices={self.num_vertices()}, "
+                f"edges={self.num_edges_count()}, "
+                f"directed={self.directed})")
@@ -0,0 +1,514 @@
+"""
+Module de hiérarchies de contraction (Contraction Hierarchies).
+
+Prétraitement : les sommets sont « contractés » un par un, du moins
+important au plus important. Contracter v revient à le retirer du graphe
+en ajoutant un raccourci u -> w (poids w(u, v) + w(v, w), sommet du milieu v)
+pour chaque paire de voisins dont le plus court chemin passait par v. Une
+recherche de témoin (Dijkstra local depuis u, sans passer par v) évite les
+raccourcis inutiles.
+
+L'ordre de contraction suit la différence d'arêtes (raccourcis ajoutés
+moins arêtes retirées), plus le nombre de voisins déjà contractés pour
+répartir les contractions ; les priorités sont mises à jour paresseusement
+(recalculées au moment de sortir de la file).
+
+Requête : deux recherches Dijkstra qui ne montent que vers des sommets de
+rang supérieur, l'une depuis la source dans le graphe montant, l'autre
+depuis la cible dans le graphe descendant inversé. Elles ne visitent que
+quelques centaines de sommets, même sur un grand réseau routier. Le
+chemin trouvé est ensuite « déplié » : chaque raccourci est remplacé
+récursivement par les deux arêtes qu'il résume.
+
+Usage :
+    >>> ch = ContractionHierarchy.build(graph)      # prétraitement (long)
+    >>> ch.save("paris.ch")
+    >>> ch = ContractionHierarchy.load("paris.ch")  # au démarrage du service
+    >>> result = ch.query(source, target)           # PathResult, chemin complet
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .graph import Graph
+from .algorithms import PathResult
+
+
+def _to_csr(adjacency: List[List[Tuple[int, float, int]]]) -> Tuple[np.ndarray, ...]:
+    """
+    Range des listes (cible, poids, milieu) par ligne en tableaux CSR.
+
+    Returns:
+        (offsets, cibles, poids, milieux)
+    """
+    n = len(adjacency)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(arcs) for arcs in adjacency], out=offsets[1:])
+    m = int(offsets[-1])
+    targets = np.empty(m, dtype=np.int64)
+    weights = np.empty(m, dtype=np.float64)
+    middles = np.empty(m, dtype=np.int64)
+    pos = 0
+    for arcs in adjacency:
+        for target, weight, middle in arcs:
+            targets[pos], weights[pos], middles[pos] = target, weight, middle
+            pos += 1
+    return offsets, targets, weights, middles
+
+
+class ContractionHierarchy:
+    """
+    Hiérarchie de contraction d'un graphe (lecture seule).
+
+    Attributs:
+        ids (np.ndarray): ID du sommet de chaque ligne
+        rank (np.ndarray): Rang de contraction de chaque ligne (0 = contracté en premier)
+        up_offsets, up_targets, up_weights, up_middles (np.ndarray): graphe
+            montant, arcs v -> w avec rank[w] > rank[v]
+        down_offsets, down_sources, down_weights, down_middles (np.ndarray):
+            graphe descendant rangé par cible, arcs u -> v avec rank[u] > rank[v]
+            (rangés à la ligne v)
+        directed (bool): Graphe d'origine orienté ou non
+        num_shortcuts (int): Nombre de raccourcis ajoutés
+
+    Un milieu vaut -1 pour une arête du graphe d'origine.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        rank: np.ndarray,
+        up: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        down: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        directed: bool = True
+    ):
+        """
+        Construit une hiérarchie à partir de ses tableaux (voir build et load).
+
+        Args:
+            ids: ID de chaque ligne
+            rank: Rang de chaque ligne
+            up: (offsets, cibles, poids, milieux) du graphe montant
+            down: (offsets, sources, poids, milieux) du graphe descendant, par cible
+            directed: Graphe d'origine orienté ou non
+        """
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.rank = np.ascontiguousarray(rank, dtype=np.int64)
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = (
+            np.ascontiguousarray(a, dtype=t)
+            for a, t in zip(up, (np.int64, np.int64, np.float64, np.int64)))
+        self.down_offsets, self.down_sources, self.down_weights, self.down_middles = (
+            np.ascontiguousarray(a, dtype=t)
+            for a, t in zip(down, (np.int64, np.int64, np.float64, np.int64)))
+        self.directed = directed
+        self.num_shortcuts = int((self.up_middles >= 0).sum() + (self.down_middles >= 0).sum())
+
+        # Vues mémoire : l'indexation renvoie des int/float Python sans copie
+        self._up = (memoryview(self.up_offsets), memoryview(self.up_targets),
+                    memoryview(self.up_weights), memoryview(self.up_middles))
+        self._down = (memoryview(self.down_offsets), memoryview(self.down_sources),
+                      memoryview(self.down_weights), memoryview(self.down_middles))
+        n = len(self.ids)
+        self._identity = bool(n == 0 or np.array_equal(self.ids, np.arange(n)))
+        self._index: Optional[Dict[int, int]] = None
+
+    # ------------------------------------------------------------------
+    # Prétraitement
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        graph: Graph,
+        witness_limit: int = 200,
+        verbose: bool = False
+    ) -> 'ContractionHierarchy':
+        """
+        Contracte tous les sommets d'un graphe.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph (poids positifs ou nuls)
+            witness_limit: Nombre maximal de sommets fermés par recherche de
+                témoin ; au-delà, le raccourci est ajouté (résultat toujours
+                exact, seulement un peu plus d'arêtes)
+            verbose: Affiche l'avancement
+
+        Returns:
+            ContractionHierarchy
+        """
+        n = graph.num_vertices()
+        # Graphe restant : out[v][w] = (poids, milieu), inn[w][v] = idem
+        out: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        inn: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for row in range(n):
+            arcs = out[row]
+            for target, weight in graph.row_neighbors(row):
+                if target != row and (target not in arcs or weight < arcs[target][0]):
+                    arcs[target] = (weight, -1)
+                    inn[target][row] = (weight, -1)
+
+        contracted = [False] * n
+        deleted_neighbors = [0] * n
+        up: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        down: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        rank = np.empty(n, dtype=np.int64)
+
+        def shortcuts_of(v: int, limit: int) -> List[Tuple[int, int, float]]:
+            """Raccourcis (u, w, poids) nécessaires si v est contracté maintenant."""
+            result = []
+            outgoing = out[v]
+            if not outgoing:
+                return result
+            max_out = max(weight for weight, _ in outgoing.values())
+            for u, (w_uv, _) in inn[v].items():
+                targets = {w: w_uv + w_vw for w, (w_vw, _) in outgoing.items() if w != u}
+                if not targets:
+                    continue
+                witness = cls._witness_search(out, u, v, targets, w_uv + max_out, limit)
+                for w, via_v in targets.items():
+                    if witness.get(w, float('inf')) > via_v:
+                        result.append((u, w, via_v))
+            return result
+
+        # Les priorités sont estimées avec des recherches de témoin plus courtes
+        estimate_limit = max(1, witness_limit // 8)
+
+        def priority(v: int) -> int:
+            edge_difference = len(shortcuts_of(v, estimate_limit)) - len(out[v]) - len(inn[v])
+            return edge_difference + deleted_neighbors[v]
+
+        queue = [(priority(v), v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            if contracted[v]:
+                continue
+            # Mise à jour paresseuse : si la priorité a augmenté, on la repousse
+            current = priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, weight in shortcuts_of(v, witness_limit):
+                existing = out[u].get(w)
+                if existing is None or weight < existing[0]:
+                    out[u][w] = (weight, v)
+                    inn[w][u] = (weight, v)
+
+            # Arcs restants de v : tous mènent à des sommets de rang supérieur
+            up[v] = [(w, weight, middle) for w, (weight, middle) in out[v].items()]
+            down[v] = [(u, weight, middle) for u, (weight, middle) in inn[v].items()]
+            for w in out[v]:
+                del inn[w][v]
+                deleted_neighbors[w] += 1
+            for u in inn[v]:
+                del out[u][v]
+                deleted_neighbors[u] += 1
+            out[v], inn[v] = {}, {}
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+            if verbose and order % 10000 == 0:
+                print(f"  {order}/{n} sommets contractés")
+
+        return cls(np.fromiter(graph.row_ids(), dtype=np.int64, count=n), rank,
+                   _to_csr(up), _to_csr(down), directed=graph.directed)
+
+    @staticmethod
+    def _witness_search(
+        out: List[Dict[int, Tuple[float, int]]],
+        source: int,
+        excluded: int,
+        targets: Dict[int, float],
+        max_distance: float,
+        limit: int
+    ) -> Dict[int, float]:
+        """
+        Dijkstra local depuis source dans le graphe restant, sans passer par excluded.
+
+        S'arrête quand toutes les cibles sont fermées, quand la distance
+        dépasse max_distance ou après limit sommets fermés.
+
+        Returns:
+            Distances provisoires {ligne: distance}
+        """
+        distances = {source: 0.0}
+        queue = [(0.0, source)]
+        settled = set()
+        remaining = len(targets)
+        while queue and len(settled) < limit:
+            d, current = heapq.heappop(queue)
+            if current in settled:
+                continue
+            if d > max_distance:
+                break
+            settled.add(current)
+            if current in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            for neighbor, (weight, _) in out[current].items():
+                if neighbor == excluded:
+                    continue
+                new_distance = d + weight
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    heapq.heappush(queue, (new_distance, neighbor))
+        return distances
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def num_vertices(self) -> int:
+        """Retourne le nombre de sommets."""
+        return len(self.ids)
+
+    def has_vertex(self, vertex_id: int) -> bool:
+        """Vérifie si un sommet existe."""
+        if self._identity:
+            return isinstance(vertex_id, (int, np.integer)) and 0 <= vertex_id < len(self.ids)
+        return vertex_id in self._id_index()
+
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        if self._identity:
+            if 0 <= vertex_id < len(self.ids):
+                return int(vertex_id)
+            raise KeyError(vertex_id)
+        return self._id_index()[vertex_id]
+
+    def _id_index(self) -> Dict[int, int]:
+        """Table ID -> ligne, construite au premier appel."""
+        if self._index is None:
+            self._index = {v: r for r, v in enumerate(self.ids.tolist())}
+        return self._index
+
+    def query(self, source: int, target: int) -> PathResult:
+        """
+        Plus court chemin de source à cible.
+
+        Args:
+            source: ID du sommet de départ
+            target: ID du sommet d'arrivée
+
+        Returns:
+            PathResult avec le chemin complet (raccourcis dépliés) ;
+            visited_nodes compte les sommets fermés par les deux recherches
+
+        Raises:
+            ValueError: si un sommet n'existe pas
+        """
+        start_time = time.perf_counter()
+        if not self.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not self.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+        if source == target:
+            return PathResult(path=[source], cost=0.0, visited_nodes=1,
+                              explored_nodes={source},
+                              execution_time=time.perf_counter() - start_time,
+                              success=True)
+
+        s_row, t_row = self.index_of(source), self.index_of(target)
+        cost, meet, parents_f, parents_b, settled, relaxed = self._search(s_row, t_row)
+        ids = self.ids.tolist() if not self._identity else None
+        to_id = (lambda row: row) if ids is None else ids.__getitem__
+        explored = {to_id(row) for row in settled}
+        if meet < 0:
+            return PathResult(visited_nodes=len(explored), explored_nodes=explored,
+                              relaxed_edges=relaxed,
+                              execution_time=time.perf_counter() - start_time,
+                              success=False)
+
+        # Chemin dans la hiérarchie : s -> meet (montant), meet -> t (descendant)
+        up_path = [meet]
+        while parents_f[up_path[-1]] >= 0:
+            up_path.append(parents_f[up_path[-1]])
+        up_path.reverse()
+        down_path = [meet]
+        while parents_b[down_path[-1]] >= 0:
+            down_path.append(parents_b[down_path[-1]])
+
+        rows = [s_row]
+        for a, b in zip(up_path, up_path[1:]):
+            self._unpack(a, b, rows)
+        for a, b in zip(down_path, down_path[1:]):
+            self._unpack(a, b, rows)
+
+        return PathResult(
+            path=[to_id(row) for row in rows],
+            cost=cost,
+            visited_nodes=len(explored),
+            explored_nodes=explored,
+            relaxed_edges=relaxed,
+            execution_time=time.perf_counter() - start_time,
+            success=True
+        )
+
+    def distance(self, source: int, target: int) -> float:
+        """
+        Coût du plus court chemin (inf si aucun chemin), sans dépliage.
+
+        Raises:
+            ValueError: si un sommet n'existe pas
+        """
+        if not self.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not self.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+        if source == target:
+            return 0.0
+        return self._search(self.index_of(source), self.index_of(target))[0]
+
+    def _search(self, s_row: int, t_row: int):
+        """
+        Recherche bidirectionnelle montante, avec élagage « stall-on-demand » :
+        un sommet atteint plus court depuis un voisin de rang supérieur (par
+        une arête descendante) n'est pas développé.
+
+        Returns:
+            (coût, sommet de rencontre ou -1, parents avant, parents arrière,
+             lignes fermées, arcs relâchés)
+        """
+        up_offsets, up_targets, up_weights, _ = self._up
+        down_offsets, down_sources, down_weights, _ = self._down
+
+        dist = ({s_row: 0.0}, {t_row: 0.0})
+        parents = ({s_row: -1}, {t_row: -1})
+        queues = ([(0.0, s_row)], [(0.0, t_row)])
+        done = (set(), set())
+        # Recherche avant : monte par les arcs du graphe montant, et se
+        # bloque via les arcs descendants (qui arrivent au sommet) ; l'inverse
+        # pour la recherche arrière
+        expand = ((up_offsets, up_targets, up_weights),
+                  (down_offsets, down_sources, down_weights))
+        stall = ((down_offsets, down_sources, down_weights),
+                 (up_offsets, up_targets, up_weights))
+
+        mu = float('inf')
+        meet = -1
+        settled = []
+        relaxed = 0
+        while queues[0] or queues[1]:
+            # Côté dont la clé minimale est la plus petite
+            if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]):
+                side = 0
+            else:
+                side = 1
+            queue = queues[side]
+            d, v = heapq.heappop(queue)
+            if d >= mu:
+                queue.clear()   # ce côté ne peut plus améliorer mu
+                continue
+            if v in done[side]:
+                continue
+            done[side].add(v)
+            settled.append(v)
+            my_dist = dist[side]
+
+            other = dist[1 - side].get(v)
+            if other is not None and d + other < mu:
+                mu = d + other
+                meet = v
+
+            # Stall-on-demand
+            offsets, arcs, weights = stall[side]
+            stalled = False
+            for i in range(offsets[v], offsets[v + 1]):
+                u_dist = my_dist.get(arcs[i])
+                if u_dist is not None and u_dist + weights[i] < d:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+
+            offsets, arcs, weights = expand[side]
+            my_parents = parents[side]
+            for i in range(offsets[v], offsets[v + 1]):
+                w = arcs[i]
+                new_distance = d + weights[i]
+                relaxed += 1
+                if new_distance < my_dist.get(w, float('inf')):
+                    my_dist[w] = new_distance
+                    my_parents[w] = v
+                    heapq.heappush(queue, (new_distance, w))
+
+        return mu, meet, parents[0], parents[1], settled, relaxed
+
+    def _arc_middle(self, a: int, b: int) -> int:
+        """Milieu de l'arc a -> b de la hiérarchie (-1 : arête d'origine)."""
+        if self.rank[a] < self.rank[b]:
+            offsets, arcs, weights, middles = self._up
+            row, other = a, b
+        else:
+            offsets, arcs, weights, middles = self._down
+            row, other = b, a
+        for i in range(offsets[row], offsets[row + 1]):
+            if arcs[i] == other:
+                return middles[i]
+        raise KeyError((a, b))
+
+    def _unpack(self, a: int, b: int, rows: List[int]) -> None:
+        """Ajoute à rows les sommets de l'arc a -> b déplié, sans a."""
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            middle = self._arc_middle(a, b)
+            if middle < 0:
+                rows.append(b)
+            else:
+                # a -> middle d'abord : empilé en dernier
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    # ------------------------------------------------------------------
+    # Sauvegarde
+    # ------------------------------------------------------------------
+
+    def save(self, filename: str) -> None:
+        """
+        Sauvegarde la hiérarchie (format NumPy .npz, nom de fichier inchangé).
+
+        Args:
+            filename: Chemin du fichier
+        """
+        with open(filename, "wb") as f:
+            np.savez(
+                f, ids=self.ids, rank=self.rank, directed=np.array(self.directed),
+                up_offsets=self.up_offsets, up_targets=self.up_targets,
+                up_weights=self.up_weights, up_middles=self.up_middles,
+                down_offsets=self.down_offsets, down_sources=self.down_sources,
+                down_weights=self.down_weights, down_middles=self.down_middles
+            )
+
+    @classmethod
+    def load(cls, filename: str) -> 'ContractionHierarchy':
+        """
+        Recharge une hiérarchie sauvegardée.
+
+        Args:
+            filename: Chemin du fichier
+
+        Returns:
+            ContractionHierarchy prête pour les requêtes
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            return cls(
+                data["ids"], data["rank"],
+                (data["up_offsets"], data["up_targets"], data["up_weights"], data["up_middles"]),
+                (data["down_offsets"], data["down_sources"], data["down_weights"],
+                 data["down_middles"]),
+                directed=bool(data["directed"])
+            )
+
+    def __repr__(self) -> str:
+        return (f"ContractionHierarchy(vertices={self.num_vertices()}, "
+                f"shortcuts={self.num_shortcuts})")
@@ -0,0 +1,629 @@
+"""
+Module de planification d'itinéraires personnalisable (Customizable Route
+Planning, CRP).
+
+Le prétraitement est séparé en deux phases :
+
+1. Topologie (une seule fois, indépendante des poids) : les sommets sont
+   découpés en cellules emboîtées sur plusieurs niveaux, par bissection
+   récursive des coordonnées. Pour chaque cellule on relève ses sommets
+   d'entrée (extrémité d'un arc venant d'une autre cellule) et de sortie.
+
+2. Personnalisation (à chaque nouveau vecteur de poids) : pour chaque
+   cellule, les distances de chaque entrée vers chaque sortie sans quitter
+   la cellule (une « clique »). Le niveau 1 se calcule sur les arcs du
+   graphe, chaque niveau supérieur sur les cliques du niveau inférieur :
+   tout le travail est fait par cellule, en NumPy.
+
+Requête : un Dijkstra bidirectionnel qui utilise les arcs du graphe près
+de la source et de la cible, et les cliques du plus haut niveau possible
+ailleurs. Les arcs de clique du chemin trouvé sont ensuite dépliés par des
+recherches limitées à leur cellule.
+
+Usage :
+    >>> overlay = CRPOverlay.build(graph)          # topologie, une fois
+    >>> metric = overlay.customize(graph)          # quelques secondes
+    >>> add_traffic_congestion(graph)
+    >>> metric = overlay.customize(graph)          # nouveaux poids
+    >>> result = metric.query(source, target)      # PathResult, chemin complet
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .algorithms import PathResult
+from .csr import CSRGraph
+
+
+DEFAULT_CELL_SIZES = (64, 1024, 16384)
+
+
+def _bisect(xs: np.ndarray, ys: np.ndarray, rows: np.ndarray, max_size: int) -> List[np.ndarray]:
+    """
+    Découpe des lignes en parts d'au plus max_size sommets, en coupant
+    récursivement à la médiane de l'axe le plus étendu.
+
+    Returns:
+        Liste des parts (tableaux de lignes)
+    """
+    parts = []
+    stack = [rows]
+    while stack:
+        part = stack.pop()
+        if len(part) <= max_size:
+            parts.append(part)
+            continue
+        x, y = xs[part], ys[part]
+        key = x if np.ptp(x) >= np.ptp(y) else y
+        order = np.argsort(key, kind='stable')
+        half = len(part) // 2
+        stack.append(part[order[half:]])
+        stack.append(part[order[:half]])
+    return parts
+
+
+def _group(keys: np.ndarray, values: np.ndarray, num_groups: int) -> List[np.ndarray]:
+    """Répartit values selon keys (0..num_groups-1), ordre croissant dans chaque groupe."""
+    order = np.lexsort((values, keys))
+    bounds = np.searchsorted(keys[order], np.arange(num_groups + 1))
+    values = values[order]
+    return [values[bounds[c]:bounds[c + 1]] for c in range(num_groups)]
+
+
+class CRPOverlay:
+    """
+    Partition multi-niveaux d'un graphe et structure des cellules (sans poids).
+
+    Attributs:
+        ids (np.ndarray): ID du sommet de chaque ligne
+        cell_sizes (Tuple[int, ...]): Taille maximale des cellules de chaque niveau
+        cells (np.ndarray): cells[k, r] = cellule de la ligne r au niveau k + 1
+        arc_levels (np.ndarray): Nombre de niveaux auxquels chaque arc change de
+            cellule (0 : arc interne à une cellule du niveau 1)
+        entries, exits (List[List[np.ndarray]]): Lignes d'entrée et de sortie de
+            chaque cellule, par niveau
+    """
+
+    def __init__(self, csr: CSRGraph, cell_sizes: Sequence[int]):
+        """
+        Calcule la topologie (voir build).
+
+        Args:
+            csr: Graphe figé
+            cell_sizes: Tailles maximales des cellules, croissantes
+        """
+        n = csr.num_vertices()
+        self.ids = csr.ids
+        self.directed = csr.directed
+        self.offsets = csr.offsets
+        self.targets = csr.targets
+        # Un niveau dont une seule cellule couvre tout le graphe ne sert à rien
+        self.cell_sizes = tuple(size for size in cell_sizes if size < n)
+        num_levels = len(self.cell_sizes)
+
+        # Partition emboîtée : chaque niveau redécoupe les cellules du niveau supérieur
+        self.cells = np.zeros((num_levels, n), dtype=np.int64)
+        parts = [np.arange(n, dtype=np.int64)]
+        for k in reversed(range(num_levels)):
+            parts = [piece for part in parts
+                     for piece in _bisect(csr.xs, csr.ys, part, self.cell_sizes[k])]
+            for c, piece in enumerate(parts):
+                self.cells[k, piece] = c
+        self.num_cells = [int(self.cells[k].max()) + 1 for k in range(num_levels)]
+
+        tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.offsets))
+        heads = self.targets
+        self.arc_levels = np.zeros(len(heads), dtype=np.int8)
+        for k in range(num_levels):
+            self.arc_levels += self.cells[k, tails] != self.cells[k, heads]
+
+        # Entrées et sorties de chaque cellule
+        self.entries: List[List[np.ndarray]] = []
+        self.exits: List[List[np.ndarray]] = []
+        self._entry_pos = np.full((num_levels, n), -1, dtype=np.int64)
+        self._exit_pos = np.full((num_levels, n), -1, dtype=np.int64)
+        for k in range(num_levels):
+            cut = self.arc_levels > k
+            entry_rows = np.unique(heads[cut])
+            exit_rows = np.unique(tails[cut])
+            self.entries.append(_group(self.cells[k, entry_rows], entry_rows, self.num_cells[k]))
+            self.exits.append(_group(self.cells[k, exit_rows], exit_rows, self.num_cells[k]))
+            for rows in self.entries[k]:
+                self._entry_pos[k, rows] = np.arange(len(rows))
+            for rows in self.exits[k]:
+                self._exit_pos[k, rows] = np.arange(len(rows))
+
+        # Position de la clique de chaque cellule dans le tableau de valeurs du niveau
+        self._clique_offsets: List[np.ndarray] = []
+        for k in range(num_levels):
+            sizes = [len(en) * len(ex) for en, ex in zip(self.entries[k], self.exits[k])]
+            offsets = np.zeros(self.num_cells[k] + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+            self._clique_offsets.append(offsets)
+
+        self._cell_graphs = [self._build_cell_graphs(k, tails, heads) for k in range(num_levels)]
+
+        # Copies en listes Python et vues mémoire pour les requêtes
+        self._cells = [self.cells[k].tolist() for k in range(num_levels)]
+        self._entry_positions = [self._entry_pos[k].tolist() for k in range(num_levels)]
+        self._exit_positions = [self._exit_pos[k].tolist() for k in range(num_levels)]
+        self._entry_lists = [[rows.tolist() for rows in self.entries[k]] for k in range(num_levels)]
+        self._exit_lists = [[rows.tolist() for rows in self.exits[k]] for k in range(num_levels)]
+        self._clique_starts = [self._clique_offsets[k].tolist() for k in range(num_levels)]
+        self._offsets = memoryview(self.offsets)
+        self._targets = memoryview(self.targets)
+        self._arc_levels = memoryview(self.arc_levels)
+
+        # Arcs rangés par tête, pour la recherche arrière
+        self.reverse_arcs = np.argsort(heads, kind='stable')
+        self.reverse_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=n), out=self.reverse_offsets[1:])
+        self.reverse_sources = tails[self.reverse_arcs]
+        self._reverse_offsets = memoryview(self.reverse_offsets)
+        self._reverse_sources = memoryview(self.reverse_sources)
+        self._reverse_arc_levels = memoryview(self.arc_levels[self.reverse_arcs])
+        self._identity = bool(n == 0 or np.array_equal(self.ids, np.arange(n)))
+        self._index: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def build(
+        cls,
+        graph,
+        cell_sizes: Sequence[int] = DEFAULT_CELL_SIZES
+    ) -> 'CRPOverlay':
+        """
+        Partitionne un graphe et prépare ses cellules (indépendant des poids).
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph
+            cell_sizes: Nombre maximal de sommets par cellule, du niveau 1 au
+                niveau le plus haut (strictement croissant)
+
+        Returns:
+            CRPOverlay, à personnaliser avec customize()
+
+        Raises:
+            ValueError: si cell_sizes n'est pas strictement croissant et positif
+        """
+        cell_sizes = tuple(int(size) for size in cell_sizes)
+        if not cell_sizes or cell_sizes[0] < 1 or any(
+                a >= b for a, b in zip(cell_sizes, cell_sizes[1:])):
+            raise ValueError("cell_sizes doit être strictement croissant et positif")
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        return cls(csr, cell_sizes)
+
+    def _build_cell_graphs(self, k: int, tails: np.ndarray, heads: np.ndarray) -> list:
+        """
+        Graphe local de chaque cellule du niveau k + 1, en indices locaux.
+
+        Au niveau 1 : les sommets de la cellule et ses arcs internes, triés
+        par tête. Au-dessus : les entrées/sorties des sous-cellules, reliées
+        par leurs cliques (une par sous-cellule) et par les arcs qui changent
+        de sous-cellule sans quitter la cellule.
+
+        Returns:
+            Par cellule, au niveau 1 : (nb sommets locaux, queues, arcs,
+            têtes distinctes, débuts de groupes par tête, entrées locales,
+            sorties locales) ; au-dessus : (nb sommets locaux, cliques
+            [(entrées, sorties, début)], queues, têtes, arcs, entrées
+            locales, sorties locales)
+        """
+        n = len(self.ids)
+        cells = self.cells[k]
+        internal = np.flatnonzero(self.arc_levels == k)
+        arcs_by_cell = _group(cells[tails[internal]], internal, self.num_cells[k])
+        if k == 0:
+            members = _group(cells, np.arange(n, dtype=np.int64), self.num_cells[k])
+        else:
+            boundary = np.unique(np.concatenate(
+                self.entries[k - 1] + self.exits[k - 1] + [np.empty(0, dtype=np.int64)]))
+            members = _group(cells[boundary], boundary, self.num_cells[k])
+            subcells = _group(self.cells[k][self._first_rows(k - 1)],
+                              np.arange(self.num_cells[k - 1], dtype=np.int64),
+                              self.num_cells[k])
+
+        local = np.full(n, -1, dtype=np.int64)
+        graphs = []
+        for c in range(self.num_cells[k]):
+            rows = members[c]
+            local[rows] = np.arange(len(rows))
+            arcs = arcs_by_cell[c]
+            arc_tails, arc_heads = local[tails[arcs]], local[heads[arcs]]
+            sources, targets = local[self.entries[k][c]], local[self.exits[k][c]]
+            if k == 0:
+                order = np.argsort(arc_heads, kind='stable')
+                arc_heads = arc_heads[order]
+                starts = np.flatnonzero(np.r_[True, arc_heads[1:] != arc_heads[:-1]]) \
+                    if len(arc_heads) else np.empty(0, dtype=np.int64)
+                graphs.append((len(rows), arc_tails[order], arcs[order],
+                               arc_heads[starts], starts, sources, targets))
+            else:
+                cliques = [(local[self.entries[k - 1][s]], local[self.exits[k - 1][s]],
+                            int(self._clique_offsets[k - 1][s])) for s in subcells[c]]
+                graphs.append((len(rows), cliques, arc_tails, arc_heads, arcs,
+                               sources, targets))
+            local[rows] = -1
+        return graphs
+
+    def _first_rows(self, k: int) -> np.ndarray:
+        """Une ligne de chaque cellule du niveau k + 1."""
+        first = np.zeros(self.num_cells[k], dtype=np.int64)
+        first[self.cells[k][::-1]] = np.arange(len(self.ids))[::-1]
+        return first
+
+    # ------------------------------------------------------------------
+    # Personnalisation
+    # ------------------------------------------------------------------
+
+    def customize(self, weights) -> 'CRPMetric':
+        """
+        Calcule les cliques de toutes les cellules pour un vecteur de poids.
+
+        Args:
+            weights: Graphe de même topologie (Graph, CompactGraph ou
+                CSRGraph, lu dans son état courant) ou tableau des poids des
+                arcs dans l'ordre CSR
+
+        Returns:
+            CRPMetric prêt pour les requêtes
+
+        Raises:
+            ValueError: si la topologie ou le nombre de poids ne correspond pas
+        """
+        if isinstance(weights, np.ndarray):
+            base = np.ascontiguousarray(weights, dtype=np.float64)
+        else:
+            csr = weights if isinstance(weights, CSRGraph) else weights.freeze()
+            if not (np.array_equal(csr.offsets, self.offsets)
+                    and np.array_equal(csr.targets, self.targets)):
+                raise ValueError("Le graphe n'a pas la topologie de la partition")
+            base = csr.weights
+        if len(base) != len(self.targets):
+            raise ValueError(f"{len(self.targets)} poids attendus, {len(base)} reçus")
+
+        values = []
+        for k, graphs in enumerate(self._cell_graphs):
+            level_values = np.empty(int(self._clique_offsets[k][-1]), dtype=np.float64)
+            for c, cell_graph in enumerate(graphs):
+                start, end = self._clique_offsets[k][c], self._clique_offsets[k][c + 1]
+                if end == start:
+                    continue
+                if k == 0:
+                    cliques = self._cell_distances(cell_graph, base)
+                else:
+                    cliques = self._overlay_distances(cell_graph, values[k - 1], base)
+                level_values[start:end] = cliques.ravel()
+            values.append(level_values)
+        return CRPMetric(self, base, values)
+
+    @staticmethod
+    def _cell_distances(cell_graph: tuple, weights: np.ndarray) -> np.ndarray:
+        """
+        Distances des entrées vers les sorties d'une cellule du niveau 1 :
+        Bellman-Ford sur ses arcs internes, toutes les entrées à la fois
+        (une ligne par entrée).
+
+        Returns:
+            Matrice (entrées × sorties)
+        """
+        num_local, tails, arcs, heads, starts, sources, targets = cell_graph
+        dist = np.full((len(sources), num_local), np.inf)
+        dist[np.arange(len(sources)), sources] = 0.0
+        if len(tails):
+            arc_weights = weights[arcs]
+            for _ in range(num_local):
+                best = np.minimum.reduceat(dist[:, tails] + arc_weights, starts, axis=1)
+                current = dist[:, heads]
+                if not (best < current).any():
+                    break
+                dist[:, heads] = np.minimum(current, best)
+        return dist[:, targets]
+
+    @staticmethod
+    def _overlay_distances(cell_graph: tuple, lower: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Distances des entrées vers les sorties d'une cellule de niveau
+        supérieur, sur les cliques de ses sous-cellules et les arcs entre
+        elles. Chaque tour traverse les cliques (produit min-plus par bloc)
+        puis les arcs ; seuls les sommets améliorés au tour précédent sont
+        repris.
+
+        Args:
+            cell_graph: Graphe local (voir _build_cell_graphs)
+            lower: Cliques du niveau inférieur
+            weights: Poids des arcs du graphe
+
+        Returns:
+            Matrice (entrées × sorties)
+        """
+        num_local, cliques, tails, heads, arcs, sources, targets = cell_graph
+        blocks = [(en, ex, lower[start:start + len(en) * len(ex)].reshape(len(en), len(ex), 1))
+                  for en, ex, start in cliques]
+        arc_weights = weights[arcs][:, None]
+
+        # Une colonne par entrée de la cellule
+        dist = np.full((num_local, len(sources)), np.inf)
+        dist[sources, np.arange(len(sources))] = 0.0
+        via_clique = np.zeros(num_local, dtype=bool)   # à propager par les cliques
+        via_arc = np.zeros(num_local, dtype=bool)      # à propager par les arcs
+        via_clique[sources] = via_arc[sources] = True
+        while True:
+            for en, ex, clique in blocks:
+                if not via_clique[en].any():
+                    continue
+                via_clique[en] = False
+                best = (dist[en][:, None, :] + clique).min(axis=0)
+                current = dist[ex]
+                improved = ex[(best < current).any(axis=1)]
+                if len(improved):
+                    dist[ex] = np.minimum(current, best)
+                    via_clique[improved] = via_arc[improved] = True
+
+            active = via_arc[tails]
+            if not active.any():
+                if not any(via_clique[en].any() for en, _, _ in blocks):
+                    break
+                continue
+            t, h = tails[active], heads[active]
+            via_arc[t] = False
+            candidates = dist[t] + arc_weights[active]
+            improved = h[(candidates < dist[h]).any(axis=1)]
+            np.minimum.at(dist, h, candidates)
+            via_clique[improved] = via_arc[improved] = True
+        return dist[targets].T
+
+    # ------------------------------------------------------------------
+    # Correspondance ID <-> ligne
+    # ------------------------------------------------------------------
+
+    def num_vertices(self) -> int:
+        """Retourne le nombre de sommets."""
+        return len(self.ids)
+
+    def num_levels(self) -> int:
+        """Retourne le nombre de niveaux de cellules."""
+        return len(self.cell_sizes)
+
+    def has_vertex(self, vertex_id: int) -> bool:
+        """Vérifie si un sommet existe."""
+        if self._identity:
+            return isinstance(vertex_id, (int, np.integer)) and 0 <= vertex_id < len(self.ids)
+        return vertex_id in self._id_index()
+
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        if self._identity:
+            if 0 <= vertex_id < len(self.ids):
+                return int(vertex_id)
+            raise KeyError(vertex_id)
+        return self._id_index()[vertex_id]
+
+    def _id_index(self) -> Dict[int, int]:
+        """Table ID -> ligne, construite au premier appel."""
+        if self._index is None:
+            self._index = {v: r for r, v in enumerate(self.ids.tolist())}
+        return self._index
+
+    def __repr__(self) -> str:
+        return (f"CRPOverlay(vertices={self.num_vertices()}, "
+                f"cells={self.num_cells})")
+
+
+class CRPMetric:
+    """
+    Partition personnalisée pour un vecteur de poids : moteur de requêtes.
+
+    Attributs:
+        overlay (CRPOverlay): Topologie partagée
+        weights (np.ndarray): Poids des arcs dans l'ordre CSR
+        values (List[np.ndarray]): Cliques de chaque niveau, mises bout à bout
+    """
+
+    def __init__(self, overlay: CRPOverlay, weights: np.ndarray, values: List[np.ndarray]):
+        """
+        Args:
+            overlay: Topologie
+            weights: Poids des arcs
+            values: Cliques de chaque niveau (voir CRPOverlay.customize)
+        """
+        self.overlay = overlay
+        self.weights = weights
+        self.values = values
+        self._weights = memoryview(weights)
+        self._reverse_weights = memoryview(np.ascontiguousarray(weights[overlay.reverse_arcs]))
+        self._values = [memoryview(v) for v in values]
+
+    def query(self, source: int, target: int) -> PathResult:
+        """
+        Plus court chemin de source à cible.
+
+        Args:
+            source: ID du sommet de départ
+            target: ID du sommet d'arrivée
+
+        Returns:
+            PathResult avec le chemin complet (arcs de clique dépliés) ;
+            visited_nodes compte les sommets fermés par les deux recherches
+
+        Raises:
+            ValueError: si un sommet n'existe pas
+        """
+        start_time = time.perf_counter()
+        overlay = self.overlay
+        if not overlay.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not overlay.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+
+        s_row, t_row = overlay.index_of(source), overlay.index_of(target)
+        cost, meet, parents_f, parents_b, settled, relaxed = self._search(s_row, t_row)
+        to_id = (lambda row: row) if overlay._identity else overlay.ids.tolist().__getitem__
+        explored = {to_id(row) for row in settled}
+        if meet < 0:
+            return PathResult(visited_nodes=len(explored), explored_nodes=explored,
+                              relaxed_edges=relaxed,
+                              execution_time=time.perf_counter() - start_time,
+                              success=False)
+
+        return PathResult(
+            path=[to_id(row) for row in self._path(meet, parents_f, parents_b)],
+            cost=cost,
+            visited_nodes=len(explored),
+            explored_nodes=explored,
+            relaxed_edges=relaxed,
+            execution_time=time.perf_counter() - start_time,
+            success=True
+        )
+
+    def distance(self, source: int, target: int) -> float:
+        """
+        Coût du plus court chemin (inf si aucun chemin), sans dépliage.
+
+        Raises:
+            ValueError: si un sommet n'existe pas
+        """
+        overlay = self.overlay
+        if not overlay.has_vertex(source):
+            raise ValueError(f"Sommet source {source} n'existe pas")
+        if not overlay.has_vertex(target):
+            raise ValueError(f"Sommet cible {target} n'existe pas")
+        return self._search(overlay.index_of(source), overlay.index_of(target))[0]
+
+    def _search(self, s_row: int, t_row: int, level: int = 0, cell: int = -1):
+        """
+        Dijkstra bidirectionnel sur le graphe de requête. Un sommet dont la
+        cellule de niveau q (le plus haut possible) ne contient ni la source
+        ni la cible n'utilise que la clique de sa cellule et les arcs qui en
+        sortent (qui y entrent, en arrière) ; les autres utilisent tous
+        leurs arcs.
+
+        Args:
+            s_row, t_row: Lignes de départ et d'arrivée
+            level, cell: Si level > 0, la recherche reste dans cette cellule
+                du niveau level (dépliage d'un arc de clique)
+
+        Returns:
+            (coût, sommet de rencontre ou -1, parents avant, parents arrière,
+             lignes fermées, arcs relâchés) ; les parents associent à une
+             ligne (voisin, niveau de l'arc), niveau 0 pour un arc du graphe
+        """
+        overlay = self.overlay
+        cells = overlay._cells
+        num_levels = len(cells)
+        source_cells = [cells_k[s_row] for cells_k in cells]
+        target_cells = [cells_k[t_row] for cells_k in cells]
+        restrict = cells[level - 1] if level else None
+        # Avant : entrée -> sorties (ligne de la clique) et arcs sortants ;
+        # arrière : sortie -> entrées (colonne de la clique) et arcs entrants
+        sides = (
+            (overlay._entry_positions, overlay._exit_lists, True,
+             overlay._offsets, overlay._targets, overlay._arc_levels, self._weights),
+            (overlay._exit_positions, overlay._entry_lists, False,
+             overlay._reverse_offsets, overlay._reverse_sources, overlay._reverse_arc_levels,
+             self._reverse_weights),
+        )
+
+        dist = ({s_row: 0.0}, {t_row: 0.0})
+        parents = ({s_row: (-1, 0)}, {t_row: (-1, 0)})
+        queues = ([(0.0, s_row)], [(0.0, t_row)])
+        done = (set(), set())
+        mu = 0.0 if s_row == t_row else float('inf')
+        meet = s_row if s_row == t_row else -1
+        settled = []
+        relaxed = 0
+        while queues[0] and queues[1] and queues[0][0][0] + queues[1][0][0] < mu:
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            d, v = heapq.heappop(queues[side])
+            if v in done[side]:
+                continue
+            done[side].add(v)
+            settled.append(v)
+            positions, neighbors, by_row, offsets, arcs, arc_levels, weights = sides[side]
+            my_dist, other_dist = dist[side], dist[1 - side]
+            my_parents, queue = parents[side], queues[side]
+
+            # Niveau de requête : plus haute cellule sans la source ni la cible
+            q = 0
+            for k in range(num_levels - 1, -1, -1):
+                c = cells[k][v]
+                if c != source_cells[k] and c != target_cells[k]:
+                    q = k + 1
+                    break
+
+            if q:
+                k = q - 1
+                pos = positions[k][v]
+                c = cells[k][v]
+                others = neighbors[k][c]
+                if pos >= 0 and others:
+                    start = overlay._clique_starts[k][c]
+                    if by_row:
+                        start += pos * len(others)
+                        clique = self._values[k][start:start + len(others)]
+                    else:
+                        width = (overlay._clique_starts[k][c + 1] - start) // len(others)
+                        clique = self._values[k][start + pos:start + width * len(others):width]
+                    for x, w in zip(others, clique):
+                        new_distance = d + w
+                        relaxed += 1
+                        if new_distance < my_dist.get(x, float('inf')):
+                            my_dist[x] = new_distance
+                            my_parents[x] = (v, q)
+                            heapq.heappush(queue, (new_distance, x))
+                            other = other_dist.get(x)
+                            if other is not None and new_distance + other < mu:
+                                mu, meet = new_distance + other, x
+
+            for i in range(offsets[v], offsets[v + 1]):
+                if arc_levels[i] < q:
+                    continue
+                x = arcs[i]
+                if restrict is not None and restrict[x] != cell:
+                    continue
+                new_distance = d + weights[i]
+                relaxed += 1
+                if new_distance < my_dist.get(x, float('inf')):
+                    my_dist[x] = new_distance
+                    my_parents[x] = (v, 0)
+                    heapq.heappush(queue, (new_distance, x))
+                    other = other_dist.get(x)
+                    if other is not None and new_distance + other < mu:
+                        mu, meet = new_distance + other, x
+
+        return mu, meet, parents[0], parents[1], settled, relaxed
+
+    def _path(self, meet: int, parents_f: Dict[int, Tuple[int, int]],
+              parents_b: Dict[int, Tuple[int, int]]) -> List[int]:
+        """Chemin complet passant par meet, arcs de clique dépliés."""
+        arcs = []
+        row = meet
+        while parents_f[row][0] >= 0:
+            parent, level = parents_f[row]
+            arcs.append((parent, row, level))
+            row = parent
+        arcs.reverse()
+        row = meet
+        while parents_b[row][0] >= 0:
+            child, level = parents_b[row]
+            arcs.append((row, child, level))
+            row = child
+
+        rows = [arcs[0][0] if arcs else meet]
+        for u, v, level in arcs:
+            if level == 0:
+                rows.append(v)
+            else:
+                # Arc de clique : recherche limitée à la cellule de u
+                cell = self.overlay._cells[level - 1][u]
+                _, sub_meet, sub_f, sub_b, _, _ = self._search(u, v, level, cell)
+                rows.extend(self._path(sub_meet, sub_f, sub_b)[1:])
+        return rows
+
+    def __repr__(self) -> str:
+        return f"CRPMetric(overlay={self.overlay!r})"
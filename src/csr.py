@@ -0,0 +1,321 @@
+"""
+Module de représentation compacte (CSR) des graphes.
+
+Le format CSR (Compressed Sparse Row) range toutes les arêtes sortantes
+dans trois tableaux NumPy contigus :
+- offsets : offsets[r]..offsets[r+1] délimite les arêtes de la ligne r
+- targets : ligne cible de chaque arête
+- weights : poids de chaque arête
+
+Les sommets sont renumérotés en lignes 0..n-1 (tableau ids : ligne -> ID).
+Un CSRGraph est figé : il n'est plus modifiable après construction, ce qui
+permet aux algorithmes de le parcourir sans aucun objet Python par arête.
+"""
+
+from typing import Dict, List, Optional, Tuple, Iterable, Iterator
+from itertools import chain
+import math
+import numpy as np
+from .graph import haversine_distance
+
+
+class CSRGraph:
+    """
+    Graphe figé au format CSR (lecture seule).
+
+    Attributs:
+        ids (np.ndarray): ID du sommet de chaque ligne (int64)
+        offsets (np.ndarray): Début des arêtes de chaque ligne, taille n + 1 (int64)
+        targets (np.ndarray): Ligne cible de chaque arête (int64)
+        weights (np.ndarray): Poids de chaque arête (float64)
+        xs, ys (np.ndarray): Coordonnées des sommets (float64)
+        directed (bool): True si le graphe d'origine est orienté
+        is_geographic (bool): True si les coordonnées sont lon/lat
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray,
+        xs: np.ndarray = None,
+        ys: np.ndarray = None,
+        directed: bool = True,
+        is_geographic: bool = False,
+        num_edges: int = None,
+        identity: Optional[bool] = None
+    ):
+        """
+        Construit un CSRGraph à partir de ses tableaux.
+
+        Args:
+            ids: ID de chaque ligne
+            offsets: Tableau d'offsets (taille n + 1)
+            targets: Lignes cibles des arêtes
+            weights: Poids des arêtes
+            xs: Coordonnées x (zéros si None)
+            ys: Coordonnées y (zéros si None)
+            directed: Graphe orienté ou non
+            is_geographic: Coordonnées géographiques (lon/lat)
+            num_edges: Nombre d'arêtes au sens de Graph (arcs / 2 si non-orienté)
+            identity: True si ids vaut 0..n-1 (vérifié en O(n) si None)
+        """
+        n = len(ids)
+        if len(offsets) != n + 1:
+            raise ValueError("offsets doit contenir n + 1 éléments")
+        if len(targets) != len(weights) or int(offsets[-1]) != len(targets):
+            raise ValueError("targets et weights doivent contenir offsets[-1] éléments")
+
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.targets = np.ascontiguousarray(targets, dtype=np.int64)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.xs = np.zeros(n) if xs is None else np.ascontiguousarray(xs, dtype=np.float64)
+        self.ys = np.zeros(n) if ys is None else np.ascontiguousarray(ys, dtype=np.float64)
+        self.directed = directed
+        self.is_geographic = is_geographic
+        if num_edges is None:
+            num_edges = len(self.targets) if directed else len(self.targets) // 2
+        self.num_edges = num_edges
+
+        # Vues mémoire : l'indexation renvoie des int/float Python sans copie
+        self._offsets = memoryview(self.offsets)
+        self._targets = memoryview(self.targets)
+        self._weights = memoryview(self.weights)
+        self._xs = memoryview(self.xs)
+        self._ys = memoryview(self.ys)
+        self._ids = memoryview(self.ids)
+
+        # Si les IDs valent 0..n-1, ligne = ID et aucune table n'est nécessaire
+        if identity is None:
+            identity = bool(n == 0 or np.array_equal(self.ids, np.arange(n)))
+        self._identity = identity
+        self._index: Optional[Dict[int, int]] = None  # construit au premier besoin
+        self._reversed: Optional['CSRGraph'] = None
+
+    @classmethod
+    def from_graph(cls, graph) -> 'CSRGraph':
+        """
+        Fige un Graph au format CSR.
+
+        Args:
+            graph: Graphe source
+
+        Returns:
+            CSRGraph équivalent (les lignes suivent l'ordre d'insertion des sommets)
+        """
+        n = graph.num_vertices()
+        degrees = np.fromiter((len(t) for t in graph._targets), dtype=np.int64, count=n)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+
+        m = int(offsets[-1])
+        targets = np.fromiter(chain.from_iterable(graph._targets), dtype=np.int64, count=m)
+        weights = np.fromiter(chain.from_iterable(graph._weights), dtype=np.float64, count=m)
+
+        xs, ys = graph.coordinate_arrays()
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        return cls(
+            np.array(graph._ids, dtype=np.int64), offsets, targets, weights, xs, ys,
+            directed=graph.directed,
+            is_geographic=getattr(graph, 'is_geographic', False),
+            num_edges=graph.num_edges_count()
+        )
+
+    # ------------------------------------------------------------------
+    # Correspondance ID <-> ligne
+    # ------------------------------------------------------------------
+
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        if self._identity:
+            if 0 <= vertex_id < len(self.ids):
+                return int(vertex_id)
+            raise KeyError(vertex_id)
+        return self._id_index()[vertex_id]
+
+    def id_of(self, row: int) -> int:
+        """Retourne l'ID du sommet d'une ligne."""
+        return row if self._identity else int(self.ids[row])
+
+    def row_ids(self):
+        """
+        Retourne la séquence ligne -> ID, indexable en O(1).
+
+        Returns:
+            range(n) si les IDs valent 0..n-1, sinon une vue mémoire des IDs
+        """
+        if self._identity:
+            return range(len(self.ids))
+        return self._ids
+
+    def has_vertex(self, vertex_id: int) -> bool:
+        """Vérifie si un sommet existe."""
+        if self._identity:
+            return isinstance(vertex_id, (int, np.integer)) and 0 <= vertex_id < len(self.ids)
+        return vertex_id in self._id_index()
+
+    def _id_index(self) -> Dict[int, int]:
+        """Table ID -> ligne (IDs quelconques), construite en O(n) au premier appel."""
+        if self._index is None:
+            self._index = {v: r for r, v in enumerate(self.ids.tolist())}
+        return self._index
+
+    # ------------------------------------------------------------------
+    # Accès aux arêtes
+    # ------------------------------------------------------------------
+
+    def row_neighbors(self, row: int) -> Iterable[Tuple[int, float]]:
+        """
+        Itère sur les (ligne_voisine, poids) d'une ligne, sans copie.
+
+        Args:
+            row: Ligne du sommet
+
+        Returns:
+            Itérateur de tuples (ligne_voisine, poids)
+        """
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def iter_neighbors(self, vertex_id: int) -> Iterator[Tuple[int, float]]:
+        """
+        Itère sur les voisins d'un sommet avec leurs poids (IDs d'origine), sans liste.
+
+        Args:
+            vertex_id: ID du sommet
+
+        Returns:
+            Itérateur de tuples (voisin_id, poids)
+        """
+        if not self.has_vertex(vertex_id):
+            return iter(())
+        row = self.index_of(vertex_id)
+        if self._identity:
+            return self.row_neighbors(row)
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return zip(map(self._ids.__getitem__, self._targets[start:end]), self._weights[start:end])
+
+    def get_neighbors(self, vertex_id: int) -> List[Tuple[int, float]]:
+        """
+        Retourne les voisins d'un sommet avec leurs poids (IDs d'origine).
+
+        Args:
+            vertex_id: ID du sommet
+
+        Returns:
+            Liste de tuples (voisin_id, poids)
+        """
+        return list(self.iter_neighbors(vertex_id))
+
+    def row_coordinates(self, row: int) -> Tuple[float, float]:
+        """Retourne les coordonnées (x, y) d'une ligne."""
+        return self._xs[row], self._ys[row]
+
+    def row_distance(self, row_a: int, row_b: int) -> float:
+        """
+        Distance à vol d'oiseau entre deux lignes.
+
+        Même convention que Vertex.distance_to : euclidienne dans le plan,
+        Haversine en kilomètres pour un graphe géographique.
+        """
+        xa, ya = self._xs[row_a], self._ys[row_a]
+        xb, yb = self._xs[row_b], self._ys[row_b]
+        if self.is_geographic:
+            return haversine_distance(ya, xa, yb, xb) / 1000.0
+        return math.sqrt((xa - xb)**2 + (ya - yb)**2)
+
+    def edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retourne toutes les arêtes sous forme de tableaux (sources, cibles, poids).
+
+        Returns:
+            Tuple de tableaux NumPy de lignes et de poids
+        """
+        sources = np.repeat(np.arange(len(self.ids), dtype=np.int64), np.diff(self.offsets))
+        return sources, self.targets, self.weights
+
+    def is_symmetric(self) -> bool:
+        """
+        Vérifie que chaque arc u -> v de poids w a un arc v -> u de même poids.
+
+        Vrai par construction pour un graphe non-orienté, sauf si le poids
+        d'un seul sens a été modifié (par exemple graph.get_edge(u, v).weight).
+
+        Complexité : O(m log m)
+        """
+        sources, targets, weights = self.edge_arrays()
+        forward = np.lexsort((weights, targets, sources))
+        backward = np.lexsort((weights, sources, targets))
+        return bool(np.array_equal(sources[forward], targets[backward])
+                    and np.array_equal(targets[forward], sources[backward])
+                    and np.array_equal(weights[forward], weights[backward]))
+
+    def reverse(self) -> 'CSRGraph':
+        """
+        Construit le graphe transposé (arêtes inversées).
+
+        Pour un graphe non-orienté aux poids symétriques, le transposé est le
+        graphe lui-même.
+
+        Returns:
+            CSRGraph transposé, mêmes lignes et mêmes IDs
+        """
+        if not self.directed and self.is_symmetric():
+            return self
+        sources, targets, weights = self.edge_arrays()
+        order = np.argsort(targets, kind='stable')
+        offsets = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=len(self.ids)), out=offsets[1:])
+        return CSRGraph(
+            self.ids, offsets, sources[order], weights[order], self.xs, self.ys,
+            directed=True, is_geographic=self.is_geographic, num_edges=self.num_edges
+        )
+
+    def reverse_graph(self) -> 'CSRGraph':
+        """
+        Retourne le graphe transposé, construit au premier appel puis conservé
+        (un CSRGraph étant figé, il ne devient jamais obsolète).
+        """
+        if self._reversed is None:
+            self._reversed = self.reverse()
+        return self._reversed
+
+    # ------------------------------------------------------------------
+    # Statistiques
+    # ------------------------------------------------------------------
+
+    def num_vertices(self) -> int:
+        """Retourne le nombre de sommets."""
+        return len(self.ids)
+
+    def num_edges_count(self) -> int:
+        """Retourne le nombre d'arêtes (même convention que Graph)."""
+        return self.num_edges
+
+    def num_arcs(self) -> int:
+        """Retourne le nombre d'arêtes orientées stockées."""
+        return len(self.targets)
+
+    def degree(self, vertex_id: int) -> int:
+        """Retourne le degré sortant d'un sommet."""
+        row = self.index_of(vertex_id)
+        return int(self.offsets[row + 1] - self.offsets[row])
+
+    def nbytes(self) -> int:
+        """Retourne la taille mémoire des tableaux (octets)."""
+        return sum(a.nbytes for a in (self.ids, self.offsets, self.targets,
+                                      self.weights, self.xs, self.ys))
+
+    def __repr__(self) -> str:
+        return (f"CSRGraph(vertices={self.num_vertices()}, "
+                f"edges={self.num_edges_count()}, "
+                f"directed={self.directed})")
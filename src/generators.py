@@ -10,7 +10,8 @@ représentatifs de réseaux urbains :
 
 import random
 import math
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+import numpy as np
 from .graph import Graph
 
 
@@ -46,10 +47,8 @@ def generate_grid_graph(
     """
     graph = Graph(directed=False)
     
-    # Créer les sommets avec positions
-    vertex_map = {}  # (row, col) -> vertex_id
-    vertex_id = 0
-    
+    # Créer les sommets avec positions (identifiant = row * cols + col)
+    xs, ys, labels = [], [], []
     for row in range(rows):
         for col in range(cols):
             # Position de base
@@ -61,36 +60,28 @@ def generate_grid_graph(
                 x += random.uniform(-noise * spacing / 2, noise * spacing / 2)
                 y += random.uniform(-noise * spacing / 2, noise * spacing / 2)
             
-            vertex = graph.add_vertex(vertex_id, x, y, label=f"({row},{col})")
-            vertex_map[(row, col)] = vertex_id
-            vertex_id += 1
-    
-    # Créer les arêtes
-    for row in range(rows):
-        for col in range(cols):
-            current_id = vertex_map[(row, col)]
-            
-            # Arête vers la droite
-            if col < cols - 1:
-                right_id = vertex_map[(row, col + 1)]
-                graph.add_edge(current_id, right_id)
-            
-            # Arête vers le bas
-            if row < rows - 1:
-                down_id = vertex_map[(row + 1, col)]
-                graph.add_edge(current_id, down_id)
-            
-            # Arêtes diagonales (optionnel)
-            if add_diagonals:
-                # Diagonale bas-droite
-                if row < rows - 1 and col < cols - 1:
-                    diag_rd = vertex_map[(row + 1, col + 1)]
-                    graph.add_edge(current_id, diag_rd)
-                
-                # Diagonale bas-gauche
-                if row < rows - 1 and col > 0:
-                    diag_ld = vertex_map[(row + 1, col - 1)]
-                    graph.add_edge(current_id, diag_ld)
+            xs.append(x)
+            ys.append(y)
+            labels.append(f"({row},{col})")
+    
+    graph.add_vertices_from(np.arange(rows * cols), xs, ys, labels)
+    
+    # Créer les arêtes : pour chaque sommet, voisins candidats dans l'ordre
+    # droite, bas, diagonale bas-droite, diagonale bas-gauche
+    r, c = np.divmod(np.arange(rows * cols), cols)
+    current = r * cols + c
+    candidates = [
+        (current + 1, c < cols - 1),
+        (current + cols, r < rows - 1),
+    ]
+    if add_diagonals:
+        candidates.append((current + cols + 1, (r < rows - 1) & (c < cols - 1)))
+        candidates.append((current + cols - 1, (r < rows - 1) & (c > 0)))
+    
+    targets = np.column_stack([t for t, _ in candidates])
+    valid = np.column_stack([ok for _, ok in candidates])
+    sources = np.repeat(current, len(candidates)).reshape(targets.shape)
+    graph.add_edges_from(sources[valid], targets[valid])
     
     return graph
 
@@ -122,7 +113,7 @@ def generate_random_urban_graph(
     Returns:
         Graph avec structure réaliste
     """
-    graph = Graph(directed=False)
+    graph = Graph(directed=False, edge_index=True)  # has_edge en O(1)
     
     # Générer positions avec distance minimale
     positions = []
@@ -153,8 +144,9 @@ def generate_random_urban_graph(
         positions.append((x, y))
     
     # Créer les sommets
-    for i, (x, y) in enumerate(positions):
-        graph.add_vertex(i, x, y, label=f"V{i}")
+    xs, ys = zip(*positions) if positions else ((), ())
+    graph.add_vertices_from(np.arange(len(positions)), xs, ys,
+                            [f"V{i}" for i in range(len(positions))])
     
     # Stratégie de connexion
     if connect_nearest:
@@ -220,7 +212,7 @@ def generate_clustered_urban_graph(
     Returns:
         Graph avec structure clustérisée
     """
-    graph = Graph(directed=False)
+    graph = Graph(directed=False, edge_index=True)  # has_edge en O(1)
     
     # Positionner les centres de clusters
     cluster_centers = []
@@ -296,21 +288,60 @@ def add_traffic_congestion(
     """
     Ajoute de la congestion (trafic) à certaines arêtes du graphe.
     
-    Modifie les poids des arêtes pour simuler du trafic dense.
+    Modifie les poids des arêtes pour simuler du trafic dense. Les poids sont
+    écrits dans le stockage lu par tous les algorithmes, et graph.version est
+    incrémenté (les caches de résultats sont invalidés).
     
     Args:
         graph: Le graphe à modifier (modification in-place)
         congestion_factor: Facteur multiplicatif du poids (> 1)
         affected_ratio: Proportion d'arêtes affectées (0 à 1)
+        
+    Note:
+        Pour un graphe non-orienté, chaque route est tirée une fois et ses
+        deux arcs sont modifiés ensemble : les poids restent symétriques
+        (les recherches arrière utilisent le graphe comme son transposé).
     """
-    all_edges = graph.get_all_edges()
-    num_affected = int(len(all_edges) * affected_ratio)
+    # Routes : groupes d'arcs stockés (ligne, position) modifiés ensemble
+    roads = _roads(graph)
+    num_affected = int(len(roads) * affected_ratio)
+    
+    # Sélectionner aléatoirement des routes
+    affected_roads = random.sample(roads, num_affected)
     
-    # Sélectionner aléatoirement des arêtes
-    affected_edges = random.sample(all_edges, num_affected)
+    weights = graph._weights
+    for road in affected_roads:
+        for row, pos in road:
+            graph._replace_weight(row, pos, weights[row][pos] * congestion_factor)
+
+
+def _roads(graph: Graph) -> List[Tuple[Tuple[int, int], ...]]:
+    """
+    Arcs stockés (ligne, position) de chaque route, dans l'ordre du stockage.
     
-    for edge in affected_edges:
-        edge.weight *= congestion_factor
+    Orienté : une route par arc. Non-orienté : la k-ième arête u -> v est
+    appariée à la k-ième arête v -> u (ajoutées ensemble par add_edge) ; une
+    boucle u -> u est stockée deux fois de suite.
+    """
+    targets = graph._targets
+    if graph.directed:
+        return [((row, pos),) for row, row_targets in enumerate(targets)
+                for pos in range(len(row_targets))]
+    
+    # Positions de chaque arc u -> v, par couple (u, v), dans l'ordre
+    positions: Dict[Tuple[int, int], List[int]] = {}
+    for row, row_targets in enumerate(targets):
+        for pos, t_row in enumerate(row_targets):
+            positions.setdefault((row, t_row), []).append(pos)
+    
+    roads = []
+    for (row, t_row), forward in positions.items():
+        if row < t_row:
+            backward = positions[(t_row, row)]
+            roads.extend(((row, f), (t_row, b)) for f, b in zip(forward, backward))
+        elif row == t_row:
+            roads.extend(((row, f), (row, b)) for f, b in zip(forward[::2], forward[1::2]))
+    return roads
 
 
 def _ensure_connectivity(graph: Graph) -> None:
@@ -339,7 +370,7 @@ def _ensure_connectivity(graph: Graph) -> None:
             
             while queue:
                 current = queue.pop(0)
-                for neighbor, _ in graph.get_neighbors(current):
+                for neighbor, _ in graph.iter_neighbors(current):
                     if neighbor not in visited:
                         visited.add(neighbor)
                         component.add(neighbor)
@@ -7,8 +7,15 @@ Ce module définit les structures de données pour représenter un graphe pondé
 - Graph : Structure complète du graphe avec ses opérations
 """
 
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set, Iterator, Iterable, TYPE_CHECKING
+from contextlib import contextmanager
+import gc
 import math
+import numpy as np
+
+if TYPE_CHECKING:
+    from .csr import CSRGraph
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -26,6 +33,23 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+@contextmanager
+def gc_paused():
+    """
+    Suspend le ramasse-miettes cyclique pendant une construction en masse.
+    
+    Créer des millions d'objets (Edge, Vertex) déclenche sinon des passes
+    répétées du ramasse-miettes, qui re-parcourent tous les objets déjà
+    créés sans rien pouvoir libérer.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 
 class Vertex:
     """
@@ -38,6 +62,8 @@ class Vertex:
         label (str): Nom optionnel du sommet
     """
     
+    __slots__ = ('id', 'x', 'y', 'label')
+    
     def __init__(self, id: int, x: float = 0.0, y: float = 0.0, label: str = ""):
         self.id = id
         self.x = x
@@ -82,8 +108,15 @@ class Edge:
         weight (float): Poids de l'arête (distance, temps, etc.)
         road_type (str): Type de route ('highway', 'main', 'residential')
         speed_limit (float): Vitesse limite (km/h)
+    
+    Une arête rangée dans un graphe n'a pas de poids propre : weight lit et
+    écrit le stockage du graphe (celui que parcourent les algorithmes), de
+    sorte qu'une modification de edge.weight est vue par toutes les recherches.
     """
     
+    __slots__ = ('source', 'target', 'road_type', 'speed_limit',
+                 '_weight', '_graph', '_row', '_pos')
+    
     def __init__(
         self, 
         source: int, 
@@ -94,9 +127,25 @@ class Edge:
     ):
         self.source = source
         self.target = target
-        self.weight = weight
+        self._weight = weight
         self.road_type = road_type
         self.speed_limit = speed_limit
+        self._graph = None  # graphe propriétaire (None = arête isolée)
+        self._row = -1
+        self._pos = -1
+    
+    @property
+    def weight(self) -> float:
+        if self._graph is None:
+            return self._weight
+        return self._graph._weights[self._row][self._pos]
+    
+    @weight.setter
+    def weight(self, value: float) -> None:
+        if self._graph is None:
+            self._weight = value
+        else:
+            self._graph._replace_weight(self._row, self._pos, value)
     
     def __repr__(self) -> str:
         return f"Edge({self.source} -> {self.target}, w={self.weight:.2f})"
@@ -112,20 +161,53 @@ class Graph:
     - w : fonction de pondération (weight)
     
     Implémentation : Liste d'adjacence pour efficacité O(n + m)
+    
+    Chaque sommet reçoit une ligne (0..n-1, ordre d'insertion). Les voisins
+    d'une ligne sont rangés dans des listes parallèles (lignes cibles, poids,
+    arêtes) : le parcours des voisins n'alloue aucun tuple intermédiaire.
     """
     
-    def __init__(self, directed: bool = True):
+    PARALLEL_EDGE_POLICIES = ("keep_all", "keep_min")
+    
+    def __init__(
+        self,
+        directed: bool = True,
+        edge_index: bool = False,
+        parallel_edges: str = "keep_all"
+    ):
         """
         Initialise un graphe vide.
         
         Args:
             directed: Si True, graphe orienté ; si False, graphe non-orienté
+            edge_index: Si True, maintient un index haché (source, cible) -> arête
+                pour get_edge / has_edge / get_weight en O(1)
+            parallel_edges: Traitement des arêtes parallèles (même source et cible) :
+                'keep_all' les conserve toutes, 'keep_min' ne garde que la moins chère
         """
+        if parallel_edges not in self.PARALLEL_EDGE_POLICIES:
+            raise ValueError(f"Politique d'arêtes parallèles inconnue : {parallel_edges}")
         self.vertices: Dict[int, Vertex] = {}
-        self.adjacency_list: Dict[int, List[Tuple[int, float, Edge]]] = {}
         self.directed = directed
         self.num_edges = 0
         self.is_geographic = False  # True si les coordonnées sont lat/lon
+        self.version = 0            # incrémenté à chaque modification (sommets, arêtes, poids)
+        self._frozen = None         # (version, CSRGraph) : dernier résultat de freeze()
+        
+        # Stockage par ligne
+        self._index: Dict[int, int] = {}      # ID -> ligne
+        self._ids: List[int] = []             # ligne -> ID
+        self._targets: List[List[int]] = []   # ligne -> lignes voisines
+        self._weights: List[List[float]] = [] # ligne -> poids des arêtes
+        self._edges: List[List[Edge]] = []    # ligne -> objets Edge
+        self._identity = True                 # True tant que ID == ligne
+        
+        # Index optionnel des arêtes : clé (ligne source, ligne cible) -> position
+        # de la première arête dans les listes de la ligne source
+        self.parallel_edges = parallel_edges
+        self._edge_index: Optional[Dict[int, int]] = None
+        if edge_index:
+            self.enable_edge_index()
     
     def add_vertex(self, vertex_id: int, x: float = 0.0, y: float = 0.0, label: str = "") -> Vertex:
         """
@@ -143,7 +225,15 @@ class Graph:
         if vertex_id not in self.vertices:
             vertex = Vertex(vertex_id, x, y, label)
             self.vertices[vertex_id] = vertex
-            self.adjacency_list[vertex_id] = []
+            row = len(self._ids)
+            self._index[vertex_id] = row
+            self._ids.append(vertex_id)
+            self._targets.append([])
+            self._weights.append([])
+            self._edges.append([])
+            if vertex_id != row:
+                self._identity = False
+            self.version += 1
             return vertex
         return self.vertices[vertex_id]
     
@@ -180,15 +270,488 @@ class Graph:
             v_target = self.vertices[target]
             weight = v_source.distance_to(v_target)
         
+        self._insert_edge(self._index[source], self._index[target], weight, road_type, speed_limit)
+    
+    def _insert_edge(
+        self,
+        s_row: int,
+        t_row: int,
+        weight: float,
+        road_type: str,
+        speed_limit: float
+    ) -> None:
+        """Insère une arête entre deux lignes existantes (politique d'arêtes parallèles comprise)."""
+        # Arête parallèle : ne garder que la moins chère si demandé
+        if self.parallel_edges == "keep_min":
+            pos = self._edge_position(s_row, t_row)
+            if pos is not None:
+                if weight < self._weights[s_row][pos]:
+                    self._replace_weight(s_row, pos, weight)
+                    if not self.directed:
+                        self._replace_weight(t_row, self._edge_position(t_row, s_row), weight)
+                return
+        
         # Créer l'arête
-        edge = Edge(source, target, weight, road_type, speed_limit)
-        self.adjacency_list[source].append((target, weight, edge))
+        self._append_arc(s_row, t_row, weight, road_type, speed_limit)
         self.num_edges += 1
         
         # Si non-orienté, ajouter l'arête inverse
         if not self.directed:
-            edge_reverse = Edge(target, source, weight, road_type, speed_limit)
-            self.adjacency_list[target].append((source, weight, edge_reverse))
+            self._append_arc(t_row, s_row, weight, road_type, speed_limit)
+    
+    # ------------------------------------------------------------------
+    # Construction groupée (tableaux NumPy)
+    # ------------------------------------------------------------------
+    
+    def add_vertices_from(
+        self,
+        ids,
+        xs=None,
+        ys=None,
+        labels: Optional[List[str]] = None
+    ) -> int:
+        """
+        Ajoute des sommets en une seule opération.
+        
+        Équivalent à add_vertex(ids[i], xs[i], ys[i], labels[i]) pour chaque i,
+        sans le coût d'un appel de méthode par sommet. Les IDs déjà présents
+        (ou répétés) sont ignorés, comme avec add_vertex.
+        
+        Args:
+            ids: IDs des sommets (tableau NumPy ou séquence d'entiers)
+            xs: Coordonnées x (zéros si None)
+            ys: Coordonnées y (zéros si None)
+            labels: Labels optionnels
+            
+        Returns:
+            Nombre de sommets ajoutés
+        """
+        ids = np.asarray(ids, dtype=np.int64).tolist()
+        n = len(ids)
+        xs = [0.0] * n if xs is None else np.asarray(xs, dtype=np.float64).tolist()
+        ys = [0.0] * n if ys is None else np.asarray(ys, dtype=np.float64).tolist()
+        labels = [""] * n if labels is None else list(labels)
+        if not (len(xs) == len(ys) == len(labels) == n):
+            raise ValueError("ids, xs, ys et labels doivent avoir la même longueur")
+        
+        # Filtrer les IDs existants ou répétés
+        index = self._index
+        if any(v in index for v in ids) or len(set(ids)) != n:
+            seen = set(index)
+            keep = [i for i, v in enumerate(ids) if not (v in seen or seen.add(v))]
+            ids = [ids[i] for i in keep]
+            xs = [xs[i] for i in keep]
+            ys = [ys[i] for i in keep]
+            labels = [labels[i] for i in keep]
+        
+        if ids:
+            start = len(self._ids)
+            index.update(zip(ids, range(start, start + len(ids))))
+            self._ids.extend(ids)
+            if self._identity and ids != list(range(start, start + len(ids))):
+                self._identity = False
+            self._extend_vertices(ids, xs, ys, labels)
+            self.version += 1
+        return len(ids)
+    
+    def _extend_vertices(
+        self,
+        ids: List[int],
+        xs: List[float],
+        ys: List[float],
+        labels: List[str]
+    ) -> None:
+        """Crée le stockage des nouveaux sommets (ID et ligne déjà enregistrés)."""
+        self.vertices.update(
+            (v, Vertex(v, x, y, label)) for v, x, y, label in zip(ids, xs, ys, labels)
+        )
+        self._targets.extend([] for _ in ids)
+        self._weights.extend([] for _ in ids)
+        self._edges.extend([] for _ in ids)
+    
+    def rows_of(self, ids):
+        """
+        Convertit des IDs de sommets en lignes (vectorisé).
+        
+        Args:
+            ids: IDs des sommets (tableau NumPy ou séquence d'entiers)
+            
+        Returns:
+            Tableau NumPy des lignes (int64)
+            
+        Raises:
+            KeyError: si un sommet n'existe pas
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._identity:
+            if ids.size and (ids.min() < 0 or ids.max() >= len(self._ids)):
+                raise KeyError(int(ids[(ids < 0) | (ids >= len(self._ids))][0]))
+            return ids
+        return np.fromiter(map(self._index.__getitem__, ids.tolist()),
+                           dtype=np.int64, count=len(ids))
+    
+    def straight_line_distances(self, sources, targets, metric: str = None):
+        """
+        Distances à vol d'oiseau entre des couples de sommets (vectorisé).
+        
+        Args:
+            sources: IDs des sommets de départ
+            targets: IDs des sommets d'arrivée
+            metric: 'euclidean' ou 'haversine' (km) ; par défaut 'haversine'
+                si le graphe est géographique, 'euclidean' sinon
+                
+        Returns:
+            Tableau NumPy des distances (float64)
+        """
+        if metric is None:
+            metric = 'haversine' if self.is_geographic else 'euclidean'
+        s_rows = self.rows_of(sources)
+        t_rows = self.rows_of(targets)
+        xs, ys = (np.asarray(a, dtype=np.float64) for a in self.coordinate_arrays())
+        x1, y1, x2, y2 = xs[s_rows], ys[s_rows], xs[t_rows], ys[t_rows]
+        if metric == 'haversine':
+            # Même formule que haversine_distance (x = lon, y = lat), en km
+            phi1, phi2 = np.radians(y1), np.radians(y2)
+            a = (np.sin((phi2 - phi1) / 2)**2
+                 + np.cos(phi1) * np.cos(phi2) * np.sin(np.radians(x2 - x1) / 2)**2)
+            return 2 * 6371.0 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return np.sqrt((x1 - x2)**2 + (y1 - y2)**2)
+    
+    def add_edges_from(
+        self,
+        sources,
+        targets,
+        weights=None,
+        road_types=None,
+        speeds=None,
+        metric: str = None
+    ) -> None:
+        """
+        Ajoute des arêtes en une seule opération.
+        
+        Équivalent à add_edge(sources[i], targets[i], weights[i], ...) pour
+        chaque i (mêmes règles : sommets créés si absents, arête inverse si
+        non-orienté, politique d'arêtes parallèles), mais les lignes et les
+        poids manquants sont calculés de façon vectorisée.
+        
+        Args:
+            sources: IDs des sommets source (tableau NumPy ou séquence)
+            targets: IDs des sommets cible
+            weights: Poids des arêtes ; si None, distance à vol d'oiseau
+                (voir straight_line_distances)
+            road_types: Type de route commun (str) ou un par arête
+            speeds: Vitesse limite commune (float) ou une par arête
+            metric: Métrique des poids calculés ('euclidean' ou 'haversine')
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        m = len(sources)
+        if len(targets) != m:
+            raise ValueError("sources et targets doivent avoir la même longueur")
+        
+        self._ensure_vertices(sources, targets)
+        s_rows = self.rows_of(sources).tolist()
+        t_rows = self.rows_of(targets).tolist()
+        if weights is None:
+            weights = self.straight_line_distances(sources, targets, metric)
+        weights = np.asarray(weights, dtype=np.float64)
+        if len(weights) != m:
+            raise ValueError("weights doit contenir une valeur par arête")
+        
+        if road_types is None or isinstance(road_types, str):
+            road_types = road_types or "main"
+        else:
+            road_types = np.asarray(road_types, dtype=object)
+        if speeds is None or np.isscalar(speeds):
+            speeds = 50.0 if speeds is None else float(speeds)
+        else:
+            speeds = np.asarray(speeds, dtype=np.float64)
+        
+        if self.parallel_edges == "keep_min":
+            # Chaque arête dépend des précédentes : insertion une à une
+            insert = self._insert_edge
+            for i, edge in enumerate(zip(s_rows, t_rows, weights.tolist())):
+                insert(*edge,
+                       road_types if isinstance(road_types, str) else road_types[i],
+                       speeds if isinstance(speeds, float) else float(speeds[i]))
+            return
+        
+        # Arcs orientés : (s, t) puis (t, s) si non-orienté, comme add_edge
+        arc_s, arc_t = np.asarray(s_rows, dtype=np.int64), np.asarray(t_rows, dtype=np.int64)
+        if not self.directed:
+            arc_s, arc_t = (np.column_stack((arc_s, arc_t)).ravel(),
+                            np.column_stack((arc_t, arc_s)).ravel())
+            weights = np.repeat(weights, 2)
+            if not isinstance(road_types, str):
+                road_types = np.repeat(road_types, 2)
+            if not isinstance(speeds, float):
+                speeds = np.repeat(speeds, 2)
+        
+        self._add_arcs(arc_s, arc_t, weights, road_types, speeds)
+        self.num_edges += m
+    
+    def _ensure_vertices(self, sources, targets) -> None:
+        """Crée les sommets absents, dans l'ordre où add_edge les créerait."""
+        endpoints = np.concatenate((sources, targets))
+        if self._identity:
+            complete = len(endpoints) == 0 or (
+                endpoints.min() >= 0 and endpoints.max() < len(self._ids))
+        else:
+            complete = bool(np.isin(endpoints, np.asarray(self._ids, dtype=np.int64)).all())
+        if not complete:
+            endpoints = np.column_stack((sources, targets)).ravel().tolist()
+            self.add_vertices_from([v for v in dict.fromkeys(endpoints) if v not in self._index])
+    
+    def _add_arcs(self, arc_s, arc_t, weights, road_types, speeds) -> None:
+        """
+        Range des arcs orientés entre lignes existantes, sans arc inverse.
+        
+        N'ajuste pas num_edges (à la charge de l'appelant).
+        
+        Args:
+            arc_s, arc_t: Lignes source et cible (tableaux int64)
+            weights: Poids (tableau float64)
+            road_types: str commun ou tableau (un par arc)
+            speeds: float commun ou tableau (un par arc)
+        """
+        # Regrouper par ligne source (tri stable : l'ordre d'insertion est conservé)
+        order = np.argsort(arc_s, kind='stable')
+        sorted_s = arc_s[order]
+        starts = np.flatnonzero(np.diff(sorted_s, prepend=-1))
+        rows = sorted_s[starts]
+        bounds = np.append(starts, len(order)).tolist()
+        arc_t = arc_t[order].tolist()
+        weights = weights[order].tolist()
+        if not isinstance(road_types, str):
+            road_types = road_types[order].tolist()
+        if not isinstance(speeds, float):
+            speeds = speeds[order].tolist()
+        
+        with gc_paused():
+            for row, lo, hi in zip(rows.tolist(), bounds, bounds[1:]):
+                self._extend_arcs(
+                    row, arc_t[lo:hi], weights[lo:hi],
+                    road_types if isinstance(road_types, str) else road_types[lo:hi],
+                    speeds if isinstance(speeds, float) else speeds[lo:hi]
+                )
+    
+    def _extend_arcs(
+        self,
+        s_row: int,
+        targets: List[int],
+        weights: List[float],
+        road_types,
+        speeds
+    ) -> None:
+        """
+        Range plusieurs arêtes orientées d'une même ligne source.
+        
+        road_types et speeds sont soit une valeur commune, soit une liste
+        (une valeur par arête).
+        """
+        from itertools import repeat
+        
+        row_targets = self._targets[s_row]
+        first = len(row_targets)
+        if self._edge_index is not None:
+            index, key = self._edge_index, self._edge_key
+            for pos, t_row in enumerate(targets, first):
+                index.setdefault(key(s_row, t_row), pos)
+        row_targets.extend(targets)
+        self._weights[s_row].extend(weights)
+        
+        if isinstance(road_types, str):
+            road_types = repeat(road_types)
+        if isinstance(speeds, float):
+            speeds = repeat(speeds)
+        ids, source = self._ids, self._ids[s_row]
+        edges = self._edges[s_row]
+        for pos, (t_row, weight, road_type, speed) in enumerate(
+                zip(targets, weights, road_types, speeds), first):
+            edge = Edge(source, ids[t_row], weight, road_type, speed)
+            edge._graph, edge._row, edge._pos = self, s_row, pos
+            edges.append(edge)
+        self.version += 1
+    
+    def _append_arc(
+        self,
+        s_row: int,
+        t_row: int,
+        weight: float,
+        road_type: str,
+        speed_limit: float
+    ) -> None:
+        """Range une arête orientée dans les listes de sa ligne source (et dans l'index)."""
+        targets = self._targets[s_row]
+        pos = len(targets)
+        if self._edge_index is not None:
+            self._edge_index.setdefault(self._edge_key(s_row, t_row), pos)
+        targets.append(t_row)
+        self._weights[s_row].append(weight)
+        edge = Edge(self._ids[s_row], self._ids[t_row], weight, road_type, speed_limit)
+        edge._graph, edge._row, edge._pos = self, s_row, pos
+        self._edges[s_row].append(edge)
+        self.version += 1
+    
+    def _edge_at(self, row: int, pos: int) -> Edge:
+        """Retourne l'arête rangée à la position pos de la ligne row."""
+        return self._edges[row][pos]
+    
+    def _replace_weight(self, row: int, pos: int, weight: float) -> None:
+        """Remplace le poids d'une arête stockée (seul point d'écriture des poids)."""
+        self._weights[row][pos] = weight
+        self.version += 1
+    
+    # ------------------------------------------------------------------
+    # Mise à jour des poids (trafic en temps réel)
+    # ------------------------------------------------------------------
+    
+    def _arc_positions(self, source: int, target: int) -> List[Tuple[int, int]]:
+        """
+        Positions (ligne, position) des arcs stockés pour l'arête source -> target.
+        
+        Pour un graphe non-orienté, inclut l'arc inverse.
+        
+        Raises:
+            ValueError: si l'arête n'existe pas
+        """
+        s_row = self._index.get(source)
+        t_row = self._index.get(target)
+        pos = None
+        if s_row is not None and t_row is not None:
+            pos = self._edge_position(s_row, t_row)
+        if pos is None:
+            raise ValueError(f"L'arête {source} -> {target} n'existe pas")
+        arcs = [(s_row, pos)]
+        if not self.directed:
+            arcs.append((t_row, self._edge_position(t_row, s_row)))
+        return arcs
+    
+    def set_weight(self, source: int, target: int, weight: float) -> None:
+        """
+        Modifie le poids d'une arête (vu immédiatement par tous les algorithmes).
+        
+        Args:
+            source: ID du sommet source
+            target: ID du sommet cible
+            weight: Nouveau poids
+            
+        Note:
+            Si le graphe est non-orienté, modifie aussi l'arête inverse.
+            En cas d'arêtes parallèles, seule la première est modifiée.
+            
+        Complexité : O(1) si l'index des arêtes est actif, O(degré) sinon
+        """
+        for row, pos in self._arc_positions(source, target):
+            self._replace_weight(row, pos, weight)
+    
+    def set_weights(self, updates: Iterable[Tuple[int, int, float]]) -> int:
+        """
+        Modifie les poids de plusieurs arêtes (mise à jour groupée du trafic).
+        
+        Les positions sont toutes résolues avant la première écriture : si une
+        arête n'existe pas, aucun poids n'est modifié.
+        
+        Args:
+            updates: Triplets (source, cible, nouveau_poids)
+            
+        Returns:
+            Nombre d'arêtes modifiées
+            
+        Raises:
+            ValueError: si une arête n'existe pas
+        """
+        resolved = [(self._arc_positions(source, target), weight)
+                    for source, target, weight in updates]
+        for arcs, weight in resolved:
+            for row, pos in arcs:
+                self._replace_weight(row, pos, weight)
+        return len(resolved)
+    
+    def scale_weights(self, edges: Iterable[Tuple[int, int]], factor: float) -> int:
+        """
+        Multiplie le poids de plusieurs arêtes par un même facteur.
+        
+        Args:
+            edges: Couples (source, cible)
+            factor: Facteur multiplicatif (ex. 2.0 = temps de parcours doublé)
+            
+        Note:
+            Pour un graphe non-orienté, l'arête inverse est aussi modifiée :
+            chaque route ne doit figurer qu'une fois dans edges.
+            
+        Returns:
+            Nombre d'arêtes modifiées
+            
+        Raises:
+            ValueError: si une arête n'existe pas
+        """
+        resolved = [self._arc_positions(source, target) for source, target in edges]
+        weights = self._weights
+        for arcs in resolved:
+            for row, pos in arcs:
+                self._replace_weight(row, pos, weights[row][pos] * factor)
+        return len(resolved)
+    
+    # ------------------------------------------------------------------
+    # Index des arêtes
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _edge_key(s_row: int, t_row: int) -> int:
+        """Clé d'index d'une arête : un seul entier au lieu d'un tuple."""
+        return (s_row << 32) | t_row
+    
+    def enable_edge_index(self) -> None:
+        """
+        Active l'index haché des arêtes (construit en O(m) à partir des arêtes existantes).
+        
+        L'index est ensuite maintenu par add_edge.
+        """
+        if self._edge_index is not None:
+            return
+        index: Dict[int, int] = {}
+        for s_row, targets in enumerate(self._targets):
+            for pos, t_row in enumerate(targets):
+                index.setdefault(self._edge_key(s_row, t_row), pos)
+        self._edge_index = index
+    
+    def has_edge_index(self) -> bool:
+        """Vérifie si l'index des arêtes est actif."""
+        return self._edge_index is not None
+    
+    def _edge_position(self, s_row: int, t_row: int) -> Optional[int]:
+        """
+        Position de la première arête s_row -> t_row dans les listes de s_row.
+        
+        O(1) avec l'index, O(degré) sinon.
+        """
+        if self._edge_index is not None:
+            return self._edge_index.get(self._edge_key(s_row, t_row))
+        try:
+            return self._targets[s_row].index(t_row)
+        except ValueError:
+            return None
+    
+    def iter_neighbors(self, vertex_id: int) -> Iterator[Tuple[int, float]]:
+        """
+        Itère sur les voisins d'un sommet avec leurs poids, sans construire de liste.
+        
+        Les couples sont lus directement dans les listes stockées ; l'itérateur
+        ne doit pas être conservé pendant une modification du graphe.
+        
+        Args:
+            vertex_id: ID du sommet
+            
+        Returns:
+            Itérateur de tuples (voisin_id, poids)
+        """
+        row = self._index.get(vertex_id)
+        if row is None:
+            return iter(())
+        if self._identity:
+            return zip(self._targets[row], self._weights[row])
+        return zip(map(self._ids.__getitem__, self._targets[row]), self._weights[row])
     
     def get_neighbors(self, vertex_id: int) -> List[Tuple[int, float]]:
         """
@@ -200,7 +763,7 @@ class Graph:
         Returns:
             Liste de tuples (voisin_id, poids)
         """
-        return [(neighbor, weight) for neighbor, weight, _ in self.adjacency_list.get(vertex_id, [])]
+        return list(self.iter_neighbors(vertex_id))
     
     def get_edge(self, source: int, target: int) -> Optional[Edge]:
         """
@@ -211,12 +774,34 @@ class Graph:
             target: ID du sommet cible
             
         Returns:
-            L'arête si elle existe, None sinon
+            L'arête si elle existe, None sinon (la première en cas d'arêtes parallèles)
+            
+        Complexité : O(1) si l'index des arêtes est actif, O(degré) sinon
+        """
+        s_row = self._index.get(source)
+        t_row = self._index.get(target)
+        if s_row is None or t_row is None:
+            return None
+        pos = self._edge_position(s_row, t_row)
+        return self._edge_at(s_row, pos) if pos is not None else None
+    
+    def get_edges(self, source: int, target: int) -> List[Edge]:
+        """
+        Récupère toutes les arêtes parallèles entre deux sommets.
+        
+        Args:
+            source: ID du sommet source
+            target: ID du sommet cible
+            
+        Returns:
+            Liste des arêtes (vide si aucune)
         """
-        for neighbor, _, edge in self.adjacency_list.get(source, []):
-            if neighbor == target:
-                return edge
-        return None
+        s_row = self._index.get(source)
+        t_row = self._index.get(target)
+        if s_row is None or t_row is None or self._edge_position(s_row, t_row) is None:
+            return []
+        return [self._edge_at(s_row, pos) for pos, neighbor in enumerate(self._targets[s_row])
+                if neighbor == t_row]
     
     def get_weight(self, source: int, target: int) -> Optional[float]:
         """
@@ -246,11 +831,7 @@ class Graph:
     
     def get_all_edges(self) -> List[Edge]:
         """Retourne la liste de toutes les arêtes."""
-        edges = []
-        for vertex_id in self.adjacency_list:
-            for _, _, edge in self.adjacency_list[vertex_id]:
-                edges.append(edge)
-        return edges
+        return [edge for edges in self._edges for edge in edges]
     
     def num_vertices(self) -> int:
         """Retourne le nombre de sommets."""
@@ -270,7 +851,8 @@ class Graph:
         Returns:
             Degré du sommet
         """
-        return len(self.adjacency_list.get(vertex_id, []))
+        row = self._index.get(vertex_id)
+        return len(self._targets[row]) if row is not None else 0
     
     def average_degree(self) -> float:
         """Retourne le degré moyen du graphe."""
@@ -296,13 +878,90 @@ class Graph:
         
         while queue:
             current = queue.pop(0)
-            for neighbor, _ in self.get_neighbors(current):
+            for neighbor, _ in self.iter_neighbors(current):
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
         
         return len(visited) == self.num_vertices()
     
+    # ------------------------------------------------------------------
+    # Accès par ligne (interface commune avec CSRGraph pour les algorithmes)
+    # ------------------------------------------------------------------
+    
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+        
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        return self._index[vertex_id]
+    
+    def id_of(self, row: int) -> int:
+        """Retourne l'ID du sommet d'une ligne."""
+        return self._ids[row]
+    
+    def row_ids(self):
+        """Retourne la séquence ligne -> ID, indexable en O(1)."""
+        return range(len(self._ids)) if self._identity else self._ids
+    
+    def row_neighbors(self, row: int) -> Iterator[Tuple[int, float]]:
+        """
+        Itère sur les (ligne_voisine, poids) d'une ligne, sans copie.
+        
+        Args:
+            row: Ligne du sommet
+            
+        Returns:
+            Itérateur de tuples (ligne_voisine, poids)
+        """
+        return zip(self._targets[row], self._weights[row])
+    
+    def coordinate_arrays(self) -> Tuple[List[float], List[float]]:
+        """Retourne les coordonnées (xs, ys) des sommets, dans l'ordre des lignes."""
+        vertices = [self.vertices[v] for v in self._ids]
+        return [v.x for v in vertices], [v.y for v in vertices]
+    
+    def row_coordinates(self, row: int) -> Tuple[float, float]:
+        """Retourne les coordonnées (x, y) d'une ligne."""
+        vertex = self.vertices[self._ids[row]]
+        return vertex.x, vertex.y
+    
+    def row_distance(self, row_a: int, row_b: int) -> float:
+        """Distance à vol d'oiseau entre deux lignes (voir Vertex.distance_to)."""
+        metric = 'haversine' if self.is_geographic else 'euclidean'
+        return self.vertices[self._ids[row_a]].distance_to(self.vertices[self._ids[row_b]], metric=metric)
+    
+    def freeze(self) -> 'CSRGraph':
+        """
+        Fige le graphe au format CSR (tableaux NumPy contigus).
+
+        Le CSRGraph obtenu est en lecture seule : les modifications
+        ultérieures du graphe ne s'y reflètent pas. Il est conservé tant que
+        la version du graphe ne change pas (appels répétés en O(1)).
+
+        Returns:
+            CSRGraph utilisable directement par dijkstra, astar et bellman_ford
+        """
+        if self._frozen is None or self._frozen[0] != self.version:
+            from .csr import CSRGraph
+            self._frozen = (self.version, CSRGraph.from_graph(self))
+        return self._frozen[1]
+    
+    def reverse_graph(self):
+        """
+        Retourne le graphe transposé (arêtes inversées), pour les recherches arrière.
+        
+        Pour un graphe non-orienté aux poids symétriques, c'est le graphe
+        lui-même. Sinon (graphe orienté, ou poids d'un seul sens modifié), un
+        CSRGraph de mêmes lignes. Le résultat est construit à la demande et
+        conservé avec freeze() tant que la version du graphe ne change pas.
+        """
+        frozen = self.freeze()
+        reverse = frozen.reverse_graph()
+        return self if reverse is frozen else reverse
+    
     def __repr__(self) -> str:
         return (f"Graph(vertices={self.num_vertices()}, "
                 f"edges={self.num_edges_count()}, "
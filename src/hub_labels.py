@@ -0,0 +1,398 @@
+"""
+Module d'étiquetage par hubs (hub labeling) : oracle de distances.
+
+Chaque sommet v reçoit deux étiquettes, listes de couples (hub, distance)
+triées par hub :
+- étiquette avant L_f(v) : distances de v vers ses hubs
+- étiquette arrière L_b(v) : distances de ses hubs vers v
+
+Pour toute paire (s, t), un sommet d'un plus court chemin s -> t figure
+dans L_f(s) et dans L_b(t) : d(s, t) = min sur les hubs communs h de
+L_f(s)[h] + L_b(t)[h]. La requête est une simple fusion de deux listes
+triées, sans aucune recherche dans le graphe.
+
+Les étiquettes sont dérivées d'une hiérarchie de contraction, du sommet
+de plus haut rang vers le plus bas : l'étiquette de v réunit celles de ses
+voisins montants (décalées du poids de l'arc), puis les entrées qui ne
+sont pas de vraies distances sont élaguées.
+
+Usage :
+    >>> labels = HubLabels.build(graph)     # ou HubLabels.from_contraction(ch)
+    >>> labels.save("paris.hl")
+    >>> labels.distance(source, target)     # au lieu de dijkstra(...).cost
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .contraction import ContractionHierarchy
+
+
+def _merge_labels(
+    row: int,
+    neighbors: np.ndarray,
+    weights: np.ndarray,
+    hubs: List[np.ndarray],
+    dists: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Étiquette de row : (row, 0) plus les étiquettes de ses voisins de rang
+    supérieur, décalées du poids de l'arc ; minimum par hub.
+
+    Returns:
+        (hubs, distances), triés par hub
+    """
+    all_hubs = np.concatenate([[row]] + [hubs[w] for w in neighbors])
+    all_dists = np.concatenate([[0.0]] + [dists[w] + c for w, c in zip(neighbors, weights)])
+    order = np.lexsort((all_dists, all_hubs))
+    all_hubs, all_dists = all_hubs[order], all_dists[order]
+    first = np.r_[True, all_hubs[1:] != all_hubs[:-1]]
+    return all_hubs[first], all_dists[first]
+
+
+def _prune_label(
+    row: int,
+    label_hubs: np.ndarray,
+    label_dists: np.ndarray,
+    other_hubs: List[np.ndarray],
+    other_dists: List[np.ndarray],
+    scratch: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retire les entrées (h, d) pour lesquelles la requête entre l'étiquette
+    et l'étiquette opposée de h trouve mieux que d (d n'est pas la vraie
+    distance, h n'est pas utile).
+
+    Args:
+        row: Sommet de l'étiquette
+        label_hubs, label_dists: Étiquette à élaguer
+        other_hubs, other_dists: Étiquettes opposées (déjà calculées pour les hubs)
+        scratch: Tableau de taille n rempli d'inf (rendu dans cet état)
+
+    Returns:
+        (hubs, distances) conservés
+    """
+    others = np.flatnonzero(label_hubs != row)
+    if not len(others):
+        return label_hubs, label_dists
+    scratch[label_hubs] = label_dists
+    candidates_hubs = [other_hubs[h] for h in label_hubs[others]]
+    lengths = np.fromiter((len(h) for h in candidates_hubs), dtype=np.int64, count=len(others))
+    starts = np.zeros(len(others), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    via = scratch[np.concatenate(candidates_hubs)] + np.concatenate(
+        [other_dists[h] for h in label_hubs[others]])
+    best = np.minimum.reduceat(via, starts)
+    scratch[label_hubs] = np.inf
+
+    keep = np.ones(len(label_hubs), dtype=bool)
+    keep[others] = best >= label_dists[others]
+    return label_hubs[keep], label_dists[keep]
+
+
+def _same_arcs(ch: ContractionHierarchy) -> bool:
+    """
+    Vrai si les arcs montants et descendants de chaque sommet coïncident
+    (graphe non-orienté aux poids symétriques) : une recherche montante
+    avant vaut alors une recherche montante arrière.
+    """
+    if not np.array_equal(ch.up_offsets, ch.down_offsets):
+        return False
+    rows = np.repeat(np.arange(ch.num_vertices()), np.diff(ch.up_offsets))
+    up = np.lexsort((ch.up_weights, ch.up_targets, rows))
+    down = np.lexsort((ch.down_weights, ch.down_sources, rows))
+    return bool(np.array_equal(ch.up_targets[up], ch.down_sources[down])
+                and np.array_equal(ch.up_weights[up], ch.down_weights[down]))
+
+
+def _to_csr(hubs: List[np.ndarray], dists: List[np.ndarray]) -> Tuple[np.ndarray, ...]:
+    """Range des étiquettes par ligne en tableaux (offsets, hubs, distances)."""
+    offsets = np.zeros(len(hubs) + 1, dtype=np.int64)
+    np.cumsum([len(h) for h in hubs], out=offsets[1:])
+    if not hubs:
+        return offsets, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)
+    return (offsets, np.concatenate(hubs).astype(np.int32),
+            np.concatenate(dists).astype(np.float64))
+
+
+class HubLabels:
+    """
+    Étiquettes de hubs d'un graphe (lecture seule).
+
+    Attributs:
+        ids (np.ndarray): ID du sommet de chaque ligne
+        forward_offsets, forward_hubs, forward_dists (np.ndarray): étiquettes
+            avant au format CSR (hubs triés dans chaque étiquette)
+        backward_offsets, backward_hubs, backward_dists (np.ndarray):
+            étiquettes arrière (mêmes tableaux qu'en avant si partagées)
+        directed (bool): Graphe d'origine orienté ou non
+        shared (bool): Étiquettes avant et arrière partagées (graphe
+            non-orienté aux poids symétriques)
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        forward: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        backward: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+        directed: bool = True
+    ):
+        """
+        Construit l'oracle à partir de ses tableaux (voir build et load).
+
+        Args:
+            ids: ID de chaque ligne
+            forward: (offsets, hubs, distances) des étiquettes avant
+            backward: Idem en arrière ; None si les étiquettes sont partagées
+                (graphe non-orienté aux poids symétriques)
+            directed: Graphe d'origine orienté ou non
+        """
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.forward_offsets, self.forward_hubs, self.forward_dists = (
+            np.ascontiguousarray(a, dtype=t)
+            for a, t in zip(forward, (np.int64, np.int32, np.float64)))
+        if backward is None:
+            self.backward_offsets, self.backward_hubs, self.backward_dists = (
+                self.forward_offsets, self.forward_hubs, self.forward_dists)
+        else:
+            self.backward_offsets, self.backward_hubs, self.backward_dists = (
+                np.ascontiguousarray(a, dtype=t)
+                for a, t in zip(backward, (np.int64, np.int32, np.float64)))
+        if len(self.forward_offsets) != len(self.ids) + 1 or \
+                len(self.backward_offsets) != len(self.ids) + 1:
+            raise ValueError("Les offsets doivent contenir n + 1 éléments")
+        self.directed = directed
+        self.shared = backward is None
+
+        # Vues mémoire : l'indexation renvoie des int/float Python sans copie
+        self._forward = (memoryview(self.forward_offsets), memoryview(self.forward_hubs),
+                         memoryview(self.forward_dists))
+        self._backward = (memoryview(self.backward_offsets), memoryview(self.backward_hubs),
+                          memoryview(self.backward_dists))
+        n = len(self.ids)
+        self._identity = bool(n == 0 or np.array_equal(self.ids, np.arange(n)))
+        self._index: Optional[Dict[int, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph, witness_limit: int = 200) -> 'HubLabels':
+        """
+        Contracte le graphe puis en dérive les étiquettes.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph (poids positifs ou nuls)
+            witness_limit: Voir ContractionHierarchy.build
+
+        Returns:
+            HubLabels
+        """
+        return cls.from_contraction(ContractionHierarchy.build(graph, witness_limit))
+
+    @classmethod
+    def from_contraction(cls, ch: ContractionHierarchy) -> 'HubLabels':
+        """
+        Dérive les étiquettes d'une hiérarchie de contraction.
+
+        Les sommets sont traités par rang décroissant : les étiquettes des
+        voisins montants sont déjà finales quand celle de v est calculée.
+        Les étiquettes sont partagées seulement si les arcs montants et
+        descendants coïncident (un graphe non-orienté dont un seul sens
+        d'une route a été modifié garde deux jeux d'étiquettes).
+
+        Args:
+            ch: Hiérarchie de contraction
+
+        Returns:
+            HubLabels
+        """
+        n = ch.num_vertices()
+        forward_hubs: List[np.ndarray] = [None] * n
+        forward_dists: List[np.ndarray] = [None] * n
+        shared = not ch.directed and _same_arcs(ch)
+        if shared:
+            backward_hubs, backward_dists = forward_hubs, forward_dists
+        else:
+            backward_hubs: List[np.ndarray] = [None] * n
+            backward_dists: List[np.ndarray] = [None] * n
+        scratch = np.full(n, np.inf)
+
+        for v in np.argsort(-ch.rank, kind='stable').tolist():
+            up = slice(ch.up_offsets[v], ch.up_offsets[v + 1])
+            hubs, dists = _merge_labels(v, ch.up_targets[up], ch.up_weights[up],
+                                        forward_hubs, forward_dists)
+            forward_hubs[v], forward_dists[v] = _prune_label(
+                v, hubs, dists, backward_hubs, backward_dists, scratch)
+            if not shared:
+                down = slice(ch.down_offsets[v], ch.down_offsets[v + 1])
+                hubs, dists = _merge_labels(v, ch.down_sources[down], ch.down_weights[down],
+                                            backward_hubs, backward_dists)
+                backward_hubs[v], backward_dists[v] = _prune_label(
+                    v, hubs, dists, forward_hubs, forward_dists, scratch)
+
+        forward = _to_csr(forward_hubs, forward_dists)
+        backward = None if shared else _to_csr(backward_hubs, backward_dists)
+        return cls(ch.ids, forward, backward, directed=ch.directed)
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def num_vertices(self) -> int:
+        """Retourne le nombre de sommets."""
+        return len(self.ids)
+
+    def has_vertex(self, vertex_id: int) -> bool:
+        """Vérifie si un sommet existe."""
+        if self._identity:
+            return isinstance(vertex_id, (int, np.integer)) and 0 <= vertex_id < len(self.ids)
+        return vertex_id in self._id_index()
+
+    def index_of(self, vertex_id: int) -> int:
+        """
+        Retourne la ligne d'un sommet.
+
+        Raises:
+            KeyError: si le sommet n'existe pas
+        """
+        if self._identity:
+            if 0 <= vertex_id < len(self.ids):
+                return int(vertex_id)
+            raise KeyError(vertex_id)
+        return self._id_index()[vertex_id]
+
+    def _id_index(self) -> Dict[int, int]:
+        """Table ID -> ligne, construite au premier appel."""
+        if self._index is None:
+            self._index = {v: r for r, v in enumerate(self.ids.tolist())}
+        return self._index
+
+    def distance(self, source: int, target: int) -> float:
+        """
+        Coût du plus court chemin de source à cible (même valeur que
+        dijkstra(graph, source, target).cost).
+
+        Args:
+            source: ID du sommet de départ
+            target: ID du sommet d'arrivée
+
+        Returns:
+            Distance (inf si aucun chemin)
+
+        Raises:
+            KeyError: si un sommet n'existe pas
+        """
+        return self.row_distance(self.index_of(source), self.index_of(target))
+
+    def row_distance(self, s_row: int, t_row: int) -> float:
+        """Distance entre deux lignes : fusion des deux étiquettes triées."""
+        offsets, hubs_f, dists_f = self._forward
+        i, end_f = offsets[s_row], offsets[s_row + 1]
+        offsets, hubs_b, dists_b = self._backward
+        j, end_b = offsets[t_row], offsets[t_row + 1]
+
+        best = float('inf')
+        while i < end_f and j < end_b:
+            hub_f, hub_b = hubs_f[i], hubs_b[j]
+            if hub_f == hub_b:
+                d = dists_f[i] + dists_b[j]
+                if d < best:
+                    best = d
+                i += 1
+                j += 1
+            elif hub_f < hub_b:
+                i += 1
+            else:
+                j += 1
+        return best
+
+    # ------------------------------------------------------------------
+    # Statistiques et sauvegarde
+    # ------------------------------------------------------------------
+
+    def label_sizes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne la taille des étiquettes avant et arrière de chaque sommet."""
+        return np.diff(self.forward_offsets), np.diff(self.backward_offsets)
+
+    def nbytes(self) -> int:
+        """Retourne la taille mémoire des tableaux (octets, étiquettes partagées comptées une fois)."""
+        arrays = [self.ids, self.forward_offsets, self.forward_hubs, self.forward_dists]
+        if not self.shared:
+            arrays += [self.backward_offsets, self.backward_hubs, self.backward_dists]
+        return sum(a.nbytes for a in arrays)
+
+    def summary(self) -> str:
+        """
+        Retourne un rapport sur la taille des étiquettes.
+
+        Returns:
+            Chaîne de caractères avec statistiques
+        """
+        forward, backward = self.label_sizes()
+        sizes = forward if self.shared else np.concatenate([forward, backward])
+        if not len(sizes):
+            sizes = np.zeros(1, dtype=np.int64)
+        return f"""
+Étiquettes de hubs : {self._kind()}
+----------------------------------------
+Nombre de sommets     : {self.num_vertices()}
+Entrées (avant)       : {int(forward.sum())}
+Entrées (arrière)     : {int(backward.sum())}
+Taille moyenne        : {sizes.mean():.1f}
+Taille médiane        : {int(np.median(sizes))}
+Taille maximale       : {int(sizes.max())}
+Mémoire               : {self.nbytes() / 1024**2:.2f} Mo
+        """.strip()
+
+    def _kind(self) -> str:
+        """Libellé du type d'étiquettes pour summary."""
+        if self.directed:
+            return "Orienté"
+        if self.shared:
+            return "Non-orienté (étiquettes partagées)"
+        return "Non-orienté (poids asymétriques)"
+
+    def save(self, filename: str) -> None:
+        """
+        Sauvegarde les étiquettes (format NumPy .npz compressé, nom de
+        fichier inchangé ; hubs sur 32 bits, étiquettes arrière omises si
+        elles sont partagées).
+
+        Args:
+            filename: Chemin du fichier
+        """
+        arrays = dict(ids=self.ids, directed=np.array(self.directed),
+                      forward_offsets=self.forward_offsets, forward_hubs=self.forward_hubs,
+                      forward_dists=self.forward_dists)
+        if not self.shared:
+            arrays.update(backward_offsets=self.backward_offsets,
+                          backward_hubs=self.backward_hubs,
+                          backward_dists=self.backward_dists)
+        with open(filename, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, filename: str) -> 'HubLabels':
+        """
+        Recharge des étiquettes sauvegardées.
+
+        Args:
+            filename: Chemin du fichier
+
+        Returns:
+            HubLabels prêt pour les requêtes
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            directed = bool(data["directed"])
+            forward = (data["forward_offsets"], data["forward_hubs"], data["forward_dists"])
+            backward = None
+            if "backward_offsets" in data.files:
+                backward = (data["backward_offsets"], data["backward_hubs"],
+                            data["backward_dists"])
+            return cls(data["ids"], forward, backward, directed=directed)
+
+    def __repr__(self) -> str:
+        forward, backward = self.label_sizes()
+        return (f"HubLabels(vertices={self.num_vertices()}, "
+                f"entries={int(forward.sum()) + (0 if self.shared else int(backward.sum()))})")
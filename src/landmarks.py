@@ -0,0 +1,403 @@
+"""
+Module ALT : A*, repères (landmarks) et inégalité triangulaire.
+
+Un prétraitement choisit k sommets repères L et calcule, pour chacun, les
+distances d(L, v) (tableau avant) et d(v, L) (tableau arrière) vers tous
+les sommets. L'inégalité triangulaire donne alors une borne inférieure de
+la distance entre deux sommets quelconques :
+
+    d(v, t) >= d(L, t) - d(L, v)      et      d(v, t) >= d(v, L) - d(t, L)
+
+Cette borne est une heuristique cohérente pour A*, bien plus précise que
+la distance à vol d'oiseau quand le réseau contourne des obstacles
+(fleuve, quartiers séparés) ou quand les poids sont des temps de parcours
+gonflés par la congestion.
+
+Choix des repères :
+- 'farthest' : chaque nouveau repère est le sommet le plus éloigné des
+  repères déjà choisis
+- 'avoid' : méthode de Goldberg et Werneck ; on construit un arbre des plus
+  courts chemins depuis une racine aléatoire et on descend vers la
+  branche la plus mal couverte par les repères existants
+
+Usage :
+    >>> landmarks = LandmarkIndex.build(graph, num_landmarks=16)
+    >>> result = astar(graph, source, target, heuristic=landmarks)
+    >>> landmarks.save("paris.landmarks")
+    >>> landmarks = LandmarkIndex.load("paris.landmarks", graph)
+"""
+
+import heapq
+import random
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from .graph import Graph
+
+
+SELECTIONS = ("farthest", "avoid")
+
+
+def _shortest_path_tree(graph: Graph, row: int) -> Tuple[np.ndarray, List[int], List[int]]:
+    """
+    Dijkstra complet depuis une ligne.
+
+    Returns:
+        (distances float64, inf si inaccessible ; parents, -1 pour la racine
+        et les sommets inaccessibles ; lignes dans l'ordre où elles sont fermées)
+    """
+    n = graph.num_vertices()
+    distances = [float('inf')] * n
+    parents = [-1] * n
+    closed = [False] * n
+    distances[row] = 0.0
+    queue = [(0.0, row)]
+    settled = []
+    row_neighbors = graph.row_neighbors
+
+    while queue:
+        d, current = heapq.heappop(queue)
+        if closed[current]:
+            continue
+        closed[current] = True
+        settled.append(current)
+        for neighbor, weight in row_neighbors(current):
+            new_distance = d + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                parents[neighbor] = current
+                heapq.heappush(queue, (new_distance, neighbor))
+    return np.array(distances, dtype=np.float64), parents, settled
+
+
+class LandmarkIndex:
+    """
+    Tables de distances des repères, utilisables comme heuristique A*.
+
+    Les tables sont indexées par ligne : l'index ne sert qu'au graphe (ou à
+    un graphe de mêmes lignes, par exemple graph.freeze()) sur lequel il a
+    été construit. Les bornes restent valides si des poids augmentent
+    ensuite (congestion) ; après une baisse de poids ou un ajout d'arête,
+    il faut reconstruire l'index.
+
+    Attributs:
+        rows (np.ndarray): Ligne de chaque repère (int64)
+        forward (np.ndarray): forward[i, v] = d(repère i, v), taille k × n
+        backward (np.ndarray): backward[i, v] = d(v, repère i) ; même tableau
+            que forward pour un graphe non-orienté
+        ids (np.ndarray): ID du sommet de chaque ligne, pour vérifier le graphe
+        num_active (int): Nombre de repères consultés par requête (voir row_bounds)
+    """
+
+    DEFAULT_ACTIVE = 8
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        forward: np.ndarray,
+        backward: np.ndarray,
+        ids: np.ndarray
+    ):
+        """
+        Construit un index à partir de ses tables (voir build et load).
+
+        Args:
+            rows: Lignes des repères
+            forward: Distances depuis les repères, k × n
+            backward: Distances vers les repères, k × n
+            ids: ID de chaque ligne du graphe
+        """
+        self.rows = np.ascontiguousarray(rows, dtype=np.int64)
+        self.forward = np.ascontiguousarray(forward, dtype=np.float64)
+        self.backward = (self.forward if backward is forward
+                         else np.ascontiguousarray(backward, dtype=np.float64))
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.num_active = self.DEFAULT_ACTIVE
+        if self.forward.shape != (len(self.rows), len(self.ids)) or \
+                self.backward.shape != self.forward.shape:
+            raise ValueError("Les tables doivent être de taille (repères × sommets)")
+
+        self._make_views()
+
+    def _make_views(self) -> None:
+        """Vues mémoire par repère : l'indexation renvoie des float Python sans copie."""
+        self._forward = [memoryview(table) for table in self.forward]
+        self._backward = [memoryview(table) for table in self.backward]
+
+    def __getstate__(self) -> dict:
+        # Les vues mémoire ne se sérialisent pas (pool de processus en
+        # mode spawn) : elles sont reconstruites au chargement
+        state = self.__dict__.copy()
+        del state['_forward'], state['_backward']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._make_views()
+
+    # ------------------------------------------------------------------
+    # Prétraitement
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        graph: Graph,
+        num_landmarks: int = 16,
+        selection: str = "avoid",
+        seed: Optional[int] = None
+    ) -> 'LandmarkIndex':
+        """
+        Choisit les repères et calcule leurs tables de distances.
+
+        Coût : environ 2k Dijkstra complets (k sur un graphe non-orienté aux
+        poids symétriques),
+        plus un par repère pour la sélection.
+
+        Args:
+            graph: Graph, CompactGraph ou CSRGraph
+            num_landmarks: Nombre de repères k (borné par le nombre de sommets)
+            selection: 'avoid' ou 'farthest'
+            seed: Graine du tirage des racines (reproductibilité)
+
+        Returns:
+            LandmarkIndex prêt pour astar(..., heuristic=index)
+        """
+        if selection not in SELECTIONS:
+            raise ValueError(f"Sélection inconnue : {selection} (attendu : {SELECTIONS})")
+        n = graph.num_vertices()
+        if n == 0:
+            raise ValueError("Graphe vide")
+        num_landmarks = min(num_landmarks, n)
+        # Transposé, ou None si le graphe est le sien (non-orienté, poids
+        # symétriques) : une seule table sert alors dans les deux sens
+        reverse = graph.reverse_graph()
+        if reverse is graph:
+            reverse = None
+        rng = random.Random(seed)
+
+        rows: List[int] = []
+        forward: List[np.ndarray] = []
+        backward: List[np.ndarray] = []
+        chooser = cls._choose_farthest if selection == "farthest" else cls._choose_avoid
+        while len(rows) < num_landmarks:
+            row = chooser(graph, rows, forward, backward, rng)
+            if row is None:
+                if rows:
+                    break   # plus aucun sommet utile (graphe entièrement couvert)
+                row = rng.randrange(n)   # graphe sans arêtes accessibles
+            rows.append(row)
+            forward.append(_shortest_path_tree(graph, row)[0])
+            backward.append(_shortest_path_tree(reverse, row)[0] if reverse is not None
+                            else forward[-1])
+
+        forward_table = np.vstack(forward)
+        backward_table = forward_table if reverse is None else np.vstack(backward)
+        return cls(np.array(rows), forward_table, backward_table,
+                   np.fromiter(graph.row_ids(), dtype=np.int64, count=n))
+
+    @staticmethod
+    def _choose_farthest(graph, rows, forward, backward, rng) -> Optional[int]:
+        """Sommet accessible le plus éloigné des repères déjà choisis."""
+        if not rows:
+            # Premier repère : le plus éloigné d'un sommet tiré au hasard
+            distances = _shortest_path_tree(graph, rng.randrange(graph.num_vertices()))[0]
+        else:
+            distances = np.minimum.reduce([f + b for f, b in zip(forward, backward)])
+            distances[rows] = -1.0
+        distances[np.isinf(distances)] = -1.0
+        row = int(np.argmax(distances))
+        return row if distances[row] > 0 else None
+
+    @staticmethod
+    def _choose_avoid(graph, rows, forward, backward, rng) -> Optional[int]:
+        """
+        Sélection 'avoid' : dans l'arbre des plus courts chemins d'une racine r,
+        chaque sommet v pèse d(r, v) - borne(r, v) (ce que les repères actuels
+        ne savent pas estimer). On descend depuis r vers le sous-arbre de plus
+        grand poids, en ignorant ceux qui contiennent déjà un repère ; la
+        feuille atteinte devient un repère.
+        """
+        n = graph.num_vertices()
+        root = rng.randrange(n)
+        distances, parents, settled = _shortest_path_tree(graph, root)
+        reachable = np.isfinite(distances)
+
+        weights = distances.copy()
+        if rows:
+            f = np.vstack(forward)
+            b = np.vstack(backward)
+            with np.errstate(invalid='ignore'):
+                bound = np.maximum(f - f[:, [root]], b[:, [root]] - b)
+            bound[~np.isfinite(bound)] = 0.0
+            weights -= np.maximum(bound.max(axis=0), 0.0)
+        weights[~reachable] = 0.0
+
+        # Poids des sous-arbres, des feuilles vers la racine (ordre de fermeture inversé)
+        size = weights.tolist()
+        covered = [False] * n
+        for row in rows:
+            covered[row] = True
+        best_child = [-1] * n
+        for v in reversed(settled):
+            p = parents[v]
+            if p < 0:
+                continue
+            if covered[v]:
+                covered[p] = True
+            elif best_child[p] < 0 or size[v] > size[best_child[p]]:
+                best_child[p] = v
+            size[p] += size[v]
+
+        if covered[root]:
+            # Un repère est déjà dans l'arbre de la racine : on descend en
+            # l'évitant, sauf si plus aucune branche n'en est dépourvue
+            if best_child[root] < 0:
+                return LandmarkIndex._choose_farthest(graph, rows, forward, backward, rng)
+        v = root
+        while best_child[v] >= 0:
+            v = best_child[v]
+        return v if v not in rows else None
+
+    # ------------------------------------------------------------------
+    # Bornes inférieures
+    # ------------------------------------------------------------------
+
+    def num_landmarks(self) -> int:
+        """Retourne le nombre de repères."""
+        return len(self.rows)
+
+    def check_graph(self, graph) -> None:
+        """
+        Vérifie que le graphe a les lignes pour lesquelles l'index a été construit.
+
+        Raises:
+            ValueError: si le nombre de sommets diffère
+        """
+        if graph.num_vertices() != len(self.ids):
+            raise ValueError(f"Index construit pour {len(self.ids)} sommets, "
+                             f"graphe de {graph.num_vertices()} sommets")
+
+    def lower_bound(self, u_row: int, v_row: int) -> float:
+        """Borne inférieure de d(u, v) donnée par l'ensemble des repères."""
+        with np.errstate(invalid='ignore'):
+            bounds = np.concatenate([self.forward[:, v_row] - self.forward[:, u_row],
+                                     self.backward[:, u_row] - self.backward[:, v_row]])
+        bounds = bounds[~np.isnan(bounds)]
+        return max(float(bounds.max()), 0.0) if len(bounds) else 0.0
+
+    def _active(self, s_row: int, t_row: int, num_active: int) -> List[int]:
+        """Repères donnant les meilleures bornes pour d(s, t) (accessibles des deux côtés)."""
+        f, b = self.forward, self.backward
+        usable = (np.isfinite(f[:, s_row]) & np.isfinite(f[:, t_row])
+                  & np.isfinite(b[:, s_row]) & np.isfinite(b[:, t_row]))
+        with np.errstate(invalid='ignore'):
+            quality = np.maximum(f[:, t_row] - f[:, s_row], b[:, s_row] - b[:, t_row])
+        candidates = np.flatnonzero(usable)
+        order = candidates[np.argsort(-quality[candidates], kind='stable')]
+        return order[:num_active].tolist()
+
+    def row_bounds(
+        self,
+        graph,
+        s_row: int,
+        t_row: int,
+        num_active: Optional[int] = None
+    ) -> Tuple[Callable[[int], float], Callable[[int], float]]:
+        """
+        Heuristiques de la requête s -> t, sur les lignes.
+
+        Seuls les num_active repères (self.num_active par défaut) donnant la
+        meilleure borne de d(s, t) sont consultés : une évaluation coûte
+        O(num_active) au lieu de O(k).
+
+        Returns:
+            (h_t, h_s) : h_t(v) minore d(v, t), h_s(v) minore d(s, v) ;
+            toutes deux cohérentes
+        """
+        self.check_graph(graph)
+        active = self._active(s_row, t_row, num_active or self.num_active)
+        fwd = [self._forward[i] for i in active]
+        bwd = [self._backward[i] for i in active]
+        # Pour chaque repère : (d(L, t), d(t, L)) et (d(L, s), d(s, L))
+        to_t = [(f, b, f[t_row], b[t_row]) for f, b in zip(fwd, bwd)]
+        from_s = [(f, b, f[s_row], b[s_row]) for f, b in zip(fwd, bwd)]
+
+        def to_target(row: int) -> float:
+            best = 0.0
+            for f, b, f_t, b_t in to_t:
+                bound = f_t - f[row]
+                if bound > best:
+                    best = bound
+                bound = b[row] - b_t
+                if bound > best:
+                    best = bound
+            return best
+
+        def from_source(row: int) -> float:
+            best = 0.0
+            for f, b, f_s, b_s in from_s:
+                bound = f[row] - f_s
+                if bound > best:
+                    best = bound
+                bound = b_s - b[row]
+                if bound > best:
+                    best = bound
+            return best
+
+        return to_target, from_source
+
+    def __call__(self, u: int, target: int, graph) -> float:
+        """
+        Heuristique au format de astar (IDs de sommets), avec tous les repères.
+
+        astar et bidirectional_astar utilisent de préférence row_bounds,
+        plus rapide.
+        """
+        return self.lower_bound(graph.index_of(u), graph.index_of(target))
+
+    # ------------------------------------------------------------------
+    # Sauvegarde
+    # ------------------------------------------------------------------
+
+    def save(self, filename: str) -> None:
+        """
+        Sauvegarde les tables (format NumPy .npz, nom de fichier inchangé).
+
+        Args:
+            filename: Chemin du fichier
+        """
+        with open(filename, "wb") as f:
+            np.savez(f, rows=self.rows, forward=self.forward,
+                     backward=self.backward if self.backward is not self.forward
+                     else np.empty((0, 0)),
+                     ids=self.ids)
+
+    @classmethod
+    def load(cls, filename: str, graph=None) -> 'LandmarkIndex':
+        """
+        Recharge un index sauvegardé.
+
+        Args:
+            filename: Chemin du fichier
+            graph: Si fourni, vérifie que ses sommets (IDs, ordre des lignes)
+                sont ceux de l'index
+
+        Returns:
+            LandmarkIndex
+
+        Raises:
+            ValueError: si le graphe ne correspond pas à l'index
+        """
+        with np.load(filename, allow_pickle=False) as data:
+            forward = data["forward"]
+            backward = data["backward"] if data["backward"].size else forward
+            index = cls(data["rows"], forward, backward, data["ids"])
+        if graph is not None:
+            index.check_graph(graph)
+            if not np.array_equal(np.fromiter(graph.row_ids(), dtype=np.int64,
+                                              count=graph.num_vertices()), index.ids):
+                raise ValueError("Les sommets du graphe ne correspondent pas à l'index")
+        return index
+
+    def __repr__(self) -> str:
+        return f"LandmarkIndex(landmarks={self.num_landmarks()}, vertices={len(self.ids)})"
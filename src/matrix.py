@@ -0,0 +1,280 @@
+"""
+Module de matrices de distances (plusieurs sources × plusieurs cibles).
+
+distance_matrix calcule en un appel toutes les distances d'un ensemble de
+sources vers un ensemble de cibles (par exemple 1000 × 1000 pour un
+dispatch), au lieu d'une requête par paire.
+
+Moteurs :
+- "dijkstra" : une recherche un-vers-plusieurs par source, arrêtée dès que
+  toutes les cibles sont fermées ;
+- "ch" : many-to-many par seaux sur une hiérarchie de contraction. Une
+  recherche montante arrière depuis chaque cible dépose (colonne, distance)
+  dans le « seau » de chaque sommet fermé ; une recherche montante avant
+  depuis chaque source lit les seaux des sommets qu'elle ferme. Chaque
+  recherche ne visite que quelques centaines de sommets ;
+- "auto" : "ch" si une hiérarchie est fournie, sinon "dijkstra".
+
+Les grandes matrices sont découpées en tuiles de lignes (sources),
+calculables en parallèle par un pool de processus (workers > 1). Les
+tâches n'emportent que des tableaux NumPy, sérialisés une fois par
+processus.
+
+Usage :
+    >>> D = distance_matrix(graph, depots, clients)
+    >>> D = distance_matrix(graph, depots, clients, hierarchy=ch, workers=4)
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from .contraction import ContractionHierarchy
+from .csr import CSRGraph
+
+
+ENGINES = ("auto", "dijkstra", "ch")
+
+
+class _DijkstraTask:
+    """Recherches un-vers-plusieurs sur les tableaux CSR du graphe."""
+
+    def __init__(self, offsets: np.ndarray, heads: np.ndarray, weights: np.ndarray,
+                 target_rows: np.ndarray):
+        self.offsets = offsets
+        self.heads = heads
+        self.weights = weights
+        self.target_rows = target_rows
+        self._lists = None
+
+    def __call__(self, source_rows: np.ndarray) -> np.ndarray:
+        """Retourne le bloc de la matrice pour source_rows."""
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.heads.tolist(), self.weights.tolist())
+        offsets, heads, weights = self._lists
+        n = len(offsets) - 1
+        columns = {}
+        for j, row in enumerate(self.target_rows.tolist()):
+            columns.setdefault(row, []).append(j)
+
+        block = np.full((len(source_rows), len(self.target_rows)), np.inf)
+        distances = [0.0] * n
+        stamps = [0] * n
+        closed = [0] * n
+        for gen, s_row in enumerate(source_rows.tolist(), start=1):
+            out = block[gen - 1]
+            remaining = len(columns)
+            distances[s_row] = 0.0
+            stamps[s_row] = gen
+            queue = [(0.0, s_row)]
+            while queue and remaining:
+                d, v = heapq.heappop(queue)
+                if closed[v] == gen:
+                    continue
+                closed[v] = gen
+                cols = columns.get(v)
+                if cols is not None:
+                    out[cols] = d
+                    remaining -= 1
+                for i in range(offsets[v], offsets[v + 1]):
+                    w = heads[i]
+                    new_distance = d + weights[i]
+                    if stamps[w] != gen or new_distance < distances[w]:
+                        distances[w] = new_distance
+                        stamps[w] = gen
+                        heapq.heappush(queue, (new_distance, w))
+        return block
+
+
+def _upward_search(expand: Tuple[list, list, list], stall: Tuple[list, list, list],
+                   root: int) -> List[Tuple[int, float]]:
+    """
+    Recherche montante dans une hiérarchie, avec stall-on-demand.
+
+    Args:
+        expand: (offsets, arcs, poids) parcourus par la recherche
+        stall: (offsets, arcs, poids) des arcs qui arrivent au sommet depuis
+            un rang supérieur (voir ContractionHierarchy._search)
+        root: Ligne de départ
+
+    Returns:
+        Liste des (ligne, distance) fermées et non bloquées
+    """
+    offsets, arcs, weights = expand
+    s_offsets, s_arcs, s_weights = stall
+    dist = {root: 0.0}
+    done = set()
+    queue = [(0.0, root)]
+    space = []
+    while queue:
+        d, v = heapq.heappop(queue)
+        if v in done:
+            continue
+        done.add(v)
+        stalled = False
+        for i in range(s_offsets[v], s_offsets[v + 1]):
+            u_dist = dist.get(s_arcs[i])
+            if u_dist is not None and u_dist + s_weights[i] < d:
+                stalled = True
+                break
+        if stalled:
+            continue
+        space.append((v, d))
+        for i in range(offsets[v], offsets[v + 1]):
+            w = arcs[i]
+            new_distance = d + weights[i]
+            if new_distance < dist.get(w, float('inf')):
+                dist[w] = new_distance
+                heapq.heappush(queue, (new_distance, w))
+    return space
+
+
+class _BucketTask:
+    """Recherches montantes avant d'une hiérarchie, lisant les seaux des cibles."""
+
+    def __init__(self, ch: ContractionHierarchy, target_rows: np.ndarray):
+        self.up = (ch.up_offsets, ch.up_targets, ch.up_weights)
+        self.down = (ch.down_offsets, ch.down_sources, ch.down_weights)
+        self.num_targets = len(target_rows)
+
+        # Seaux : recherches arrière depuis chaque cible, rangés par sommet
+        up = tuple(array.tolist() for array in self.up)
+        down = tuple(array.tolist() for array in self.down)
+        rows, columns, dists = [], [], []
+        for j, t_row in enumerate(target_rows.tolist()):
+            for v, d in _upward_search(down, up, t_row):
+                rows.append(v)
+                columns.append(j)
+                dists.append(d)
+        order = np.argsort(np.asarray(rows, dtype=np.int64), kind='stable')
+        self.bucket_offsets = np.zeros(ch.num_vertices() + 1, dtype=np.int64)
+        np.cumsum(np.bincount(np.asarray(rows, dtype=np.int64), minlength=ch.num_vertices()),
+                  out=self.bucket_offsets[1:])
+        self.bucket_columns = np.asarray(columns, dtype=np.int64)[order]
+        self.bucket_dists = np.asarray(dists, dtype=np.float64)[order]
+        self._lists = None
+
+    def __call__(self, source_rows: np.ndarray) -> np.ndarray:
+        """Retourne le bloc de la matrice pour source_rows."""
+        if self._lists is None:
+            self._lists = (tuple(array.tolist() for array in self.up),
+                           tuple(array.tolist() for array in self.down),
+                           self.bucket_offsets.tolist(), self.bucket_columns.tolist(),
+                           self.bucket_dists.tolist())
+        up, down, bucket_offsets, columns, dists = self._lists
+
+        block = np.empty((len(source_rows), self.num_targets))
+        for i, s_row in enumerate(source_rows.tolist()):
+            out = [float('inf')] * self.num_targets
+            for v, d in _upward_search(up, down, s_row):
+                for k in range(bucket_offsets[v], bucket_offsets[v + 1]):
+                    j = columns[k]
+                    if d + dists[k] < out[j]:
+                        out[j] = d + dists[k]
+            block[i] = out
+        return block
+
+
+_worker_task = None
+
+
+def _init_worker(task) -> None:
+    """Installe la tâche dans un processus du pool (une fois par processus)."""
+    global _worker_task
+    _worker_task = task
+
+
+def _run_tile(source_rows: np.ndarray) -> np.ndarray:
+    """Calcule une tuile dans un processus du pool."""
+    return _worker_task(source_rows)
+
+
+def _rows_of(index, vertices: Sequence[int], role: str) -> np.ndarray:
+    """Lignes des sommets (ValueError si l'un d'eux n'existe pas)."""
+    rows = np.empty(len(vertices), dtype=np.int64)
+    for k, v in enumerate(vertices):
+        if not index.has_vertex(v):
+            raise ValueError(f"Sommet {role} {v} n'existe pas")
+        rows[k] = index.index_of(v)
+    return rows
+
+
+def distance_matrix(
+    graph,
+    sources: Sequence[int],
+    targets: Optional[Sequence[int]] = None,
+    engine: str = "auto",
+    hierarchy: Optional[ContractionHierarchy] = None,
+    workers: Optional[int] = 1,
+    tile_size: int = 128
+) -> np.ndarray:
+    """
+    Matrice des distances de chaque source vers chaque cible.
+
+    Args:
+        graph: Graph, CompactGraph ou CSRGraph (peut valoir None si une
+            hiérarchie est fournie)
+        sources: IDs des sources (lignes de la matrice)
+        targets: IDs des cibles (colonnes) ; si None, les sources
+        engine: "auto", "dijkstra" ou "ch" (hiérarchie construite si absente)
+        hierarchy: Hiérarchie de contraction du graphe (voir contraction.py)
+        workers: Nombre de processus (1 : calcul dans le processus courant,
+            None : un par cœur)
+        tile_size: Nombre de sources par tuile
+
+    Returns:
+        np.ndarray (len(sources) × len(targets)) de coûts, inf si aucun chemin
+
+    Raises:
+        ValueError: si le moteur est inconnu, si un sommet n'existe pas ou si
+            la hiérarchie ne correspond pas au graphe
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur inconnu : {engine} (attendu : {', '.join(ENGINES)})")
+    if tile_size < 1:
+        raise ValueError("tile_size doit être positif")
+    if targets is None:
+        targets = sources
+    if engine == "auto":
+        engine = "ch" if hierarchy is not None else "dijkstra"
+
+    if engine == "ch":
+        if hierarchy is None:
+            hierarchy = ContractionHierarchy.build(graph)
+        elif graph is not None and graph.num_vertices() != hierarchy.num_vertices():
+            raise ValueError(f"Hiérarchie de {hierarchy.num_vertices()} sommets, "
+                             f"graphe de {graph.num_vertices()} sommets")
+        index = hierarchy
+    else:
+        if graph is None:
+            raise ValueError("Le moteur dijkstra nécessite un graphe")
+        index = graph if isinstance(graph, CSRGraph) else graph.freeze()
+
+    source_rows = _rows_of(index, sources, "source")
+    target_rows = _rows_of(index, targets, "cible")
+    matrix = np.full((len(source_rows), len(target_rows)), np.inf)
+    if len(source_rows) == 0 or len(target_rows) == 0:
+        return matrix
+
+    if engine == "ch":
+        task = _BucketTask(hierarchy, target_rows)
+    else:
+        _, heads, weights = index.edge_arrays()
+        task = _DijkstraTask(index.offsets, heads, weights, target_rows)
+
+    starts = range(0, len(source_rows), tile_size)
+    tiles = [source_rows[start:start + tile_size] for start in starts]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tiles))
+    if workers <= 1:
+        blocks = map(task, tiles)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(task,))
+        with pool:
+            blocks = list(pool.map(_run_tile, tiles))
+    for start, block in zip(starts, blocks):
+        matrix[start:start + len(block)] = block
+    return matrix
@@ -0,0 +1,227 @@
+"""
+Module d'import des réseaux routiers OpenStreetMap.
+
+Fournit, sans dépendre d'OSMnx :
+- la conversion d'un graphe NetworkX produit par OSMnx en Graph
+- la lecture d'un extrait OSM local (fichier .osm XML), pour travailler
+  sans accès réseau
+- un cache disque des graphes convertis, au format binaire (storage.py),
+  indexé par les paramètres du téléchargement
+
+Les graphes produits sont non-orientés, géographiques (x = longitude,
+y = latitude) et pondérés en kilomètres.
+"""
+
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .graph import Graph
+from .storage import FORMAT_VERSION, load_graph_binary, save_graph_binary
+
+
+# Types de voie exclus selon le type de réseau (même esprit que les filtres OSMnx)
+_EXCLUDED_HIGHWAYS = {
+    "drive": {"footway", "path", "pedestrian", "steps", "cycleway", "bridleway",
+              "track", "corridor", "elevator", "escalator", "proposed",
+              "construction", "platform", "raceway", "bus_guideway", "service"},
+    "walk": {"motorway", "motorway_link", "trunk", "trunk_link", "proposed",
+             "construction", "raceway", "bus_guideway"},
+    "bike": {"motorway", "motorway_link", "trunk", "trunk_link", "footway",
+             "steps", "corridor", "proposed", "construction", "raceway"},
+    "all": {"proposed", "construction"},
+}
+
+
+def _new_osm_graph() -> Graph:
+    """Graphe vide configuré pour un réseau OSM."""
+    # Les doublons u->v / v->u d'OSM sont fusionnés en gardant la plus courte
+    graph = Graph(directed=False, edge_index=True, parallel_edges="keep_min")
+    graph.is_geographic = True
+    return graph
+
+
+def graph_from_networkx(G_osm) -> Graph:
+    """
+    Convertit un graphe OSMnx (NetworkX) en Graph.
+
+    Args:
+        G_osm: MultiDiGraph renvoyé par osmnx (attributs 'x', 'y' des nœuds,
+            'length' en mètres des arêtes)
+
+    Returns:
+        Graph géographique pondéré en kilomètres
+    """
+    graph = _new_osm_graph()
+
+    # Sommets : OSM node_id -> notre vertex_id (ordre de NetworkX)
+    node_mapping = {node_id: i for i, node_id in enumerate(G_osm.nodes)}
+    nodes = G_osm.nodes(data=True)
+    graph.add_vertices_from(
+        np.arange(len(node_mapping)),
+        [data.get('x', 0) for _, data in nodes],  # OSMnx : 'x' = longitude
+        [data.get('y', 0) for _, data in nodes],  # 'y' = latitude
+        [f"OSM_{node_id}" for node_id, _ in nodes]
+    )
+
+    edges = np.array(
+        [(node_mapping[u], node_mapping[v], data.get('length', 0) or 0)
+         for u, v, data in G_osm.edges(data=True)
+         if u in node_mapping and v in node_mapping],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    _add_osm_edges(graph, edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64),
+                   edges[:, 2])
+    return graph
+
+
+def _add_osm_edges(
+    graph: Graph,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    lengths_m: np.ndarray,
+    road_types=None,
+    speeds=None
+) -> None:
+    """Ajoute des routes : longueur réelle (m -> km) ou, si absente, distance haversine."""
+    weights_km = np.where(
+        lengths_m > 0,
+        lengths_m / 1000.0,
+        graph.straight_line_distances(sources, targets, metric='haversine')
+    )
+    graph.add_edges_from(sources, targets, weights_km, road_types, speeds)
+
+
+def _parse_speed(value: Optional[str]) -> float:
+    """Vitesse OSM ('50', '30 mph', 'FR:urban'...) en km/h ; 50 si illisible."""
+    if not value:
+        return 50.0
+    number = value.split(";")[0].strip().split(" ")[0]
+    try:
+        speed = float(number)
+    except ValueError:
+        return 50.0
+    return speed * 1.609344 if "mph" in value else speed
+
+
+def load_osm_xml(filename: str, network_type: str = "drive") -> Graph:
+    """
+    Lit un extrait OpenStreetMap local (.osm XML), sans OSMnx ni réseau.
+
+    Le fichier est parcouru au fil de l'eau (iterparse). Chaque voie 'highway'
+    retenue pour le type de réseau donne une arête entre nœuds consécutifs ;
+    seuls les nœuds utilisés par ces voies deviennent des sommets. Le graphe
+    n'est pas simplifié (les nœuds intermédiaires des voies sont conservés).
+
+    Args:
+        filename: Chemin du fichier .osm
+        network_type: 'drive', 'walk', 'bike' ou 'all'
+
+    Returns:
+        Graph géographique pondéré en kilomètres (distance haversine),
+        avec type de route ('highway') et vitesse ('maxspeed') par arête
+    """
+    excluded = _EXCLUDED_HIGHWAYS.get(network_type)
+    if excluded is None:
+        raise ValueError(f"Type de réseau inconnu : {network_type}")
+
+    coordinates: Dict[int, Tuple[float, float]] = {}
+    ways: List[Tuple[List[int], str, float]] = []
+
+    for _, element in ET.iterparse(filename, events=("end",)):
+        if element.tag == "node":
+            coordinates[int(element.get("id"))] = (float(element.get("lon")),
+                                                   float(element.get("lat")))
+            element.clear()
+        elif element.tag == "way":
+            tags = {tag.get("k"): tag.get("v") for tag in element.iter("tag")}
+            highway = tags.get("highway")
+            if highway and highway not in excluded and tags.get("area") != "yes":
+                refs = [int(nd.get("ref")) for nd in element.iter("nd")]
+                ways.append((refs, highway, _parse_speed(tags.get("maxspeed"))))
+            element.clear()
+
+    sources, targets, road_types, speeds = [], [], [], []
+    for refs, highway, speed in ways:
+        refs = [ref for ref in refs if ref in coordinates]
+        for u, v in zip(refs, refs[1:]):
+            if u != v:
+                sources.append(u)
+                targets.append(v)
+                road_types.append(highway)
+                speeds.append(speed)
+
+    graph = _new_osm_graph()
+    used = list(dict.fromkeys(chain.from_iterable(zip(sources, targets))))
+    node_mapping = {node_id: i for i, node_id in enumerate(used)}
+    graph.add_vertices_from(
+        np.arange(len(used)),
+        [coordinates[node_id][0] for node_id in used],
+        [coordinates[node_id][1] for node_id in used],
+        [f"OSM_{node_id}" for node_id in used]
+    )
+    _add_osm_edges(
+        graph,
+        np.array([node_mapping[u] for u in sources], dtype=np.int64),
+        np.array([node_mapping[v] for v in targets], dtype=np.int64),
+        np.zeros(len(sources)),
+        road_types,
+        speeds
+    )
+    return graph
+
+
+# ----------------------------------------------------------------------
+# Cache disque
+# ----------------------------------------------------------------------
+
+def osm_cache_path(
+    cache_dir: str,
+    place_name: str,
+    network_type: str = "drive",
+    simplify: bool = True,
+    max_nodes: Optional[int] = None
+) -> str:
+    """
+    Chemin du fichier de cache d'un réseau OSM.
+
+    La clé (lieu, type de réseau, simplification, nombre maximal de nœuds,
+    version du format binaire) est hachée : un changement de paramètre ou
+    de format donne un autre fichier.
+
+    Returns:
+        Chemin '<cache_dir>/<lieu>-<empreinte>.sgpg'
+    """
+    key = json.dumps([place_name, network_type, bool(simplify), max_nodes, FORMAT_VERSION])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    slug = "".join(c if c.isalnum() else "_" for c in place_name.lower()).strip("_")[:40]
+    return os.path.join(cache_dir, f"{slug}-{digest}.sgpg")
+
+
+def load_cached_graph(path: str) -> Optional[Graph]:
+    """
+    Recharge un graphe du cache.
+
+    Returns:
+        Le graphe, ou None si le fichier est absent ou illisible
+        (ancienne version du format, fichier tronqué...)
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        graph = load_graph_binary(path)
+    except (ValueError, OSError):
+        return None
+    graph.enable_edge_index()
+    return graph
+
+
+def save_cached_graph(graph: Graph, path: str) -> None:
+    """Enregistre un graphe dans le cache (répertoire créé si besoin)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    save_graph_binary(graph, path)
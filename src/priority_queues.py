@@ -0,0 +1,210 @@
+"""
+Module de files de priorité interchangeables pour Dijkstra et A*.
+
+Par défaut, les recherches utilisent heapq avec doublons paresseux : le tas
+peut contenir O(m) entrées et chaque opération coûte O(log m). Quand les
+clés sont des entiers qui ne décroissent jamais (Dijkstra, ou A* avec une
+heuristique cohérente, poids multiples d'un pas resolution), des files à
+seaux font mieux :
+
+- DialBuckets : un seau par valeur de clé, parcourus dans l'ordre ; une
+  opération coûte O(1) plus le saut des seaux vides (O(m + D) pour D la
+  plus grande distance). Idéal pour de petits poids entiers (grilles).
+- RadixHeap : seaux par nombre de bits de différence avec la dernière clé
+  sortie ; O(log C) amorti par entrée, quel que soit l'écart entre clés
+  (distances en mètres sur un réseau OSM).
+- BinaryHeap : heapq, clés quelconques, sert de référence.
+
+Les trois exposent push(clé, ligne), pop() -> (clé, ligne), len() et
+stats() (entrées ajoutées, sorties, taille maximale) pour choisir la file
+la plus rapide selon le type de graphe.
+
+Usage :
+    >>> result = dijkstra(graph, source, target, queue="dial")
+    >>> result = astar(graph, source, target, queue="radix", resolution=0.001)   # km au mètre
+    >>> result.queue_stats
+    {'pushes': 812, 'pops': 640, 'max_size': 97}
+"""
+
+import heapq
+from typing import Dict, List, Tuple, Union
+
+
+class BinaryHeap:
+    """Tas binaire (heapq), clés quelconques, doublons paresseux."""
+
+    def __init__(self):
+        self._heap: List[Tuple] = []
+        self.pushes = 0
+        self.pops = 0
+        self.max_size = 0
+
+    def push(self, key, row: int) -> None:
+        """Ajoute une entrée."""
+        heapq.heappush(self._heap, (key, row))
+        self.pushes += 1
+        if len(self._heap) > self.max_size:
+            self.max_size = len(self._heap)
+
+    def pop(self) -> Tuple:
+        """Retire l'entrée de plus petite clé."""
+        self.pops += 1
+        return heapq.heappop(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne {pushes, pops, max_size}."""
+        return {"pushes": self.pushes, "pops": self.pops, "max_size": self.max_size}
+
+    def __repr__(self) -> str:
+        return f"BinaryHeap(size={len(self)})"
+
+
+class DialBuckets:
+    """
+    File de Dial : un seau par valeur de clé entière (clés monotones).
+
+    Une clé inférieure à la dernière clé sortie est traitée comme égale à
+    celle-ci (file monotone).
+    """
+
+    def __init__(self):
+        self._buckets: List[List[int]] = []
+        self._base = None       # clé du seau 0
+        self._current = 0       # premier seau potentiellement non vide
+        self._size = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_size = 0
+
+    def push(self, key: int, row: int) -> None:
+        """Ajoute une entrée de clé entière."""
+        if self._base is None:
+            self._base = key
+        index = max(key - self._base, self._current)
+        buckets = self._buckets
+        if index >= len(buckets):
+            buckets.extend([] for _ in range(index + 1 - len(buckets)))
+        buckets[index].append(row)
+        self.pushes += 1
+        self._size += 1
+        if self._size > self.max_size:
+            self.max_size = self._size
+
+    def pop(self) -> Tuple[int, int]:
+        """
+        Retire une entrée de plus petite clé.
+
+        Raises:
+            IndexError: si la file est vide
+        """
+        if not self._size:
+            raise IndexError("pop sur une file vide")
+        buckets = self._buckets
+        index = self._current
+        while not buckets[index]:
+            index += 1
+        self._current = index
+        self._size -= 1
+        self.pops += 1
+        return self._base + index, buckets[index].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne {pushes, pops, max_size, buckets}."""
+        return {"pushes": self.pushes, "pops": self.pops, "max_size": self.max_size,
+                "buckets": len(self._buckets)}
+
+    def __repr__(self) -> str:
+        return f"DialBuckets(size={self._size}, buckets={len(self._buckets)})"
+
+
+class RadixHeap:
+    """
+    Tas radix : clés entières positives ou nulles, monotones.
+
+    Le seau i contient les clés dont la différence avec la dernière clé
+    sortie tient sur i bits ; vider le premier seau non vide redistribue
+    ses entrées dans des seaux plus bas. Une clé inférieure à la dernière
+    clé sortie est traitée comme égale à celle-ci.
+    """
+
+    def __init__(self):
+        self._buckets: List[List[Tuple[int, int]]] = [[] for _ in range(65)]
+        self._last = 0
+        self._size = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_size = 0
+
+    def push(self, key: int, row: int) -> None:
+        """Ajoute une entrée de clé entière (au plus 2**64 - 1)."""
+        if key < self._last:
+            key = self._last
+        self._buckets[(key ^ self._last).bit_length()].append((key, row))
+        self.pushes += 1
+        self._size += 1
+        if self._size > self.max_size:
+            self.max_size = self._size
+
+    def pop(self) -> Tuple[int, int]:
+        """
+        Retire une entrée de plus petite clé.
+
+        Raises:
+            IndexError: si la file est vide
+        """
+        if not self._size:
+            raise IndexError("pop sur une file vide")
+        buckets = self._buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            entries = buckets[index]
+            buckets[index] = []
+            last = min(entries)[0]
+            self._last = last
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self._size -= 1
+        self.pops += 1
+        return buckets[0].pop()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne {pushes, pops, max_size}."""
+        return {"pushes": self.pushes, "pops": self.pops, "max_size": self.max_size}
+
+    def __repr__(self) -> str:
+        return f"RadixHeap(size={self._size}, last={self._last})"
+
+
+QUEUES = {
+    "heap": BinaryHeap,
+    "dial": DialBuckets,
+    "radix": RadixHeap,
+}
+
+
+def make_queue(queue: Union[str, object]):
+    """
+    Crée une file à partir de son nom, ou retourne la file fournie.
+
+    Args:
+        queue: "heap", "dial", "radix", ou une file vide (push, pop, len, stats)
+
+    Raises:
+        ValueError: si le nom est inconnu
+    """
+    if isinstance(queue, str):
+        if queue not in QUEUES:
+            raise ValueError(f"File inconnue : {queue} (attendu : {', '.join(QUEUES)})")
+        return QUEUES[queue]()
+    return queue
@@ -0,0 +1,254 @@
+"""
+Module de sauvegarde binaire des graphes (format projetable en mémoire).
+
+Le format reprend les tableaux CSR d'un graphe figé, précédés d'un en-tête
+de taille fixe. Chaque section est alignée sur 64 octets et sa position se
+déduit de l'en-tête seul : l'ouverture (open_graph_binary) ne lit ni ne
+convertit aucune donnée, elle projette le fichier en mémoire (mmap) en
+lecture seule. Plusieurs processus qui ouvrent le même fichier partagent
+donc les mêmes pages physiques.
+
+Disposition du fichier (petit-boutiste) :
+    en-tête      magic, version, drapeaux, n, m (arcs), nombre d'arêtes,
+                 position et taille des métadonnées
+    ids          int64[n]      ID du sommet de chaque ligne
+    offsets      int64[n + 1]  début des arcs de chaque ligne
+    targets      int64[m]      ligne cible de chaque arc
+    weights      float64[m]    poids de chaque arc
+    xs, ys       float64[n]    coordonnées des sommets
+    road_types   uint8[m]      code du type de route de chaque arc
+    speeds       float64[m]    vitesse limite de chaque arc
+    métadonnées  JSON (table des types de route, labels des sommets)
+
+Usage :
+    >>> save_graph_binary(graph, "paris.sgpg")
+    >>> csr = open_graph_binary("paris.sgpg")    # O(1), pour les requêtes
+    >>> graph = load_graph_binary("paris.sgpg")  # Graph modifiable
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Dict, List, Tuple, Type
+import numpy as np
+from .graph import Graph, gc_paused
+from .csr import CSRGraph
+
+
+MAGIC = b"SGPGRAPH"
+FORMAT_VERSION = 1
+
+# magic, version, drapeaux, n, m, num_edges, position et taille des métadonnées
+_HEADER = struct.Struct("<8sIIQQQQQ")
+_ALIGN = 64
+
+_FLAG_DIRECTED = 1
+_FLAG_GEOGRAPHIC = 2
+_FLAG_IDENTITY = 4
+
+# (nom, type, longueur en fonction de n et m)
+_SECTIONS = (
+    ("ids", "<i8", lambda n, m: n),
+    ("offsets", "<i8", lambda n, m: n + 1),
+    ("targets", "<i8", lambda n, m: m),
+    ("weights", "<f8", lambda n, m: m),
+    ("xs", "<f8", lambda n, m: n),
+    ("ys", "<f8", lambda n, m: n),
+    ("road_types", "u1", lambda n, m: m),
+    ("speeds", "<f8", lambda n, m: m),
+)
+
+
+def _aligned(position: int) -> int:
+    """Arrondit une position au multiple de _ALIGN supérieur."""
+    return (position + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _layout(n: int, m: int) -> Tuple[List[Tuple[str, str, int, int]], int]:
+    """
+    Calcule la position de chaque section.
+
+    Returns:
+        (liste de (nom, type, position, longueur), fin des sections)
+    """
+    layout = []
+    position = _aligned(_HEADER.size)
+    for name, dtype, length in _SECTIONS:
+        count = length(n, m)
+        layout.append((name, dtype, position, count))
+        position = _aligned(position + count * np.dtype(dtype).itemsize)
+    return layout, position
+
+
+def _edge_attributes(graph) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Types de route (codes) et vitesses de tous les arcs, dans l'ordre CSR.
+
+    Returns:
+        (codes uint8, vitesses float64, table code -> type de route)
+    """
+    if isinstance(graph, CSRGraph):
+        m = graph.num_arcs()
+        return np.zeros(m, dtype=np.uint8), np.full(m, 50.0), ["main"]
+
+    names: List[str] = ["main"]
+    codes: Dict[str, int] = {"main": 0}
+    edges = graph.get_all_edges()
+    road_types = np.empty(len(edges), dtype=np.uint8)
+    speeds = np.empty(len(edges), dtype=np.float64)
+    for i, edge in enumerate(edges):
+        code = codes.get(edge.road_type)
+        if code is None:
+            code = codes[edge.road_type] = len(names)
+            if code > 255:
+                raise ValueError("Trop de types de route distincts (255 maximum)")
+            names.append(edge.road_type)
+        road_types[i] = code
+        speeds[i] = edge.speed_limit
+    return road_types, speeds, names
+
+
+def save_graph_binary(graph, filename: str) -> None:
+    """
+    Sauvegarde un graphe au format binaire.
+
+    L'écriture passe par un fichier temporaire renommé à la fin : un lecteur
+    ne voit jamais un fichier à moitié écrit.
+
+    Args:
+        graph: Graph, CompactGraph ou CSRGraph (ce dernier sans attributs
+            d'arêtes : types de route et vitesses par défaut)
+        filename: Chemin du fichier
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    road_types, speeds, road_type_names = _edge_attributes(graph)
+
+    labels = None
+    if isinstance(graph, Graph):
+        labels = [graph.vertices[v].label for v in graph.row_ids()]
+        if all(label == f"V{v}" for v, label in zip(graph.row_ids(), labels)):
+            labels = None  # labels par défaut : inutile de les stocker
+    metadata = json.dumps({"road_types": road_type_names, "labels": labels}).encode("utf-8")
+
+    n, m = csr.num_vertices(), csr.num_arcs()
+    arrays = {
+        "ids": csr.ids, "offsets": csr.offsets, "targets": csr.targets,
+        "weights": csr.weights, "xs": csr.xs, "ys": csr.ys,
+        "road_types": road_types, "speeds": speeds,
+    }
+    flags = ((_FLAG_DIRECTED if csr.directed else 0)
+             | (_FLAG_GEOGRAPHIC if csr.is_geographic else 0)
+             | (_FLAG_IDENTITY if csr._identity else 0))
+    layout, metadata_offset = _layout(n, m)
+
+    tmp_name = f"{filename}.tmp{os.getpid()}"
+    with open(tmp_name, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, flags, n, m, csr.num_edges_count(),
+                             metadata_offset, len(metadata)))
+        for name, dtype, position, count in layout:
+            f.write(b"\0" * (position - f.tell()))
+            f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+        f.write(b"\0" * (metadata_offset - f.tell()))
+        f.write(metadata)
+    os.replace(tmp_name, filename)
+
+
+def _read(filename: str) -> Tuple[dict, Dict[str, np.ndarray], dict]:
+    """
+    Projette un fichier binaire en mémoire.
+
+    Returns:
+        (en-tête, tableaux en lecture seule adossés au mmap, métadonnées)
+
+    Raises:
+        ValueError: si le fichier n'est pas un graphe binaire ou si sa
+            version n'est pas prise en charge
+    """
+    with open(filename, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{filename} : fichier trop court")
+    magic, version, flags, n, m, num_edges, metadata_offset, metadata_len = \
+        _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{filename} : pas un graphe binaire")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{filename} : version {version} non prise en charge "
+                         f"(attendue : {FORMAT_VERSION})")
+
+    layout, _ = _layout(n, m)
+    if metadata_offset + metadata_len > len(buffer):
+        raise ValueError(f"{filename} : fichier tronqué")
+    arrays = {
+        name: np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+        for name, dtype, position, count in layout
+    }
+    metadata = json.loads(bytes(buffer[metadata_offset:metadata_offset + metadata_len]))
+    header = {
+        "directed": bool(flags & _FLAG_DIRECTED),
+        "is_geographic": bool(flags & _FLAG_GEOGRAPHIC),
+        "identity": bool(flags & _FLAG_IDENTITY),
+        "num_edges": num_edges,
+    }
+    return header, arrays, metadata
+
+
+def open_graph_binary(filename: str) -> CSRGraph:
+    """
+    Ouvre un graphe binaire en lecture seule, sans copie.
+
+    Les tableaux du CSRGraph renvoyé sont adossés au fichier projeté : le
+    coût d'ouverture ne dépend pas de la taille du graphe, et les pages sont
+    partagées entre les processus qui ouvrent le même fichier.
+
+    Args:
+        filename: Chemin du fichier
+
+    Returns:
+        CSRGraph prêt pour les requêtes
+    """
+    header, arrays, _ = _read(filename)
+    return CSRGraph(
+        arrays["ids"], arrays["offsets"], arrays["targets"], arrays["weights"],
+        arrays["xs"], arrays["ys"],
+        directed=header["directed"],
+        is_geographic=header["is_geographic"],
+        num_edges=header["num_edges"],
+        identity=header["identity"]
+    )
+
+
+def load_graph_binary(filename: str, graph_class: Type[Graph] = Graph) -> Graph:
+    """
+    Reconstruit un graphe modifiable à partir d'un fichier binaire.
+
+    Les lignes, l'ordre des arcs, les types de route, les vitesses et les
+    labels sont restitués à l'identique.
+
+    Args:
+        filename: Chemin du fichier
+        graph_class: Graph ou CompactGraph
+
+    Returns:
+        Graphe équivalent à celui qui a été sauvegardé
+    """
+    header, arrays, metadata = _read(filename)
+    graph = graph_class(directed=header["directed"])
+    graph.is_geographic = header["is_geographic"]
+    graph.add_vertices_from(arrays["ids"], arrays["xs"], arrays["ys"], metadata["labels"])
+
+    offsets = arrays["offsets"].tolist()
+    targets = arrays["targets"].tolist()
+    weights = arrays["weights"].tolist()
+    names = metadata["road_types"]
+    road_types = [names[code] for code in arrays["road_types"].tolist()]
+    speeds = arrays["speeds"].tolist()
+    with gc_paused():
+        for row in range(len(offsets) - 1):
+            lo, hi = offsets[row], offsets[row + 1]
+            if lo < hi:
+                graph._extend_arcs(row, targets[lo:hi], weights[lo:hi],
+                                   road_types[lo:hi], speeds[lo:hi])
+    graph.num_edges = header["num_edges"]
+    return graph
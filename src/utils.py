@@ -2,18 +2,24 @@
 Module utilitaire pour le projet.
 
 Contient des fonctions auxiliaires pour :
-- Mesure de performance
+- Mesure de performance (temps et mémoire)
 - Export de résultats
 - Statistiques
+- Sauvegarde et chargement des graphes
 """
 
 import time
 import json
+import re
 import csv
-from typing import Dict, List, Any, Callable
+import tracemalloc
+from itertools import islice
+from typing import Dict, List, Any, Callable, Tuple, Iterator, TextIO, Type
 from functools import wraps
-from .graph import Graph
+import numpy as np
+from .graph import Graph, Edge
 from .algorithms import PathResult
+from .storage import save_graph_binary, load_graph_binary
 
 
 def timeit(func: Callable) -> Callable:
@@ -101,6 +107,31 @@ def measure_algorithm_performance(
     }
 
 
+def measure_memory(func: Callable, *args, **kwargs) -> Tuple[Any, int]:
+    """
+    Mesure la mémoire conservée par le résultat d'une fonction.
+    
+    La mémoire allouée pendant l'appel et encore vivante après celui-ci
+    (donc retenue par le résultat) est mesurée avec tracemalloc.
+    
+    Args:
+        func: Fonction à appeler (ex : générateur de graphe, conversion)
+        *args, **kwargs: Arguments de la fonction
+        
+    Returns:
+        Tuple (résultat, octets retenus)
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = func(*args, **kwargs)
+    after, _ = tracemalloc.get_traced_memory()
+    if not already_tracing:
+        tracemalloc.stop()
+    return result, after - before
+
+
 def export_results_to_json(
     results: Dict[str, Any],
     filename: str
@@ -193,8 +224,8 @@ def compare_and_print(
     print(f"Graphe : {graph.num_vertices()} sommets, {graph.num_edges_count()} arêtes\n")
     
     # Tableau comparatif
-    print(f"{'Algorithme':<15} {'Coût':<10} {'Sommets':<10} {'% Expl.':<10} {'Temps (ms)':<12} {'Speedup':<10}")
-    print(f"{'-'*70}")
+    print(f"{'Algorithme':<24} {'Coût':<10} {'Sommets':<10} {'% Expl.':<10} {'Temps (ms)':<12} {'Speedup':<10}")
+    print(f"{'-'*79}")
     
     base_time = None
     
@@ -209,13 +240,13 @@ def compare_and_print(
             else:
                 speedup = f"{base_time / time_ms:.2f}x" if time_ms > 0 else "N/A"
             
-            print(f"{name:<15} {result.cost:<10.2f} {result.visited_nodes:<10} {expl_pct:<10} "
+            print(f"{name:<24} {result.cost:<10.2f} {result.visited_nodes:<10} {expl_pct:<10} "
                   f"{time_ms:<12.2f} {speedup:<10}")
         else:
-            print(f"{name:<15} {'N/A':<10} {result.visited_nodes:<10} {'N/A':<10} "
+            print(f"{name:<24} {'N/A':<10} {result.visited_nodes:<10} {'N/A':<10} "
                   f"{result.execution_time * 1000:<12.2f} {'N/A':<10}")
     
-    print(f"{'-'*70}\n")
+    print(f"{'-'*79}\n")
     
     # Analyse
     if len(results) >= 2:
@@ -244,6 +275,32 @@ def compare_and_print(
                 print(f"    - Réduction de sommets visités : {reduction:.1f}%")
                 print(f"    - Gain de temps : {gain:.1f}%")
             
+            # Comparaison Dijkstra bidirectionnel vs Dijkstra
+            if 'bidirectional_dijkstra' in results and 'dijkstra' in results:
+                r_dijk = results['dijkstra']
+                r_bidir = results['bidirectional_dijkstra']
+                if r_dijk.visited_nodes > 0:
+                    reduction = (1 - r_bidir.visited_nodes / r_dijk.visited_nodes) * 100
+                else:
+                    reduction = 0.0
+                speedup = r_dijk.execution_time / r_bidir.execution_time if r_bidir.execution_time > 0 else float('inf')
+                print("  • Dijkstra bidirectionnel vs Dijkstra :")
+                print(f"    - Réduction de sommets visités : {reduction:.1f}%")
+                print(f"    - Speedup : {speedup:.2f}×")
+            
+            # Comparaison A* bidirectionnel vs A*
+            if 'bidirectional_astar' in results and 'astar' in results:
+                r_astar = results['astar']
+                r_bidir = results['bidirectional_astar']
+                if r_astar.visited_nodes > 0:
+                    reduction = (1 - r_bidir.visited_nodes / r_astar.visited_nodes) * 100
+                else:
+                    reduction = 0.0
+                speedup = r_astar.execution_time / r_bidir.execution_time if r_bidir.execution_time > 0 else float('inf')
+                print("  • A* bidirectionnel vs A* :")
+                print(f"    - Réduction de sommets visités : {reduction:.1f}%")
+                print(f"    - Speedup : {speedup:.2f}×")
+            
             # Comparaison Bellman-Ford vs Dijkstra
             if 'bellman_ford' in results and 'dijkstra' in results:
                 r_dijk = results['dijkstra']
@@ -384,31 +441,294 @@ def save_graph_to_file(
     """
     Sauvegarde un graphe dans un fichier.
     
+    Les formats texte sont écrits au fil de l'eau (un sommet ou une arête à
+    la fois) : la mémoire utilisée ne dépend pas de la taille du graphe.
+    
     Args:
         graph: Le graphe à sauvegarder
         filename: Nom du fichier
-        format: Format ('json' ou 'edgelist')
+        format: Format ('json', 'edgelist' ou 'binary' : voir storage.py,
+            rechargeable avec load_graph_binary / open_graph_binary)
     """
     if format == "json":
-        data = {
-            "vertices": [
-                {"id": v.id, "x": v.x, "y": v.y, "label": v.label}
-                for v in graph.vertices.values()
-            ],
-            "edges": [
-                {"source": e.source, "target": e.target, "weight": e.weight}
-                for e in graph.get_all_edges()
-            ],
-            "directed": graph.directed
-        }
-        
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write('{\n')
+            f.write(f'  "directed": {json.dumps(graph.directed)},\n')
+            f.write(f'  "is_geographic": {json.dumps(graph.is_geographic)},\n')
+            
+            f.write('  "vertices": [')
+            separator = '\n    '
+            for vertex_id in graph.row_ids():
+                v = graph.vertices[vertex_id]
+                f.write(separator)
+                f.write(json.dumps({"id": v.id, "x": v.x, "y": v.y, "label": v.label}))
+                separator = ',\n    '
+            f.write('\n  ],\n')
+            
+            f.write('  "edges": [')
+            separator = '\n    '
+            for edge in _iter_stored_edges(graph):
+                f.write(separator)
+                f.write(json.dumps({
+                    "source": edge.source, "target": edge.target, "weight": edge.weight,
+                    "road_type": edge.road_type, "speed_limit": edge.speed_limit
+                }))
+                separator = ',\n    '
+            f.write('\n  ]\n}\n')
     
     elif format == "edgelist":
+        ids = graph.row_ids()
         with open(filename, 'w') as f:
-            for edge in graph.get_all_edges():
-                f.write(f"{edge.source} {edge.target} {edge.weight}\n")
+            for row in range(graph.num_vertices()):
+                source = ids[row]
+                f.writelines(f"{source} {ids[t]} {w}\n" for t, w in graph.row_neighbors(row))
+    
+    elif format == "binary":
+        save_graph_binary(graph, filename)
+    
+    else:
+        raise ValueError(f"Format inconnu : {format}")
     
     print(f"✓ Graphe sauvegardé : {filename}")
 
+
+def _iter_stored_edges(graph: Graph) -> Iterator[Edge]:
+    """Itère sur les arêtes stockées, ligne par ligne, sans construire de liste."""
+    for row in range(graph.num_vertices()):
+        for pos in range(graph.degree(graph.id_of(row))):
+            yield graph._edge_at(row, pos)
+
+
+def load_graph_from_file(
+    filename: str,
+    format: str = "json",
+    directed: bool = True,
+    graph_class: Type[Graph] = Graph,
+    chunk_size: int = 100_000,
+    use_numpy: bool = True
+) -> Graph:
+    """
+    Recharge un graphe écrit par save_graph_to_file.
+    
+    Les fichiers texte sont lus par blocs : au plus chunk_size sommets ou
+    arêtes sont en attente à un instant donné, puis ajoutés en une seule
+    opération (voir Graph.add_edges_from). Le document JSON n'est jamais
+    chargé en entier.
+    
+    Args:
+        filename: Nom du fichier
+        format: Format ('json', 'edgelist' ou 'binary')
+        directed: Orientation du graphe pour 'edgelist' (le format ne la
+            contient pas ; les formats 'json' et 'binary' l'enregistrent)
+        graph_class: Graph ou CompactGraph
+        chunk_size: Nombre de sommets ou d'arêtes lus par bloc
+        use_numpy: Pour 'edgelist', découpe les blocs de lignes avec NumPy
+            (sinon ligne par ligne en Python)
+        
+    Returns:
+        Le graphe reconstruit (mêmes arêtes orientées, dans le même ordre)
+        
+    Note:
+        Les fichiers contiennent chaque arête orientée stockée : pour un
+        graphe non-orienté, les deux sens sont relus tels quels, sans être
+        dédoublés.
+    """
+    if format == "binary":
+        return load_graph_binary(filename, graph_class)
+    
+    # Les arcs sont rangés tels quels ; l'orientation n'est fixée qu'à la fin
+    graph = graph_class(directed=True)
+    loader = _ArcLoader(graph, chunk_size)
+    
+    if format == "json":
+        with open(filename, 'r') as f:
+            for key, value in _iter_json_members(f, chunk_size, ("vertices", "edges")):
+                if key == "vertices":
+                    loader.add_vertex(value["id"], value.get("x", 0.0), value.get("y", 0.0),
+                                      value.get("label", ""))
+                elif key == "edges":
+                    loader.add_arc(value["source"], value["target"], value["weight"],
+                                   value.get("road_type", "main"),
+                                   value.get("speed_limit", 50.0))
+                elif key == "directed":
+                    directed = bool(value)
+                elif key == "is_geographic":
+                    graph.is_geographic = bool(value)
+    
+    elif format == "edgelist":
+        with open(filename, 'r') as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                lines = [line for line in lines if line.strip() and not line.lstrip().startswith('#')]
+                if use_numpy:
+                    columns = np.array(" ".join(lines).split()).reshape(-1, 3)
+                    loader.add_arcs(columns[:, 0].astype(np.int64), columns[:, 1].astype(np.int64),
+                                    columns[:, 2].astype(np.float64))
+                else:
+                    for line in lines:
+                        source, target, weight = line.split()
+                        loader.add_arc(int(source), int(target), float(weight))
+    
+    else:
+        raise ValueError(f"Format inconnu : {format}")
+    
+    num_arcs = loader.finish()
+    graph.directed = directed
+    graph.num_edges = num_arcs if directed else num_arcs // 2
+    return graph
+
+
+class _ArcLoader:
+    """
+    Tampon de chargement : accumule sommets et arêtes orientées, puis les
+    ajoute au graphe par blocs.
+    """
+    
+    def __init__(self, graph: Graph, chunk_size: int):
+        self.graph = graph
+        self.chunk_size = chunk_size
+        self.num_arcs = 0
+        self._vertices: List[Tuple[int, float, float, str]] = []
+        self._arcs: List[Tuple[int, int, float, str, float]] = []
+    
+    def add_vertex(self, vertex_id: int, x: float, y: float, label: str) -> None:
+        self._vertices.append((vertex_id, x, y, label))
+        if len(self._vertices) >= self.chunk_size:
+            self._flush_vertices()
+    
+    def add_arc(self, source: int, target: int, weight: float,
+                road_type: str = "main", speed_limit: float = 50.0) -> None:
+        self._arcs.append((source, target, weight, road_type, speed_limit))
+        if len(self._arcs) >= self.chunk_size:
+            self._flush_arcs()
+    
+    def add_arcs(self, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray) -> None:
+        """Ajoute directement un bloc d'arcs sous forme de tableaux."""
+        self._flush_arcs()
+        self._store(sources, targets, weights, "main", 50.0)
+    
+    def _flush_vertices(self) -> None:
+        if self._vertices:
+            ids, xs, ys, labels = zip(*self._vertices)
+            self._vertices = []
+            self.graph.add_vertices_from(ids, xs, ys, labels)
+    
+    def _flush_arcs(self) -> None:
+        self._flush_vertices()  # les sommets annoncés avant les arêtes gardent leurs coordonnées
+        if self._arcs:
+            sources, targets, weights, road_types, speeds = zip(*self._arcs)
+            self._arcs = []
+            self._store(np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64),
+                        np.array(weights, dtype=np.float64),
+                        np.array(road_types, dtype=object), np.array(speeds, dtype=np.float64))
+    
+    def _store(self, sources, targets, weights, road_types, speeds) -> None:
+        graph = self.graph
+        graph._ensure_vertices(sources, targets)
+        graph._add_arcs(graph.rows_of(sources), graph.rows_of(targets), weights, road_types, speeds)
+        self.num_arcs += len(sources)
+    
+    def finish(self) -> int:
+        """Vide les tampons et retourne le nombre total d'arcs ajoutés."""
+        self._flush_arcs()
+        return self.num_arcs
+
+
+_JSON_WHITESPACE = re.compile(r'[ \t\r\n]*')
+
+
+def _iter_json_members(
+    f: TextIO,
+    chunk_size: int,
+    streamed_keys: Tuple[str, ...]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Parcourt un objet JSON de premier niveau sans le charger en entier.
+    
+    Pour les clés de streamed_keys (dont la valeur est une liste), produit un
+    couple (clé, élément) par élément ; pour les autres clés, un couple
+    (clé, valeur). Seul l'élément en cours de décodage est en mémoire.
+    
+    Args:
+        f: Fichier texte ouvert
+        chunk_size: Taille indicative des lectures (caractères = 64 × chunk_size)
+        streamed_keys: Clés dont la liste est parcourue élément par élément
+        
+    Raises:
+        ValueError: si le document n'est pas un objet JSON valide
+    """
+    decoder = json.JSONDecoder()
+    read_size = 64 * chunk_size
+    buffer, pos, eof = "", 0, False
+    
+    def fill() -> bool:
+        """Lit un bloc de plus ; retourne False en fin de fichier."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        data = f.read(read_size)
+        if not data:
+            eof = True
+            return False
+        buffer = buffer[pos:] + data
+        pos = 0
+        return True
+    
+    def peek() -> str:
+        """Premier caractère non blanc (sans le consommer)."""
+        nonlocal pos
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                raise ValueError("JSON invalide : fin de fichier inattendue")
+    
+    def expect(char: str) -> None:
+        nonlocal pos
+        if peek() != char:
+            raise ValueError(f"JSON invalide : '{char}' attendu à la position {pos}")
+        pos += 1
+    
+    def value() -> Any:
+        """Décode une valeur complète (lit la suite du fichier si nécessaire)."""
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                result, end = decoder.raw_decode(buffer, pos)
+                # Un nombre coupé en fin de tampon se décode sans erreur : s'assurer
+                # qu'il est suivi d'au moins un caractère
+                if end < len(buffer) or eof:
+                    pos = end
+                    return result
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+    
+    expect('{')
+    if peek() == '}':
+        return
+    while True:
+        key = value()
+        expect(':')
+        if key in streamed_keys and peek() == '[':
+            pos += 1
+            if peek() != ']':
+                while True:
+                    yield key, value()
+                    if peek() == ',':
+                        pos += 1
+                        continue
+                    break
+            expect(']')
+        else:
+            yield key, value()
+        if peek() == ',':
+            pos += 1
+            continue
+        expect('}')
+        return
@@ -12,7 +12,7 @@ import matplotlib.patches as patches
 import numpy as np
 from typing import List, Optional, Dict
 from .graph import Graph
-from .algorithms import PathResult
+from .algorithms import PathResult, ShortestPathTree
 
 
 def plot_graph(
@@ -238,7 +238,7 @@ def plot_comparison(
     fig, axes = plt.subplots(1, 3, figsize=figsize)
     
     # Couleurs pour chaque algorithme
-    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#9B59B6', '#F7DC6F']
     
     # 1. Comparaison des coûts
     ax1 = axes[0]
@@ -380,7 +380,7 @@ def plot_performance_scaling(
 def plot_heatmap_distances(
     graph: Graph,
     source: int,
-    distances: Dict[int, float],
+    distances,
     title: str = "Carte des Distances",
     figsize: tuple = (12, 10),
     save_path: Optional[str] = None
@@ -391,11 +391,15 @@ def plot_heatmap_distances(
     Args:
         graph: Le graphe
         source: Sommet source
-        distances: Dictionnaire {vertex_id: distance}
+        distances: Dictionnaire {vertex_id: distance}, ou ShortestPathTree
+            (résultat de dijkstra(graph, source))
         title: Titre du graphique
         figsize: Taille de la figure
         save_path: Chemin pour sauvegarder
     """
+    if isinstance(distances, ShortestPathTree):
+        distances = distances.as_dict()
+    
     fig, ax = plt.subplots(figsize=figsize)
     
     # Préparer les données
@@ -0,0 +1,93 @@
+"""
+Module d'espace de travail réutilisable pour les recherches de plus court chemin.
+
+Une recherche a besoin de tableaux de taille n (distances, parents, sommets
+fermés). Les initialiser à chaque requête coûte O(n), même pour un trajet
+de quelques rues. SearchWorkspace conserve ces tableaux d'une requête à
+l'autre et les « estampille » par génération : une case n'est valide que si
+son estampille vaut la génération courante. Commencer une requête revient
+donc à incrémenter un compteur ; seules les cases touchées sont écrites.
+
+Usage typique (un espace de travail par thread) :
+    >>> ws = SearchWorkspace()
+    >>> for source, target in requetes:
+    ...     result = dijkstra(graph, source, target, workspace=ws)
+"""
+
+from typing import List
+
+
+class SearchWorkspace:
+    """
+    Tableaux de recherche réutilisables, estampillés par génération.
+
+    Attributs:
+        distances (List[float]): Distance provisoire (valide si stamps[r] == generation)
+        parents (List[int]): Ligne du parent (valide si stamps[r] == generation)
+        stamps (List[int]): Génération de la dernière écriture de distances/parents
+        closed (List[int]): Génération à laquelle la ligne a été fermée (settled)
+        generation (int): Numéro de la requête en cours
+
+    Note:
+        Un espace de travail n'est pas partagé entre threads : chaque thread
+        (ou chaque recherche simultanée) doit posséder le sien.
+    """
+
+    def __init__(self, num_vertices: int = 0):
+        """
+        Initialise un espace de travail.
+
+        Args:
+            num_vertices: Capacité initiale (agrandie automatiquement si besoin)
+        """
+        self.distances: List[float] = []
+        self.parents: List[int] = []
+        self.stamps: List[int] = []
+        self.closed: List[int] = []
+        self.generation = 0
+        self._backward: 'SearchWorkspace' = None
+        self.reserve(num_vertices)
+
+    def reserve(self, num_vertices: int) -> None:
+        """
+        Agrandit les tableaux pour contenir au moins num_vertices lignes.
+
+        Les nouvelles cases ont l'estampille 0, jamais égale à une génération
+        active : elles sont donc considérées comme vierges.
+        """
+        missing = num_vertices - len(self.stamps)
+        if missing > 0:
+            self.distances.extend([float('inf')] * missing)
+            self.parents.extend([-1] * missing)
+            self.stamps.extend([0] * missing)
+            self.closed.extend([0] * missing)
+
+    def begin(self, num_vertices: int) -> int:
+        """
+        Démarre une nouvelle requête en O(1) (hors agrandissement).
+
+        Args:
+            num_vertices: Nombre de sommets du graphe interrogé
+
+        Returns:
+            La génération de la requête
+        """
+        self.reserve(num_vertices)
+        self.generation += 1
+        return self.generation
+
+    def backward(self) -> 'SearchWorkspace':
+        """
+        Retourne l'espace de travail associé à la recherche arrière
+        (algorithmes bidirectionnels), créé au premier appel.
+        """
+        if self._backward is None:
+            self._backward = SearchWorkspace(self.capacity())
+        return self._backward
+    
+    def capacity(self) -> int:
+        """Retourne le nombre de lignes disponibles."""
+        return len(self.stamps)
+
+    def __repr__(self) -> str:
+        return f"SearchWorkspace(capacity={self.capacity()}, generation={self.generation})"
@@ -0,0 +1,41 @@
+"""
+Fonctions communes aux tests : graphes aléatoires et coût d'un chemin.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+from src.graph import Graph
+
+
+def random_graph(n, m, directed, seed, offset=0, negative=False):
+    """
+    Graphe aléatoire (éventuellement non connexe), poids entiers, demi-entiers ou nuls.
+
+    Args:
+        offset: Décalage des IDs (sommets offset .. offset + n - 1)
+        negative: Si True, certains poids sont diminués de 1.5 (poids négatifs possibles)
+    """
+    rng = random.Random(seed)
+    g = Graph(directed=directed)
+    for i in range(n):
+        g.add_vertex(offset + i, rng.random(), rng.random())
+    for _ in range(m):
+        weight = rng.choice([0.0, 1.0, 2.5, 7.0])
+        if negative:
+            weight -= rng.choice([0.0, 0.0, 1.5])
+        g.add_edge(offset + rng.randrange(n), offset + rng.randrange(n), weight=weight)
+    return g
+
+
+def path_cost(graph, path):
+    """Coût d'un chemin en suivant les arêtes du graphe (inf si une arête manque)."""
+    cost = 0.0
+    for u, v in zip(path, path[1:]):
+        weights = [w for n, w in graph.iter_neighbors(u) if n == v]
+        if not weights:
+            return float('inf')
+        cost += min(weights)
+    return cost
@@ -8,7 +8,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import pytest
 from src.graph import Graph
-from src.algorithms import dijkstra, astar, PathResult
+from src.algorithms import (dijkstra, astar, bellman_ford, spfa, bidirectional_dijkstra,
+                            bidirectional_astar, PathResult, ShortestPathTree,
+                            iter_dijkstra, iter_astar)
+from src.workspace import SearchWorkspace
+from src.generators import generate_grid_graph, generate_random_urban_graph
 
 
 class TestDijkstra:
@@ -92,6 +96,175 @@ class TestDijkstra:
         assert len(result.path) == 5
 
 
+class TestShortestPathTree:
+    """Tests du mode une-source de Dijkstra (target=None)."""
+    
+    def test_distances_and_paths(self):
+        """Distances et chemins identiques aux requêtes avec cible."""
+        g = generate_grid_graph(6, 6)
+        g.set_weight(0, 1, 5.0)
+        tree = dijkstra(g, 0)
+        assert isinstance(tree, ShortestPathTree)
+        assert tree.visited_nodes == 36
+        for v in range(36):
+            expected = dijkstra(g, 0, v)
+            assert tree.distance_to(v) == pytest.approx(expected.cost)
+            path = tree.path_to(v)
+            assert path[0] == 0 and path[-1] == v
+            assert sum(g.get_weight(a, b) for a, b in zip(path, path[1:])) == \
+                pytest.approx(expected.cost)
+    
+    def test_unreachable_and_ids(self):
+        """Sommets non atteints : inf et chemin vide ; IDs non contigus."""
+        g = Graph(directed=True)
+        for v in (10, 20, 30):
+            g.add_vertex(v)
+        g.add_edge(10, 20, weight=2.0)
+        tree = dijkstra(g.freeze(), 10)
+        assert tree.as_dict() == {10: 0.0, 20: 2.0}
+        assert tree.distance_to(30) == float('inf')
+        assert tree.path_to(30) == []
+        assert tree.path_to(20) == [10, 20]
+        with pytest.raises(ValueError):
+            tree.distance_to(40)
+    
+    def test_radius(self):
+        """Coupure au rayon : aucune distance provisoire au-delà."""
+        g = generate_grid_graph(10, 10)
+        full = dijkstra(g, 0)
+        radius = full.distance_to(33)
+        tree = dijkstra(g, 0, radius=radius)
+        assert tree.visited_nodes < full.visited_nodes
+        assert set(tree.reached()) == {v for v, d in full.as_dict().items() if d <= radius}
+    
+    def test_target_set(self):
+        """Arrêt dès que toutes les cibles sont atteintes."""
+        g = generate_grid_graph(10, 10)
+        tree = dijkstra(g, 0, targets=[11, 22])
+        assert tree.distance_to(22) == dijkstra(g, 0, 22).cost
+        assert tree.visited_nodes < 100
+        with pytest.raises(ValueError):
+            dijkstra(g, 0, 5, radius=3.0)
+        with pytest.raises(ValueError):
+            dijkstra(g, 0, targets=[1000])
+
+
+class TestIterSearch:
+    """Tests des recherches pas à pas (iter_dijkstra, iter_astar)."""
+    
+    def test_dijkstra_events(self):
+        """Un événement par sommet fermé, distances croissantes, même résultat."""
+        g = generate_grid_graph(8, 8)
+        g.set_weight(0, 1, 5.0)
+        expected = dijkstra(g, 0, 63)
+        search = iter_dijkstra(g, 0, 63)
+        events = list(search)
+        assert events[0] == (0, 0.0, None)
+        assert events[-1][0] == 63
+        assert {node for node, _, _ in events} == expected.explored_nodes
+        distances = [distance for _, distance, _ in events]
+        assert distances == sorted(distances)
+        seen = set()
+        for node, _, parent in events:
+            assert parent is None or parent in seen
+            seen.add(node)
+        assert search.result.path == expected.path
+        assert search.result.cost == expected.cost
+    
+    def test_tree_and_radius(self):
+        """Sans cible : le résultat final est l'arbre, coupé au rayon."""
+        g = generate_grid_graph(6, 6)
+        search = iter_dijkstra(g.freeze(), 0, radius=3.0)
+        events = list(search)
+        assert all(distance <= 3.0 for _, distance, _ in events)
+        assert search.result.as_dict() == {node: d for node, d, _ in events}
+    
+    def test_astar_events(self):
+        """Événements de A* : mêmes sommets explorés que astar."""
+        g = generate_grid_graph(10, 10)
+        expected = astar(g, 0, 99)
+        search = iter_astar(g, 0, 99)
+        events = list(search)
+        assert {node for node, _, _ in events} == expected.explored_nodes
+        assert events[-1][:2] == (99, expected.cost)
+        assert search.result.cost == expected.cost
+    
+    def test_early_stop(self):
+        """Arrêt anticipé : aucun résultat, l'espace de travail reste réutilisable."""
+        g = generate_grid_graph(10, 10)
+        ws = SearchWorkspace()
+        search = iter_dijkstra(g, 0, 99, workspace=ws)
+        for count, (node, distance, parent) in enumerate(search, start=1):
+            if count == 5:
+                break
+        search.close()
+        assert search.result is None
+        assert dijkstra(g, 0, 99, workspace=ws).cost == dijkstra(g, 0, 99).cost
+    
+    def test_errors(self):
+        """Erreurs signalées dès l'appel, avant toute itération."""
+        g = generate_grid_graph(3, 3)
+        with pytest.raises(ValueError):
+            iter_dijkstra(g, 0, 99)
+        with pytest.raises(ValueError):
+            iter_dijkstra(g, 0, 5, radius=1.0)
+        with pytest.raises(ValueError):
+            iter_astar(g, 99, 0)
+
+
+class TestBellmanFord:
+    """Tests de Bellman-Ford vectorisé et de SPFA."""
+    
+    def negative_graph(self, cycle):
+        """Graphe orienté avec une arête négative, et un cycle négatif si demandé."""
+        g = Graph(directed=True)
+        for v in range(5):
+            g.add_vertex(v)
+        g.add_edge(0, 1, weight=4.0)
+        g.add_edge(0, 2, weight=1.0)
+        g.add_edge(1, 3, weight=1.0)
+        g.add_edge(2, 1, weight=-2.0)
+        g.add_edge(3, 4, weight=2.0)
+        if cycle:
+            g.add_edge(3, 2, weight=-1.0)
+        return g
+    
+    @pytest.mark.parametrize("algo", [bellman_ford, spfa])
+    def test_negative_weights(self, algo):
+        """Arête négative : 0 -> 2 -> 1 -> 3 -> 4."""
+        result = algo(self.negative_graph(cycle=False), 0, 4)
+        assert result.success
+        assert result.path == [0, 2, 1, 3, 4]
+        assert result.cost == pytest.approx(2.0)
+    
+    @pytest.mark.parametrize("algo", [bellman_ford, spfa])
+    def test_negative_cycle(self, algo):
+        """Cycle négatif accessible : ValueError."""
+        with pytest.raises(ValueError):
+            algo(self.negative_graph(cycle=True), 0, 4)
+    
+    @pytest.mark.parametrize("algo", [bellman_ford, spfa])
+    def test_same_cost_as_dijkstra(self, algo):
+        """Poids positifs : mêmes coûts que Dijkstra, échecs compris."""
+        g = generate_random_urban_graph(num_vertices=150, avg_degree=3, width=2000,
+                                        height=2000, min_distance=20)
+        g.add_vertex(1000, 0.0, 0.0)
+        for target in list(range(0, 150, 7)) + [1000]:
+            expected = dijkstra(g, 0, target)
+            result = algo(g.freeze(), 0, target)
+            assert result.success == expected.success
+            assert result.cost == pytest.approx(expected.cost)
+    
+    def test_early_termination(self):
+        """Arrêt dès qu'une passe ne change rien, bien avant n - 1 passes."""
+        g = generate_grid_graph(10, 10)
+        result = bellman_ford(g, 0, 99)
+        assert result.cost == 18.0
+        num_arcs = len(g.freeze().targets)
+        assert result.relaxed_edges % num_arcs == 0
+        assert result.relaxed_edges // num_arcs < (g.num_vertices() - 1) // 3
+
+
 class TestAstar:
     """Tests pour l'algorithme A*."""
     
@@ -162,6 +335,210 @@ class TestAstar:
         assert result.cost == 0.0
 
 
+class TestBidirectionalDijkstra:
+    """Tests pour le Dijkstra bidirectionnel."""
+    
+    def test_same_cost_as_dijkstra(self):
+        """Même coût que Dijkstra, et chemin valide, sur un graphe aléatoire."""
+        import random
+        random.seed(7)
+        g = generate_random_urban_graph(num_vertices=80, avg_degree=4)
+        vertices = list(g.vertices.keys())
+        for _ in range(30):
+            source, target = random.choice(vertices), random.choice(vertices)
+            expected = dijkstra(g, source, target)
+            result = bidirectional_dijkstra(g, source, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+                assert result.path[0] == source and result.path[-1] == target
+                path_cost = sum(g.get_weight(u, v) for u, v in zip(result.path, result.path[1:]))
+                assert abs(path_cost - result.cost) < 1e-9
+    
+    def test_directed(self):
+        """Graphe orienté : la recherche arrière suit les arêtes à l'envers."""
+        g = Graph(directed=True)
+        for i in range(4):
+            g.add_vertex(i)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=1.0)
+        g.add_edge(2, 3, weight=1.0)
+        g.add_edge(3, 0, weight=1.0)
+        g.add_edge(0, 3, weight=5.0)
+        
+        result = bidirectional_dijkstra(g, 0, 3)
+        assert result.path == [0, 1, 2, 3]
+        assert result.cost == 3.0
+        
+        # 3 -> 1 n'existe que par 3 -> 0 -> 1
+        result = bidirectional_dijkstra(g, 3, 1)
+        assert result.path == [3, 0, 1]
+        assert result.cost == 2.0
+    
+    def test_no_path(self):
+        """Cible inaccessible (arête à sens unique)."""
+        g = Graph(directed=True)
+        g.add_vertex(0)
+        g.add_vertex(1)
+        g.add_edge(0, 1, weight=1.0)
+        
+        result = bidirectional_dijkstra(g, 1, 0)
+        assert not result.success
+        assert result.path == []
+    
+    def test_source_equals_target(self):
+        """Test quand source = cible."""
+        g = Graph()
+        g.add_vertex(0)
+        
+        result = bidirectional_dijkstra(g, 0, 0)
+        assert result.success
+        assert result.path == [0]
+        assert result.cost == 0.0
+    
+    def test_explores_fewer_vertices(self):
+        """Sur une grille, deux demi-disques au lieu d'un disque."""
+        g = generate_grid_graph(30, 30)
+        source, target = 15 * 30 + 5, 15 * 30 + 25
+        
+        expected = dijkstra(g, source, target)
+        result = bidirectional_dijkstra(g, source, target)
+        
+        assert abs(result.cost - expected.cost) < 1e-9
+        assert result.visited_nodes == len(result.explored_nodes)
+        assert result.visited_nodes < expected.visited_nodes
+    
+    def test_reverse_graph_follows_updates(self):
+        """Le graphe transposé est reconstruit après une modification."""
+        g = Graph(directed=True)
+        for i in range(3):
+            g.add_vertex(i)
+        g.add_edge(0, 2, weight=10.0)
+        assert bidirectional_dijkstra(g, 0, 2).cost == 10.0
+        
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=1.0)
+        assert bidirectional_dijkstra(g, 0, 2).cost == 2.0
+        
+        g.set_weight(1, 2, 20.0)
+        assert bidirectional_dijkstra(g, 0, 2).cost == 10.0
+
+    def test_undirected_asymmetric_weights(self):
+        """Non-orienté, un seul sens modifié : transposé réel, coûts exacts."""
+        import random
+        rng = random.Random(0)
+        g = generate_grid_graph(12, 12)
+        assert g.reverse_graph() is g
+        for u in list(g.vertices):
+            for v, w in g.get_neighbors(u):
+                if rng.random() < 0.3:
+                    g.get_edge(u, v).weight = 5 * w
+        assert g.reverse_graph() is not g
+        assert not g.freeze().is_symmetric()
+
+        for _ in range(40):
+            source, target = rng.randrange(144), rng.randrange(144)
+            expected = dijkstra(g, source, target).cost
+            assert abs(bidirectional_dijkstra(g, source, target).cost - expected) < 1e-9
+            assert abs(bidirectional_astar(g, source, target).cost - expected) < 1e-9
+            assert abs(bidirectional_dijkstra(g.freeze(), source, target).cost - expected) < 1e-9
+
+    def test_workspace_reuse(self):
+        """Réutiliser un espace de travail donne les mêmes résultats."""
+        g = generate_grid_graph(10, 10)
+        workspace = SearchWorkspace()
+        for source, target in [(0, 99), (45, 3), (99, 0), (12, 12)]:
+            expected = dijkstra(g, source, target)
+            result = bidirectional_dijkstra(g, source, target, workspace=workspace)
+            assert abs(result.cost - expected.cost) < 1e-9
+
+
+class TestBidirectionalAstar:
+    """Tests pour l'A* bidirectionnel (potentiels moyennés)."""
+    
+    def test_same_cost_as_dijkstra(self):
+        """Exact sur un graphe planaire aléatoire."""
+        import random
+        random.seed(11)
+        g = generate_random_urban_graph(num_vertices=80, avg_degree=4)
+        vertices = list(g.vertices.keys())
+        for _ in range(30):
+            source, target = random.choice(vertices), random.choice(vertices)
+            expected = dijkstra(g, source, target)
+            result = bidirectional_astar(g, source, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+                assert result.path[0] == source and result.path[-1] == target
+    
+    def test_directed_asymmetric(self):
+        """Graphe orienté, poids différents dans chaque sens."""
+        import random
+        rng = random.Random(5)
+        grid = generate_grid_graph(12, 12)
+        g = Graph(directed=True)
+        for v in grid.vertices.values():
+            g.add_vertex(v.id, v.x, v.y)
+        for edge in grid.get_all_edges():
+            if rng.random() < 0.8:
+                g.add_edge(edge.source, edge.target, weight=edge.weight * rng.uniform(1.0, 3.0))
+        for _ in range(30):
+            source, target = rng.randrange(144), rng.randrange(144)
+            expected = dijkstra(g, source, target)
+            result = bidirectional_astar(g, source, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+    
+    def test_geographic(self):
+        """Graphe géographique : heuristique Haversine en km."""
+        import numpy as np
+        rng = np.random.default_rng(3)
+        g = Graph(directed=False)
+        g.is_geographic = True
+        g.add_vertices_from(np.arange(150), 2.30 + rng.random(150) * 0.05,
+                            48.85 + rng.random(150) * 0.05)
+        sources, targets = rng.integers(0, 150, 500), rng.integers(0, 150, 500)
+        lengths = g.straight_line_distances(sources, targets, metric='haversine')
+        g.add_edges_from(sources, targets, lengths * rng.uniform(1.0, 1.3, 500))
+        for _ in range(30):
+            source, target = (int(v) for v in rng.integers(0, 150, 2))
+            expected = dijkstra(g, source, target)
+            result = bidirectional_astar(g, source, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+    
+    def test_explores_fewer_vertices(self):
+        """Moins de sommets explorés que le Dijkstra bidirectionnel."""
+        g = generate_grid_graph(30, 30)
+        source, target = 2 * 30 + 3, 27 * 30 + 26
+        
+        expected = bidirectional_dijkstra(g, source, target)
+        result = bidirectional_astar(g, source, target)
+        
+        assert abs(result.cost - expected.cost) < 1e-9
+        assert result.visited_nodes < expected.visited_nodes
+    
+    def test_csr(self):
+        """Même résultat sur le graphe figé."""
+        g = generate_grid_graph(10, 10)
+        expected = bidirectional_astar(g, 0, 99)
+        result = bidirectional_astar(g.freeze(), 0, 99)
+        assert result.path == expected.path
+        assert result.cost == expected.cost
+    
+    def test_no_path(self):
+        """Cible inaccessible."""
+        g = Graph(directed=True)
+        g.add_vertex(0, 0.0, 0.0)
+        g.add_vertex(1, 1.0, 0.0)
+        g.add_edge(0, 1, weight=1.0)
+        
+        assert not bidirectional_astar(g, 1, 0).success
+        assert bidirectional_astar(g, 0, 0).path == [0]
+
+
 class TestComparison:
     """Tests de comparaison entre algorithmes."""
     
@@ -212,6 +589,145 @@ class TestComparison:
         assert result_astar.visited_nodes <= result_dijkstra.visited_nodes
 
 
+class TestCSR:
+    """Tests des algorithmes sur un graphe figé (CSRGraph)."""
+    
+    def test_same_results_as_graph(self):
+        """Dijkstra, A* et Bellman-Ford donnent les mêmes coûts sur Graph et CSRGraph."""
+        g = generate_random_urban_graph(60, avg_degree=4)
+        csr = g.freeze()
+        
+        for source, target in [(0, 59), (5, 30), (12, 47)]:
+            expected = dijkstra(g, source, target)
+            for algo in (dijkstra, astar, bellman_ford):
+                result = algo(csr, source, target)
+                assert result.success
+                assert abs(result.cost - expected.cost) < 1e-6
+                assert result.path[0] == source and result.path[-1] == target
+    
+    def test_explored_nodes_are_ids(self):
+        """Les sommets explorés sont exprimés en IDs d'origine."""
+        g = Graph(directed=True)
+        g.add_vertex(10, 0.0, 0.0)
+        g.add_vertex(20, 1.0, 0.0)
+        g.add_vertex(30, 2.0, 0.0)
+        g.add_edge(10, 20, weight=1.0)
+        g.add_edge(20, 30, weight=1.0)
+        
+        result = dijkstra(g.freeze(), 10, 30)
+        
+        assert result.path == [10, 20, 30]
+        assert result.explored_nodes == {10, 20, 30}
+    
+    def test_no_path(self):
+        """Pas de chemin sur un graphe orienté."""
+        g = Graph(directed=True)
+        g.add_vertex(0)
+        g.add_vertex(1)
+        g.add_edge(1, 0, weight=1.0)
+        csr = g.freeze()
+        
+        assert not dijkstra(csr, 0, 1).success
+        assert not astar(csr, 0, 1).success
+
+
+class TestSearchWorkspace:
+    """Tests de l'espace de travail réutilisable."""
+    
+    def test_reuse_gives_same_results(self):
+        """Réutiliser un workspace ne change pas les résultats."""
+        g = generate_grid_graph(15, 15)
+        ws = SearchWorkspace()
+        
+        for source, target in [(0, 224), (224, 0), (7, 112), (100, 101)]:
+            expected = dijkstra(g, source, target)
+            for algo in (dijkstra, astar):
+                result = algo(g, source, target, workspace=ws)
+                assert result.success
+                assert abs(result.cost - expected.cost) < 1e-6
+                assert result.path[0] == source and result.path[-1] == target
+        
+        assert ws.generation == 8
+    
+    def test_unreachable_after_reuse(self):
+        """Une cible atteinte lors d'une requête précédente n'est pas réutilisée."""
+        g = Graph(directed=True)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(2, 1, weight=1.0)
+        ws = SearchWorkspace()
+        
+        assert dijkstra(g, 0, 1, workspace=ws).success
+        assert not dijkstra(g, 2, 0, workspace=ws).success
+        assert not astar(g, 2, 0, workspace=ws).success
+    
+    def test_grows_with_graph(self):
+        """Le workspace s'agrandit pour un graphe plus grand."""
+        ws = SearchWorkspace(4)
+        g = generate_grid_graph(5, 5)
+        
+        result = dijkstra(g.freeze(), 0, 24, workspace=ws)
+        
+        assert result.success
+        assert ws.capacity() >= 25
+
+
+
+class TestTraffic:
+    """Tests des mises à jour de poids (trafic)."""
+    
+    def test_congestion_changes_route(self):
+        """Une route congestionnée est évitée par tous les algorithmes."""
+        g = Graph(directed=False)
+        g.add_vertex(0, 0, 0)
+        g.add_vertex(1, 1, 0)
+        g.add_vertex(2, 2, 0)
+        g.add_vertex(3, 1, 1)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=1.0)
+        g.add_edge(0, 3, weight=1.5)
+        g.add_edge(3, 2, weight=1.5)
+        ws = SearchWorkspace()
+        
+        assert dijkstra(g, 0, 2, workspace=ws).path == [0, 1, 2]
+        
+        g.get_edge(0, 1).weight *= 5
+        for result in (dijkstra(g, 0, 2, workspace=ws), astar(g, 0, 2), bellman_ford(g, 0, 2)):
+            assert result.path == [0, 3, 2]
+            assert abs(result.cost - 3.0) < 1e-9
+    
+    def test_add_traffic_congestion(self):
+        """add_traffic_congestion modifie les coûts vus par Dijkstra."""
+        import random
+        from src.generators import add_traffic_congestion
+        
+        g = generate_grid_graph(10, 10)
+        before = dijkstra(g, 0, 99).cost
+        version = g.version
+        
+        random.seed(1)
+        add_traffic_congestion(g, congestion_factor=3.0, affected_ratio=1.0)
+        
+        assert g.version > version
+        assert abs(dijkstra(g, 0, 99).cost - 3 * before) < 1e-6
+        assert abs(astar(g, 0, 99).cost - 3 * before) < 1e-6
+
+    def test_add_traffic_congestion_symmetric(self):
+        """Non-orienté : les deux sens d'une route restent au même poids."""
+        import random
+        from src.generators import add_traffic_congestion
+
+        random.seed(0)
+        g = generate_grid_graph(10, 10)
+        add_traffic_congestion(g, congestion_factor=5.0, affected_ratio=0.3)
+
+        for u in g.vertices:
+            for v, w in g.get_neighbors(u):
+                assert g.get_edge(v, u).weight == w
+        for s, t in [(98, 69), (0, 99), (45, 3), (12, 87)]:
+            expected = dijkstra(g, s, t).cost
+            assert abs(bidirectional_dijkstra(g, s, t).cost - expected) < 1e-9
+            assert abs(bellman_ford(g, s, t).cost - expected) < 1e-9
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
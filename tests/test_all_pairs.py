@@ -0,0 +1,104 @@
+"""
+Tests unitaires pour le module all_pairs.py (tables toutes paires)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, bellman_ford
+from src.all_pairs import AllPairsTable
+from src.generators import generate_grid_graph
+from tests.helpers import random_graph, path_cost
+
+
+def check_table(graph, table, reference=dijkstra):
+    """Compare chaque paire de la table à une recherche de référence."""
+    for s in graph.vertices:
+        for t in graph.vertices:
+            expected = reference(graph, s, t)
+            assert table.distance(s, t) == pytest.approx(expected.cost)
+            path = table.path(s, t)
+            assert bool(path) == expected.success
+            if path:
+                assert path[0] == s and path[-1] == t
+                assert path_cost(graph, path) == pytest.approx(expected.cost)
+
+
+class TestAllPairsTable:
+    """Tests de construction et de requêtes."""
+
+    @pytest.mark.parametrize("method, block_size", [
+        ("floyd_warshall", 64), ("floyd_warshall", 7), ("dijkstra", 64)])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, method, block_size):
+        """Distances et chemins identiques à Dijkstra (arcs de poids nul inclus)."""
+        g = random_graph(30, 80, directed, seed=3, offset=5)
+        table = AllPairsTable.build(g, method=method, block_size=block_size)
+        assert table.method == method
+        check_table(g, table)
+
+    def test_negative_weights(self):
+        """Poids négatifs : Floyd–Warshall, comparé à Bellman-Ford."""
+        g = random_graph(15, 30, True, seed=0, negative=True)
+        table = AllPairsTable.build(g)
+        assert table.method == "floyd_warshall"
+        check_table(g, table, reference=bellman_ford)
+        with pytest.raises(ValueError):
+            AllPairsTable.build(g, method="dijkstra")
+
+    def test_negative_cycle(self):
+        """Un cycle de poids négatif est signalé."""
+        g = Graph(directed=True)
+        for v in range(4):
+            g.add_vertex(v, 0.0, 0.0)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=-2.0)
+        g.add_edge(2, 1, weight=1.0)
+        g.add_edge(2, 3, weight=1.0)
+        with pytest.raises(ValueError):
+            AllPairsTable.build(g)
+
+    def test_auto(self):
+        """Le choix automatique suit le coût estimé."""
+        grid = generate_grid_graph(10, 10)
+        assert AllPairsTable.build(grid).method == "dijkstra"
+        dense = random_graph(40, 1600, True, seed=1)
+        assert AllPairsTable.build(dense).method == "floyd_warshall"
+        fw, dij = AllPairsTable.estimate_costs(1000, 4000)
+        assert dij < fw
+
+    def test_query_and_errors(self):
+        """query retourne un PathResult ; sommets inconnus et méthode inconnue."""
+        g = generate_grid_graph(5, 5)
+        table = AllPairsTable.build(g)
+        result = table.query(0, 24)
+        expected = dijkstra(g, 0, 24)
+        assert result.success
+        assert result.cost == pytest.approx(expected.cost)
+        assert len(result.path) == len(expected.path)
+        assert table.path(3, 3) == [3]
+        with pytest.raises(ValueError):
+            table.query(0, 99)
+        with pytest.raises(KeyError):
+            table.distance(99, 0)
+        with pytest.raises(ValueError):
+            AllPairsTable.build(g, method="johnson")
+
+    def test_save_load(self, tmp_path):
+        """Sauvegarde puis rechargement : mêmes réponses, sauts sur 16 bits."""
+        g = random_graph(25, 60, True, seed=2, offset=100)
+        table = AllPairsTable.build(g, method="floyd_warshall")
+        filename = str(tmp_path / "district.apsp")
+        table.save(filename)
+        loaded = AllPairsTable.load(filename)
+        assert loaded.method == "floyd_warshall"
+        assert loaded.next_hop.dtype == np.int16
+        np.testing.assert_array_equal(loaded.distances, table.distances)
+        for s in (100, 110, 124):
+            for t in (101, 117, 124):
+                assert loaded.path(s, t) == table.path(s, t)
+        assert "Table toutes paires" in loaded.summary()
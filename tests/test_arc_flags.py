@@ -0,0 +1,111 @@
+"""
+Tests unitaires pour le module arc_flags.py (élagage par régions)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pickle
+import random
+import pytest
+from src.algorithms import dijkstra, astar
+from src.arc_flags import ArcFlags
+from src.generators import generate_grid_graph, generate_clustered_urban_graph
+from tests.helpers import random_graph
+
+
+class TestArcFlags:
+    """Tests de prétraitement et de requêtes élaguées."""
+
+    @pytest.mark.parametrize("num_regions", [1, 5, 16])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, num_regions):
+        """Mêmes coûts que Dijkstra sans élagage (échecs compris)."""
+        g = random_graph(60, 170, directed, seed=8, offset=100)
+        flags = ArcFlags.build(g, num_regions=num_regions)
+        csr = g.freeze()
+        for source in range(100, 160, 4):
+            for target in range(100, 160):
+                expected = dijkstra(g, source, target)
+                for result in (dijkstra(g, source, target, arc_flags=flags),
+                               dijkstra(csr, source, target, arc_flags=flags),
+                               astar(g, source, target, heuristic=lambda u, v, graph: 0.0,
+                                     arc_flags=flags)):
+                    assert result.success == expected.success
+                    if expected.success:
+                        assert result.cost == pytest.approx(expected.cost, abs=1e-9)
+                        assert result.path[0] == source and result.path[-1] == target
+
+    def test_undirected_asymmetric_weights(self):
+        """Non-orienté, un seul sens modifié : bits calculés sur le vrai transposé."""
+        rng = random.Random(4)
+        g = generate_grid_graph(12, 12)
+        for u in list(g.vertices):
+            for v, w in g.get_neighbors(u):
+                if rng.random() < 0.3:
+                    g.get_edge(u, v).weight = 5 * w
+        flags = ArcFlags.build(g, num_regions=8)
+        for _ in range(60):
+            source, target = rng.randrange(144), rng.randrange(144)
+            expected = dijkstra(g, source, target)
+            result = dijkstra(g, source, target, arc_flags=flags)
+            assert result.cost == pytest.approx(expected.cost, abs=1e-9)
+
+    def test_cluster_regions(self):
+        """Régions = quartiers du générateur ; moins de sommets explorés."""
+        random.seed(3)
+        g = generate_clustered_urban_graph(num_clusters=6, vertices_per_cluster=40)
+        regions = {v: vertex.label.split('_')[0] for v, vertex in g.vertices.items()}
+        flags = ArcFlags.build(g, regions=regions)
+        assert flags.num_regions == 6
+
+        rng = random.Random(0)
+        visited = pruned = 0
+        for _ in range(30):
+            source, target = rng.randrange(240), rng.randrange(240)
+            expected = dijkstra(g, source, target)
+            result = dijkstra(g, source, target, arc_flags=flags)
+            assert result.cost == pytest.approx(expected.cost)
+            visited += expected.visited_nodes
+            pruned += result.visited_nodes
+        assert pruned < visited / 2
+
+    def test_missing_region(self):
+        """Un sommet sans région est refusé."""
+        g = generate_grid_graph(3, 3)
+        with pytest.raises(ValueError):
+            ArcFlags.build(g, regions={v: 0 for v in range(8)})
+
+    def test_stale_flags(self):
+        """Bits refusés après modification des poids ou sur un autre graphe."""
+        g = generate_grid_graph(5, 5)
+        flags = ArcFlags.build(g, num_regions=4)
+        with pytest.raises(ValueError):
+            dijkstra(generate_grid_graph(4, 4), 0, 15, arc_flags=flags)
+        with pytest.raises(ValueError):
+            dijkstra(g, 0, None, arc_flags=flags)
+        g.set_weight(0, 1, 50.0)
+        with pytest.raises(ValueError):
+            dijkstra(g, 0, 24, arc_flags=flags)
+
+    def test_region_masks_cached(self):
+        """Un masque par région, calculé une fois et non sérialisé."""
+        g = generate_grid_graph(6, 6)
+        flags = ArcFlags.build(g, num_regions=4)
+        mask = flags.region_mask(2)
+        assert flags.region_mask(2) is mask
+        assert bytes(mask) == flags.region_flags(2).tobytes()
+        dijkstra(g, 0, 35, arc_flags=flags)
+        assert len(flags._masks) == 2
+        copy = pickle.loads(pickle.dumps(flags))
+        assert copy._masks == {}
+        assert dijkstra(g, 0, 35, arc_flags=copy).cost == dijkstra(g, 0, 35).cost
+
+    def test_summary(self):
+        """Rapport mémoire et élagage."""
+        flags = ArcFlags.build(generate_grid_graph(6, 6), num_regions=9)
+        report = flags.summary()
+        assert f"Nombre de régions     : {flags.num_regions}" in report
+        assert flags.num_regions >= 9
+        assert flags.nbytes() > 0
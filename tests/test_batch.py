@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour le module batch.py (itinéraires par lots)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import pytest
+from src.algorithms import dijkstra
+from src.batch import route_many
+from src.storage import save_graph_binary
+from src.generators import generate_grid_graph
+from tests.helpers import random_graph
+
+
+def random_pairs(graph, count, seed):
+    """Requêtes (source, cible) aléatoires."""
+    rng = random.Random(seed)
+    vertices = list(graph.vertices.keys())
+    return [(rng.choice(vertices), rng.choice(vertices)) for _ in range(count)]
+
+
+def check_results(graph, pairs, results):
+    """Chaque requête a un résultat, de même coût que Dijkstra."""
+    assert sorted(i for i, _ in results) == list(range(len(pairs)))
+    for i, result in results:
+        expected = dijkstra(graph, *pairs[i])
+        assert result.success == expected.success
+        assert result.cost == pytest.approx(expected.cost)
+        if result.success:
+            assert (result.path[0], result.path[-1]) == pairs[i]
+
+
+class TestRouteMany:
+    """Tests des lots séquentiels et du pool de processus."""
+
+    @pytest.mark.parametrize("algorithm", ["dijkstra", "astar", "bidirectional_dijkstra"])
+    def test_serial(self, algorithm):
+        """Mêmes coûts qu'une boucle sur dijkstra, dans l'ordre des requêtes."""
+        g = generate_grid_graph(8, 8)
+        pairs = random_pairs(g, 40, seed=1)
+        results = list(route_many(g, pairs, algorithm=algorithm, chunk_size=7))
+        assert [i for i, _ in results] == list(range(len(pairs)))
+        check_results(g, pairs, results)
+        assert all(not result.explored_nodes for _, result in results)
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_process_pool(self, ordered):
+        """Paquets calculés par un pool de processus (graphe orienté, IDs décalés)."""
+        g = random_graph(40, 120, True, seed=2, offset=10)
+        pairs = random_pairs(g, 60, seed=3)
+        results = list(route_many(g, pairs, workers=2, chunk_size=8, ordered=ordered,
+                                  keep_explored=True))
+        if ordered:
+            assert [i for i, _ in results] == list(range(len(pairs)))
+        check_results(g, pairs, results)
+        assert any(result.explored_nodes for _, result in results)
+
+    def test_spawn_with_landmarks(self):
+        """Mode spawn (Windows, macOS) : index ALT et arc-flags copiés par pickle."""
+        import multiprocessing
+        from src.landmarks import LandmarkIndex
+        from src.arc_flags import ArcFlags
+        g = generate_grid_graph(8, 8)
+        pairs = random_pairs(g, 24, seed=5)
+        context = multiprocessing.get_context("spawn")
+        landmarks = LandmarkIndex.build(g, num_landmarks=4, seed=0)
+        check_results(g, pairs, list(route_many(g, pairs, algorithm="astar", workers=2,
+                                                chunk_size=6, mp_context=context,
+                                                heuristic=landmarks)))
+        flags = ArcFlags.build(g, num_regions=4)
+        check_results(g, pairs, list(route_many(g, pairs, workers=2, chunk_size=6,
+                                                mp_context=context, arc_flags=flags)))
+
+    def test_binary_file(self, tmp_path):
+        """Un graphe binaire déjà sauvegardé est partagé sans réécriture."""
+        g = generate_grid_graph(6, 6)
+        filename = str(tmp_path / "ville.sgpg")
+        save_graph_binary(g, filename)
+        pairs = random_pairs(g, 20, seed=4)
+        check_results(g, pairs, list(route_many(filename, pairs, workers=2, chunk_size=5,
+                                                queue="dial")))
+        check_results(g, pairs, list(route_many(filename, pairs)))
+
+    def test_errors(self):
+        """Algorithme inconnu, sommet inexistant, paquets vides."""
+        g = generate_grid_graph(3, 3)
+        with pytest.raises(ValueError):
+            route_many(g, [(0, 1)], algorithm="floyd")
+        with pytest.raises(ValueError):
+            route_many(g, [(0, 99)])
+        with pytest.raises(ValueError):
+            route_many(g, [(0, 1)], chunk_size=0)
+        assert list(route_many(g, [], workers=4)) == []
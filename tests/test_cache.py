@@ -0,0 +1,64 @@
+"""
+Tests unitaires pour le module cache.py (cache d'arbres des plus courts chemins)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from src.algorithms import dijkstra
+from src.cache import ShortestPathTreeCache
+from src.generators import generate_grid_graph
+
+
+class TestShortestPathTreeCache:
+    """Tests du cache LRU d'arbres."""
+
+    def test_same_results_as_dijkstra(self):
+        """Un arbre par source, réutilisé pour chaque nouvelle cible."""
+        g = generate_grid_graph(8, 8)
+        cache = ShortestPathTreeCache()
+        for target in range(64):
+            result = cache.route(g, 0, target)
+            expected = dijkstra(g, 0, target)
+            assert result.success
+            assert result.cost == pytest.approx(expected.cost)
+            assert result.path[0] == 0 and result.path[-1] == target
+        assert cache.misses == 1 and cache.hits == 63
+        assert cache.tree(g, 0) is cache.tree(g, 0)
+        assert cache.tree(g.freeze(), 0) is not cache.tree(g, 0)
+
+    def test_invalidated_by_weight_change(self):
+        """Modifier un poids rend les anciens arbres invisibles puis les retire."""
+        g = generate_grid_graph(4, 4)
+        cache = ShortestPathTreeCache()
+        assert cache.route(g, 0, 1).cost == 1.0
+        g.set_weight(0, 1, 10.0)
+        assert cache.route(g, 0, 1).cost == 2.0 + 1.0
+        assert len(cache) == 1 and cache.misses == 2
+
+    def test_memory_bound(self):
+        """Éviction du moins récemment utilisé au-delà de max_bytes."""
+        g = generate_grid_graph(10, 10)
+        size = dijkstra(g, 0).nbytes()
+        cache = ShortestPathTreeCache(max_bytes=int(size * 2.5))
+        for source in (0, 1, 2):
+            cache.tree(g, source)
+        cache.tree(g, 1)                  # 1 devient le plus récent
+        cache.tree(g, 3)                  # évince 2
+        assert len(cache) == 2 and cache.nbytes() <= cache.max_bytes
+        hits = cache.hits
+        cache.tree(g, 1)
+        assert cache.hits == hits + 1
+        cache.invalidate(g)
+        assert len(cache) == 0 and cache.nbytes() == 0
+
+    def test_unknown_vertex(self):
+        """Sommets inexistants refusés comme par dijkstra."""
+        cache = ShortestPathTreeCache()
+        g = generate_grid_graph(3, 3)
+        with pytest.raises(ValueError):
+            cache.route(g, 0, 42)
+        with pytest.raises(ValueError):
+            cache.route(g, 42, 0)
@@ -0,0 +1,102 @@
+"""
+Tests unitaires pour le module contraction.py (hiérarchies de contraction)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra
+from src.contraction import ContractionHierarchy
+from src.generators import generate_grid_graph, add_traffic_congestion
+from tests.helpers import random_graph, path_cost
+
+
+class TestContractionHierarchy:
+    """Tests du prétraitement et des requêtes."""
+
+    @pytest.mark.parametrize("witness_limit", [1, 200])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, witness_limit):
+        """Les coûts sont ceux de Dijkstra et les chemins dépliés sont valides."""
+        g = random_graph(60, 180, directed, seed=11)
+        ch = ContractionHierarchy.build(g, witness_limit=witness_limit)
+        for source in range(0, 60, 5):
+            for target in range(60):
+                expected = dijkstra(g, source, target)
+                result = ch.query(source, target)
+                assert result.success == expected.success
+                if expected.success:
+                    assert abs(result.cost - expected.cost) < 1e-9
+                    assert result.path[0] == source and result.path[-1] == target
+                    assert abs(path_cost(g, result.path) - result.cost) < 1e-9
+                    assert abs(ch.distance(source, target) - expected.cost) < 1e-9
+
+    def test_grid_with_traffic(self):
+        """Grille congestionnée : moins de sommets visités que Dijkstra."""
+        random.seed(3)
+        g = generate_grid_graph(15, 15)
+        add_traffic_congestion(g, congestion_factor=3.0, affected_ratio=0.4)
+        ch = ContractionHierarchy.build(g)
+        assert ch.num_shortcuts > 0
+        expected = dijkstra(g, 0, 224)
+        result = ch.query(0, 224)
+        assert abs(result.cost - expected.cost) < 1e-9
+        assert abs(path_cost(g, result.path) - expected.cost) < 1e-9
+        assert result.visited_nodes < expected.visited_nodes
+
+    def test_arbitrary_ids(self):
+        """Les IDs du graphe d'origine sont conservés."""
+        g = random_graph(30, 90, True, seed=4, offset=1000)
+        ch = ContractionHierarchy.build(g)
+        assert ch.has_vertex(1005) and not ch.has_vertex(5)
+        for target in range(1000, 1030):
+            expected = dijkstra(g, 1003, target)
+            result = ch.query(1003, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+                assert all(1000 <= v < 1030 for v in result.path)
+
+    def test_unreachable_and_same_vertex(self):
+        """Cible inaccessible, source égale à la cible, sommet inconnu."""
+        g = Graph(directed=True)
+        for i in range(3):
+            g.add_vertex(i)
+        g.add_edge(0, 1, weight=2.0)
+        ch = ContractionHierarchy.build(g)
+
+        assert ch.query(1, 0).success is False
+        assert ch.distance(1, 0) == float('inf')
+        result = ch.query(2, 2)
+        assert result.success and result.path == [2] and result.cost == 0.0
+        with pytest.raises(ValueError):
+            ch.query(0, 99)
+        with pytest.raises(ValueError):
+            ch.distance(99, 0)
+        with pytest.raises(ValueError):
+            ch.distance(99, 99)
+
+
+class TestContractionStorage:
+    """Tests de sauvegarde et rechargement."""
+
+    def test_round_trip(self, tmp_path):
+        """La hiérarchie rechargée répond comme l'originale."""
+        g = random_graph(40, 120, True, seed=8)
+        ch = ContractionHierarchy.build(g)
+        path = str(tmp_path / "graph.ch")
+        ch.save(path)
+        assert os.path.exists(path)
+
+        loaded = ContractionHierarchy.load(path)
+        assert loaded.directed is True
+        assert loaded.num_shortcuts == ch.num_shortcuts
+        assert (loaded.rank == ch.rank).all()
+        for target in range(40):
+            a, b = ch.query(0, target), loaded.query(0, target)
+            assert a.success == b.success
+            assert a.path == b.path
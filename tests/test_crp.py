@@ -0,0 +1,90 @@
+"""
+Tests unitaires pour le module crp.py (partition personnalisable)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import numpy as np
+import pytest
+from src.algorithms import dijkstra
+from src.crp import CRPOverlay
+from src.generators import generate_grid_graph, add_traffic_congestion
+from tests.helpers import random_graph, path_cost
+
+
+def assert_matches_dijkstra(graph, metric, sources):
+    """Coûts identiques à Dijkstra et chemins dépliés valides."""
+    for source in sources:
+        for target in graph.vertices:
+            expected = dijkstra(graph, source, target)
+            result = metric.query(source, target)
+            assert result.success == expected.success
+            if expected.success:
+                assert abs(result.cost - expected.cost) < 1e-9
+                assert result.path[0] == source and result.path[-1] == target
+                assert abs(path_cost(graph, result.path) - result.cost) < 1e-9
+
+
+class TestCRPOverlay:
+    """Tests de la partition, de la personnalisation et des requêtes."""
+
+    @pytest.mark.parametrize("cell_sizes", [(4, 16, 40), (8,), (3, 9, 27)])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, cell_sizes):
+        """Les requêtes donnent les coûts de Dijkstra, sur plusieurs niveaux."""
+        g = random_graph(60, 180, directed, seed=13)
+        overlay = CRPOverlay.build(g, cell_sizes)
+        assert overlay.num_levels() == len(cell_sizes)
+        assert_matches_dijkstra(g, overlay.customize(g), range(0, 60, 6))
+
+    def test_partition_is_nested(self):
+        """Chaque cellule est contenue dans une cellule du niveau supérieur."""
+        overlay = CRPOverlay.build(generate_grid_graph(20, 20), (10, 50, 200))
+        for k in range(overlay.num_levels() - 1):
+            for c in range(overlay.num_cells[k]):
+                parents = np.unique(overlay.cells[k + 1][overlay.cells[k] == c])
+                assert len(parents) == 1
+            assert np.bincount(overlay.cells[k]).max() <= overlay.cell_sizes[k]
+
+    def test_recustomize_after_traffic(self):
+        """La même topologie sert après un changement de poids."""
+        random.seed(5)
+        g = generate_grid_graph(12, 12)
+        overlay = CRPOverlay.build(g, (16, 64))
+        before = overlay.customize(g)
+        add_traffic_congestion(g, congestion_factor=4.0, affected_ratio=0.5)
+        after = overlay.customize(g)
+        assert_matches_dijkstra(g, after, [0, 77, 143])
+        assert before.distance(0, 143) <= after.distance(0, 143)
+
+    def test_weight_vector(self):
+        """Personnalisation à partir d'un tableau de poids dans l'ordre CSR."""
+        g = generate_grid_graph(8, 8)
+        overlay = CRPOverlay.build(g, (8, 32))
+        weights = g.freeze().weights * 2.0
+        metric = overlay.customize(weights)
+        assert abs(metric.distance(0, 63) - 2.0 * dijkstra(g, 0, 63).cost) < 1e-9
+        with pytest.raises(ValueError):
+            overlay.customize(weights[:-1])
+        with pytest.raises(ValueError):
+            overlay.customize(generate_grid_graph(8, 9))
+
+    def test_arbitrary_ids_and_edge_cases(self):
+        """IDs quelconques, cible inaccessible, source égale à la cible."""
+        g = random_graph(30, 40, True, seed=2, offset=500)
+        metric = CRPOverlay.build(g, (5, 15)).customize(g)
+        assert_matches_dijkstra(g, metric, [500, 517])
+        result = metric.query(510, 510)
+        assert result.success and result.path == [510] and result.cost == 0.0
+        with pytest.raises(ValueError):
+            metric.query(500, 3)
+        with pytest.raises(ValueError):
+            metric.distance(3, 500)
+
+    def test_invalid_cell_sizes(self):
+        """Tailles de cellules non croissantes."""
+        with pytest.raises(ValueError):
+            CRPOverlay.build(generate_grid_graph(3, 3), (16, 8))
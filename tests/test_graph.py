@@ -7,7 +7,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import pytest
+import numpy as np
 from src.graph import Graph, Vertex, Edge
+from src.compact import CompactGraph
 
 
 class TestVertex:
@@ -115,6 +117,91 @@ class TestGraph:
         assert (1, 5.0) in neighbors
         assert (2, 10.0) in neighbors
     
+    def test_iter_neighbors(self):
+        """Test de l'itération des voisins sans liste intermédiaire."""
+        g = Graph(directed=False)
+        g.add_edge(10, 20, weight=1.5)
+        g.add_edge(10, 30, weight=2.5)
+        
+        assert sorted(g.iter_neighbors(10)) == [(20, 1.5), (30, 2.5)]
+        assert list(g.iter_neighbors(20)) == [(10, 1.5)]
+        assert list(g.iter_neighbors(99)) == []
+        assert g.get_neighbors(10) == list(g.iter_neighbors(10))
+    
+    def test_edge_index(self):
+        """Test de l'index des arêtes (O(1)) et de sa synchronisation avec add_edge."""
+        g = Graph(directed=False, edge_index=True)
+        g.add_edge(0, 1, weight=2.0)
+        g.add_edge(1, 2, weight=3.0)
+        
+        assert g.has_edge_index()
+        assert g.has_edge(1, 0)
+        assert g.get_weight(2, 1) == 3.0
+        assert not g.has_edge(0, 2)
+        
+        # Index activé après coup
+        g2 = Graph(directed=True)
+        g2.add_edge(5, 6, weight=1.0)
+        g2.enable_edge_index()
+        g2.add_edge(6, 7, weight=1.0)
+        assert g2.has_edge(5, 6) and g2.has_edge(6, 7)
+        assert not g2.has_edge(7, 6)
+    
+    def test_parallel_edges_keep_all(self):
+        """Les arêtes parallèles sont toutes conservées par défaut."""
+        g = Graph(directed=True, edge_index=True)
+        g.add_edge(0, 1, weight=5.0)
+        g.add_edge(0, 1, weight=2.0)
+        
+        assert g.num_edges_count() == 2
+        assert g.get_weight(0, 1) == 5.0  # Première arête
+        assert sorted(e.weight for e in g.get_edges(0, 1)) == [2.0, 5.0]
+    
+    def test_parallel_edges_keep_min(self):
+        """Avec 'keep_min', seule l'arête la moins chère est gardée."""
+        for indexed in (True, False):
+            g = Graph(directed=False, edge_index=indexed, parallel_edges="keep_min")
+            g.add_edge(0, 1, weight=5.0)
+            g.add_edge(1, 0, weight=2.0)
+            g.add_edge(0, 1, weight=9.0)
+            
+            assert g.num_edges_count() == 1
+            assert g.get_weight(0, 1) == 2.0
+            assert g.get_weight(1, 0) == 2.0
+            assert g.get_neighbors(0) == [(1, 2.0)]
+        
+        with pytest.raises(ValueError):
+            Graph(parallel_edges="unknown")
+    
+    def test_set_weight(self):
+        """Les poids modifiés sont vus partout et incrémentent la version."""
+        g = Graph(directed=False)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=1.0)
+        version = g.version
+        
+        g.set_weight(0, 1, 4.0)
+        assert g.get_weight(1, 0) == 4.0
+        assert g.get_neighbors(0) == [(1, 4.0)]
+        assert g.version > version
+        
+        # Écrire edge.weight modifie le stockage lu par les algorithmes
+        g.get_edge(1, 2).weight = 3.0
+        assert g.get_neighbors(1) == [(0, 4.0), (2, 3.0)]
+        assert g.get_weight(2, 1) == 1.0  # seul l'arc 1 -> 2 est modifié
+        
+        assert g.scale_weights([(0, 1)], 0.5) == 1
+        assert g.get_weight(0, 1) == 2.0 and g.get_weight(1, 0) == 2.0
+        
+        with pytest.raises(ValueError):
+            g.set_weights([(1, 2, 7.0), (0, 2, 1.0)])
+        assert g.get_weight(1, 2) == 3.0  # rien n'a été écrit
+        
+        # Arête isolée : poids propre
+        e = Edge(0, 1, 2.0)
+        e.weight = 5.0
+        assert e.weight == 5.0
+    
     def test_degree(self):
         """Test de calcul du degré."""
         g = Graph(directed=False)
@@ -149,6 +236,194 @@ class TestGraph:
         assert not g2.is_connected()
 
 
+class TestCSRGraph:
+    """Tests pour la représentation figée (CSR)."""
+    
+    def test_freeze_structure(self):
+        """Test que freeze() conserve sommets, arêtes et poids."""
+        g = Graph(directed=False)
+        g.add_vertex(0, 0.0, 0.0)
+        g.add_vertex(1, 3.0, 4.0)
+        g.add_vertex(2, 6.0, 8.0)
+        g.add_edge(0, 1, weight=5.0)
+        g.add_edge(1, 2, weight=7.0)
+        
+        csr = g.freeze()
+        
+        assert csr.num_vertices() == 3
+        assert csr.num_edges_count() == 2
+        assert csr.num_arcs() == 4
+        assert sorted(csr.get_neighbors(1)) == [(0, 5.0), (2, 7.0)]
+        assert csr.degree(1) == 2
+    
+    def test_freeze_arbitrary_ids(self):
+        """Test avec des IDs non contigus."""
+        g = Graph(directed=True)
+        g.add_edge(100, 7, weight=2.0)
+        g.add_edge(7, 42, weight=3.0)
+        
+        csr = g.freeze()
+        
+        assert csr.has_vertex(42)
+        assert not csr.has_vertex(1)
+        assert csr.get_neighbors(100) == [(7, 2.0)]
+        assert csr.id_of(csr.index_of(42)) == 42
+
+    def test_freeze_cached_per_version(self):
+        """freeze() et reverse_graph() sont conservés jusqu'à la modification suivante."""
+        g = Graph(directed=True)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(1, 2, weight=2.0)
+
+        csr, rev = g.freeze(), g.reverse_graph()
+        assert g.freeze() is csr
+        assert g.reverse_graph() is rev
+
+        g.set_weight(0, 1, 4.0)
+        assert g.freeze() is not csr
+        assert g.reverse_graph() is not rev
+        assert csr.get_neighbors(0) == [(1, 1.0)]
+        assert g.freeze().get_neighbors(0) == [(1, 4.0)]
+
+    def test_reverse(self):
+        """Test du graphe transposé."""
+        g = Graph(directed=True)
+        g.add_edge(0, 1, weight=1.0)
+        g.add_edge(0, 2, weight=2.0)
+        g.add_edge(2, 1, weight=3.0)
+        
+        rev = g.freeze().reverse()
+        
+        assert sorted(rev.get_neighbors(1)) == [(0, 1.0), (2, 3.0)]
+        assert rev.get_neighbors(0) == []
+
+
+class TestCompactGraph:
+    """Tests pour le stockage en colonnes (CompactGraph)."""
+    
+    def _build(self, cls):
+        g = cls(directed=False)
+        g.add_vertex(0, 0.0, 0.0, "A")
+        g.add_vertex(1, 3.0, 4.0)
+        g.add_vertex(2, 6.0, 8.0)
+        g.add_edge(0, 1)
+        g.add_edge(1, 2, weight=7.0, road_type="highway", speed_limit=90.0)
+        return g
+    
+    def test_same_api_as_graph(self):
+        """CompactGraph se comporte comme Graph."""
+        g = self._build(Graph)
+        c = self._build(CompactGraph)
+        
+        assert c.num_vertices() == g.num_vertices()
+        assert c.num_edges_count() == g.num_edges_count()
+        assert c.get_neighbors(1) == g.get_neighbors(1)
+        assert abs(c.get_weight(0, 1) - 5.0) < 1e-9
+        assert c.is_connected()
+        assert len(c.get_all_edges()) == len(g.get_all_edges())
+    
+    def test_views(self):
+        """Les vues lisent et écrivent dans les colonnes."""
+        c = self._build(CompactGraph)
+        
+        v = c.vertices[0]
+        assert isinstance(v, Vertex)
+        assert v.label == "A" and c.vertices[1].label == "V1"
+        v.x = 10.0
+        assert c.vertices[0].x == 10.0
+        
+        e = c.get_edge(2, 1)
+        assert isinstance(e, Edge)
+        assert (e.source, e.target) == (2, 1)
+        assert e.road_type == "highway" and e.speed_limit == 90.0
+        assert c.get_edge(0, 1).road_type == "main"
+        e.weight = 1.0
+        assert c.get_weight(2, 1) == 1.0
+    
+    def test_speed_limit_precision(self):
+        """Vitesses stockées en double précision, comme Graph et le format .sgpg."""
+        c = CompactGraph()
+        c.add_vertex(0)
+        c.add_vertex(1)
+        c.add_edge(0, 1, speed_limit=33.3)
+        assert c.get_edge(0, 1).speed_limit == 33.3
+        c.get_edge(0, 1).speed_limit = 0.1
+        assert c.get_edge(0, 1).speed_limit == 0.1
+
+    def test_from_graph(self):
+        """Conversion d'un Graph existant."""
+        g = self._build(Graph)
+        c = CompactGraph.from_graph(g)
+        
+        assert c.get_neighbors(1) == g.get_neighbors(1)
+        assert c.vertices[0].label == "A"
+        assert c.get_edge(1, 2).road_type == "highway"
+    
+    def test_slots(self):
+        """Vertex et Edge n'ont pas de __dict__."""
+        assert not hasattr(Vertex(0), '__dict__')
+        assert not hasattr(Edge(0, 1, 1.0), '__dict__')
+
+
+
+class TestBulkConstruction:
+    """Tests de la construction groupée (add_vertices_from / add_edges_from)."""
+    
+    EDGES = [(10, 20, 1.0), (20, 30, 2.0), (10, 20, 0.5), (30, 10, 4.0), (40, 10, 3.0)]
+    
+    def _sequential(self, cls, **kwargs):
+        g = cls(**kwargs)
+        for i, v in enumerate((10, 20, 30)):
+            g.add_vertex(v, float(i), 0.0, f"S{v}")
+        for s, t, w in self.EDGES:
+            g.add_edge(s, t, weight=w, road_type="highway" if w > 2 else "main")
+        return g
+    
+    def _bulk(self, cls, **kwargs):
+        g = cls(**kwargs)
+        g.add_vertices_from(np.array([10, 20, 30]), [0.0, 1.0, 2.0], [0.0, 0.0, 0.0],
+                            ["S10", "S20", "S30"])
+        s, t, w = (np.array(col) for col in zip(*self.EDGES))
+        g.add_edges_from(s, t, w, road_types=np.where(w > 2, "highway", "main"))
+        return g
+    
+    def test_same_as_add_edge(self):
+        """Résultat identique à une suite d'appels add_edge."""
+        for cls in (Graph, CompactGraph):
+            for kwargs in ({"directed": True}, {"directed": False},
+                           {"directed": False, "edge_index": True, "parallel_edges": "keep_min"}):
+                a, b = self._sequential(cls, **kwargs), self._bulk(cls, **kwargs)
+                assert b.num_vertices() == a.num_vertices() == 4
+                assert b.num_edges_count() == a.num_edges_count()
+                assert b.vertices[20].label == "S20"
+                for v in a.vertices:
+                    assert b.get_neighbors(v) == a.get_neighbors(v)
+                    assert ([e.road_type for e in b.get_all_edges()]
+                            == [e.road_type for e in a.get_all_edges()])
+                assert b.has_edge(40, 10)
+    
+    def test_computed_weights(self):
+        """Poids calculés : euclidiens, ou haversine (km) si géographique."""
+        g = Graph(directed=True)
+        g.add_vertices_from(np.arange(3), [0.0, 3.0, 3.0], [0.0, 4.0, 0.0])
+        g.add_edges_from(np.array([0, 1]), np.array([1, 2]))
+        assert g.get_weight(0, 1) == 5.0 and g.get_weight(1, 2) == 4.0
+        
+        geo = Graph(directed=True)
+        geo.is_geographic = True
+        geo.add_vertices_from([0, 1], [2.35, 2.29], [48.85, 48.86])
+        geo.add_edges_from([0], [1])
+        expected = geo.vertices[0].distance_to(geo.vertices[1], metric='haversine')
+        assert abs(geo.get_weight(0, 1) - expected) < 1e-9
+    
+    def test_existing_vertices_ignored(self):
+        """Les IDs déjà présents ou répétés ne sont pas ajoutés deux fois."""
+        g = Graph()
+        g.add_vertex(1, 5.0, 5.0)
+        assert g.add_vertices_from([0, 1, 2, 2]) == 2
+        assert g.num_vertices() == 3
+        assert g.vertices[1].x == 5.0
+
 class TestGraphScenarios:
     """Tests de scénarios réalistes."""
     
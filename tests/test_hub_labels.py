@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour le module hub_labels.py (oracle de distances)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import numpy as np
+import pytest
+from src.algorithms import dijkstra
+from src.contraction import ContractionHierarchy
+from src.hub_labels import HubLabels
+from src.generators import generate_grid_graph
+from tests.helpers import random_graph
+
+
+class TestHubLabels:
+    """Tests de construction et de requêtes."""
+
+    @pytest.mark.parametrize("witness_limit", [1, 200])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, witness_limit):
+        """Les distances sont celles de Dijkstra (inf si inaccessible)."""
+        g = random_graph(60, 170, directed, seed=21, offset=100)
+        labels = HubLabels.build(g, witness_limit=witness_limit)
+        for source in range(100, 160, 4):
+            for target in range(100, 160):
+                expected = dijkstra(g, source, target).cost
+                assert labels.distance(source, target) == pytest.approx(expected, abs=1e-9)
+
+    def test_from_contraction(self):
+        """Étiquettes triées par hub, dérivées d'une hiérarchie existante."""
+        g = generate_grid_graph(10, 10)
+        labels = HubLabels.from_contraction(ContractionHierarchy.build(g))
+        assert labels.shared and labels.backward_hubs is labels.forward_hubs
+        for v in range(100):
+            hubs = labels.forward_hubs[labels.forward_offsets[v]:labels.forward_offsets[v + 1]]
+            assert (np.diff(hubs) > 0).all() and v in hubs
+        assert labels.distance(0, 99) == dijkstra(g, 0, 99).cost
+
+    def test_undirected_asymmetric_weights(self, tmp_path):
+        """Non-orienté, un seul sens modifié : étiquettes avant et arrière distinctes."""
+        rng = random.Random(5)
+        g = generate_grid_graph(12, 12)
+        for u in list(g.vertices):
+            for v, w in g.get_neighbors(u):
+                if rng.random() < 0.3:
+                    g.get_edge(u, v).weight = 5 * w
+        labels = HubLabels.build(g)
+        assert not labels.shared
+        assert "asymétriques" in labels.summary()
+        path = str(tmp_path / "graph.hl")
+        labels.save(path)
+        labels = HubLabels.load(path)
+        assert not labels.shared and not labels.directed
+        for _ in range(60):
+            source, target = rng.randrange(144), rng.randrange(144)
+            assert labels.distance(source, target) == pytest.approx(
+                dijkstra(g, source, target).cost, abs=1e-9)
+
+    def test_summary(self):
+        """Rapport de taille des étiquettes."""
+        labels = HubLabels.build(random_graph(30, 90, True, seed=1))
+        forward, backward = labels.label_sizes()
+        assert len(forward) == len(backward) == 30
+        report = labels.summary()
+        assert str(int(forward.sum())) in report and "Taille moyenne" in report
+
+    def test_unknown_vertex(self):
+        """Sommet inexistant."""
+        labels = HubLabels.build(generate_grid_graph(3, 3))
+        with pytest.raises(KeyError):
+            labels.distance(0, 42)
+
+
+class TestHubLabelsStorage:
+    """Tests de sauvegarde et rechargement."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_round_trip(self, tmp_path, directed):
+        """Les étiquettes rechargées sont identiques."""
+        g = random_graph(40, 120, directed, seed=3)
+        labels = HubLabels.build(g)
+        path = str(tmp_path / "graph.hl")
+        labels.save(path)
+        assert os.path.exists(path)
+
+        loaded = HubLabels.load(path)
+        assert loaded.directed == directed
+        assert loaded.forward_hubs.dtype == np.int32
+        assert (loaded.forward_dists == labels.forward_dists).all()
+        assert (loaded.backward_hubs is loaded.forward_hubs) == (not directed)
+        for target in range(40):
+            assert loaded.distance(0, target) == labels.distance(0, target)
@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour le module landmarks.py (heuristique ALT)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import pytest
+from src.graph import Graph
+from src.algorithms import dijkstra, astar, bidirectional_astar
+from src.landmarks import LandmarkIndex
+from src.generators import (
+    generate_grid_graph,
+    generate_clustered_urban_graph,
+    add_traffic_congestion
+)
+from tests.helpers import random_graph
+
+
+class TestLandmarkIndex:
+    """Tests du prétraitement et des bornes."""
+
+    @pytest.mark.parametrize("selection", ["avoid", "farthest"])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_lower_bounds(self, selection, directed):
+        """Les bornes ne dépassent jamais la vraie distance."""
+        g = random_graph(40, 100, directed, seed=3)
+        index = LandmarkIndex.build(g, num_landmarks=5, selection=selection, seed=1)
+        assert index.num_landmarks() == 5
+        for source in range(0, 40, 7):
+            for target in range(40):
+                result = dijkstra(g, source, target)
+                if result.success:
+                    assert index(source, target, g) <= result.cost + 1e-9
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_astar_exact(self, directed):
+        """A* et A* bidirectionnel restent exacts avec les repères."""
+        g = random_graph(60, 180, directed, seed=5)
+        index = LandmarkIndex.build(g, num_landmarks=6, seed=2)
+        rng = random.Random(0)
+        for _ in range(50):
+            source, target = rng.randrange(60), rng.randrange(60)
+            expected = dijkstra(g, source, target)
+            for result in (astar(g, source, target, heuristic=index),
+                           bidirectional_astar(g, source, target, heuristic=index)):
+                assert result.success == expected.success
+                if expected.success:
+                    assert abs(result.cost - expected.cost) < 1e-9
+
+    def test_fewer_explored_than_straight_line(self):
+        """Sur une ville en quartiers, ALT explore nettement moins que A*."""
+        random.seed(4)
+        g = generate_clustered_urban_graph(num_clusters=6, vertices_per_cluster=40)
+        index = LandmarkIndex.build(g, num_landmarks=8, seed=0)
+        rng = random.Random(1)
+        vertices = list(g.vertices.keys())
+        visited_astar = visited_alt = 0
+        for _ in range(30):
+            source, target = rng.choice(vertices), rng.choice(vertices)
+            visited_astar += astar(g, source, target).visited_nodes
+            visited_alt += astar(g, source, target, heuristic=index).visited_nodes
+        assert visited_alt * 2 < visited_astar
+
+    def test_valid_after_congestion(self):
+        """Construit sans trafic, l'index reste exact quand les poids augmentent."""
+        random.seed(2)
+        g = generate_grid_graph(12, 12)
+        index = LandmarkIndex.build(g, num_landmarks=4, seed=0)
+        add_traffic_congestion(g, congestion_factor=3.0, affected_ratio=0.5)
+        for source, target in [(0, 143), (5, 130), (70, 20)]:
+            expected = dijkstra(g, source, target)
+            result = astar(g, source, target, heuristic=index)
+            assert abs(result.cost - expected.cost) < 1e-9
+
+    def test_undirected_asymmetric_weights(self):
+        """Non-orienté, un seul sens modifié : tables distinctes, bornes admissibles."""
+        rng = random.Random(3)
+        g = generate_grid_graph(12, 12)
+        for u in list(g.vertices):
+            for v, w in g.get_neighbors(u):
+                if rng.random() < 0.3:
+                    g.get_edge(u, v).weight = 5 * w
+        index = LandmarkIndex.build(g, num_landmarks=6, seed=0)
+        assert index.backward is not index.forward
+        for _ in range(40):
+            source, target = rng.randrange(144), rng.randrange(144)
+            expected = dijkstra(g, source, target)
+            assert abs(astar(g, source, target, heuristic=index).cost - expected.cost) < 1e-9
+            result = bidirectional_astar(g, source, target, heuristic=index)
+            assert abs(result.cost - expected.cost) < 1e-9
+
+    def test_frozen_graph(self):
+        """Un index construit sur un Graph sert aussi à sa version figée."""
+        g = generate_grid_graph(8, 8)
+        index = LandmarkIndex.build(g, num_landmarks=4, seed=0)
+        expected = astar(g, 0, 63, heuristic=index)
+        result = astar(g.freeze(), 0, 63, heuristic=index)
+        assert result.cost == expected.cost
+        assert result.visited_nodes == expected.visited_nodes
+
+    def test_wrong_graph(self):
+        """Un index n'est pas utilisable sur un autre graphe."""
+        index = LandmarkIndex.build(generate_grid_graph(5, 5), num_landmarks=2, seed=0)
+        with pytest.raises(ValueError):
+            astar(generate_grid_graph(6, 6), 0, 10, heuristic=index)
+
+    def test_invalid_selection(self):
+        """Méthode de sélection inconnue."""
+        with pytest.raises(ValueError):
+            LandmarkIndex.build(generate_grid_graph(3, 3), selection="random")
+
+
+class TestLandmarkStorage:
+    """Tests de sauvegarde et rechargement des tables."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_round_trip(self, tmp_path, directed):
+        """Les tables rechargées sont identiques."""
+        g = random_graph(30, 80, directed, seed=7)
+        index = LandmarkIndex.build(g, num_landmarks=3, seed=0)
+        path = str(tmp_path / "graph.landmarks")
+        index.save(path)
+        assert os.path.exists(path)
+
+        loaded = LandmarkIndex.load(path, g)
+        assert (loaded.rows == index.rows).all()
+        assert (loaded.forward == index.forward).all()
+        assert (loaded.backward == index.backward).all()
+        assert (loaded.backward is loaded.forward) == (not directed)
+
+    def test_load_checks_graph(self, tmp_path):
+        """Le rechargement vérifie les sommets du graphe."""
+        g = generate_grid_graph(4, 4)
+        path = str(tmp_path / "grid.landmarks")
+        LandmarkIndex.build(g, num_landmarks=2, seed=0).save(path)
+
+        other = Graph()
+        for i in range(16):
+            other.add_vertex(100 + i)
+        with pytest.raises(ValueError):
+            LandmarkIndex.load(path, other)
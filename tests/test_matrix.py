@@ -0,0 +1,65 @@
+"""
+Tests unitaires pour le module matrix.py (matrices de distances)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pytest
+from src.algorithms import dijkstra
+from src.contraction import ContractionHierarchy
+from src.matrix import distance_matrix
+from src.generators import generate_grid_graph
+from tests.helpers import random_graph
+
+
+def expected_matrix(graph, sources, targets):
+    """Matrice de référence, une requête Dijkstra par paire."""
+    return np.array([[dijkstra(graph, s, t).cost for t in targets] for s in sources])
+
+
+class TestDistanceMatrix:
+    """Tests des moteurs et du découpage en tuiles."""
+
+    @pytest.mark.parametrize("engine", ["dijkstra", "ch"])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact(self, directed, engine):
+        """Mêmes coûts que Dijkstra, inf si aucun chemin, cibles répétées."""
+        g = random_graph(50, 140, directed, seed=4, offset=10)
+        sources = list(range(10, 60, 3))
+        targets = list(range(10, 60, 2)) + [11, 11]
+        matrix = distance_matrix(g, sources, targets, engine=engine, tile_size=4)
+        assert matrix.shape == (len(sources), len(targets))
+        np.testing.assert_allclose(matrix, expected_matrix(g, sources, targets))
+
+    def test_hierarchy(self):
+        """Avec une hiérarchie, le moteur auto utilise les seaux (graphe facultatif)."""
+        g = generate_grid_graph(8, 8)
+        ch = ContractionHierarchy.build(g)
+        sources, targets = [0, 9, 63], [5, 40, 63]
+        expected = expected_matrix(g, sources, targets)
+        np.testing.assert_allclose(distance_matrix(g, sources, targets, hierarchy=ch), expected)
+        np.testing.assert_allclose(distance_matrix(None, sources, targets, hierarchy=ch), expected)
+
+    def test_process_pool(self):
+        """Tuiles calculées par un pool de processus."""
+        g = random_graph(40, 120, True, seed=2)
+        vertices = list(range(40))
+        expected = distance_matrix(g, vertices)
+        np.testing.assert_array_equal(
+            distance_matrix(g, vertices, tile_size=10, workers=2), expected)
+        np.testing.assert_array_equal(
+            distance_matrix(g, vertices, engine="ch", tile_size=10, workers=2), expected)
+
+    def test_errors(self):
+        """Moteur inconnu, sommet inexistant, hiérarchie d'un autre graphe."""
+        g = generate_grid_graph(3, 3)
+        with pytest.raises(ValueError):
+            distance_matrix(g, [0], [1], engine="floyd")
+        with pytest.raises(ValueError):
+            distance_matrix(g, [0], [99])
+        with pytest.raises(ValueError):
+            distance_matrix(g, [0], [1], hierarchy=ContractionHierarchy.build(generate_grid_graph(2, 2)))
+        assert distance_matrix(g, [], [1, 2]).shape == (0, 2)
@@ -0,0 +1,113 @@
+"""
+Tests unitaires pour le module osm.py (extraits locaux et cache disque)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from src.algorithms import dijkstra
+from src.osm import load_osm_xml, osm_cache_path, load_cached_graph, save_cached_graph
+
+
+OSM_EXTRACT = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="101" lat="48.8600" lon="2.3700"/>
+  <node id="102" lat="48.8610" lon="2.3700"/>
+  <node id="103" lat="48.8620" lon="2.3710"/>
+  <node id="104" lat="48.8600" lon="2.3720"/>
+  <node id="105" lat="48.8650" lon="2.3750"/>
+  <way id="1">
+    <nd ref="101"/><nd ref="102"/><nd ref="103"/>
+    <tag k="highway" v="residential"/>
+    <tag k="maxspeed" v="30"/>
+  </way>
+  <way id="2">
+    <nd ref="101"/><nd ref="104"/>
+    <tag k="highway" v="primary"/>
+  </way>
+  <way id="3">
+    <nd ref="104"/><nd ref="105"/>
+    <tag k="highway" v="footway"/>
+  </way>
+  <way id="4">
+    <nd ref="102"/><nd ref="105"/>
+    <tag k="building" v="yes"/>
+  </way>
+</osm>
+"""
+
+
+@pytest.fixture
+def extract(tmp_path):
+    path = tmp_path / "quartier.osm"
+    path.write_text(OSM_EXTRACT)
+    return str(path)
+
+
+class TestOsmExtract:
+    """Tests du lecteur d'extraits OSM locaux."""
+    
+    def test_drive_network(self, extract):
+        """Seules les voies carrossables sont retenues, pondérées en km."""
+        g = load_osm_xml(extract, network_type="drive")
+        
+        assert g.is_geographic and not g.directed
+        assert g.num_vertices() == 4  # 105 n'est relié que par un trottoir
+        assert g.num_edges_count() == 3
+        labels = {v.label for v in g.get_all_vertices()}
+        assert "OSM_105" not in labels
+        
+        a, b = (v.id for v in g.get_all_vertices() if v.label in ("OSM_101", "OSM_102"))
+        assert abs(g.get_weight(a, b) - 0.1112) < 1e-3  # 0,001° de latitude ≈ 111 m
+        assert g.get_edge(a, b).road_type == "residential"
+        assert g.get_edge(a, b).speed_limit == 30.0
+    
+    def test_walk_network(self, extract):
+        """Le réseau piéton inclut les trottoirs."""
+        g = load_osm_xml(extract, network_type="walk")
+        
+        assert g.num_vertices() == 5
+        assert dijkstra(g, 0, g.num_vertices() - 1).success
+        with pytest.raises(ValueError):
+            load_osm_xml(extract, network_type="bateau")
+
+
+class TestOsmCache:
+    """Tests du cache disque des graphes OSM."""
+    
+    def test_cache_key(self, tmp_path):
+        """Chaque combinaison de paramètres a son propre fichier."""
+        base = osm_cache_path(str(tmp_path), "Paris, France", "drive", True, 3000)
+        
+        assert base == osm_cache_path(str(tmp_path), "Paris, France", "drive", True, 3000)
+        assert base.endswith(".sgpg") and os.path.basename(base).startswith("paris__france")
+        for other in (("Lyon, France", "drive", True, 3000),
+                      ("Paris, France", "walk", True, 3000),
+                      ("Paris, France", "drive", False, 3000),
+                      ("Paris, France", "drive", True, 5000)):
+            assert osm_cache_path(str(tmp_path), *other) != base
+    
+    def test_save_and_reload(self, tmp_path, extract):
+        """Le graphe relu du cache est identique ; un fichier absent ou corrompu donne None."""
+        g = load_osm_xml(extract)
+        path = osm_cache_path(str(tmp_path / "cache"), extract)
+        
+        assert load_cached_graph(path) is None
+        save_cached_graph(g, path)
+        cached = load_cached_graph(path)
+        
+        assert cached.is_geographic
+        assert cached.has_edge_index()
+        for v in g.vertices:
+            assert cached.get_neighbors(v) == g.get_neighbors(v)
+            assert cached.vertices[v].label == g.vertices[v].label
+        
+        with open(path, "wb") as f:
+            f.write(b"corrompu")
+        assert load_cached_graph(path) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+"""
+Tests unitaires pour le module priority_queues.py (files de priorité)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import pytest
+from src.algorithms import dijkstra, astar
+from src.priority_queues import BinaryHeap, DialBuckets, RadixHeap, make_queue
+from src.generators import generate_grid_graph, generate_random_urban_graph
+from tests.helpers import random_graph
+
+
+class TestQueues:
+    """Tests des files seules."""
+
+    @pytest.mark.parametrize("cls", [BinaryHeap, DialBuckets, RadixHeap])
+    def test_monotone_order(self, cls):
+        """Clés sorties dans l'ordre croissant, ajouts entre deux sorties."""
+        rng = random.Random(1)
+        queue = cls()
+        last = 0
+        popped = []
+        for _ in range(200):
+            for _ in range(rng.randrange(3)):
+                queue.push(last + rng.randrange(50), rng.randrange(10))
+            if queue:
+                last = queue.pop()[0]
+                popped.append(last)
+        while queue:
+            popped.append(queue.pop()[0])
+        assert popped == sorted(popped)
+        stats = queue.stats()
+        assert stats["pushes"] == stats["pops"] == len(popped)
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_make_queue(self):
+        """Noms connus, instance retournée telle quelle."""
+        assert isinstance(make_queue("radix"), RadixHeap)
+        queue = DialBuckets()
+        assert make_queue(queue) is queue
+        with pytest.raises(ValueError):
+            make_queue("fibonacci")
+
+
+class TestSearchWithQueues:
+    """Tests de dijkstra et astar avec une file interchangeable."""
+
+    @pytest.mark.parametrize("queue", ["heap", "dial", "radix"])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_exact_multiple_weights(self, directed, queue):
+        """Poids multiples de 0.5 : mêmes coûts qu'avec heapq, statistiques renseignées."""
+        g = random_graph(60, 180, directed, seed=5)
+        for source in range(0, 60, 6):
+            tree = dijkstra(g, source, queue=queue, resolution=0.5)
+            reference = dijkstra(g, source)
+            assert tree.queue_stats["pops"] >= tree.visited_nodes
+            for target in range(60):
+                expected = reference.distance_to(target)
+                assert tree.distance_to(target) == expected
+                assert dijkstra(g, source, target, queue=queue, resolution=0.5).cost == expected
+                assert astar(g, source, target, heuristic=lambda u, v, graph: 0.0,
+                             queue=queue, resolution=0.5).cost == expected
+
+    @pytest.mark.parametrize("queue", ["dial", "radix"])
+    def test_grid_astar(self, queue):
+        """A* avec l'heuristique euclidienne sur une grille."""
+        g = generate_grid_graph(15, 15)
+        for target in (224, 100, 14):
+            assert astar(g, 0, target, queue=queue).cost == dijkstra(g, 0, target).cost
+
+    def test_real_weights(self):
+        """Poids réels en kilomètres : heap exact, files à seaux refusées."""
+        random.seed(3)
+        g = generate_random_urban_graph(num_vertices=300, avg_degree=4, width=5000,
+                                        height=5000, min_distance=20)
+        for edge in g.get_all_edges():
+            edge.weight /= 1000.0
+
+        def km(u, v, graph):
+            return graph.vertices[u].distance_to(graph.vertices[v]) / 1000.0
+
+        for target in range(1, 300, 37):
+            expected = dijkstra(g, 0, target)
+            for result in (dijkstra(g, 0, target, queue="heap"),
+                           astar(g, 0, target, heuristic=km, queue="heap")):
+                assert result.success == expected.success
+                assert result.cost == pytest.approx(expected.cost, abs=1e-12)
+        for queue in ("dial", "radix"):
+            with pytest.raises(ValueError):
+                dijkstra(g, 0, 299, queue=queue)
+            with pytest.raises(ValueError):
+                astar(g, 0, 299, queue=queue, resolution=0.001)
+        assert dijkstra(g, 0, 5).queue_stats is None
+
+    def test_resolution(self):
+        """Poids arrondis au mètre puis exprimés en km : exact avec resolution=0.001."""
+        random.seed(3)
+        g = generate_random_urban_graph(num_vertices=300, avg_degree=4, width=5000,
+                                        height=5000, min_distance=20)
+        for edge in g.get_all_edges():
+            edge.weight = round(edge.weight) / 1000.0
+        for target in range(1, 300, 37):
+            expected = dijkstra(g, 0, target)
+            result = dijkstra(g, 0, target, queue="radix", resolution=0.001)
+            assert result.success == expected.success
+            assert result.cost == pytest.approx(expected.cost, abs=1e-9)
+        with pytest.raises(ValueError):
+            dijkstra(g, 0, 5, queue="dial", resolution=0.0)
+
+    def test_radius_rejected(self):
+        """Le rayon n'est pas proposé avec une file quantifiée."""
+        with pytest.raises(ValueError):
+            dijkstra(generate_grid_graph(3, 3), 0, radius=2.0, queue="dial")
@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour le module storage.py (format binaire)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+import numpy as np
+from src.graph import Graph
+from src.compact import CompactGraph
+from src.csr import CSRGraph
+from src.algorithms import dijkstra
+from src.generators import generate_random_urban_graph
+from src.storage import save_graph_binary, open_graph_binary, load_graph_binary
+from src.utils import save_graph_to_file, load_graph_from_file
+
+
+def _sample_graph():
+    g = Graph(directed=False)
+    g.is_geographic = True
+    g.add_vertex(5, 2.35, 48.85, "Châtelet")
+    g.add_vertex(7, 2.36, 48.86)
+    g.add_vertex(9, 2.37, 48.85)
+    g.add_edge(5, 7, weight=1.2, road_type="highway", speed_limit=90.0)
+    g.add_edge(7, 9, weight=0.8, speed_limit=30.0)
+    g.add_edge(5, 9)
+    return g
+
+
+class TestBinaryFormat:
+    """Tests du format binaire projetable en mémoire."""
+    
+    def test_round_trip(self, tmp_path):
+        """Graph -> fichier -> Graph restitue sommets, arcs et attributs."""
+        g = _sample_graph()
+        path = str(tmp_path / "ville.sgpg")
+        save_graph_binary(g, path)
+        
+        for cls in (Graph, CompactGraph):
+            h = load_graph_binary(path, graph_class=cls)
+            assert isinstance(h, cls)
+            assert h.directed == g.directed and h.is_geographic
+            assert h.num_edges_count() == g.num_edges_count()
+            assert list(h.row_ids()) == list(g.row_ids())
+            assert h.vertices[5].label == "Châtelet" and h.vertices[7].label == "V7"
+            for v in g.vertices:
+                assert h.get_neighbors(v) == g.get_neighbors(v)
+            assert [(e.road_type, e.speed_limit) for e in h.get_all_edges()] == \
+                   [(e.road_type, e.speed_limit) for e in g.get_all_edges()]
+    
+    def test_open_is_zero_copy(self, tmp_path):
+        """open_graph_binary renvoie un CSRGraph adossé au fichier, en lecture seule."""
+        g = generate_random_urban_graph(60, avg_degree=3)
+        path = str(tmp_path / "ville.sgpg")
+        save_graph_binary(g, path)
+        
+        csr = open_graph_binary(path)
+        assert isinstance(csr, CSRGraph)
+        assert not csr.weights.flags.writeable
+        assert np.array_equal(csr.weights, g.freeze().weights)
+        assert abs(dijkstra(csr, 0, 59).cost - dijkstra(g, 0, 59).cost) < 1e-9
+        
+        # Un CSRGraph se sauvegarde aussi (attributs d'arêtes par défaut)
+        save_graph_binary(csr, str(tmp_path / "copie.sgpg"))
+        assert np.array_equal(open_graph_binary(str(tmp_path / "copie.sgpg")).targets, csr.targets)
+    
+    def test_invalid_files(self, tmp_path):
+        """Un fichier étranger ou d'une autre version est refusé."""
+        path = tmp_path / "autre.bin"
+        path.write_bytes(b"pas un graphe" * 10)
+        with pytest.raises(ValueError):
+            open_graph_binary(str(path))
+        
+        save_graph_binary(_sample_graph(), str(path))
+        data = bytearray(path.read_bytes())
+        data[8] = 99  # numéro de version
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            load_graph_binary(str(path))
+
+
+
+class TestTextFormats:
+    """Tests des formats texte (écriture et lecture au fil de l'eau)."""
+    
+    def _assert_same(self, g, h):
+        assert h.directed == g.directed
+        assert h.num_vertices() == g.num_vertices()
+        assert h.num_edges_count() == g.num_edges_count()
+        for v in g.vertices:
+            assert h.get_neighbors(v) == g.get_neighbors(v)
+    
+    def test_json_round_trip(self, tmp_path):
+        """JSON : sommets, arêtes et attributs restitués, même par petits blocs."""
+        g = _sample_graph()
+        path = str(tmp_path / "ville.json")
+        save_graph_to_file(g, path, format="json")
+        
+        for chunk_size in (1, 2, 1000):
+            h = load_graph_from_file(path, chunk_size=chunk_size)
+            self._assert_same(g, h)
+            assert h.is_geographic
+            assert h.vertices[5].label == "Châtelet" and h.vertices[9].x == 2.37
+            assert h.get_edge(7, 5).road_type == "highway"
+            assert h.get_edge(9, 7).speed_limit == 30.0
+    
+    def test_json_legacy_layout(self, tmp_path):
+        """Un document avec 'directed' en dernier (ancien format) est relu."""
+        import json
+        g = _sample_graph()
+        path = tmp_path / "ancien.json"
+        path.write_text(json.dumps({
+            "vertices": [{"id": v.id, "x": v.x, "y": v.y, "label": v.label}
+                         for v in g.vertices.values()],
+            "edges": [{"source": e.source, "target": e.target, "weight": e.weight}
+                      for e in g.get_all_edges()],
+            "directed": False
+        }, indent=2))
+        
+        self._assert_same(g, load_graph_from_file(str(path), chunk_size=1))
+    
+    def test_edgelist_round_trip(self, tmp_path):
+        """Edgelist : relu par blocs, avec ou sans NumPy."""
+        g = generate_random_urban_graph(40, avg_degree=3)
+        path = str(tmp_path / "ville.txt")
+        save_graph_to_file(g, path, format="edgelist")
+        
+        for use_numpy in (True, False):
+            h = load_graph_from_file(path, format="edgelist", directed=False,
+                                     chunk_size=7, use_numpy=use_numpy)
+            self._assert_same(g, h)
+            assert abs(dijkstra(h, 0, 39).cost - dijkstra(g, 0, 39).cost) < 1e-9
+    
+    def test_unknown_format(self, tmp_path):
+        """Un format inconnu est refusé."""
+        with pytest.raises(ValueError):
+            save_graph_to_file(_sample_graph(), str(tmp_path / "x"), format="xml")
+        with pytest.raises(ValueError):
+            load_graph_from_file(str(tmp_path / "x"), format="xml")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
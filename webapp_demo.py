@@ -13,13 +13,16 @@ Lancement:
 import streamlit as st
 import folium
 from streamlit_folium import st_folium
+import os
 import random
 import time
-import math
-from src.graph import Graph
-from src.algorithms import astar, dijkstra, bellman_ford
+from src.algorithms import astar, bidirectional_astar, dijkstra, bellman_ford, iter_astar
+from src.cache import ShortestPathTreeCache
 from src.generators import generate_random_urban_graph
 from src.utils import print_path_result
+from src.storage import load_graph_binary
+from src.osm import (graph_from_networkx, load_osm_xml, osm_cache_path,
+                     load_cached_graph, save_cached_graph)
 
 # Import OSMnx pour les vraies données géographiques
 try:
@@ -29,81 +32,72 @@ except ImportError:
     OSMNX_AVAILABLE = False
     # Le warning sera affiché dans la sidebar si l'utilisateur essaie d'utiliser les vraies routes
 
+# Cache disque des graphes OSM convertis, et fichier local pour le mode hors-ligne
+OSM_CACHE_DIR = os.environ.get("SMART_GPS_OSM_CACHE", os.path.join("cache", "osm"))
+OSM_OFFLINE_FILE = os.environ.get("SMART_GPS_OSM_FILE", "")
 
-def create_real_city_from_osm(place_name="11e Arrondissement, Paris, France", network_type="drive", simplify=True, max_nodes=5000):
+
+def create_real_city_from_osm(place_name="11e Arrondissement, Paris, France", network_type="drive", simplify=True, max_nodes=5000, offline_file=None):
     """
     Crée un graphe à partir des vraies données OpenStreetMap.
     
+    Le graphe converti est conservé dans un cache disque (OSM_CACHE_DIR) :
+    les sessions suivantes le rechargent sans téléchargement ni conversion.
+    Pour un extrait OSM local, la clé du cache inclut la date de
+    modification et la taille du fichier (un extrait modifié est reconverti) ;
+    un graphe binaire (.sgpg) est chargé directement, sans passer par le cache.
+    
     Args:
         place_name: Nom du lieu (ex: "Paris, France", "Les Halles, Paris")
         network_type: Type de réseau ("drive", "walk", "bike", "all")
         simplify: Si True, simplifie le graphe (enlève les nœuds intermédiaires)
+        max_nodes: Nombre maximal de nœuds (fait partie de la clé du cache)
+        offline_file: Mode hors-ligne : graphe déjà sauvegardé (.sgpg) ou
+            extrait OSM local (.osm / .xml) ; aucun accès réseau
     
     Returns:
         Graph avec vraies coordonnées géographiques
     """
-    if not OSMNX_AVAILABLE:
-        return create_sample_city()
+    cache_path = None
+    if not offline_file:
+        cache_path = osm_cache_path(OSM_CACHE_DIR, place_name, network_type, simplify, max_nodes)
+    elif not offline_file.endswith(".sgpg"):
+        try:
+            stat = os.stat(offline_file)
+        except OSError:
+            stat = None   # fichier absent : l'erreur est gérée au chargement
+        if stat is not None:
+            source = f"{os.path.abspath(offline_file)}@{stat.st_mtime_ns}:{stat.st_size}"
+            cache_path = osm_cache_path(OSM_CACHE_DIR, source, network_type, simplify, max_nodes)
+    
+    cached = load_cached_graph(cache_path) if cache_path is not None else None
+    if cached is not None:
+        return cached
     
     try:
-        # Télécharger le réseau routier depuis OpenStreetMap
-        with st.spinner("📥 Téléchargement des données OpenStreetMap..."):
-            G_osm = ox.graph_from_place(place_name, network_type=network_type, simplify=False)
-        
-        # Simplifier le graphe pour réduire le nombre de nœuds
-        if simplify:
-            with st.spinner("🔧 Simplification du graphe..."):
-                G_osm = ox.simplify_graph(G_osm)
-        
-        # Convertir NetworkX vers notre format Graph
-        graph = Graph(directed=False)
-        graph.is_geographic = True
-        
-        # Créer un mapping OSM node_id -> notre vertex_id
-        node_mapping = {}
-        vertex_id = 0
-        
-        # Ajouter tous les sommets avec leurs vraies coordonnées
-        with st.spinner("📍 Conversion des intersections..."):
-            for node_id, data in G_osm.nodes(data=True):
-                lat = data.get('y', 0)  # OSMnx utilise 'y' pour latitude
-                lng = data.get('x', 0)  # OSMnx utilise 'x' pour longitude
-                
-                graph.add_vertex(vertex_id, lng, lat, label=f"OSM_{node_id}")
-                node_mapping[node_id] = vertex_id
-                vertex_id += 1
+        if offline_file:
+            graph = load_offline_city(offline_file, network_type, simplify)
+        elif OSMNX_AVAILABLE:
+            # Télécharger le réseau routier depuis OpenStreetMap
+            with st.spinner("📥 Téléchargement des données OpenStreetMap..."):
+                G_osm = ox.graph_from_place(place_name, network_type=network_type, simplify=False)
+            
+            # Simplifier le graphe pour réduire le nombre de nœuds
+            if simplify:
+                with st.spinner("🔧 Simplification du graphe..."):
+                    G_osm = ox.simplify_graph(G_osm)
+            
+            # Convertir NetworkX vers notre format Graph (conversion vectorisée)
+            with st.spinner("🛣️ Conversion des routes..."):
+                graph = graph_from_networkx(G_osm)
+        else:
+            return create_sample_city()
         
-        # Ajouter toutes les arêtes avec leurs vraies longueurs
-        with st.spinner("🛣️ Conversion des routes..."):
-            edges_added = 0
-            for u, v, data in G_osm.edges(data=True):
-                if u in node_mapping and v in node_mapping:
-                    # Utiliser la longueur réelle de l'arête (en mètres)
-                    length_m = data.get('length', 0)
-                    if length_m == 0:
-                        # Si pas de longueur, calculer depuis les coordonnées
-                        u_node = G_osm.nodes[u]
-                        v_node = G_osm.nodes[v]
-                        lat1, lng1 = u_node.get('y', 0), u_node.get('x', 0)
-                        lat2, lng2 = v_node.get('y', 0), v_node.get('x', 0)
-                        # Distance haversine approximative (en mètres)
-                        R = 6371000  # Rayon de la Terre en mètres
-                        dlat = math.radians(lat2 - lat1)
-                        dlng = math.radians(lng2 - lng1)
-                        a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlng/2)**2
-                        length_m = 2 * R * math.asin(math.sqrt(a))
-                    
-                    # Convertir en kilomètres pour le poids
-                    weight_km = length_m / 1000.0
-                    
-                    # Éviter les doublons (graphe non orienté)
-                    if not graph.has_edge(node_mapping[u], node_mapping[v]):
-                        graph.add_edge(
-                            node_mapping[u], 
-                            node_mapping[v], 
-                            weight=weight_km
-                        )
-                        edges_added += 1
+        if cache_path is not None:
+            try:
+                save_cached_graph(graph, cache_path)
+            except OSError as e:
+                print(f"Cache OSM non écrit ({cache_path}) : {e}")
         
         # Ne pas afficher de message ici - sera géré dans main()
         return graph
@@ -117,6 +111,31 @@ def create_real_city_from_osm(place_name="11e Arrondissement, Paris, France", ne
         return create_sample_city()
 
 
+def load_offline_city(filename, network_type="drive", simplify=True):
+    """
+    Charge une ville sans accès réseau.
+    
+    Args:
+        filename: Graphe binaire (.sgpg, voir src/storage.py) ou extrait OSM (.osm / .xml)
+        network_type: Type de réseau retenu dans un extrait OSM
+        simplify: Simplification OSMnx d'un extrait OSM (si OSMnx est installé)
+    
+    Returns:
+        Graph avec vraies coordonnées géographiques
+    """
+    if filename.endswith(".sgpg"):
+        graph = load_graph_binary(filename)
+        graph.enable_edge_index()   # comme un graphe du cache (mises à jour du trafic)
+        return graph
+    
+    with st.spinner("📂 Lecture de l'extrait OSM local..."):
+        if OSMNX_AVAILABLE:
+            G_osm = ox.graph_from_xml(filename, simplify=simplify)
+            return graph_from_networkx(G_osm)
+        # Sans OSMnx : lecteur intégré (graphe non simplifié)
+        return load_osm_xml(filename, network_type)
+
+
 def create_sample_city():
     """Crée une ville d'exemple avec un graphe généré (pas de vraies coordonnées)."""
     graph = generate_random_urban_graph(
@@ -370,8 +389,23 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### <i class='fas fa-map'></i> Type de carte", unsafe_allow_html=True)
     
+    # Mode hors-ligne : graphe sauvegardé (.sgpg) ou extrait OSM local (.osm)
+    offline_file = st.sidebar.text_input(
+        "Fichier local (mode hors-ligne)",
+        value=OSM_OFFLINE_FILE,
+        help="Graphe sauvegardé (.sgpg) ou extrait OpenStreetMap (.osm / .xml). Laisser vide pour télécharger la zone."
+    ).strip()
+    if offline_file and not os.path.exists(offline_file):
+        st.sidebar.error(f"Fichier introuvable : {offline_file}")
+        offline_file = ""
+    
+    # Vraies routes possibles : OSMnx, fichier local ou zone déjà en cache
+    osm_place, osm_max_nodes = "11e Arrondissement, Paris, France", 3000
+    osm_possible = (OSMNX_AVAILABLE or bool(offline_file)
+                    or os.path.exists(osm_cache_path(OSM_CACHE_DIR, osm_place, "drive", True, osm_max_nodes)))
+    
     # Afficher un avertissement si OSMnx n'est pas disponible
-    if not OSMNX_AVAILABLE:
+    if not osm_possible:
         st.sidebar.error("""
         ⚠️ **OSMnx non installé**
         
@@ -379,30 +413,33 @@ def main():
         ```bash
         pip install osmnx>=1.8.0
         ```
+        
+        Ou indiquer un fichier local (.osm ou .sgpg) ci-dessus.
         """)
     
     use_real_map = st.sidebar.checkbox(
         "Utiliser les vraies routes (OpenStreetMap)",
         value=False,
-        disabled=not OSMNX_AVAILABLE,
-        help="Active les vraies coordonnées géographiques et distances réelles. Plus lent au chargement." if OSMNX_AVAILABLE else "OSMnx doit être installé pour activer cette option."
+        disabled=not osm_possible,
+        help="Active les vraies coordonnées géographiques et distances réelles. Plus lent au premier chargement (ensuite en cache)." if osm_possible else "OSMnx doit être installé (ou un fichier local indiqué) pour activer cette option."
     )
     
     # Initialiser le graphe
-    graph_key = f"graph_{use_real_map}"
-    is_real_graph_key = f"is_real_graph_{use_real_map}"
-    loading_message_key = f"loading_msg_{use_real_map}"
+    graph_key = f"graph_{use_real_map}_{offline_file}"
+    is_real_graph_key = f"is_real_graph_{use_real_map}_{offline_file}"
+    loading_message_key = f"loading_msg_{use_real_map}_{offline_file}"
     
     if graph_key not in st.session_state:
-        if use_real_map and OSMNX_AVAILABLE:
+        if use_real_map and osm_possible:
             # Essayer de charger OSM (zone plus petite pour éviter les timeouts)
             # Utiliser une zone plus petite que tout Paris pour un chargement plus rapide
             try:
-                graph = create_real_city_from_osm("11e Arrondissement, Paris, France", "drive", max_nodes=3000)
+                graph = create_real_city_from_osm(osm_place, "drive", max_nodes=osm_max_nodes,
+                                                  offline_file=offline_file or None)
                 st.session_state[graph_key] = graph
-                # Vérifier si c'est vraiment un graphe OSM (plus de 500 sommets = probablement OSM)
-                # Un graphe généré a 100 sommets
-                is_real = graph.num_vertices() > 150  # Seuil pour distinguer OSM du graphe généré (100)
+                # Vérifier si c'est vraiment un graphe OSM (le graphe généré de repli
+                # n'est pas géographique ; un petit extrait local peut avoir < 150 sommets)
+                is_real = graph.is_geographic
                 st.session_state[is_real_graph_key] = is_real
                 
                 if is_real:
@@ -433,7 +470,7 @@ def main():
         if is_real_graph_key not in st.session_state:
             # Pour les anciens graphes, vérifier le nombre de sommets
             graph = st.session_state[graph_key]
-            st.session_state[is_real_graph_key] = graph.num_vertices() > 150
+            st.session_state[is_real_graph_key] = graph.is_geographic
     
     graph = st.session_state[graph_key]
     is_real_graph = st.session_state.get(is_real_graph_key, False)
@@ -468,7 +505,9 @@ def main():
     st.sidebar.subheader("Algorithme")
     algo_choice = st.sidebar.radio(
         "Choisir l'algorithme:",
-        ["A* (Recommandé)", "Dijkstra", "Bellman-Ford"]
+        ["A* (Recommandé)", "A* bidirectionnel", "Dijkstra", "Bellman-Ford"],
+        help="A* bidirectionnel : recherche depuis le départ et l'arrivée à la fois, "
+             "utile pour les longs trajets d'un bout à l'autre de la ville"
     )
     
     # Moyen de transport
@@ -605,14 +644,38 @@ def main():
                 progress_bar.progress(20)
                 
                 # Choisir l'algorithme
+                tree_cache_hit = None   # Dijkstra : arbre lu dans le cache ou construit
                 if algo_choice == "A* (Recommandé)":
                     status_text.markdown("<i class='fas fa-star'></i> **Calcul avec A* (heuristique guidée)...**", unsafe_allow_html=True)
+                    # Recherche pas à pas : la barre suit le front de recherche
+                    # (distance parcourue rapportée à la distance à vol d'oiseau)
+                    search = iter_astar(graph, source, target)
+                    crow_flies = graph.row_distance(graph.index_of(source), graph.index_of(target))
+                    for count, (node, distance, parent) in enumerate(search, start=1):
+                        if count % 500 == 0:
+                            fraction = min(1.0, distance / crow_flies) if crow_flies > 0 else 1.0
+                            progress_bar.progress(20 + int(60 * fraction))
+                            status_text.markdown(f"<i class='fas fa-star'></i> **Calcul avec A*...** {count} sommets explorés", unsafe_allow_html=True)
+                    result = search.result
+                elif algo_choice == "A* bidirectionnel":
+                    status_text.markdown("<i class='fas fa-arrows-alt-h'></i> **Calcul avec A* bidirectionnel (départ et arrivée)...**", unsafe_allow_html=True)
                     progress_bar.progress(50)
-                    result = astar(graph, source, target)
+                    result = bidirectional_astar(graph, source, target)
                 elif algo_choice == "Dijkstra":
+                    # Arbre complet de la source gardé en cache : changer seulement
+                    # l'arrivée ne relance pas de recherche (invalidé si les poids changent)
+                    if 'tree_cache' not in st.session_state:
+                        st.session_state.tree_cache = ShortestPathTreeCache()
                     status_text.markdown("<i class='fas fa-square'></i> **Calcul avec Dijkstra (exploration complète)...**", unsafe_allow_html=True)
                     progress_bar.progress(50)
-                    result = dijkstra(graph, source, target)
+                    cache = st.session_state.tree_cache
+                    hits = cache.hits
+                    tree = cache.tree(graph, source)
+                    result = tree.result_to(target)
+                    # Statistiques de la recherche qui a construit l'arbre (durée
+                    # comprise), et non de la seule lecture dans le cache
+                    result.execution_time = tree.execution_time
+                    tree_cache_hit = cache.hits > hits
                 else:  # Bellman-Ford
                     status_text.markdown("<i class='fas fa-shield-alt'></i> **Calcul avec Bellman-Ford (poids négatifs)...**", unsafe_allow_html=True)
                     progress_bar.progress(50)
@@ -622,6 +685,7 @@ def main():
                 status_text.markdown("<i class='fas fa-chart-bar'></i> **Analyse des résultats...**", unsafe_allow_html=True)
                 
                 st.session_state.result = result
+                st.session_state.tree_cache_hit = tree_cache_hit
                 
                 if result.success:
                     progress_bar.progress(100)
@@ -747,6 +811,15 @@ def main():
                 st.metric("Arêtes explorées", result.relaxed_edges)
             
             st.metric("Temps de calcul", f"{result.execution_time * 1000:.2f} ms")
+            tree_cache_hit = st.session_state.get('tree_cache_hit')
+            if tree_cache_hit is not None:
+                # Dijkstra : arbre complet de la source (sans arrêt à l'arrivée)
+                if tree_cache_hit:
+                    st.caption("Arbre de la source en cache : statistiques de l'exploration complète "
+                               "qui l'a construit (aucune recherche pour ce trajet)")
+                else:
+                    st.caption("Exploration complète depuis la source (arbre gardé en cache "
+                               "pour les prochaines arrivées)")
             
             # Efficacité
             efficiency = (result.visited_nodes / graph.num_vertices()) * 100